@@ -62,6 +62,8 @@ generate_files() {
   sed -i "s/model /${name}_model /g" *.py
   rm __init__.py  # we don't care about __init__.py files
   cp *.py $project_root/symphony/bdk/gen/${name}_model
+  # import referenced models lazily to reduce import time and memory
+  python $code_gen_dir/lazy_model_imports.py $project_root/symphony/bdk/gen/${name}_model
 
   # update rest.py
   cd $code_gen_dir/output/symphony/bdk/gen
@@ -0,0 +1,118 @@
+"""Post-processes generated model packages so that model classes are imported lazily.
+
+The generator imports, at the top of each model module, all the models it references. Importing a single model
+then loads most of the model graph. This script:
+
+* moves these imports in a ``lazy_import()`` function, called by the cached properties which need the referenced
+  models (``additional_properties_type``, ``openapi_types``, ``discriminator`` and ``_composed_schemas``),
+* writes a package ``__init__.py`` resolving model classes on first access with a module ``__getattr__``.
+
+Usage: ``python lazy_model_imports.py <model_package_directory>...``. Running it several times is harmless.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+MODEL_IMPORT = re.compile(r"^from symphony\.bdk\.gen\.\w+_model\.\w+ import \w+$")
+MODEL_GLOBAL = re.compile(r"^globals\(\)\['\w+'\] = \w+$")
+CLASS_DEFINITION = re.compile(r"^class (\w+)\(", re.MULTILINE)
+LAZY_PROPERTIES = re.compile(
+    r"^    def (additional_properties_type|openapi_types|discriminator|_composed_schemas)\(\):$"
+)
+
+INIT_TEMPLATE = """# do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from {package} import {example}`
+import importlib
+
+_MODEL_MODULES = {{
+{models}
+}}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    model = getattr(importlib.import_module(f"{{__name__}}.{{module_name}}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
+"""
+
+
+def make_imports_lazy(source: str) -> str:
+    lines = source.split("\n")
+    import_lines = [
+        i for i, line in enumerate(lines) if MODEL_IMPORT.match(line) or MODEL_GLOBAL.match(line)
+    ]
+    if not import_lines or "def lazy_import():" in source:
+        return source
+
+    result = []
+    lazy_import_added = False
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if i in import_lines:
+            if not lazy_import_added:
+                result.append("def lazy_import():")
+                lazy_import_added = True
+            result.append("    " + line)
+            i += 1
+            continue
+        result.append(line)
+        i += 1
+        if LAZY_PROPERTIES.match(line):
+            # the call is added after the docstring, if any
+            docstring = lines[i].strip()
+            if docstring.startswith('"""'):
+                result.append(lines[i])
+                i += 1
+                if len(docstring) == 3 or not docstring.endswith('"""'):
+                    while not lines[i].strip().endswith('"""'):
+                        result.append(lines[i])
+                        i += 1
+                    result.append(lines[i])
+                    i += 1
+            result.append("        lazy_import()")
+    return "\n".join(result)
+
+
+def write_package_init(package_directory: Path) -> None:
+    models = {}
+    for module in sorted(package_directory.glob("*.py")):
+        if module.name == "__init__.py":
+            continue
+        for class_name in CLASS_DEFINITION.findall(module.read_text(encoding="utf-8")):
+            models[class_name] = module.stem
+    package = ".".join(package_directory.resolve().parts[-4:])
+    (package_directory / "__init__.py").write_text(
+        INIT_TEMPLATE.format(
+            package=package,
+            example=next(iter(models), "Model"),
+            models="\n".join(
+                f'    "{name}": "{module}",' for name, module in sorted(models.items())
+            ),
+        ),
+        encoding="utf-8",
+    )
+
+
+def main(package_directories):
+    for package_directory in map(Path, package_directories):
+        for module in package_directory.glob("*.py"):
+            if module.name == "__init__.py":
+                continue
+            source = module.read_text(encoding="utf-8")
+            lazy_source = make_imports_lazy(source)
+            if lazy_source != source:
+                module.write_text(lazy_source, encoding="utf-8")
+        write_package_init(package_directory)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,80 @@
+"""Measures the client side overhead of calling a generated API method: parameter validation and binding in
+:py:class:`~symphony.bdk.gen.api_client.Endpoint` and request preparation in
+:py:class:`~symphony.bdk.gen.api_client.ApiClient`, the HTTP request itself being replaced by a canned response.
+
+Usage: ``python benchmarks/endpoint_benchmark.py [--calls 20000]``
+"""
+
+import argparse
+import asyncio
+import time
+
+from symphony.bdk.gen.agent_api.messages_api import MessagesApi
+from symphony.bdk.gen.api_client import ApiClient
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.pod_api.users_api import UsersApi
+
+
+class _NoContentResponse:
+    status = 204
+    data = b""
+
+    @staticmethod
+    def getheaders():
+        return {}
+
+
+async def _request(*args, **kwargs):
+    return _NoContentResponse()
+
+
+def build_scenarios(api_client: ApiClient) -> dict:
+    messages_api = MessagesApi(api_client)
+    users_api = UsersApi(api_client)
+    return {
+        "path+query+header": lambda: messages_api.v4_stream_sid_message_get(
+            sid="stream-id",
+            since=0,
+            session_token="session-token",
+            skip=0,
+            limit=50,
+            key_manager_token="km-token",
+        ),
+        "query list+header": lambda: users_api.v3_users_get(
+            session_token="session-token",
+            uid="1,2,3",
+            local=False,
+        ),
+        "form+csv+header": lambda: messages_api.v4_message_blast_post(
+            session_token="session-token",
+            sids=["stream-1", "stream-2"],
+            message="<messageML/>",
+            key_manager_token="km-token",
+        ),
+    }
+
+
+async def measure(name: str, call, calls: int) -> None:
+    for _ in range(min(calls, 1000)):
+        await call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {elapsed / calls * 1_000_000:8.1f} us/call")
+
+
+async def main(calls: int):
+    api_client = ApiClient(Configuration(host="https://acme.symphony.com/agent"))
+    api_client.request = _request
+    for name, call in build_scenarios(api_client).items():
+        await measure(name, call, calls)
+    await api_client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--calls", type=int, default=20000, help="number of measured calls per scenario"
+    )
+    asyncio.run(main(parser.parse_args().calls))
@@ -0,0 +1,68 @@
+"""Measures the import time, number of loaded modules and peak memory of importing BDK modules, each of them in a
+fresh interpreter.
+
+Usage: ``python benchmarks/import_benchmark.py [--runs 5] [module ...]``
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "symphony.bdk.gen.agent_model.v4_event",
+    "symphony.bdk.gen.pod_model.v2_user_detail",
+    "symphony.bdk.core.service.message.message_service",
+    "symphony.bdk.core.symphony_bdk",
+]
+
+IMPORT_SCRIPT = """
+import json
+import resource
+import sys
+import time
+baseline_modules = len(sys.modules)
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{
+    "duration": duration,
+    "modules": len(sys.modules) - baseline_modules,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    results = [
+        json.loads(
+            subprocess.check_output(
+                [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)], text=True
+            )
+        )
+        for _ in range(runs)
+    ]
+    return {
+        "duration": statistics.median(r["duration"] for r in results),
+        "modules": results[0]["modules"],
+        "max_rss_kb": statistics.median(r["max_rss_kb"] for r in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="number of measured runs per module")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="modules to import")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        result = measure(module, args.runs)
+        print(
+            f"{module:<55} {result['duration'] * 1000:8.1f} ms   {result['modules']:5d} modules"
+            f"   {result['max_rss_kb'] / 1024:6.1f} MB max RSS"
+        )
+
+
+if __name__ == "__main__":
+    main()
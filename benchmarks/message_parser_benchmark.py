@@ -0,0 +1,114 @@
+"""Measures the CPU spent by a listener extracting the text content, mentions, hashtags, cashtags and emojis of large
+incoming messages with the :py:mod:`~symphony.bdk.core.service.message.message_parser` functions, which share a single
+parsing of the message, compared to parsing the message again for each of them.
+
+Usage: ``python benchmarks/message_parser_benchmark.py [--messages 2000] [--entities 200]``
+"""
+
+import argparse
+import json
+import time
+
+from symphony.bdk.core.service.message.message_parser import (
+    ParsedMessage,
+    get_cashtags,
+    get_emojis,
+    get_hashtags,
+    get_mentions,
+    get_text_content_from_message,
+)
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+
+
+def build_message(entities: int) -> V4Message:
+    data = {}
+    presentation_ml = []
+    for index in range(entities):
+        kind = index % 4
+        if kind == 0:
+            data[str(index)] = {
+                "id": [{"type": "com.symphony.user.userId", "value": str(13056700580915 + index)}],
+                "type": "com.symphony.user.mention",
+            }
+            presentation_ml.append(
+                f'<span class="entity" data-entity-id="{index}">@user{index}</span>'
+            )
+        elif kind == 1:
+            data[str(index)] = {
+                "id": [{"type": "org.symphonyoss.taxonomy.hashtag", "value": f"tag{index}"}],
+                "type": "org.symphonyoss.taxonomy",
+                "version": "1.0",
+            }
+            presentation_ml.append(
+                f'<span class="entity" data-entity-id="{index}">#tag{index}</span>'
+            )
+        elif kind == 2:
+            data[str(index)] = {
+                "id": [{"type": "org.symphonyoss.fin.security.id.ticker", "value": f"TCK{index}"}],
+                "type": "org.symphonyoss.fin.security",
+                "version": "1.0",
+            }
+            presentation_ml.append(
+                f'<span class="entity" data-entity-id="{index}">$TCK{index}</span>'
+            )
+        else:
+            data[str(index)] = {
+                "type": "com.symphony.emoji",
+                "version": "1.0",
+                "data": {"annotation": f"emoji{index}", "unicode": "\U0001f600"},
+            }
+            presentation_ml.append(f'<span class="entity" data-entity-id="{index}">😀</span>')
+        presentation_ml.append(" some text &amp; more text <b>in bold</b> ")
+    return V4Message(
+        message=f'<div data-format="PresentationML" data-version="2.0">{"".join(presentation_ml)}</div>',
+        data=json.dumps(data),
+    )
+
+
+def with_helpers(message: V4Message):
+    get_text_content_from_message(message)
+    get_mentions(message)
+    get_hashtags(message)
+    get_cashtags(message)
+    get_emojis(message)
+
+
+def parsing_each_time(message: V4Message):
+    # one parsing per accessor, as the helpers used to do
+    ParsedMessage(message).text_content
+    ParsedMessage(message).mentions
+    ParsedMessage(message).hashtags
+    ParsedMessage(message).cashtags
+    ParsedMessage(message).emojis
+
+
+def measure(name: str, extract, messages: list) -> None:
+    start = time.process_time()
+    for message in messages:
+        extract(message)
+    elapsed = time.process_time() - start
+    print(f"{name:<25} {elapsed / len(messages) * 1_000:8.3f} ms/message (CPU)")
+
+
+def main(messages: int, entities: int):
+    message = build_message(entities)
+    print(f"{len(message.message)} bytes of PresentationML, {len(message.data)} bytes of data")
+    # a fresh message for each run, as received from the datafeed
+    measure(
+        "parsing each time",
+        parsing_each_time,
+        [V4Message(message=message.message, data=message.data) for _ in range(messages)],
+    )
+    measure(
+        "helpers, parsed once",
+        with_helpers,
+        [V4Message(message=message.message, data=message.data) for _ in range(messages)],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000, help="number of measured messages")
+    parser.add_argument("--entities", type=int, default=200, help="number of entities per message")
+    args = parser.parse_args()
+    main(args.messages, args.entities)
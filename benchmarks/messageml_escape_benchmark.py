@@ -0,0 +1,108 @@
+"""Measures :py:func:`~symphony.bdk.core.service.message.messageml_util.escape_special_chars` and its incremental
+variant on large texts, such as tables and log excerpts, against the previous regex based implementation, copied below.
+Outputs of the implementations are checked to be identical.
+
+Usage: ``python benchmarks/messageml_escape_benchmark.py [--sizes 1000 100000 500000] [--density 0.05] [--runs 5]``
+"""
+
+import argparse
+import random
+import re
+import string
+import time
+
+from symphony.bdk.core.service.message.messageml_util import (
+    escape_special_chars,
+    escape_special_chars_chunks,
+)
+
+_LEGACY_SPECIAL_CHARS = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "'": "&apos;",
+    '"': "&quot;",
+    "#": "&#35;",
+    "\\$": "&#36;",
+    "%": "&#37;",
+    "\\(": "&#40;",
+    "\\)": "&#41;",
+    "\\*": "&#42;",
+    "\\.": "&#46;",
+    ";": "&#59;",
+    "=": "&#61;",
+    "\\[": "&#91;",
+    "\\\\": "&#92;",
+    "\\]": "&#93;",
+    "`": "&#96;",
+    "\\{": "&#123;",
+    "\\}": "&#125;",
+}
+
+
+def legacy_escape_special_chars(raw_text: str) -> str:
+    current_parsed_index = 0
+    parsed_text = ""
+    for match in re.finditer("|".join(_LEGACY_SPECIAL_CHARS), raw_text):
+        replacement = _LEGACY_SPECIAL_CHARS.get(
+            match.group(0), _LEGACY_SPECIAL_CHARS.get("\\" + match.group(0))
+        )
+        parsed_text += raw_text[current_parsed_index : match.start()] + replacement
+        current_parsed_index = match.end()
+    return parsed_text + raw_text[current_parsed_index:]
+
+
+def escape_in_chunks(raw_text: str) -> str:
+    return "".join(
+        escape_special_chars_chunks(raw_text[i : i + 8192] for i in range(0, len(raw_text), 8192))
+    )
+
+
+def build_text(size: int, density: float) -> str:
+    # a log excerpt like text, with the given ratio of special characters
+    special_chars = "&<>'\"#$%()*.;=[\\]`{}"
+    regular_chars = string.ascii_letters + string.digits + " " * 10
+    weights = [(1 - density) / len(regular_chars)] * len(regular_chars) + [
+        density / len(special_chars)
+    ] * len(special_chars)
+    return "".join(random.Random(size).choices(regular_chars + special_chars, weights, k=size))
+
+
+def measure(escape, text: str, runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        escape(text)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(sizes: list, density: float, runs: int):
+    print(f"{'size':>10} {'legacy (ms)':>12} {'escape (ms)':>12} {'chunks (ms)':>12}")
+    for size in sizes:
+        text = build_text(size, density)
+        expected = legacy_escape_special_chars(text)
+        assert escape_special_chars(text) == expected
+        assert escape_in_chunks(text) == expected
+
+        legacy = measure(legacy_escape_special_chars, text, runs)
+        escape = measure(escape_special_chars, text, runs)
+        chunks = measure(escape_in_chunks, text, runs)
+        print(f"{size:>10} {legacy * 1000:12.3f} {escape * 1000:12.3f} {chunks * 1000:12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 100_000, 500_000],
+        help="text sizes in characters",
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.05, help="ratio of special characters in the text"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="runs per size, the fastest is kept")
+    args = parser.parse_args()
+    main(args.sizes, args.density, args.runs)
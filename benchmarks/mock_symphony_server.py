@@ -0,0 +1,159 @@
+"""Local aiohttp stand-in for the login, key manager, pod and agent endpoints used by the benchmark suite.
+
+Responses are built from the recorded payloads of the ``payloads`` folder. The server listens on a random local port
+and counts the requests it receives per route, so that a benchmark can check how many HTTP calls an operation needs.
+"""
+
+import asyncio
+import copy
+import json
+from collections import Counter
+from pathlib import Path
+
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+PAYLOADS_DIR = Path(__file__).parent / "payloads"
+BOT_USERNAME = "bot-username"
+
+
+def load_payload(name: str):
+    with open(PAYLOADS_DIR / name, encoding="utf-8") as payload_file:
+        return json.load(payload_file)
+
+
+def generate_private_key() -> str:
+    """Generates the RSA key the bot signs its authentication JWT with. The mock server does not check signatures."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+
+
+class MockSymphonyServer:
+    """Serves recorded payloads on the routes called by the BDK. Use it as an async context manager."""
+
+    def __init__(self, directory_size: int = 1000, idle_read_delay: float = 0.01):
+        """
+
+        :param directory_size: the number of users returned by the user search, across all pages.
+        :param idle_read_delay: the time a datafeed read waits before returning an empty batch when no event is
+          queued, standing for the long polling of a real agent.
+        """
+        self.directory_size = directory_size
+        self.idle_read_delay = idle_read_delay
+        self.requests = Counter()
+        self._session = load_payload("session.json")
+        self._datafeed = load_payload("datafeed.json")
+        self._message = json.dumps(load_payload("message.json")).encode("utf-8")
+        self._event = load_payload("message_sent_event.json")
+        self._user = load_payload("user.json")
+        self._batches = []
+        self._ack_id = 0
+        self._runner = None
+        self.port = None
+
+    async def __aenter__(self):
+        app = web.Application(client_max_size=10 * 1024 * 1024)
+        app.router.add_post("/login/pubkey/authenticate", self._authenticate)
+        app.router.add_post("/relay/pubkey/authenticate", self._authenticate)
+        app.router.add_get("/pod/v2/sessioninfo", self._session_info)
+        app.router.add_post("/pod/v1/user/search", self._search_users)
+        app.router.add_get("/agent/v5/datafeeds", self._list_datafeeds)
+        app.router.add_post("/agent/v5/datafeeds", self._create_datafeed)
+        app.router.add_delete("/agent/v5/datafeeds/{datafeed_id}", self._delete_datafeed)
+        app.router.add_post("/agent/v5/datafeeds/{datafeed_id}/read", self._read_datafeed)
+        app.router.add_post("/agent/v4/stream/{sid}/message/create", self._create_message)
+        app.middlewares.append(self._count_requests)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._runner.cleanup()
+
+    def bdk_config(self, private_key: str) -> dict:
+        """Builds the configuration of a bot pointing to this server.
+
+        :param private_key: the RSA private key content of the bot.
+        :return: the configuration, to be passed to :py:class:`~symphony.bdk.core.config.model.bdk_config.BdkConfig`.
+        """
+        return {
+            "scheme": "http",
+            "host": "127.0.0.1",
+            "port": self.port,
+            "bot": {"username": BOT_USERNAME, "privateKey": {"content": private_key}},
+            "datafeed": {"version": "v2"},
+        }
+
+    def queue_events(self, batch_count: int, batch_size: int) -> None:
+        """Queues MESSAGESENT events to be returned by the next datafeed reads.
+
+        :param batch_count: the number of non-empty reads.
+        :param batch_size: the number of events per read.
+        """
+        for batch_index in range(batch_count):
+            batch = []
+            for event_index in range(batch_size):
+                event = copy.deepcopy(self._event)
+                event["id"] = f"{event['id']}-{batch_index}-{event_index}"
+                batch.append(event)
+            self._batches.append(json.dumps(batch))
+
+    @web.middleware
+    async def _count_requests(self, request, handler):
+        self.requests[f"{request.method} {request.match_info.route.resource.canonical}"] += 1
+        return await handler(request)
+
+    async def _authenticate(self, request):
+        await request.read()
+        return web.json_response({"token": "session-token", "name": "sessionToken"})
+
+    async def _session_info(self, request):
+        return web.json_response(self._session)
+
+    async def _search_users(self, request):
+        await request.read()
+        skip = int(request.query.get("skip", 0))
+        limit = int(request.query.get("limit", 50))
+        users = []
+        for user_id in range(skip, min(skip + limit, self.directory_size)):
+            user = dict(self._user)
+            user["id"] = self._user["id"] + user_id
+            users.append(user)
+        return web.json_response(
+            {"count": len(users), "skip": skip, "limit": limit, "users": users}
+        )
+
+    async def _list_datafeeds(self, request):
+        return web.json_response([self._datafeed])
+
+    async def _create_datafeed(self, request):
+        return web.json_response(self._datafeed)
+
+    async def _delete_datafeed(self, request):
+        return web.Response(status=204)
+
+    async def _read_datafeed(self, request):
+        await request.read()
+        self._ack_id += 1
+        if self._batches:
+            events = self._batches.pop(0)
+        else:
+            await asyncio.sleep(self.idle_read_delay)
+            events = "[]"
+        return web.Response(
+            body=f'{{"events": {events}, "ackId": "ack-{self._ack_id}"}}',
+            content_type="application/json",
+        )
+
+    async def _create_message(self, request):
+        await request.read()
+        return web.Response(body=self._message, content_type="application/json")
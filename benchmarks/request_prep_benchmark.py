@@ -0,0 +1,83 @@
+"""Measures the CPU spent preparing a request in an :py:class:`~symphony.bdk.gen.api_client.ApiClient` created by the
+:py:class:`~symphony.bdk.core.client.api_client_factory.ApiClientFactory`: trace id generation, default headers
+merging, path and parameters serialization. The HTTP request itself is replaced by a canned response.
+
+Usage: ``python benchmarks/request_prep_benchmark.py [--calls 50000]``
+"""
+
+import argparse
+import asyncio
+import time
+
+from symphony.bdk.core.client.api_client_factory import ApiClientFactory
+from symphony.bdk.core.client.trace_id import DistributedTracingContext
+from symphony.bdk.core.config.model.bdk_config import BdkConfig
+
+CONFIG = {
+    "host": "acme.symphony.com",
+    "bot": {"username": "bot-username", "privateKey": {"content": "private-key-content"}},
+    "defaultHeaders": {"X-Custom-Header": "custom-value", "X-Other-Header": "other-value"},
+}
+
+
+class _NoContentResponse:
+    status = 204
+    data = b""
+
+    @staticmethod
+    def getheaders():
+        return {}
+
+
+async def _request(*args, **kwargs):
+    return _NoContentResponse()
+
+
+async def send_message(client):
+    await client.call_api(
+        "/v4/stream/{sid}/message/create",
+        "POST",
+        {"sid": "stream-id"},
+        [],
+        {
+            "sessionToken": "session-token",
+            "keyManagerToken": "km-token",
+            "Accept": "application/json",
+            "Content-Type": "multipart/form-data",
+        },
+        post_params=[("message", "<messageML>Hello</messageML>")],
+        files={},
+        _return_http_data_only=True,
+    )
+
+
+async def measure(name: str, client, calls: int) -> None:
+    for _ in range(min(calls, 1000)):
+        await send_message(client)
+    start = time.process_time()
+    for _ in range(calls):
+        await send_message(client)
+    elapsed = time.process_time() - start
+    print(f"{name:<25} {elapsed / calls * 1_000_000:8.2f} us/call (CPU)")
+
+
+async def main(calls: int):
+    factory = ApiClientFactory(BdkConfig(**CONFIG))
+    client = factory.get_agent_client()
+    client.request = _request
+
+    DistributedTracingContext.clear()
+    await measure("generated trace id", client, calls)
+    DistributedTracingContext.set_trace_id("user-trace-id")
+    await measure("user trace id", client, calls)
+    DistributedTracingContext.clear()
+
+    await factory.close_clients()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--calls", type=int, default=50000, help="number of measured calls per scenario"
+    )
+    asyncio.run(main(parser.parse_args().calls))
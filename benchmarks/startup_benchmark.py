@@ -0,0 +1,65 @@
+"""Measures the BDK startup time: importing the :py:class:`SymphonyBdk` entry point in a fresh interpreter, then
+creating a :py:class:`SymphonyBdk` instance from a minimal configuration.
+
+Usage: ``python benchmarks/startup_benchmark.py [--runs 10]``
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import symphony.bdk.core.symphony_bdk
+print(time.perf_counter() - start)
+"""
+
+MINIMAL_CONFIG = {
+    "host": "acme.symphony.com",
+    "bot": {"username": "bot-username", "privateKey": {"content": "private-key-content"}},
+}
+
+
+def measure_import(runs: int) -> list:
+    """Imports the BDK entry point in a new interpreter for each run, so that no module is already loaded."""
+    return [
+        float(subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT], text=True))
+        for _ in range(runs)
+    ]
+
+
+async def measure_construction(runs: int) -> list:
+    from symphony.bdk.core.config.model.bdk_config import BdkConfig
+    from symphony.bdk.core.symphony_bdk import SymphonyBdk
+
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        bdk = SymphonyBdk(BdkConfig(**MINIMAL_CONFIG))
+        durations.append(time.perf_counter() - start)
+        await bdk.close_clients()
+    return durations
+
+
+def report(name: str, durations: list) -> None:
+    print(
+        f"{name:<30} median {statistics.median(durations) * 1000:8.1f} ms"
+        f"   min {min(durations) * 1000:8.1f} ms   max {max(durations) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10, help="number of measured runs")
+    args = parser.parse_args()
+
+    report("import symphony_bdk", measure_import(args.runs))
+    report("SymphonyBdk(config)", asyncio.run(measure_construction(args.runs)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""End-to-end benchmark suite running a bot against a local mock Symphony server, see
+:py:mod:`mock_symphony_server`. Each scenario goes through the whole BDK stack, HTTP included:
+
+* ``datafeed_v2_dispatch``: reads batches of MESSAGESENT events with :py:class:`DatafeedLoopV2` and dispatches them to
+  a listener, latency being the read and dispatch time of a batch,
+* ``send_message``: :py:meth:`MessageService.send_message` calls, sent by concurrent workers,
+* ``search_all_users``: iterates through all the pages of :py:meth:`UserService.search_all_users`,
+* ``auth_refresh``: refreshes of the bot session, JWT signing included.
+
+Results are written to a JSON report. Given the report of a previous run, scenarios whose throughput dropped more than
+the tolerance are listed and the script exits with status 1.
+
+Usage: ``python benchmarks/suite.py [--scale 1.0] [--output report.json] [--compare baseline.json]``
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+
+from mock_symphony_server import MockSymphonyServer, generate_private_key
+
+from symphony.bdk.core.config.model.bdk_config import BdkConfig
+from symphony.bdk.core.metrics import BdkMetrics, set_metrics
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.symphony_bdk import SymphonyBdk
+from symphony.bdk.gen.pod_model.user_search_query import UserSearchQuery
+
+STREAM_ID = "YuK1c2y2yuie6-UfQnjSPX___pQEn69idA"
+MESSAGE = "<messageML>Hello <mention uid='7078106482890'/>, your order <b>#4521</b> is confirmed.</messageML>"
+
+
+class ScenarioResult:
+    """Operations count, duration, per operation latencies and HTTP requests of a scenario."""
+
+    def __init__(self, operations: int, duration: float, latencies: list, requests: dict):
+        self.operations = operations
+        self.duration = duration
+        self.latencies = latencies
+        self.requests = requests
+
+    def to_dict(self) -> dict:
+        latencies = sorted(self.latencies)
+        throughput = self.operations / self.duration if self.duration else None
+        return {
+            "operations": self.operations,
+            "duration_s": round(self.duration, 6),
+            "throughput_per_s": round(throughput, 3) if throughput else None,
+            "latency_ms": {
+                "mean": _ms(statistics.fmean(latencies)),
+                "p50": _ms(_percentile(latencies, 50)),
+                "p95": _ms(_percentile(latencies, 95)),
+                "p99": _ms(_percentile(latencies, 99)),
+                "max": _ms(latencies[-1]),
+            },
+            "http_requests": dict(sorted(self.requests.items())),
+        }
+
+
+class _BatchTimings(BdkMetrics):
+    """Collects the read and dispatch durations of each datafeed batch."""
+
+    def __init__(self):
+        self.reads = []
+        self.dispatches = []
+
+    def on_datafeed_read(self, duration, batch_size):
+        if batch_size:
+            self.reads.append(duration)
+
+    def on_datafeed_dispatch(self, duration, batch_size):
+        if batch_size:
+            self.dispatches.append(duration)
+
+
+class _CountingListener(RealTimeEventListener):
+    def __init__(self, expected: int):
+        self.received = 0
+        self._expected = expected
+        self.done = asyncio.Event()
+
+    async def on_message_sent(self, initiator, event):
+        self.received += 1
+        if self.received == self._expected:
+            self.done.set()
+
+
+async def datafeed_v2_dispatch(bdk, server, scale: float) -> ScenarioResult:
+    batch_count, batch_size = int(200 * scale) or 1, 50
+    timings = _BatchTimings()
+    set_metrics(timings)
+    listener = _CountingListener(batch_count * batch_size)
+    datafeed_loop = bdk.datafeed()
+    datafeed_loop.subscribe(listener)
+    server.requests.clear()
+
+    server.queue_events(batch_count, batch_size)
+    start = time.perf_counter()
+    loop_task = asyncio.create_task(datafeed_loop.start())
+    await listener.done.wait()
+    duration = time.perf_counter() - start
+    await datafeed_loop.stop()
+    await loop_task
+    set_metrics(None)
+
+    latencies = [read + dispatch for read, dispatch in zip(timings.reads, timings.dispatches)]
+    return ScenarioResult(listener.received, duration, latencies, dict(server.requests))
+
+
+async def send_message(bdk, server, scale: float, concurrency: int = 10) -> ScenarioResult:
+    operations = int(2000 * scale) or 1
+    messages = bdk.messages()
+    await messages.send_message(STREAM_ID, MESSAGE)
+    server.requests.clear()
+    latencies = []
+    remaining = iter(range(operations))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            await messages.send_message(STREAM_ID, MESSAGE)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ScenarioResult(operations, time.perf_counter() - start, latencies, dict(server.requests))
+
+
+async def search_all_users(bdk, server, scale: float) -> ScenarioResult:
+    operations = int(50 * scale) or 1
+    users = bdk.users()
+    query = UserSearchQuery(query="jane")
+    server.requests.clear()
+    latencies = []
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        call_start = time.perf_counter()
+        found = [user async for user in await users.search_all_users(query, chunk_size=100)]
+        latencies.append(time.perf_counter() - call_start)
+        assert len(found) == server.directory_size
+    return ScenarioResult(operations, time.perf_counter() - start, latencies, dict(server.requests))
+
+
+async def auth_refresh(bdk, server, scale: float) -> ScenarioResult:
+    operations = int(200 * scale) or 1
+    bot_session = bdk.bot_session()
+    server.requests.clear()
+    latencies = []
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        call_start = time.perf_counter()
+        await bot_session.refresh()
+        latencies.append(time.perf_counter() - call_start)
+    return ScenarioResult(operations, time.perf_counter() - start, latencies, dict(server.requests))
+
+
+SCENARIOS = {
+    "datafeed_v2_dispatch": datafeed_v2_dispatch,
+    "send_message": send_message,
+    "search_all_users": search_all_users,
+    "auth_refresh": auth_refresh,
+}
+
+
+async def run(scenarios: list, scale: float) -> dict:
+    private_key = generate_private_key()
+    results = {}
+    async with MockSymphonyServer() as server:
+        for name in scenarios:
+            # a new bot for each scenario, so that none benefits from the connections or caches of another
+            async with SymphonyBdk(BdkConfig(**server.bdk_config(private_key))) as bdk:
+                results[name] = (await SCENARIOS[name](bdk, server, scale)).to_dict()
+            print(_summary_line(name, results[name]))
+    return {
+        "bdk_version": _bdk_version(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "scale": scale,
+        "scenarios": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """Lists the scenarios whose throughput dropped by more than the tolerance compared to the baseline.
+
+    :param report: the report of the current run.
+    :param baseline: the report of a previous run.
+    :param tolerance: the accepted throughput drop, as a fraction of the baseline throughput.
+    :return: the list of regression descriptions, empty if none.
+    """
+    regressions = []
+    for name, result in report["scenarios"].items():
+        baseline_result = baseline.get("scenarios", {}).get(name)
+        if not baseline_result or not baseline_result.get("throughput_per_s"):
+            continue
+        ratio = result["throughput_per_s"] / baseline_result["throughput_per_s"]
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{name}: {result['throughput_per_s']}/s vs {baseline_result['throughput_per_s']}/s "
+                f"in baseline ({(ratio - 1) * 100:+.1f}%)"
+            )
+    return regressions
+
+
+def _summary_line(name: str, result: dict) -> str:
+    latency = result["latency_ms"]
+    return (
+        f"{name:<22} {result['throughput_per_s']:>10.1f} ops/s  "
+        f"p50 {latency['p50']:>8.3f} ms  p95 {latency['p95']:>8.3f} ms  p99 {latency['p99']:>8.3f} ms"
+    )
+
+
+def _percentile(sorted_values: list, percent: int) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _bdk_version() -> str:
+    try:
+        return version("symphony_bdk_python")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="scenario to run, all by default"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiplier of the number of operations per scenario",
+    )
+    parser.add_argument("--output", default="benchmark-report.json", help="path of the JSON report")
+    parser.add_argument("--compare", help="path of a previous JSON report to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="accepted throughput drop when comparing, 0.2 by default",
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.scenario or list(SCENARIOS), args.scale))
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
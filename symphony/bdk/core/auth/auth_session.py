@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 
 from symphony.bdk.core.auth.exception import AuthInitializationError
 from symphony.bdk.core.auth.jwt_helper import extract_token_claims
+from symphony.bdk.core.metrics import measure_auth_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class AuthSession:
         self._authenticator = authenticator
         self._expire_at = -1
 
+    @measure_auth_refresh
     async def refresh(self):
         """Trigger re-authentication to refresh the tokens."""
         logger.debug("Authenticate")
@@ -132,6 +134,7 @@ class OboAuthSession(AuthSession):
         self.user_id = user_id
         self.username = username
 
+    @measure_auth_refresh
     async def refresh(self):
         """Trigger re-authentication to refresh the OBO session token."""
         if self.user_id is not None:
@@ -176,6 +179,7 @@ class AppAuthSession:
         self._expire_at = -1
         self._symphony_token = ""
 
+    @measure_auth_refresh
     async def refresh(self) -> None:
         """Triggers re-authentication to refresh the tokens.
 
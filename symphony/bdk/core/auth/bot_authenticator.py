@@ -1,7 +1,7 @@
 """Module containing BotAuthenticator classes."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from symphony.bdk.core.auth.jwt_helper import create_signed_jwt, generate_expiration_time
 from symphony.bdk.core.config.model.bdk_bot_config import BdkBotConfig
@@ -29,6 +29,7 @@ class BotAuthenticator(ABC):
         self._key_manager_auth_client = key_manager_auth_client
         self._retry_config = retry_config
         self._agent_version_service = None
+        self._agent_version_service_factory = None
 
     async def retrieve_session_token(self) -> str:
         """Authenticates and retrieves a new session token.
@@ -64,12 +65,24 @@ class BotAuthenticator(ABC):
 
     @property
     def agent_version_service(self) -> Optional[AgentVersionService]:
+        if self._agent_version_service is None and self._agent_version_service_factory is not None:
+            self._agent_version_service = self._agent_version_service_factory()
         return self._agent_version_service
 
     @agent_version_service.setter
     def agent_version_service(self, agent_version_service: AgentVersionService):
         self._agent_version_service = agent_version_service
 
+    def set_agent_version_service_factory(
+        self, agent_version_service_factory: Callable[[], AgentVersionService]
+    ):
+        """Sets the function creating the AgentVersionService on first access, so that the agent api client is only
+        created when the agent version is needed.
+
+        :param agent_version_service_factory: the function returning the AgentVersionService instance.
+        """
+        self._agent_version_service_factory = agent_version_service_factory
+
 
 class BotAuthenticatorRsa(BotAuthenticator):
     """Bot authenticator RSA implementation."""
@@ -9,6 +9,8 @@ import urllib3
 from aiohttp.hdrs import USER_AGENT
 
 from symphony.bdk.core.client.trace_id import X_TRACE_ID, add_x_trace_id
+from symphony.bdk.core.metrics import REGISTERED_METRICS
+from symphony.bdk.core.tracing import get_tracer, trace_api_call
 from symphony.bdk.gen.api_client import ApiClient
 from symphony.bdk.gen.configuration import Configuration
 
@@ -27,19 +29,14 @@ class ApiClientFactory:
 
     def __init__(self, config):
         self._config = config
-        self._login_client = self._get_api_client(self._config.pod, LOGIN)
-        self._pod_client = self._get_api_client(self._config.pod, POD)
-        self._relay_client = self._get_api_client(self._config.key_manager, RELAY)
-        self._agent_client = self._get_api_client(self._config.agent, AGENT)
-        self._session_auth_client = self._get_api_client_with_client_cert(
-            self._config.session_auth, SESSION_AUTH, self._config.bot.certificate.path
-        )
-        self._key_auth_client = self._get_api_client_with_client_cert(
-            self._config.key_manager, KEY_AUTH, self._config.bot.certificate.path
-        )
-        self._app_session_auth_client = self._get_api_client_with_client_cert(
-            self._config.session_auth, SESSION_AUTH, self._config.app.certificate.path
-        )
+        # clients are created on first access, as creating their SSL context is costly
+        self._login_client = None
+        self._pod_client = None
+        self._relay_client = None
+        self._agent_client = None
+        self._session_auth_client = None
+        self._key_auth_client = None
+        self._app_session_auth_client = None
         self._custom_clients = []
 
     def get_login_client(self) -> ApiClient:
@@ -47,6 +44,8 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Login API.
         """
+        if self._login_client is None:
+            self._login_client = self._get_api_client(self._config.pod, LOGIN)
         return self._login_client
 
     def get_pod_client(self) -> ApiClient:
@@ -54,6 +53,8 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Pod API.
         """
+        if self._pod_client is None:
+            self._pod_client = self._get_api_client(self._config.pod, POD)
         return self._pod_client
 
     def get_client(self, context_path):
@@ -71,6 +72,8 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Key Manager API.
         """
+        if self._relay_client is None:
+            self._relay_client = self._get_api_client(self._config.key_manager, RELAY)
         return self._relay_client
 
     def get_session_auth_client(self) -> ApiClient:
@@ -78,6 +81,10 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Session Auth Api for bot certificate authentication.
         """
+        if self._session_auth_client is None:
+            self._session_auth_client = self._get_api_client_with_client_cert(
+                self._config.session_auth, SESSION_AUTH, self._config.bot.certificate.path
+            )
         return self._session_auth_client
 
     def get_key_auth_client(self) -> ApiClient:
@@ -85,6 +92,10 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Key Auth Api for bot certificate authentication.
         """
+        if self._key_auth_client is None:
+            self._key_auth_client = self._get_api_client_with_client_cert(
+                self._config.key_manager, KEY_AUTH, self._config.bot.certificate.path
+            )
         return self._key_auth_client
 
     def get_app_session_auth_client(self) -> ApiClient:
@@ -92,6 +103,10 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Session Auth API.
         """
+        if self._app_session_auth_client is None:
+            self._app_session_auth_client = self._get_api_client_with_client_cert(
+                self._config.session_auth, SESSION_AUTH, self._config.app.certificate.path
+            )
         return self._app_session_auth_client
 
     def get_agent_client(self) -> ApiClient:
@@ -99,21 +114,26 @@ class ApiClientFactory:
 
         :return: an ApiClient instance for Agent API.
         """
+        if self._agent_client is None:
+            self._agent_client = self._get_api_client(self._config.agent, AGENT)
         return self._agent_client
 
     async def close_clients(self):
         """
         Close all the existing api clients created by the api client factory.
         """
-        await self._login_client.close()
-        await self._relay_client.close()
-        await self._pod_client.close()
-        await self._agent_client.close()
-        await self._session_auth_client.close()
-        await self._key_auth_client.close()
-        await self._app_session_auth_client.close()
-        for client in self._custom_clients:
-            await client.close()
+        clients = [
+            self._login_client,
+            self._relay_client,
+            self._pod_client,
+            self._agent_client,
+            self._session_auth_client,
+            self._key_auth_client,
+            self._app_session_auth_client,
+        ]
+        for client in clients + self._custom_clients:
+            if client is not None:
+                await client.close()
 
     def _get_api_client(self, server_config, context) -> ApiClient:
         configuration = self._get_client_config(context, server_config)
@@ -142,6 +162,9 @@ class ApiClientFactory:
         try:
             client = ApiClient(configuration=client_config)
             ApiClientFactory._add_headers(client, server_config)
+            client.metrics = REGISTERED_METRICS
+            if get_tracer() is not None:
+                client._ApiClient__call_api = trace_api_call(client, client._ApiClient__call_api)
             return client
         except SSLError as exc:
             logger.exception(
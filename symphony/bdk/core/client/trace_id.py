@@ -1,11 +1,18 @@
 """Module responsible for managing the trace ID sent as X-Trace-Id header and logged under the `trace_id` variable"""
 
+import functools
 import logging
 import random
 import string
 from contextvars import ContextVar
 
 TRACE_ID_LENGTH = 6
+TRACE_ID_CHARACTERS = string.ascii_letters + string.digits
+# all the two characters strings, so that a trace id is built from 3 random indexes instead of 6 random choices
+_TRACE_ID_PAIRS = [
+    first + second for first in TRACE_ID_CHARACTERS for second in TRACE_ID_CHARACTERS
+]
+_TRACE_ID_PAIRS_COUNT = len(_TRACE_ID_PAIRS)
 
 X_TRACE_ID = "X-Trace-Id"
 
@@ -36,18 +43,34 @@ def add_x_trace_id(func):
     :return: the decorated function
     """
 
+    @functools.wraps(func)
     async def add_x_trace_id_header(*args, **kwargs):
-        if not DistributedTracingContext.is_trace_id_set_by_user():
-            DistributedTracingContext.set_new_trace_id()
+        if DistributedTracingContext.is_trace_id_set_by_user():
+            trace_id = DistributedTracingContext.get_trace_id()
+        else:
+            trace_id = DistributedTracingContext.set_new_trace_id()
 
-        if DistributedTracingContext.has_trace_id() and len(args) > HEADER_ARG_INDEX:
-            args[HEADER_ARG_INDEX][X_TRACE_ID] = DistributedTracingContext.get_trace_id()
+        if trace_id and len(args) > HEADER_ARG_INDEX:
+            args[HEADER_ARG_INDEX][X_TRACE_ID] = trace_id
 
         return await func(*args, **kwargs)
 
     return add_x_trace_id_header
 
 
+def generate_trace_id() -> str:
+    """Generates a random trace id of :py:const:`TRACE_ID_LENGTH` alphanumeric characters.
+
+    :return: the generated trace id
+    """
+    bits = random.getrandbits(48)
+    return (
+        _TRACE_ID_PAIRS[(bits & 0xFFFF) % _TRACE_ID_PAIRS_COUNT]
+        + _TRACE_ID_PAIRS[((bits >> 16) & 0xFFFF) % _TRACE_ID_PAIRS_COUNT]
+        + _TRACE_ID_PAIRS[(bits >> 32) % _TRACE_ID_PAIRS_COUNT]
+    )
+
+
 class DistributedTracingContext:
     """Class to manage the tracing id context."""
 
@@ -89,13 +112,14 @@ class DistributedTracingContext:
         cls._is_trace_id_set_by_user = True
 
     @classmethod
-    def set_new_trace_id(cls) -> None:
+    def set_new_trace_id(cls) -> str:
         """Sets the trace id to a newly generated value.
 
-        :return: None
+        :return: the generated trace id
         """
-        trace_id = "".join(random.choices(string.ascii_letters + string.digits, k=TRACE_ID_LENGTH))
+        trace_id = generate_trace_id()
         cls._trace_id_context.set(trace_id)
+        return trace_id
 
     @classmethod
     def clear(cls) -> None:
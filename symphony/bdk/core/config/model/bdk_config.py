@@ -1,11 +1,19 @@
 from symphony.bdk.core.config.model.bdk_app_config import BdkAppConfig
 from symphony.bdk.core.config.model.bdk_bot_config import BdkBotConfig
 from symphony.bdk.core.config.model.bdk_client_config import BdkClientConfig
+from symphony.bdk.core.config.model.bdk_connection_cache_config import BdkConnectionCacheConfig
 from symphony.bdk.core.config.model.bdk_datafeed_config import BdkDatafeedConfig
 from symphony.bdk.core.config.model.bdk_datahose_config import BdkDatahoseConfig
+from symphony.bdk.core.config.model.bdk_presence_feed_config import BdkPresenceFeedConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
+from symphony.bdk.core.config.model.bdk_room_membership_index_config import (
+    BdkRoomMembershipIndexConfig,
+)
+from symphony.bdk.core.config.model.bdk_send_queue_config import BdkSendQueueConfig
 from symphony.bdk.core.config.model.bdk_server_config import BdkServerConfig
 from symphony.bdk.core.config.model.bdk_ssl_config import BdkSslConfig
+from symphony.bdk.core.config.model.bdk_user_cache_config import BdkUserCacheConfig
+from symphony.bdk.core.config.model.bdk_watchdog_config import BdkWatchdogConfig
 
 
 class BdkConfig(BdkServerConfig):
@@ -35,6 +43,12 @@ class BdkConfig(BdkServerConfig):
         self.datahose = BdkDatahoseConfig(config.get("datahose"))
         self.retry = BdkRetryConfig(config.get("retry"))
         self.manifest = config.get("manifest")
+        self.user_cache = BdkUserCacheConfig(config.get("userCache"))
+        self.connection_cache = BdkConnectionCacheConfig(config.get("connectionCache"))
+        self.room_membership_index = BdkRoomMembershipIndexConfig(config.get("roomMembershipIndex"))
+        self.send_queue = BdkSendQueueConfig(config.get("sendQueue"))
+        self.watchdog = BdkWatchdogConfig(config.get("watchdog"))
+        self.presence_feed = BdkPresenceFeedConfig(config.get("presenceFeed"))
 
     def is_bot_configured(self) -> bool:
         """
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+ENABLED = "enabled"
+MAX_SIZE = "maxSize"
+TTL_SECONDS = "ttlSeconds"
+WARM_UP = "warmUp"
+
+
+class BdkConnectionCacheConfig:
+    """Class holding the configuration of the connection cache used by the
+    :py:class:`~symphony.bdk.core.service.connection.connection_service.ConnectionService`.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_TTL_SECONDS = 3600
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the connection cache specific configuration.
+        """
+        self.enabled = False
+        self.max_size = self.DEFAULT_MAX_SIZE
+        self.ttl = timedelta(seconds=self.DEFAULT_TTL_SECONDS)
+        self.warm_up = False
+        if config is not None:
+            self.enabled = config.get(ENABLED, False)
+            self.max_size = config.get(MAX_SIZE, self.DEFAULT_MAX_SIZE)
+            self.ttl = timedelta(seconds=config.get(TTL_SECONDS, self.DEFAULT_TTL_SECONDS))
+            self.warm_up = config.get(WARM_UP, False)
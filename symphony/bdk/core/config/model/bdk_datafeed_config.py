@@ -5,6 +5,8 @@ from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 
 VERSION = "version"
 DF_ID_FILE_PATH = "idFilePath"
+EARLY_ACK = "earlyAck"
+MAX_PENDING_TASKS = "maxPendingTasks"
 DF_V1 = "v1"
 DF_V2 = "v2"
 
@@ -23,6 +25,8 @@ def log_dfv1_deprecation(version):
 class BdkDatafeedConfig:
     """Class holding datafeed specific configuration."""
 
+    DEFAULT_MAX_PENDING_TASKS = 1000
+
     def __init__(self, config):
         """
 
@@ -31,6 +35,8 @@ class BdkDatafeedConfig:
         self.version = DF_V2
         self.id_file_path = ""
         self.retry = BdkRetryConfig(dict(maxAttempts=BdkRetryConfig.INFINITE_MAX_ATTEMPTS))
+        self.early_ack = False
+        self.max_pending_tasks = self.DEFAULT_MAX_PENDING_TASKS
         if config is not None:
             self.id_file_path = (
                 Path(config.get(DF_ID_FILE_PATH)) if DF_ID_FILE_PATH in config else ""
@@ -39,6 +45,8 @@ class BdkDatafeedConfig:
             self.version = config.get(VERSION)
             if "retry" in config:
                 self.retry = BdkRetryConfig(config.get("retry"))
+            self.early_ack = config.get(EARLY_ACK, False)
+            self.max_pending_tasks = config.get(MAX_PENDING_TASKS, self.DEFAULT_MAX_PENDING_TASKS)
 
     def get_id_file_path(self) -> Path:
         """
@@ -0,0 +1,32 @@
+from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
+
+POLL_INTERVAL_SECONDS = "pollIntervalSeconds"
+SEED = "seed"
+PAGE_SIZE = "pageSize"
+
+
+class BdkPresenceFeedConfig:
+    """Class holding the configuration of the
+    :py:class:`~symphony.bdk.core.service.presence.presence_feed_loop.PresenceFeedLoop`.
+    """
+
+    DEFAULT_POLL_INTERVAL_SECONDS = 5
+    DEFAULT_PAGE_SIZE = 5000
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the presence feed specific configuration.
+        """
+        self.poll_interval = self.DEFAULT_POLL_INTERVAL_SECONDS
+        self.seed = True
+        self.page_size = self.DEFAULT_PAGE_SIZE
+        self.retry = BdkRetryConfig(dict(maxAttempts=BdkRetryConfig.INFINITE_MAX_ATTEMPTS))
+        if config is not None:
+            self.poll_interval = config.get(
+                POLL_INTERVAL_SECONDS, self.DEFAULT_POLL_INTERVAL_SECONDS
+            )
+            self.seed = config.get(SEED, True)
+            self.page_size = config.get(PAGE_SIZE, self.DEFAULT_PAGE_SIZE)
+            if "retry" in config:
+                self.retry = BdkRetryConfig(config.get("retry"))
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+ENABLED = "enabled"
+SNAPSHOT_FILE_PATH = "snapshotFilePath"
+CONCURRENCY = "concurrency"
+
+
+class BdkRoomMembershipIndexConfig:
+    """Class holding the configuration of the
+    :py:class:`~symphony.bdk.core.service.stream.room_membership_index.RoomMembershipIndex`.
+    """
+
+    DEFAULT_CONCURRENCY = 10
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the room membership index specific configuration.
+        """
+        self.enabled = False
+        self.snapshot_file_path = None
+        self.concurrency = self.DEFAULT_CONCURRENCY
+        if config is not None:
+            self.enabled = config.get(ENABLED, False)
+            self.concurrency = config.get(CONCURRENCY, self.DEFAULT_CONCURRENCY)
+            if SNAPSHOT_FILE_PATH in config:
+                self.snapshot_file_path = Path(config.get(SNAPSHOT_FILE_PATH))
@@ -0,0 +1,31 @@
+ENABLED = "enabled"
+MAX_CONCURRENT_STREAMS = "maxConcurrentStreams"
+RATE_LIMIT = "rateLimit"
+BURST = "burst"
+
+
+class BdkSendQueueConfig:
+    """Class holding the configuration of the
+    :py:class:`~symphony.bdk.core.service.message.send_queue.MessageSendQueue`.
+    """
+
+    DEFAULT_MAX_CONCURRENT_STREAMS = 10
+    DEFAULT_RATE_LIMIT = 10
+    DEFAULT_BURST = 10
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the send queue specific configuration.
+        """
+        self.enabled = False
+        self.max_concurrent_streams = self.DEFAULT_MAX_CONCURRENT_STREAMS
+        self.rate_limit = self.DEFAULT_RATE_LIMIT
+        self.burst = self.DEFAULT_BURST
+        if config is not None:
+            self.enabled = config.get(ENABLED, False)
+            self.max_concurrent_streams = config.get(
+                MAX_CONCURRENT_STREAMS, self.DEFAULT_MAX_CONCURRENT_STREAMS
+            )
+            self.rate_limit = config.get(RATE_LIMIT, self.DEFAULT_RATE_LIMIT)
+            self.burst = config.get(BURST, self.DEFAULT_BURST)
@@ -0,0 +1,35 @@
+from datetime import timedelta
+from pathlib import Path
+
+ENABLED = "enabled"
+MAX_SIZE = "maxSize"
+TTL_SECONDS = "ttlSeconds"
+WARM_UP = "warmUp"
+SNAPSHOT_FILE_PATH = "snapshotFilePath"
+
+
+class BdkUserCacheConfig:
+    """Class holding the configuration of the user cache used by the
+    :py:class:`~symphony.bdk.core.service.user.user_service.UserService`.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_TTL_SECONDS = 3600
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the user cache specific configuration.
+        """
+        self.enabled = False
+        self.max_size = self.DEFAULT_MAX_SIZE
+        self.ttl = timedelta(seconds=self.DEFAULT_TTL_SECONDS)
+        self.warm_up = False
+        self.snapshot_file_path = None
+        if config is not None:
+            self.enabled = config.get(ENABLED, False)
+            self.max_size = config.get(MAX_SIZE, self.DEFAULT_MAX_SIZE)
+            self.ttl = timedelta(seconds=config.get(TTL_SECONDS, self.DEFAULT_TTL_SECONDS))
+            self.warm_up = config.get(WARM_UP, False)
+            if SNAPSHOT_FILE_PATH in config:
+                self.snapshot_file_path = Path(config.get(SNAPSHOT_FILE_PATH))
@@ -0,0 +1,29 @@
+ENABLED = "enabled"
+LISTENER_BUDGET = "listenerBudget"
+LAG_THRESHOLD = "lagThreshold"
+SAMPLING_INTERVAL = "samplingInterval"
+
+
+class BdkWatchdogConfig:
+    """Class holding the configuration of the
+    :py:class:`~symphony.bdk.core.service.datafeed.watchdog.DatafeedWatchdog`.
+    """
+
+    DEFAULT_LISTENER_BUDGET = 10.0
+    DEFAULT_LAG_THRESHOLD = 0.1
+    DEFAULT_SAMPLING_INTERVAL = 1.0
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the watchdog specific configuration.
+        """
+        self.enabled = False
+        self.listener_budget = self.DEFAULT_LISTENER_BUDGET
+        self.lag_threshold = self.DEFAULT_LAG_THRESHOLD
+        self.sampling_interval = self.DEFAULT_SAMPLING_INTERVAL
+        if config is not None:
+            self.enabled = config.get(ENABLED, False)
+            self.listener_budget = config.get(LISTENER_BUDGET, self.DEFAULT_LISTENER_BUDGET)
+            self.lag_threshold = config.get(LAG_THRESHOLD, self.DEFAULT_LAG_THRESHOLD)
+            self.sampling_interval = config.get(SAMPLING_INTERVAL, self.DEFAULT_SAMPLING_INTERVAL)
@@ -0,0 +1,292 @@
+"""Module containing the instrumentation hooks called by the BDK on API calls, retries, authentication refreshes and
+datafeed loop iterations.
+
+Metrics are registered process wide with :func:`set_metrics`, which is done by
+:py:class:`~symphony.bdk.core.symphony_bdk.SymphonyBdk` when it is given a :py:class:`BdkMetrics` instance.
+"""
+
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Dict, Optional, Tuple
+
+
+class BdkMetrics:
+    """Interface of the instrumentation hooks called by the BDK. All hooks do nothing: subclasses only need to
+    override the ones they are interested in.
+
+    Hooks are called synchronously on the event loop, implementations must therefore return quickly and never raise.
+    """
+
+    def on_api_call(
+        self,
+        operation_id: Optional[str],
+        method: str,
+        status: Optional[int],
+        duration: float,
+        response_size: int,
+    ) -> None:
+        """Called after each HTTP call made by an API client, whether it succeeded or not.
+
+        :param operation_id: the identifier of the called endpoint (e.g. `v4_stream_sid_message_create_post`),
+          None for requests not made through a generated API.
+        :param method: the HTTP method.
+        :param status: the HTTP status of the response, None if no response was received.
+        :param duration: the duration of the HTTP call, in seconds.
+        :param response_size: the size of the response body, in bytes.
+        """
+
+    def on_retry(
+        self, operation: str, attempt_number: int, exception: Optional[BaseException]
+    ) -> None:
+        """Called each time a failed call is about to be retried.
+
+        :param operation: the qualified name of the retried function.
+        :param attempt_number: the number of the attempt which just failed, starting at 1.
+        :param exception: the exception raised by the failed attempt, None if it returned a value to be retried.
+        """
+
+    def on_auth_refresh(self, session_type: str, duration: float, success: bool) -> None:
+        """Called after each refresh of an authentication session.
+
+        :param session_type: the class name of the refreshed session (e.g. `AuthSession`, `OboAuthSession`).
+        :param duration: the duration of the refresh, in seconds.
+        :param success: True if the tokens were refreshed, False if the refresh failed.
+        """
+
+    def on_datafeed_read(self, duration: float, batch_size: int) -> None:
+        """Called after each successful read of the datafeed or datahose.
+
+        :param duration: the duration of the read call, including retries, in seconds.
+        :param batch_size: the number of received events.
+        """
+
+    def on_datafeed_dispatch(self, duration: float, batch_size: int) -> None:
+        """Called once the events of a read batch have been processed by all the listeners.
+
+        :param duration: the time spent running the listeners, in seconds.
+        :param batch_size: the number of dispatched events.
+        """
+
+    def on_datafeed_ack(self, delay: float) -> None:
+        """Called when a batch of events is acknowledged, i.e. when the ack id is updated.
+
+        :param delay: the time elapsed between the reception of the events and their acknowledgement, in seconds.
+        """
+
+    def on_listener_error(self, event_type: Optional[str], exception: BaseException) -> None:
+        """Called when a listener method raises an exception.
+
+        :param event_type: the type of the event being processed (e.g. `MESSAGESENT`).
+        :param exception: the raised exception.
+        """
+
+
+_NO_METRICS = BdkMetrics()
+_metrics: BdkMetrics = _NO_METRICS
+
+
+class _RegisteredMetrics(BdkMetrics):
+    """Forwards the API calls to the metrics registered at the time of the call, so that API clients report to the
+    metrics registered after their creation.
+    """
+
+    def on_api_call(self, operation_id, method, status, duration, response_size):
+        _metrics.on_api_call(operation_id, method, status, duration, response_size)
+
+
+REGISTERED_METRICS = _RegisteredMetrics()
+
+
+def get_metrics() -> BdkMetrics:
+    """Returns the registered metrics.
+
+    :return: the registered :py:class:`BdkMetrics`, a no-op instance if none was registered.
+    """
+    return _metrics
+
+
+def set_metrics(metrics: Optional[BdkMetrics]) -> None:
+    """Registers the metrics the BDK reports to.
+
+    :param metrics: the :py:class:`BdkMetrics` instance, None to stop reporting.
+    """
+    global _metrics
+    _metrics = metrics if metrics is not None else _NO_METRICS
+
+
+def is_metrics_enabled() -> bool:
+    """Checks whether metrics have been registered.
+
+    :return: True if a :py:class:`BdkMetrics` instance has been registered with :func:`set_metrics`.
+    """
+    return _metrics is not _NO_METRICS
+
+
+def measure_auth_refresh(refresh):
+    """Decorator of the `refresh` coroutine of authentication sessions, reporting the refresh to the registered
+    metrics.
+
+    :param refresh: the refresh method to be decorated.
+    :return: the decorated method.
+    """
+
+    @wraps(refresh)
+    async def measured_refresh(self, *args, **kwargs):
+        if not is_metrics_enabled():
+            return await refresh(self, *args, **kwargs)
+
+        start = time.monotonic()
+        success = False
+        try:
+            result = await refresh(self, *args, **kwargs)
+            success = True
+            return result
+        finally:
+            get_metrics().on_auth_refresh(type(self).__name__, time.monotonic() - start, success)
+
+    return measured_refresh
+
+
+class MetricSummary:
+    """Count, sum and maximum of observed values."""
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    @property
+    def average(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def __repr__(self):
+        return f"MetricSummary(count={self.count}, sum={self.sum}, max={self.max})"
+
+
+class InMemoryMetrics(BdkMetrics):
+    """Reference :py:class:`BdkMetrics` implementation keeping counters and summaries in memory.
+
+    Collected values can be read from its attributes or exported in the Prometheus text format with
+    :func:`to_prometheus_text`.
+    """
+
+    def __init__(self, prefix: str = "symphony_bdk"):
+        """
+
+        :param prefix: the prefix of the metric names when exported in the Prometheus text format.
+        """
+        self._prefix = prefix
+        self.api_calls: Dict[Tuple[Optional[str], str, str], int] = defaultdict(int)
+        self.api_call_durations: Dict[Optional[str], MetricSummary] = defaultdict(MetricSummary)
+        self.api_response_bytes: Dict[Optional[str], int] = defaultdict(int)
+        self.retries: Dict[str, int] = defaultdict(int)
+        self.auth_refreshes: Dict[Tuple[str, bool], int] = defaultdict(int)
+        self.auth_refresh_durations: Dict[str, MetricSummary] = defaultdict(MetricSummary)
+        self.datafeed_reads = MetricSummary()
+        self.datafeed_batch_sizes = MetricSummary()
+        self.datafeed_dispatches = MetricSummary()
+        self.datafeed_ack_delays = MetricSummary()
+        self.listener_errors: Dict[Optional[str], int] = defaultdict(int)
+
+    def on_api_call(self, operation_id, method, status, duration, response_size):
+        status_label = str(status) if status is not None else "none"
+        self.api_calls[(operation_id, method, status_label)] += 1
+        self.api_call_durations[operation_id].observe(duration)
+        self.api_response_bytes[operation_id] += response_size
+
+    def on_retry(self, operation, attempt_number, exception):
+        self.retries[operation] += 1
+
+    def on_auth_refresh(self, session_type, duration, success):
+        self.auth_refreshes[(session_type, success)] += 1
+        self.auth_refresh_durations[session_type].observe(duration)
+
+    def on_datafeed_read(self, duration, batch_size):
+        self.datafeed_reads.observe(duration)
+        self.datafeed_batch_sizes.observe(batch_size)
+
+    def on_datafeed_dispatch(self, duration, batch_size):
+        self.datafeed_dispatches.observe(duration)
+
+    def on_datafeed_ack(self, delay):
+        self.datafeed_ack_delays.observe(delay)
+
+    def on_listener_error(self, event_type, exception):
+        self.listener_errors[event_type] += 1
+
+    def to_prometheus_text(self) -> str:
+        """Exports the collected metrics in the Prometheus text exposition format.
+
+        :return: the metrics as text, ready to be served on a `/metrics` endpoint.
+        """
+        lines = []
+        self._counter(
+            lines,
+            "api_calls_total",
+            {
+                _labels(operation_id=o, method=m, status=s): v
+                for (o, m, s), v in self.api_calls.items()
+            },
+        )
+        self._summary(
+            lines,
+            "api_call_duration_seconds",
+            {_labels(operation_id=o): v for o, v in self.api_call_durations.items()},
+        )
+        self._counter(
+            lines,
+            "api_response_bytes_total",
+            {_labels(operation_id=o): v for o, v in self.api_response_bytes.items()},
+        )
+        self._counter(
+            lines, "retries_total", {_labels(operation=o): v for o, v in self.retries.items()}
+        )
+        self._counter(
+            lines,
+            "auth_refreshes_total",
+            {
+                _labels(session_type=t, success=str(s).lower()): v
+                for (t, s), v in self.auth_refreshes.items()
+            },
+        )
+        self._summary(
+            lines,
+            "auth_refresh_duration_seconds",
+            {_labels(session_type=t): v for t, v in self.auth_refresh_durations.items()},
+        )
+        self._summary(lines, "datafeed_read_duration_seconds", {"": self.datafeed_reads})
+        self._summary(lines, "datafeed_batch_size", {"": self.datafeed_batch_sizes})
+        self._summary(lines, "datafeed_dispatch_duration_seconds", {"": self.datafeed_dispatches})
+        self._summary(lines, "datafeed_ack_delay_seconds", {"": self.datafeed_ack_delays})
+        self._counter(
+            lines,
+            "listener_errors_total",
+            {_labels(event_type=t): v for t, v in self.listener_errors.items()},
+        )
+        return "\n".join(lines) + "\n"
+
+    def _counter(self, lines: list, name: str, values: dict) -> None:
+        name = f"{self._prefix}_{name}"
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f"{name}{labels} {value}" for labels, value in values.items())
+
+    def _summary(self, lines: list, name: str, values: dict) -> None:
+        name = f"{self._prefix}_{name}"
+        lines.append(f"# TYPE {name} summary")
+        for labels, summary in values.items():
+            lines.append(f"{name}_count{labels} {summary.count}")
+            lines.append(f"{name}_sum{labels} {summary.sum}")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items() if v is not None) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
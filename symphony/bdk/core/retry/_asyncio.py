@@ -18,6 +18,9 @@ from tenacity import (
     TryAgain,
 )
 
+from symphony.bdk.core.metrics import get_metrics, is_metrics_enabled
+from symphony.bdk.core.tracing import retry_attempt
+
 
 class AsyncRetrying(BaseRetrying):
     """This is a modified version of the tenacity.AsyncRetrying class that handles asynchronously defined retry or
@@ -70,6 +73,13 @@ class AsyncRetrying(BaseRetrying):
         self.statistics["idle_for"] += iteration_sleep
         self.statistics["attempt_number"] += 1
 
+        if is_metrics_enabled():
+            get_metrics().on_retry(
+                getattr(retry_state.fn, "__qualname__", None),
+                retry_state.attempt_number,
+                fut.exception() if fut.failed else None,
+            )
+
         if self.before_sleep is not None:
             self.before_sleep(retry_state=retry_state)
 
@@ -83,7 +93,8 @@ class AsyncRetrying(BaseRetrying):
             do = await self.iter(retry_state=retry_state)
             if isinstance(do, DoAttempt):
                 try:
-                    result = await fn(*args, **kwargs)
+                    with retry_attempt(retry_state.attempt_number):
+                        result = await fn(*args, **kwargs)
                 except BaseException:
                     retry_state.set_exception(sys.exc_info())
                 else:
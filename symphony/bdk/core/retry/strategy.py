@@ -139,3 +139,23 @@ async def read_datahose_retry(retry_state: RetryCallState):
             return True
         raise exception
     return False
+
+
+async def read_presence_feed_retry(retry_state: RetryCallState):
+    """Read presence feed retry strategy
+
+    Retry if the raised exception verifies the is_network_or_minor_error_or_client predicate
+    If this exception is a 400 client error, we recreate the presence feed
+    If this exception is a 401 unauthorized error, we refresh the current AuthSession tokens
+    """
+    if retry_state.outcome.failed:
+        exception = retry_state.outcome.exception()
+        if is_network_or_minor_error_or_client(exception):
+            presence_feed_loop = retry_state.args[0]  # a PresenceFeedLoop instance
+            if is_client_error(exception):
+                await presence_feed_loop.recreate_presence_feed()
+            elif is_unauthorized(exception):
+                await presence_feed_loop._auth_session.refresh()
+            return True
+        raise exception
+    return False
@@ -0,0 +1,117 @@
+"""This module takes care of calling an endpoint for many items, e.g. users or chunks of user ids, with a bounded number
+of concurrent calls, so that one failing item does not stop the others.
+"""
+
+import asyncio
+from asyncio import TimeoutError
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    TypeVar,
+    Union,
+)
+
+from aiohttp import ClientConnectionError
+
+from symphony.bdk.gen import ApiException
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BulkResult(Generic[T, R]):
+    """Result of a bulk operation for a single item.
+
+    * `item`: the item the call was made for,
+    * `value`: the value returned by the call, None if it failed,
+    * `error`: the exception raised once the retries were exhausted, None if the call succeeded.
+    """
+
+    def __init__(self, item: T, value: R = None, error: Exception = None):
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def is_successful(self) -> bool:
+        """True if the call succeeded for the item."""
+        return self.error is None
+
+    def __repr__(self):
+        return f"BulkResult(item={self.item}, successful={self.is_successful})"
+
+
+async def run_concurrently(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    call: Callable[[T], Awaitable[R]],
+    max_concurrency: int,
+) -> AsyncGenerator[BulkResult[T, R], None]:
+    """Calls `call` for each item, with at most `max_concurrency` concurrent calls. Items are only read when a call
+    can be made, so that very large inputs can be streamed, and results are yielded as soon as a call completes, in
+    completion order. API, connection and timeout errors are reported in the result of the item, other exceptions
+    are raised and cancel the pending calls.
+
+    :param items: an iterable or an async iterable of items.
+    :param call: a coroutine taking an item, usually retried with the retry configuration of the service.
+    :param max_concurrency: the maximum number of concurrent calls.
+    :return: an asynchronous generator of :py:class:`BulkResult`, one per item.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("Max concurrency must be strictly positive")
+
+    async def call_for_item(item):
+        try:
+            return BulkResult(item, await call(item))
+        except (ApiException, ClientConnectionError, TimeoutError) as exc:
+            return BulkResult(item, error=exc)
+
+    pending = set()
+    try:
+        async for item in _iterate(items):
+            while len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(call_for_item(item)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def chunks(
+    items: Union[Iterable[T], AsyncIterable[T]], chunk_size: int
+) -> AsyncGenerator[List[T], None]:
+    """Splits items in lists of at most `chunk_size` items, read lazily.
+
+    :param items: an iterable or an async iterable of items.
+    :param chunk_size: the maximum number of items of a chunk.
+    :return: an asynchronous generator of chunks.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be strictly positive")
+    chunk = []
+    async for item in _iterate(items):
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _iterate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncGenerator[T, None]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
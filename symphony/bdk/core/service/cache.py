@@ -0,0 +1,145 @@
+"""This module contains a size-bounded LRU cache with time-to-live expiry, used by services that want to avoid
+repeating identical calls to the Symphony APIs.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheStats:
+    """Counters of a :py:class:`LruTtlCache`, useful to size the cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of lookups answered by the cache.
+
+        :return: the ratio between 0 and 1, 0 if no lookup has been made yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"expirations={self.expirations})"
+        )
+
+
+class LruTtlCache(Generic[T]):
+    """A least-recently-used cache holding at most `max_size` entries, each of them expiring `ttl` seconds after it
+    was put in the cache.
+
+    Expiry is based on wall clock time so that entries can be persisted and reloaded across restarts.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.time):
+        """
+
+        :param max_size: the maximum number of entries. When exceeded, the least recently used entry is evicted.
+        :param ttl: the time-to-live of an entry, in seconds.
+        :param clock: the function returning the current time in seconds, mostly intended for tests.
+        """
+        if max_size <= 0:
+            raise ValueError("Cache max size must be strictly positive")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Retrieves a value and marks it as most recently used.
+
+        :param key: the key of the entry.
+        :return: the cached value, None if the key is absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def peek(self, key: Hashable) -> Optional[T]:
+        """Retrieves a value without updating the counters nor the least recently used order.
+
+        :param key: the key of the entry.
+        :return: the cached value, None if the key is absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, value: T, expires_at: float = None) -> None:
+        """Adds or replaces a value, evicting the least recently used entries if the cache is full.
+
+        :param key: the key of the entry.
+        :param value: the value to be cached.
+        :param expires_at: the expiry timestamp in seconds. Defaults to now plus the cache time-to-live.
+        """
+        if expires_at is None:
+            expires_at = self._clock() + self._ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Removes an entry from the cache.
+
+        :param key: the key of the entry.
+        :return: True if an entry was removed, False otherwise.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Removes all entries, counters are kept."""
+        self._entries.clear()
+
+    def purge_expired(self) -> int:
+        """Removes all expired entries.
+
+        :return: the number of removed entries.
+        """
+        now = self._clock()
+        expired_keys = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired_keys:
+            del self._entries[key]
+        self.stats.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def items(self) -> Iterator[Tuple[Hashable, float, T]]:
+        """Iterates over the entries which are not expired, from least to most recently used.
+        Iterating does not change the order of the entries.
+
+        :return: an iterator of `(key, expires_at, value)` tuples.
+        """
+        now = self._clock()
+        for key, (expires_at, value) in list(self._entries.items()):
+            if expires_at > now:
+                yield key, expires_at, value
@@ -0,0 +1,140 @@
+import logging
+from typing import Iterable, Optional
+
+from symphony.bdk.core.service.cache import LruTtlCache
+from symphony.bdk.core.service.connection.model.connection_status import ConnectionStatus
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.pod_model.user_connection import UserConnection
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+logger = logging.getLogger(__name__)
+
+CONNECTION_REQUESTED = "CONNECTIONREQUESTED"
+CONNECTION_ACCEPTED = "CONNECTIONACCEPTED"
+
+
+class ConnectionCache(RealTimeEventListener):
+    """Cache of the connection statuses of the bot with other users, used by the
+    :py:class:`~symphony.bdk.core.service.connection.connection_service.ConnectionService`.
+
+    Statuses are cached in a size-bounded LRU cache with time-to-live expiry, keyed by user id. The cache is filled
+    with :func:`ConnectionService.list_connections` and with the connections returned by the service calls. When
+    subscribed to the datafeed loop, it is updated from the CONNECTIONREQUESTED and CONNECTIONACCEPTED events: the
+    status of a cached connection is updated, otherwise only the status is cached, which is not enough to answer
+    :func:`~ConnectionCache.get` but answers :func:`~ConnectionCache.is_connected`.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+
+        :param max_size: the maximum number of cached connections.
+        :param ttl: the time-to-live of the entries, in seconds.
+        """
+        self._connections = LruTtlCache(max_size, ttl)
+
+    @property
+    def connections(self) -> LruTtlCache:
+        """The cache of connections, keyed by user id. Values are either connections or, when only known from the
+        datafeed events, connection statuses.
+        """
+        return self._connections
+
+    def get(self, user_id: int) -> Optional[UserConnection]:
+        """Returns the cached connection with a user.
+
+        :param user_id: the id of the user.
+        :return: the connection, None if not cached, expired or if only its status is known from the datafeed events.
+        """
+        entry = self._connections.get(user_id)
+        return entry if isinstance(entry, UserConnection) else None
+
+    def get_status(self, user_id: int) -> Optional[str]:
+        """Returns the cached status of the connection with a user.
+
+        :param user_id: the id of the user.
+        :return: the connection status, None if not cached or expired.
+        """
+        entry = self._connections.get(user_id)
+        if isinstance(entry, UserConnection):
+            return entry.get("status")
+        return entry
+
+    def is_connected(self, user_id: int) -> Optional[bool]:
+        """Checks if the bot is connected to a user without calling the pod.
+
+        :param user_id: the id of the user.
+        :return: True if the connection is accepted, False if it is not, None if the connection is not cached.
+        """
+        status = self.get_status(user_id)
+        if status is None:
+            return None
+        return status == ConnectionStatus.ACCEPTED.value
+
+    def put(self, connection: UserConnection) -> None:
+        """Caches a connection, ignored if the connection does not contain the user id."""
+        user_id = connection.get("user_id")
+        if user_id is not None:
+            self._connections.put(user_id, connection)
+
+    def put_all(self, connections: Iterable[UserConnection]) -> None:
+        """Caches connections, e.g. returned by :func:`ConnectionService.list_connections`."""
+        for connection in connections:
+            self.put(connection)
+
+    def invalidate(self, user_id: int) -> None:
+        """Removes the cached connection with a user."""
+        self._connections.invalidate(user_id)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._connections.clear()
+
+    async def is_accepting_event(self, event: V4Event, bot_info: UserV2) -> bool:
+        """Updates the cached connections from the CONNECTIONREQUESTED and CONNECTIONACCEPTED events.
+
+        The cache is updated while the event is checked, so all events are rejected: no listener task is created for
+        it.
+
+        :param event: the received event.
+        :param bot_info: the bot service account information.
+        :return: always False.
+        """
+        event_type = getattr(event, "type", None)
+        if event_type not in (CONNECTION_REQUESTED, CONNECTION_ACCEPTED) or bot_info is None:
+            return False
+        initiator = getattr(getattr(event, "initiator", None), "user", None)
+        initiator_id = getattr(initiator, "user_id", None)
+        if initiator_id is None:
+            return False
+        payload = getattr(event, "payload", None)
+        if event_type == CONNECTION_REQUESTED:
+            if initiator_id == bot_info.id:
+                to_user = getattr(getattr(payload, "connection_requested", None), "to_user", None)
+                self._put_status(
+                    getattr(to_user, "user_id", None), ConnectionStatus.PENDING_OUTGOING
+                )
+            else:
+                self._put_status(initiator_id, ConnectionStatus.PENDING_INCOMING)
+        else:
+            if initiator_id == bot_info.id:
+                from_user = getattr(
+                    getattr(payload, "connection_accepted", None), "from_user", None
+                )
+                self._put_status(getattr(from_user, "user_id", None), ConnectionStatus.ACCEPTED)
+            else:
+                self._put_status(initiator_id, ConnectionStatus.ACCEPTED)
+        return False
+
+    def _put_status(self, user_id: Optional[int], status: ConnectionStatus) -> None:
+        if user_id is None:
+            return
+        logger.debug("Connection with user %s is now %s", user_id, status.value)
+        connection = self._connections.peek(user_id)
+        if isinstance(connection, UserConnection):
+            # the cached connection may have been returned to callers already, so it is not updated in place
+            self._connections.put(
+                user_id, UserConnection(**{**connection.to_dict(), "status": status.value})
+            )
+        else:
+            self._connections.put(user_id, status.value)
@@ -1,11 +1,52 @@
+import logging
+from typing import Awaitable, Callable, Dict, Iterable
+
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.bulk import BulkResult, run_concurrently
+from symphony.bdk.core.service.connection.connection_cache import ConnectionCache
 from symphony.bdk.core.service.connection.model.connection_status import ConnectionStatus
 from symphony.bdk.gen.pod_api.connection_api import ConnectionApi
 from symphony.bdk.gen.pod_model.user_connection import UserConnection
 from symphony.bdk.gen.pod_model.user_connection_request import UserConnectionRequest
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_CONNECTION_CONCURRENCY = 10
+
+
+class BulkConnectionReport:
+    """Result of a bulk connection operation, keyed by user id.
+
+    * `connections`: the connections returned by the pod for the users processed successfully,
+    * `errors`: the exceptions raised once the retries were exhausted for the other users.
+    """
+
+    def __init__(self):
+        self.connections: Dict[int, UserConnection] = {}
+        self.errors: Dict[int, Exception] = {}
+
+    @property
+    def is_successful(self) -> bool:
+        """True if all the users have been processed successfully."""
+        return not self.errors
+
+    def add(self, result: BulkResult[int, UserConnection]) -> None:
+        """Adds the result of a single user to the report.
+
+        :param result: the result of the call made for the user.
+        """
+        if result.is_successful:
+            self.connections[result.item] = result.value
+        else:
+            self.errors[result.item] = result.error
+
+    def __repr__(self):
+        return (
+            f"BulkConnectionReport(successful={len(self.connections)}, failed={len(self.errors)})"
+        )
+
 
 class OboConnectionService:
     """Class exposing OBO-enabled endpoints for connection management.
@@ -25,6 +66,7 @@ class OboConnectionService:
         self._connection_api = connection_api
         self._auth_session = auth_session
         self._retry_config = retry_config
+        self._connection_cache = None
 
     @retry
     async def get_connection(self, user_id: int) -> UserConnection:
@@ -38,7 +80,9 @@ class OboConnectionService:
 
         """
         params = {"user_id": str(user_id), "session_token": await self._auth_session.session_token}
-        return await self._connection_api.v1_connection_user_user_id_info_get(**params)
+        return self._cache_connection(
+            await self._connection_api.v1_connection_user_user_id_info_get(**params)
+        )
 
     @retry
     async def list_connections(
@@ -64,6 +108,8 @@ class OboConnectionService:
             params["user_ids"] = ",".join(map(str, user_ids))
 
         user_connection_list = await self._connection_api.v1_connection_list_get(**params)
+        for connection in user_connection_list.value:
+            self._cache_connection(connection)
         return user_connection_list.value
 
     @retry
@@ -82,7 +128,9 @@ class OboConnectionService:
             "connection_request": user_connection_request,
             "session_token": await self._auth_session.session_token,
         }
-        return await self._connection_api.v1_connection_create_post(**params)
+        return self._cache_connection(
+            await self._connection_api.v1_connection_create_post(**params)
+        )
 
     @retry
     async def accept_connection(self, user_id: int) -> UserConnection:
@@ -100,7 +148,9 @@ class OboConnectionService:
             "connection_request": user_connection_request,
             "session_token": await self._auth_session.session_token,
         }
-        return await self._connection_api.v1_connection_accept_post(**params)
+        return self._cache_connection(
+            await self._connection_api.v1_connection_accept_post(**params)
+        )
 
     @retry
     async def reject_connection(self, user_id: int) -> UserConnection:
@@ -118,7 +168,9 @@ class OboConnectionService:
             "connection_request": user_connection_request,
             "session_token": await self._auth_session.session_token,
         }
-        return await self._connection_api.v1_connection_reject_post(**params)
+        return self._cache_connection(
+            await self._connection_api.v1_connection_reject_post(**params)
+        )
 
     @retry
     async def remove_connection(self, user_id: int) -> None:
@@ -131,6 +183,52 @@ class OboConnectionService:
         """
         params = {"uid": user_id, "session_token": await self._auth_session.session_token}
         await self._connection_api.v1_connection_user_uid_remove_post(**params)
+        if self._connection_cache is not None:
+            self._connection_cache.invalidate(user_id)
+
+    async def bulk_accept_connections(
+        self, user_ids: Iterable[int], max_concurrency: int = DEFAULT_BULK_CONNECTION_CONCURRENCY
+    ) -> BulkConnectionReport:
+        """Accepts the connection requests of many users, e.g. received as CONNECTIONREQUESTED events by an onboarding
+        bot. Each request is accepted with :func:`~OboConnectionService.accept_connection`, and thus retried with
+        the retry configuration of the service, with at most `max_concurrency` concurrent calls.
+
+        :param user_ids: the ids of the users who requested to connect with the caller, duplicates are ignored.
+        :param max_concurrency: the maximum number of requests accepted concurrently.
+        :return: a :py:class:`BulkConnectionReport` with the connection or the error of each user.
+        """
+        return await self._bulk_call(self.accept_connection, user_ids, max_concurrency)
+
+    async def bulk_create_connections(
+        self, user_ids: Iterable[int], max_concurrency: int = DEFAULT_BULK_CONNECTION_CONCURRENCY
+    ) -> BulkConnectionReport:
+        """Sends connection requests to many users. Each request is sent with
+        :func:`~OboConnectionService.create_connection`, and thus retried with the retry configuration of the
+        service, with at most `max_concurrency` concurrent calls.
+
+        :param user_ids: the ids of the users with whom the caller wants to connect, duplicates are ignored.
+        :param max_concurrency: the maximum number of requests sent concurrently.
+        :return: a :py:class:`BulkConnectionReport` with the connection or the error of each user.
+        """
+        return await self._bulk_call(self.create_connection, user_ids, max_concurrency)
+
+    async def _bulk_call(
+        self,
+        call: Callable[[int], Awaitable[UserConnection]],
+        user_ids: Iterable[int],
+        max_concurrency: int,
+    ) -> BulkConnectionReport:
+        report = BulkConnectionReport()
+        async for result in run_concurrently(dict.fromkeys(user_ids), call, max_concurrency):
+            if not result.is_successful:
+                logger.warning("Connection call failed for user %s: %s", result.item, result.error)
+            report.add(result)
+        return report
+
+    def _cache_connection(self, connection: UserConnection) -> UserConnection:
+        if self._connection_cache is not None and connection is not None:
+            self._connection_cache.put(connection)
+        return connection
 
 
 class ConnectionService(OboConnectionService):
@@ -143,4 +241,53 @@ class ConnectionService(OboConnectionService):
     * Accept a connection request from a user
     * Reject a connection request from a user
     * Remove a connection with a user
+
+    If a :py:class:`~symphony.bdk.core.service.connection.connection_cache.ConnectionCache` is given, connections are
+    served from it when possible.
     """
+
+    def __init__(
+        self,
+        connection_api: ConnectionApi,
+        auth_session: AuthSession,
+        retry_config: BdkRetryConfig,
+        connection_cache: ConnectionCache = None,
+    ):
+        super().__init__(connection_api, auth_session, retry_config)
+        self._connection_cache = connection_cache
+
+    @property
+    def connection_cache(self) -> ConnectionCache:
+        """The connection cache used by this service.
+
+        :return: the :py:class:`ConnectionCache` instance, None if the cache is not enabled.
+        """
+        return self._connection_cache
+
+    async def warm_up_connection_cache(self) -> int:
+        """Fills the connection cache with all the connections of the bot, using :func:`~list_connections`.
+        Does nothing if the cache is not enabled.
+
+        :return: the number of cached connections.
+        """
+        if self._connection_cache is None:
+            return 0
+        return len(await self.list_connections(ConnectionStatus.ALL))
+
+    async def get_connection(self, user_id: int) -> UserConnection:
+        """
+        Get connection status, i.e. check if the calling user is connected to the specified user.
+        If the connection cache is enabled, a cached connection is returned without calling the pod, unless only its
+        status is known from the datafeed events.
+        See: `Get Connection <https://developers.symphony.com/restapi/reference/get-connection>`_
+
+        :param user_id: The id of the user with whom the caller want to check.
+
+        :return: Connection status with the specified user.
+
+        """
+        if self._connection_cache is not None:
+            connection = self._connection_cache.get(user_id)
+            if connection is not None:
+                return connection
+        return await super().get_connection(user_id)
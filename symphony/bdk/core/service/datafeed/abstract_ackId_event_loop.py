@@ -1,10 +1,15 @@
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
-from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop
+from symphony.bdk.core.metrics import get_metrics
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import (
+    WORKER_POOL_DISPATCH_TASK_NAME,
+    AbstractDatafeedLoop,
+)
 from symphony.bdk.core.service.datafeed.exception import EventError
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
@@ -33,20 +38,49 @@ class AbstractAckIdEventLoop(AbstractDatafeedLoop, ABC):
         """
         super().__init__(datafeed_api, session_service, auth_session, config)
         self._ack_id = ""
+        self._early_ack = False
+        self._max_pending_tasks = config.datafeed.max_pending_tasks
 
     async def _run_loop_iteration(self):
+        await self._wait_for_pending_tasks_below_limit()
+
+        start = time.monotonic()
         events = await self._read_events()
+        received_at = time.monotonic()
+        get_metrics().on_datafeed_read(received_at - start, len(events.events or []))
+
+        if self._early_ack:
+            # events are acknowledged as soon as handed to the listener tasks, whose outcome is only logged,
+            # but only once the worker pool, if any, reported the outcome of the events
+            worker_pool_tasks = []
+            for task in await self._create_listener_tasks(events.events):
+                if task.get_name() == WORKER_POOL_DISPATCH_TASK_NAME:
+                    worker_pool_tasks.append(task)
+                else:
+                    self._track_background_task(task)
+            done_tasks = (await asyncio.wait(worker_pool_tasks))[0] if worker_pool_tasks else []
+            # the dispatch only covers handing the events over, the listener tasks running in the background
+            get_metrics().on_datafeed_dispatch(
+                time.monotonic() - received_at, len(events.events or [])
+            )
+            if not await self._are_tasks_successful(done_tasks):
+                return
+            self._ack_id = events.ack_id
+            get_metrics().on_datafeed_ack(time.monotonic() - received_at)
+            return
 
         is_run_successful = await self._run_all_listener_tasks(events.events)
         if is_run_successful:
             # updates ack id so that on next call DFv2 knows that events have been processed
             # if not updated, events will be requeued after some time, typically 30s
             self._ack_id = events.ack_id
+            get_metrics().on_datafeed_ack(time.monotonic() - received_at)
 
     async def _run_all_listener_tasks(self, events):
-        start = time.time()
+        start = time.monotonic()
         done_tasks = await self._run_listener_tasks(events)
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
+        get_metrics().on_datafeed_dispatch(elapsed, len(events or []))
 
         if elapsed > EVENT_PROCESSING_MAX_DURATION_SECONDS:
             logging.warning(
@@ -58,6 +92,14 @@ class AbstractAckIdEventLoop(AbstractDatafeedLoop, ABC):
 
         return await self._are_tasks_successful(done_tasks)
 
+    async def _wait_for_pending_tasks_below_limit(self):
+        while len(self._background_tasks) >= self._max_pending_tasks:
+            logger.debug(
+                "%s listener tasks still running, waiting before reading more events",
+                len(self._background_tasks),
+            )
+            await asyncio.wait(self._background_tasks, return_when=asyncio.FIRST_COMPLETED)
+
     async def _are_tasks_successful(self, tasks):
         success = True
         for task in tasks:
@@ -6,18 +6,31 @@ from abc import ABC, abstractmethod
 from asyncio import Task
 from contextvars import ContextVar
 from enum import Enum
-from typing import List
+from typing import Coroutine, List, Optional
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
+from symphony.bdk.core.metrics import get_metrics
+from symphony.bdk.core.service.datafeed.exception import EventError
 from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.datafeed.watchdog import DatafeedWatchdog
 from symphony.bdk.core.service.session.session_service import SessionService
+from symphony.bdk.core.tracing import (
+    DATAFEED_DISPATCH_SPAN_NAME,
+    EVENT_ID,
+    EVENT_TYPE,
+    LISTENER,
+    get_tracer,
+)
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
 from symphony.bdk.gen.agent_model.v4_event import V4Event
 
 logger = logging.getLogger(__name__)
 
+WORKER_POOL_DISPATCH_TASK_NAME = "worker-pool-dispatch"
+
 event_listener_context = ContextVar("event_listener_context", default="main-task")
+_dispatch_context = ContextVar("_dispatch_context", default=None)
 
 
 class DatafeedVersion(Enum):
@@ -63,6 +76,26 @@ def _set_context_var(current_task, event, listener):
     event_listener_context.set(f"{current_task.get_name()}/{event_id}/{id(listener)}")
 
 
+def defer(coroutine: Coroutine) -> Task:
+    """Runs a coroutine in a background task, so that the listener method calling this function can return
+    immediately. This is meant for long running processing which would otherwise delay the acknowledgement of the
+    events, and cause their redelivery.
+
+    The acknowledgement of the events does not wait for deferred tasks: an :py:class:`EventError` raised by a deferred
+    task will not cause the events to be re-queued, it has to be raised by the listener method itself. Deferred tasks
+    are awaited, or cancelled in case of hard kill, when the datafeed loop stops.
+
+    :param coroutine: the coroutine to run in background.
+    :return: the task running the coroutine.
+    """
+    dispatch_context = _dispatch_context.get()
+    if dispatch_context is None:
+        coroutine.close()
+        raise RuntimeError("defer can only be called while processing a datafeed event")
+    datafeed_loop, event = dispatch_context
+    return datafeed_loop._defer(coroutine, event)
+
+
 class AbstractDatafeedLoop(ABC):
     """Base class for implementing the datafeed services.
 
@@ -93,8 +126,30 @@ class AbstractDatafeedLoop(ABC):
         self._hard_kill = False
         self._timeout = None
         self._tasks = []
+        self._background_tasks = set()
         self._retry_config = config.datafeed.retry
         self._bot_info = None
+        self._watchdog = DatafeedWatchdog(config.watchdog) if config.watchdog.enabled else None
+        self._worker_pool = None
+
+    @property
+    def watchdog(self) -> Optional[DatafeedWatchdog]:
+        """The watchdog of the event loop lag and of the listener tasks runtime.
+
+        :return: the :py:class:`~symphony.bdk.core.service.datafeed.watchdog.DatafeedWatchdog`, None if it is not
+          enabled in the configuration.
+        """
+        return self._watchdog
+
+    def use_worker_pool(self, worker_pool) -> None:
+        """Makes the loop dispatch the received events to a pool of worker processes, in addition to the listeners
+        subscribed to the loop. Must be called before the loop is started. The events are acknowledged once the
+        workers reported their outcome, even when the loop acknowledges the events early.
+
+        :param worker_pool: the :py:class:`~symphony.bdk.core.service.datafeed.worker_pool.DatafeedWorkerPool`
+          running the listeners in worker processes.
+        """
+        self._worker_pool = worker_pool
 
     @abstractmethod
     async def start(self):
@@ -102,10 +157,18 @@ class AbstractDatafeedLoop(ABC):
 
         :return: None
         """
+        if self._watchdog is not None:
+            self._watchdog.start()
+        if self._worker_pool is not None:
+            self._worker_pool.start(self._bot_info)
         try:
             await self._run_loop()
         finally:
             await self._stop_listener_tasks()
+            if self._worker_pool is not None:
+                await self._worker_pool.stop(cancel_pending=self._hard_kill)
+            if self._watchdog is not None:
+                await self._watchdog.stop()
 
     async def stop(self, hard_kill: bool = False, timeout: float = None):
         """Stop the datafeed event service
@@ -154,18 +217,64 @@ class AbstractDatafeedLoop(ABC):
             await self._wait_for_completion_or_timeout()
 
     async def _cancel_tasks(self):
-        logger.debug("Cancelling %s listener tasks", len(self._tasks))
-        for task in self._tasks:
+        tasks = [*self._tasks, *self._background_tasks]
+        logger.debug("Cancelling %s listener tasks", len(tasks))
+        for task in tasks:
             task.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _wait_for_completion_or_timeout(self):
-        logger.debug("Waiting for %s listener tasks to finish", len(self._tasks))
+        logger.debug(
+            "Waiting for %s listener tasks to finish",
+            len(self._tasks) + len(self._background_tasks),
+        )
         try:
-            await asyncio.wait_for(asyncio.gather(*self._tasks), timeout=self._timeout)
+            await asyncio.wait_for(
+                asyncio.gather(
+                    asyncio.gather(*self._tasks),
+                    asyncio.gather(*self._background_tasks, return_exceptions=True),
+                ),
+                timeout=self._timeout,
+            )
         except asyncio.TimeoutError:
             logger.debug("Task completion timed out")
 
+    def _defer(self, coroutine: Coroutine, event: V4Event) -> Task:
+        async def run_deferred():
+            try:
+                return await coroutine
+            except Exception as exc:
+                get_metrics().on_listener_error(getattr(event, "type", None), exc)
+                raise
+
+        task = asyncio.create_task(
+            run_deferred(), name=f"{asyncio.current_task().get_name()}-deferred"
+        )
+        self._track_background_task(task)
+        return task
+
+    def _track_background_task(self, task: Task) -> None:
+        """Keeps track of a task whose outcome does not condition the acknowledgement of the events, so that it is
+        awaited when the loop stops and its exception, if any, is logged.
+        """
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _on_background_task_done(self, task: Task) -> None:
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if isinstance(exception, EventError):
+            logger.warning(
+                "Failed to process events inside %s, events have already been acknowledged "
+                "and will not be re-queued",
+                task.get_name(),
+                exc_info=exception,
+            )
+        elif exception:
+            logger.debug("Exception occurred inside %s", task.get_name(), exc_info=exception)
+
     async def _run_listener_tasks(self, events: List[V4Event]) -> List[Task]:
         tasks = await self._create_listener_tasks(events)
         if tasks:
@@ -183,17 +292,44 @@ class AbstractDatafeedLoop(ABC):
                     task = asyncio.create_task(self._dispatch_to_listener_method(listener, event))
                     tasks.append(task)
 
+        if self._worker_pool is not None and events:
+            # raises an EventError if events failed to be processed in the worker processes
+            tasks.append(
+                asyncio.create_task(
+                    self._worker_pool.dispatch([e for e in events if e is not None]),
+                    name=WORKER_POOL_DISPATCH_TASK_NAME,
+                )
+            )
+
         return tasks
 
     async def _dispatch_to_listener_method(self, listener: RealTimeEventListener, event: V4Event):
         current_task = asyncio.current_task()
         _set_context_var(current_task, event, listener)
+        _dispatch_context.set((self, event))
 
         self._tasks.append(current_task)
+        if self._watchdog is not None:
+            self._watchdog.task_started(event_listener_context.get(), listener, event)
+        tracer = get_tracer()
         try:
-            await self._run_listener_method(listener, event)
+            if tracer is None:
+                await self._run_listener_method(listener, event)
+            else:
+                attributes = {
+                    EVENT_TYPE: getattr(event, "type", None),
+                    EVENT_ID: getattr(event, "id", None),
+                    LISTENER: type(listener).__qualname__,
+                }
+                with tracer.start_span(DATAFEED_DISPATCH_SPAN_NAME, attributes):
+                    await self._run_listener_method(listener, event)
+        except Exception as exc:
+            get_metrics().on_listener_error(getattr(event, "type", None), exc)
+            raise
         finally:
             self._tasks.remove(current_task)
+            if self._watchdog is not None:
+                self._watchdog.task_finished(event_listener_context.get())
 
     @staticmethod
     async def _run_listener_method(listener: RealTimeEventListener, event: V4Event):
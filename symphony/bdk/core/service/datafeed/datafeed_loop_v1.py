@@ -1,5 +1,7 @@
 import logging
+import time
 
+from symphony.bdk.core.metrics import get_metrics
 from symphony.bdk.core.retry import retry
 from symphony.bdk.core.retry.strategy import read_datafeed_retry
 from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop
@@ -69,8 +71,13 @@ class DatafeedLoopV1(AbstractDatafeedLoop):
         self._datafeed_id = datafeed_id
 
     async def _run_loop_iteration(self):
+        start = time.monotonic()
         events = await self._read_datafeed()
+        received_at = time.monotonic()
+        get_metrics().on_datafeed_read(received_at - start, len(events))
+
         done_tasks = await self._run_listener_tasks(events)
+        get_metrics().on_datafeed_dispatch(time.monotonic() - received_at, len(events))
         for future in done_tasks:
             await self._log_listener_exception(future)
 
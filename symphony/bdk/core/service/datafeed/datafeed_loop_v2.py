@@ -48,6 +48,7 @@ class DatafeedLoopV2(AbstractAckIdEventLoop):
     ):
         super().__init__(datafeed_api, session_service, auth_session, config)
         self._datafeed_id = None
+        self._early_ack = config.datafeed.early_ack
 
     async def start(self):
         if self._running:
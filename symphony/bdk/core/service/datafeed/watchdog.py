@@ -0,0 +1,179 @@
+"""Module containing the watchdog of the datafeed loops, which detects blocked event loops and slow listeners."""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from symphony.bdk.core.config.model.bdk_watchdog_config import BdkWatchdogConfig
+from symphony.bdk.core.metrics import MetricSummary
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+
+logger = logging.getLogger(__name__)
+
+
+class ListenerTaskInfo:
+    """A listener task currently processing an event."""
+
+    def __init__(self, label: str, listener: str, event_type: Optional[str]):
+        """
+
+        :param label: the `event_listener_context` label of the task, as found in the logs.
+        :param listener: the qualified class name of the listener.
+        :param event_type: the type of the processed event (e.g. `MESSAGESENT`).
+        """
+        self.label = label
+        self.listener = listener
+        self.event_type = event_type
+        self.started_at = time.monotonic()
+        self.over_budget = False
+
+    @property
+    def elapsed(self) -> float:
+        """The time elapsed since the task started processing the event, in seconds."""
+        return time.monotonic() - self.started_at
+
+    def __repr__(self):
+        return (
+            f"ListenerTaskInfo(label={self.label!r}, listener={self.listener!r}, "
+            f"event_type={self.event_type!r}, elapsed={self.elapsed:.3f})"
+        )
+
+
+class DatafeedWatchdog:
+    """Watches the listener tasks of a datafeed loop and the event loop running them.
+
+    While the datafeed loop is running, the event loop lag is sampled periodically: a lag above the configured
+    threshold means that some code blocked the event loop, typically synchronous code in a listener. At each sample,
+    listener tasks running for longer than their budget are flagged and logged while still running, so that slow
+    listeners are identified before the events they are processing are re-queued.
+    """
+
+    def __init__(self, config: BdkWatchdogConfig):
+        """
+
+        :param config: the watchdog configuration.
+        """
+        self._listener_budget = config.listener_budget
+        self._lag_threshold = config.lag_threshold
+        self._sampling_interval = config.sampling_interval
+        self._running_tasks: Dict[str, ListenerTaskInfo] = {}
+        self._sampling_task = None
+        self.event_loop_lag = MetricSummary()
+        self.blocked_samples = 0
+        self.listener_runtimes: Dict[str, MetricSummary] = defaultdict(MetricSummary)
+        self.over_budget_tasks: Dict[str, int] = defaultdict(int)
+
+    def start(self) -> None:
+        """Starts sampling the event loop lag, in a background task. Does nothing if already started."""
+        if self._sampling_task is None or self._sampling_task.done():
+            self._sampling_task = asyncio.create_task(self._sample_periodically())
+
+    async def stop(self) -> None:
+        """Stops sampling the event loop lag and logs the collected statistics."""
+        if self._sampling_task is not None:
+            self._sampling_task.cancel()
+            await asyncio.gather(self._sampling_task, return_exceptions=True)
+            self._sampling_task = None
+        logger.info("Datafeed watchdog statistics: %s", self.get_stats())
+
+    def task_started(self, label: str, listener: RealTimeEventListener, event: V4Event) -> None:
+        """Called when a listener task starts processing an event.
+
+        :param label: the `event_listener_context` label of the task.
+        :param listener: the listener processing the event.
+        :param event: the processed event.
+        """
+        self._running_tasks[label] = ListenerTaskInfo(
+            label, type(listener).__qualname__, getattr(event, "type", None)
+        )
+
+    def task_finished(self, label: str) -> None:
+        """Called when a listener task is done processing an event, whatever the outcome.
+
+        :param label: the `event_listener_context` label of the task.
+        """
+        task_info = self._running_tasks.pop(label, None)
+        if task_info is not None:
+            elapsed = task_info.elapsed
+            self.listener_runtimes[task_info.listener].observe(elapsed)
+            if elapsed > self._listener_budget and not task_info.over_budget:
+                self._flag_over_budget(task_info, elapsed)
+
+    def running_tasks(self) -> List[ListenerTaskInfo]:
+        """Returns the listener tasks currently processing an event, the longest running first.
+
+        :return: the list of running tasks.
+        """
+        return sorted(self._running_tasks.values(), key=lambda task_info: task_info.started_at)
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the collected statistics.
+
+        :return: a dict with the event loop lag, the runtime of each listener, the number of tasks which exceeded the
+          listener budget per listener and the currently running tasks.
+        """
+        return {
+            "event_loop_lag": _summary_stats(self.event_loop_lag),
+            "blocked_samples": self.blocked_samples,
+            "listener_runtimes": {
+                listener: _summary_stats(summary)
+                for listener, summary in self.listener_runtimes.items()
+            },
+            "over_budget_tasks": dict(self.over_budget_tasks),
+            "running_tasks": [
+                {
+                    "label": task_info.label,
+                    "listener": task_info.listener,
+                    "event_type": task_info.event_type,
+                    "elapsed": task_info.elapsed,
+                }
+                for task_info in self.running_tasks()
+            ],
+        }
+
+    async def _sample_periodically(self):
+        while True:
+            expected = time.monotonic() + self._sampling_interval
+            await asyncio.sleep(self._sampling_interval)
+            self._record_lag(max(0.0, time.monotonic() - expected))
+            self._check_running_tasks()
+
+    def _record_lag(self, lag: float) -> None:
+        self.event_loop_lag.observe(lag)
+        if lag > self._lag_threshold:
+            self.blocked_samples += 1
+            logger.warning(
+                "Event loop was blocked for %.3f seconds, running listener tasks: %s. "
+                "Make sure listeners do not run blocking code, or run it in an executor.",
+                lag,
+                [task_info.label for task_info in self.running_tasks()],
+            )
+
+    def _check_running_tasks(self) -> None:
+        for task_info in self.running_tasks():
+            elapsed = task_info.elapsed
+            if elapsed > self._listener_budget and not task_info.over_budget:
+                self._flag_over_budget(task_info, elapsed)
+
+    def _flag_over_budget(self, task_info: ListenerTaskInfo, elapsed: float) -> None:
+        task_info.over_budget = True
+        self.over_budget_tasks[task_info.listener] += 1
+        logger.warning(
+            "Listener %s has been processing event %s in %s for %.3f seconds, over the budget of %s seconds",
+            task_info.listener,
+            task_info.event_type,
+            task_info.label,
+            elapsed,
+            self._listener_budget,
+        )
+
+
+def _summary_stats(summary: MetricSummary) -> dict:
+    return {
+        "count": summary.count,
+        "average": summary.average,
+        "max": summary.max,
+    }
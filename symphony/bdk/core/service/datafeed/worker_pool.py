@@ -0,0 +1,233 @@
+"""Module containing the pool of worker processes which datafeed loops can dispatch events to, in order to run
+CPU-heavy listeners on several cores.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Callable, List, Optional
+
+from symphony.bdk.core.metrics import get_metrics
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import (
+    AbstractDatafeedLoop,
+    _set_context_var,
+)
+from symphony.bdk.core.service.datafeed.exception import EventError
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.model_utils import model_to_dict, validate_and_convert_types
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerListenerError(Exception):
+    """Exception raised by a listener in a worker process, as reported to the reader process."""
+
+    def __init__(self, event_type: Optional[str], listener: str, message: str):
+        super().__init__(f"{listener} failed to process {event_type} event: {message}")
+        self.event_type = event_type
+        self.listener = listener
+
+
+class DatafeedWorkerPool:
+    """Pool of worker processes running the listeners of a datafeed loop.
+
+    The datafeed loop keeps reading events and managing the ack id in its own process, and hands the events, serialized
+    in JSON, to the worker processes. Each worker process creates its own listeners by calling the listeners factory
+    once, and runs them on its own event loop. The events of a batch are acknowledged once all the workers reported
+    their outcome: if a listener raised an :py:class:`EventError`, the events are not acknowledged and will be
+    re-queued, as for listeners running in the reader process.
+
+    Worker processes are started with the `spawn` method by default: the listeners factory must therefore be
+    picklable, for instance a module level function or a :py:func:`functools.partial` of it.
+    """
+
+    def __init__(
+        self,
+        listeners_factory: Callable[[], List[RealTimeEventListener]],
+        processes: int = None,
+        events_per_task: int = 10,
+        mp_context=None,
+    ):
+        """
+
+        :param listeners_factory: the function called in each worker process to create the listeners. It can be a
+          coroutine function, in which case it is awaited on the event loop of the worker.
+        :param processes: the number of worker processes, the number of CPUs by default.
+        :param events_per_task: the maximum number of events sent to a worker at once.
+        :param mp_context: the multiprocessing context used to start the worker processes, `spawn` by default.
+        """
+        self._listeners_factory = listeners_factory
+        self._processes = processes
+        self._events_per_task = events_per_task
+        self._mp_context = (
+            mp_context if mp_context is not None else multiprocessing.get_context("spawn")
+        )
+        self._serialized_bot_info = None
+        self._executor = None
+
+    def start(self, bot_info: Optional[UserV2] = None) -> None:
+        """Starts the worker processes. Called by the datafeed loop when it starts.
+
+        :param bot_info: the session of the bot, passed to the `is_accepting_event` method of the listeners.
+        """
+        self._serialized_bot_info = (
+            json.dumps(model_to_dict(bot_info, serialize=True)) if bot_info is not None else None
+        )
+        self._executor = self._create_executor()
+
+    async def stop(self, cancel_pending: bool = False) -> None:
+        """Stops the worker processes, once the events they are processing are done. Called by the datafeed loop when
+        it stops.
+
+        :param cancel_pending: if True, events not yet handed to a worker process are dropped.
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(executor.shutdown, wait=True, cancel_futures=cancel_pending)
+            )
+
+    async def dispatch(self, events: List[V4Event]) -> None:
+        """Dispatches events to the worker processes and waits for the listeners to process them.
+
+        :param events: the events to be processed.
+        :raise EventError: if a listener raised an :py:class:`EventError` or if a worker process died.
+        """
+        if self._executor is None:
+            raise RuntimeError("The worker pool is not started")
+
+        serialized_events = [json.dumps(model_to_dict(event, serialize=True)) for event in events]
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _process_events,
+                    "[" + ",".join(serialized_events[i : i + self._events_per_task]) + "]",
+                )
+                for i in range(0, len(serialized_events), self._events_per_task)
+            ),
+            return_exceptions=True,
+        )
+
+        failed = False
+        for result in results:
+            if isinstance(result, BrokenProcessPool):
+                logger.error(
+                    "A worker process died, events will not be acknowledged", exc_info=result
+                )
+                failed = True
+                if executor is self._executor:
+                    self._executor = self._create_executor()
+                    executor = self._executor
+            elif isinstance(result, BaseException):
+                logger.error("Failed to dispatch events to the worker processes", exc_info=result)
+                failed = True
+            else:
+                failed = self._handle_listener_errors(result) or failed
+
+        if failed:
+            raise EventError("Events processing failed in the worker processes")
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=self._mp_context,
+            initializer=_initialize_worker,
+            initargs=(self._listeners_factory, self._serialized_bot_info),
+        )
+
+    @staticmethod
+    def _handle_listener_errors(listener_errors: list) -> bool:
+        failed = False
+        for event_type, listener, is_event_error, message in listener_errors:
+            exception = WorkerListenerError(event_type, listener, message)
+            get_metrics().on_listener_error(event_type, exception)
+            if is_event_error:
+                logger.warning(
+                    "Failed to process events in a worker process, will not update ack id, "
+                    "events will be re-queued: %s",
+                    exception,
+                )
+                failed = True
+            else:
+                logger.debug("Exception occurred in a worker process: %s", exception)
+        return failed
+
+
+class _WorkerState:
+    def __init__(self, loop, listeners, bot_info, configuration):
+        self.loop = loop
+        self.listeners = listeners
+        self.bot_info = bot_info
+        self.configuration = configuration
+
+
+_worker_state: Optional[_WorkerState] = None
+
+
+def _initialize_worker(listeners_factory, serialized_bot_info):
+    global _worker_state
+    configuration = Configuration(discard_unknown_keys=True)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    listeners = listeners_factory()
+    if asyncio.iscoroutine(listeners):
+        listeners = loop.run_until_complete(listeners)
+    bot_info = (
+        _deserialize(json.loads(serialized_bot_info), UserV2, configuration)
+        if serialized_bot_info is not None
+        else None
+    )
+    _worker_state = _WorkerState(loop, listeners, bot_info, configuration)
+
+
+def _process_events(serialized_events: str) -> list:
+    state = _worker_state
+    events = [
+        _deserialize(event, V4Event, state.configuration) for event in json.loads(serialized_events)
+    ]
+    return state.loop.run_until_complete(_run_listeners(state, events))
+
+
+async def _run_listeners(state: _WorkerState, events: List[V4Event]) -> list:
+    tasks = []
+    for event in events:
+        for listener in state.listeners:
+            if await listener.is_accepting_event(event, state.bot_info):
+                tasks.append((event, listener, asyncio.create_task(_run_listener(listener, event))))
+    if tasks:
+        await asyncio.wait([task for _, _, task in tasks])
+
+    listener_errors = []
+    for event, listener, task in tasks:
+        exception = task.exception()
+        if exception is not None:
+            listener_errors.append(
+                (
+                    event.type,
+                    type(listener).__qualname__,
+                    isinstance(exception, EventError),
+                    repr(exception),
+                )
+            )
+    return listener_errors
+
+
+async def _run_listener(listener: RealTimeEventListener, event: V4Event):
+    _set_context_var(asyncio.current_task(), event, listener)
+    await AbstractDatafeedLoop._run_listener_method(listener, event)
+
+
+def _deserialize(data, model_class, configuration):
+    return validate_and_convert_types(
+        data, (model_class,), ["received_data"], True, True, configuration=configuration
+    )
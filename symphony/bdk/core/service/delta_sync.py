@@ -0,0 +1,185 @@
+"""This module contains a helper to mirror paginated listings, such as users or groups, into a local directory by
+emitting only the objects added, changed or removed since the previous run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterable, Callable, Dict, Generic, List, TypeVar
+
+from symphony.bdk.gen.api_client import ApiClient
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+T = TypeVar("T")
+
+
+def content_fingerprint(obj) -> str:
+    """Computes a fingerprint of the whole content of an object.
+
+    :param obj: a generated model instance, or any JSON serializable object.
+    :return: a digest of the JSON serialization of the object, with sorted keys.
+    """
+    serialized = json.dumps(
+        ApiClient.sanitize_for_serialization(obj), sort_keys=True, default=str
+    ).encode("utf-8")
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+
+class SnapshotStore(ABC):
+    """Stores the fingerprints of the objects seen by the last run of a :py:class:`DeltaSync`."""
+
+    @abstractmethod
+    def load(self) -> Dict[str, str]:
+        """Loads the fingerprints saved by the last run.
+
+        :return: the fingerprints keyed by object key, empty if nothing has been saved yet.
+        """
+
+    @abstractmethod
+    def save(self, fingerprints: Dict[str, str]) -> None:
+        """Saves the fingerprints of the current run, replacing the previous ones.
+
+        :param fingerprints: the fingerprints keyed by object key.
+        """
+
+    def commit(self, result: "DeltaSyncResult") -> None:
+        """Saves the fingerprints of a run once its changes have been applied, so that the next run is computed from
+        them. Until then, the next run reports the same changes again.
+
+        :param result: the result returned by :func:`DeltaSync.sync`.
+        """
+        self.save(result.fingerprints)
+
+
+class InMemorySnapshotStore(SnapshotStore):
+    """Keeps the fingerprints in memory, e.g. for a sync running periodically in the same process."""
+
+    def __init__(self):
+        self._fingerprints = {}
+
+    def load(self) -> Dict[str, str]:
+        return dict(self._fingerprints)
+
+    def save(self, fingerprints: Dict[str, str]) -> None:
+        self._fingerprints = dict(fingerprints)
+
+
+class FileSnapshotStore(SnapshotStore):
+    """Persists the fingerprints to a JSON file, replaced atomically at each save."""
+
+    def __init__(self, file_path: Path):
+        """
+
+        :param file_path: the path of the snapshot file.
+        """
+        self._file_path = Path(file_path)
+
+    def load(self) -> Dict[str, str]:
+        if not self._file_path.exists():
+            return {}
+        try:
+            snapshot = json.loads(self._file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning(
+                "Could not read snapshot %s, all objects will be considered as added",
+                self._file_path,
+                exc_info=True,
+            )
+            return {}
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning("Unsupported snapshot version in %s, ignoring it", self._file_path)
+            return {}
+        return snapshot.get("fingerprints", {})
+
+    def save(self, fingerprints: Dict[str, str]) -> None:
+        tmp_file_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        tmp_file_path.write_text(
+            json.dumps({"version": SNAPSHOT_VERSION, "fingerprints": fingerprints}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file_path, self._file_path)
+
+
+class DeltaSyncResult(Generic[T]):
+    """Objects added, changed or removed since the previous run of a :py:class:`DeltaSync`.
+
+    Removed objects are given by their key as stored in the snapshot, i.e. converted to a string. The fingerprints of
+    all the listed objects are kept to be saved with :func:`SnapshotStore.commit`.
+    """
+
+    def __init__(self):
+        self.added: List[T] = []
+        self.changed: List[T] = []
+        self.removed: List[str] = []
+        self.unchanged = 0
+        self.fingerprints: Dict[str, str] = {}
+
+    @property
+    def has_changes(self) -> bool:
+        """True if objects have been added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self):
+        return (
+            f"DeltaSyncResult(added={len(self.added)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)}, unchanged={self.unchanged})"
+        )
+
+
+class DeltaSync(Generic[T]):
+    """Compares the objects of a listing to the fingerprints saved by the previous run.
+
+    Each object is identified by a key and summarized by a fingerprint: objects whose key was not in the snapshot are
+    added, objects whose fingerprint differs are changed and keys of the snapshot which are not listed anymore are
+    removed. The snapshot is not replaced by the run: once the changes have been applied, the caller commits them with
+    :func:`SnapshotStore.commit`. A run which is interrupted, or whose changes fail to be applied, is simply run again
+    and reports the same changes.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        key: Callable[[T], object],
+        fingerprint: Callable[[T], str] = content_fingerprint,
+    ):
+        """
+
+        :param store: the store of the snapshot.
+        :param key: returns the unique key of an object, e.g. its id.
+        :param fingerprint: returns a string which changes whenever the object changes, e.g. an eTag or a last update
+          date. By default, a digest of the whole object is computed.
+        """
+        self._store = store
+        self._key = key
+        self._fingerprint = fingerprint
+
+    async def sync(self, objects: AsyncIterable[T]) -> DeltaSyncResult[T]:
+        """Walks the listing and computes the changes since the last committed run.
+
+        :param objects: the listing, e.g. the async generator returned by a ``list_all_*`` method.
+        :return: the objects added, changed and the keys of the objects removed since the last committed run, to be
+          committed with :func:`SnapshotStore.commit` once applied.
+        """
+        previous = self._store.load()
+        result = DeltaSyncResult()
+        current = result.fingerprints
+        async for obj in objects:
+            key = str(self._key(obj))
+            fingerprint = self._fingerprint(obj)
+            current[key] = fingerprint
+            previous_fingerprint = previous.get(key)
+            if previous_fingerprint is None:
+                result.added.append(obj)
+            elif previous_fingerprint != fingerprint:
+                result.changed.append(obj)
+            else:
+                result.unchanged += 1
+        result.removed = [key for key in previous if key not in current]
+        logger.debug("Delta sync done: %s", result)
+        return result
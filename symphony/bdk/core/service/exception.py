@@ -7,3 +7,9 @@ class MessageParserError(Exception):
 
 class MessageCreationError(Exception):
     """Raised when a :py:class:`~symphony.bdk.core.service.message.model.Message` failed to be created"""
+
+
+class SendQueueClosedError(Exception):
+    """Raised when a message is queued in a closed
+    :py:class:`~symphony.bdk.core.service.message.send_queue.MessageSendQueue`
+    """
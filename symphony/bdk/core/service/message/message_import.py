@@ -0,0 +1,176 @@
+"""This module contains the report and checkpoint of the message import pipeline, see
+:func:`~symphony.bdk.core.service.message.message_service.MessageService.bulk_import_messages`.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import AsyncGenerator, AsyncIterable, Iterable, List, Tuple, Union
+
+from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
+from symphony.bdk.gen.agent_model.v4_imported_message import V4ImportedMessage
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = "batchSize"
+IMPORTED_UP_TO = "importedUpTo"
+COMPLETED_BATCHES = "completedBatches"
+IMPORTED = "imported"
+REJECTED = "rejected"
+
+
+class ImportReport:
+    """Aggregated result of a message import.
+
+    * `imported`: number of messages imported successfully,
+    * `rejected`: number of messages rejected by the agent, the corresponding responses are kept in `rejections`,
+    * `failed`: number of messages of batches which could not be sent, the batch indexes and raised exceptions are
+      kept in `failed_batches`,
+    * `skipped`: number of messages skipped because they had already been imported by a previous run.
+
+    Counters of the previous runs are restored from the checkpoint file, if any.
+    """
+
+    def __init__(self):
+        self.imported = 0
+        self.rejected = 0
+        self.failed = 0
+        self.skipped = 0
+        self.rejections: List[V4ImportResponse] = []
+        self.failed_batches: List[Tuple[int, Exception]] = []
+
+    @property
+    def is_successful(self) -> bool:
+        """True if all the messages have been imported."""
+        return self.rejected == 0 and self.failed == 0
+
+    def add_responses(self, responses: List[V4ImportResponse]) -> None:
+        """Merges the responses of an imported batch into the report.
+
+        :param responses: the responses returned by the agent for the batch.
+        """
+        for response in responses:
+            if response.get("message_id"):
+                self.imported += 1
+            else:
+                self.rejected += 1
+                self.rejections.append(response)
+
+    def __repr__(self):
+        return (
+            f"ImportReport(imported={self.imported}, rejected={self.rejected}, failed={self.failed}, "
+            f"skipped={self.skipped})"
+        )
+
+
+class ImportCheckpoint:
+    """Keeps track of the imported batches in a local file, so that an interrupted import can be resumed.
+
+    Batches are identified by their index in the imported messages: resuming an import requires the same messages to
+    be passed in the same order, with the same batch size.
+    """
+
+    def __init__(self, file_path: Path, batch_size: int):
+        """
+
+        :param file_path: the checkpoint file. If None, nothing is persisted.
+        :param batch_size: the number of messages per batch.
+        :raise ValueError: if the checkpoint file has been written with a different batch size.
+        """
+        self._file_path = file_path
+        self._batch_size = batch_size
+        self._imported_up_to = 0
+        self._completed_batches = set()
+        self._imported = 0
+        self._rejected = 0
+        self._load()
+
+    def is_completed(self, batch_index: int) -> bool:
+        """Checks if a batch has been imported by this or a previous run."""
+        return batch_index < self._imported_up_to or batch_index in self._completed_batches
+
+    def restore(self, report: ImportReport) -> None:
+        """Restores the counters of the previous runs into a report."""
+        report.imported += self._imported
+        report.rejected += self._rejected
+
+    def complete(self, batch_index: int, report: ImportReport) -> None:
+        """Marks a batch as imported and persists the checkpoint. A checkpoint which cannot be written is logged and
+        does not stop the import.
+
+        :param batch_index: the index of the imported batch.
+        :param report: the report holding the up-to-date counters.
+        """
+        self._completed_batches.add(batch_index)
+        while self._imported_up_to in self._completed_batches:
+            self._completed_batches.remove(self._imported_up_to)
+            self._imported_up_to += 1
+        self._imported = report.imported
+        self._rejected = report.rejected
+        self._save()
+
+    def _load(self) -> None:
+        if self._file_path is None or not os.path.exists(self._file_path):
+            return
+        checkpoint = json.loads(self._file_path.read_text(encoding="utf-8"))
+        if checkpoint[BATCH_SIZE] != self._batch_size:
+            raise ValueError(
+                f"Checkpoint {self._file_path} has been written with a batch size of {checkpoint[BATCH_SIZE]}"
+            )
+        self._imported_up_to = checkpoint[IMPORTED_UP_TO]
+        self._completed_batches = set(checkpoint[COMPLETED_BATCHES])
+        self._imported = checkpoint[IMPORTED]
+        self._rejected = checkpoint[REJECTED]
+        logger.debug(
+            "Resuming import from checkpoint %s, %s batches already imported",
+            self._file_path,
+            self._imported_up_to + len(self._completed_batches),
+        )
+
+    def _save(self) -> None:
+        if self._file_path is None:
+            return
+        checkpoint = {
+            BATCH_SIZE: self._batch_size,
+            IMPORTED_UP_TO: self._imported_up_to,
+            COMPLETED_BATCHES: sorted(self._completed_batches),
+            IMPORTED: self._imported,
+            REJECTED: self._rejected,
+        }
+        tmp_file_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        try:
+            tmp_file_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+            os.replace(tmp_file_path, self._file_path)
+        except OSError:
+            # the import goes on, a resumed run will only import again the batches not checkpointed
+            logger.warning("Could not write import checkpoint %s", self._file_path, exc_info=True)
+
+
+async def batches(
+    messages: Union[Iterable[V4ImportedMessage], AsyncIterable[V4ImportedMessage]], batch_size: int
+) -> AsyncGenerator[Tuple[int, List[V4ImportedMessage]], None]:
+    """Splits messages in batches without reading more messages than needed for the current batch.
+
+    :param messages: an iterable or an async iterable of messages.
+    :param batch_size: the maximum number of messages per batch.
+    :return: an async generator of `(batch_index, batch)` tuples.
+    """
+    batch = []
+    index = 0
+    if isinstance(messages, AsyncIterable):
+        async for message in messages:
+            batch.append(message)
+            if len(batch) == batch_size:
+                yield index, batch
+                batch = []
+                index += 1
+    else:
+        for message in messages:
+            batch.append(message)
+            if len(batch) == batch_size:
+                yield index, batch
+                batch = []
+                index += 1
+    if batch:
+        yield index, batch
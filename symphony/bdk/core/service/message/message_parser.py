@@ -1,6 +1,7 @@
 """This module contains a set of util functions that can be used on incoming V4Message such as:
 extracting entities like Mentions, Hashtags, Cashtags, Emojis and extracting text content from presentationML
-contained in the message.
+contained in the message. The message is parsed once and the result is cached on the message instance, see
+:py:class:`ParsedMessage`.
 """
 
 import html
@@ -15,19 +16,125 @@ from symphony.bdk.core.service.exception import MessageParserError
 from symphony.bdk.gen.agent_model.v4_message import V4Message
 
 
+class ParsedMessage:
+    """Parse-once view over an incoming V4Message.
+
+    The PresentationML and the entity data of the message are parsed lazily, at most once, and entities of all types
+    are extracted in a single pass. Use :py:meth:`ParsedMessage.of` to get the view cached on the message instance, so
+    that listeners and helper functions working on the same message share the parsing work.
+    """
+
+    _CACHE_ATTRIBUTE = "_bdk_parsed_message"
+
+    def __init__(self, message: V4Message):
+        """
+
+        :param message: the incoming V4Message to be parsed.
+        """
+        self._presentation_ml = message.message
+        self._data = message.data
+        self._text_content = None
+        self._entities = None
+        self._tags = None
+        self._emojis = None
+
+    @classmethod
+    def of(cls, message: V4Message) -> "ParsedMessage":
+        """Returns the parsed view of a message, cached on the message instance. The cached view is discarded if the
+        PresentationML or the data of the message has been replaced since.
+
+        :param message: the incoming V4Message to be parsed.
+        :return: the parsed view of the message.
+        """
+        parsed_message = vars(message).get(cls._CACHE_ATTRIBUTE)
+        if (
+            parsed_message is None
+            or parsed_message._presentation_ml is not message.message
+            or parsed_message._data is not message.data
+        ):
+            parsed_message = cls(message)
+            # generated models only accept their own properties as attributes
+            object.__setattr__(message, cls._CACHE_ATTRIBUTE, parsed_message)
+        return parsed_message
+
+    @property
+    def text_content(self) -> str:
+        """The text content of the PresentationML of the message.
+
+        :raise MessageParserError: if the PresentationML cannot be parsed.
+        """
+        if self._text_content is None:
+            try:
+                escaped_text_content = (
+                    tostring(fromstring(self._presentation_ml), method="text").decode().strip()
+                )
+            except ParseError as exc:
+                raise MessageParserError(
+                    "Unable to parse the PresentationML, it is not in the correct format."
+                ) from exc
+            self._text_content = html.unescape(escaped_text_content)
+        return self._text_content
+
+    @property
+    def entities(self) -> dict:
+        """The entity data of the message, as a dict.
+
+        :raise MessageParserError: if the data cannot be parsed.
+        """
+        if self._entities is None:
+            self._entities = _parse_json_data(self._data)
+        return self._entities
+
+    @property
+    def mentions(self) -> [int]:
+        """The ids of the users mentioned in the message."""
+        return [int(user_id) for user_id in self._get_tags(_EntityTypeEnum.MENTION)]
+
+    @property
+    def hashtags(self) -> [str]:
+        """The text of the hashtags found in the message."""
+        return list(self._get_tags(_EntityTypeEnum.HASHTAG))
+
+    @property
+    def cashtags(self) -> [str]:
+        """The text of the cashtags found in the message."""
+        return list(self._get_tags(_EntityTypeEnum.CASHTAG))
+
+    @property
+    def emojis(self) -> Dict[str, str]:
+        """The emojis found in the message, the keys being their annotation and the values their unicode."""
+        if self._emojis is None:
+            self._index_entities()
+        return dict(self._emojis)
+
+    def _get_tags(self, entity_type) -> list:
+        if self._tags is None:
+            self._index_entities()
+        return self._tags[entity_type]
+
+    def _index_entities(self):
+        tags = {entity_type: [] for entity_type in _EntityTypeEnum}
+        emojis = {}
+        for item in self.entities.values():
+            try:
+                entity_type = _ENTITY_TYPES.get(item["type"])
+                if entity_type is _EntityTypeEnum.EMOJI:
+                    emojis[item["data"]["annotation"]] = item["data"]["unicode"]
+                elif entity_type is not None:
+                    tags[entity_type].append(item["id"][0]["value"])
+            except KeyError:
+                pass
+        self._tags = tags
+        self._emojis = emojis
+
+
 def get_text_content_from_message(message: V4Message) -> str:
     """Get text content from PresentationML on incoming messages
 
     :param message: message containing the PresentationML to be parsed
     :return: the message text content extracted from the given PresentationML
     """
-    try:
-        escaped_text_content = tostring(fromstring(message.message), method="text").decode().strip()
-        return html.unescape(escaped_text_content)
-    except ParseError as exc:
-        raise MessageParserError(
-            "Unable to parse the PresentationML, it is not in the correct format."
-        ) from exc
+    return ParsedMessage.of(message).text_content
 
 
 def get_mentions(message: V4Message) -> [int]:
@@ -37,8 +144,7 @@ def get_mentions(message: V4Message) -> [int]:
     :param message: incoming V4 message to be parsed
     :return: list of users ids that has been mentioned inside the message
     """
-    mentions_list = _get_tags(message, _EntityTypeEnum.MENTION)
-    return [int(user_id) for user_id in mentions_list]
+    return ParsedMessage.of(message).mentions
 
 
 def get_hashtags(message: V4Message) -> [str]:
@@ -47,7 +153,7 @@ def get_hashtags(message: V4Message) -> [str]:
     :param message: message incoming V4 message to be parsed
     :return: list of hashtags contained in the message
     """
-    return _get_tags(message, _EntityTypeEnum.HASHTAG)
+    return ParsedMessage.of(message).hashtags
 
 
 def get_cashtags(message: V4Message) -> [str]:
@@ -56,7 +162,7 @@ def get_cashtags(message: V4Message) -> [str]:
     :param message: message incoming V4 message to be parsed
     :return: list of cashtags contained in the message
     """
-    return _get_tags(message, _EntityTypeEnum.CASHTAG)
+    return ParsedMessage.of(message).cashtags
 
 
 def get_emojis(message: V4Message) -> Dict[str, str]:
@@ -66,27 +172,7 @@ def get_emojis(message: V4Message) -> Dict[str, str]:
     :param message: message incoming V4 message to be parsed
     :return: list of cashtags contained in the message
     """
-    json_data = _parse_json_data(message.data)
-    emojis_list = {}
-    for item in json_data.values():
-        try:
-            if item["type"] == _EntityTypeEnum.EMOJI.value:
-                emojis_list[item["data"]["annotation"]] = item["data"]["unicode"]
-        except KeyError:
-            pass
-    return emojis_list
-
-
-def _get_tags(message, entity_type):
-    json_data = _parse_json_data(message.data)
-    tags_list = []
-    for item in json_data.values():
-        try:
-            if item["type"] == entity_type.value:
-                tags_list.append(item["id"][0]["value"])
-        except KeyError:
-            pass
-    return tags_list
+    return ParsedMessage.of(message).emojis
 
 
 def _parse_json_data(json_data):
@@ -101,3 +187,6 @@ class _EntityTypeEnum(Enum):
     CASHTAG = "org.symphonyoss.fin.security"
     MENTION = "com.symphony.user.mention"
     EMOJI = "com.symphony.emoji"
+
+
+_ENTITY_TYPES = {entity_type.value: entity_type for entity_type in _EntityTypeEnum}
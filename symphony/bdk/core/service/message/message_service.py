@@ -1,13 +1,27 @@
-from typing import IO, AsyncGenerator, List, Tuple, Union
+import asyncio
+import io
+import logging
+import os
+from asyncio import TimeoutError
+from pathlib import Path
+from typing import IO, AsyncGenerator, AsyncIterable, Iterable, List, Tuple, Union
+
+from aiohttp import ClientConnectionError
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
-from symphony.bdk.core.service.message.model import Message
+from symphony.bdk.core.service.message.message_import import (
+    ImportCheckpoint,
+    ImportReport,
+    batches,
+)
+from symphony.bdk.core.service.message.model import BlastReport, Message, MessageMLBody
 from symphony.bdk.core.service.message.multi_attachments_messages_api import (
     MultiAttachmentsMessagesApi,
 )
 from symphony.bdk.core.service.pagination import offset_based_pagination
+from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.agent_api.attachments_api import AttachmentsApi
 from symphony.bdk.gen.agent_model.message_search_query import MessageSearchQuery
 from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
@@ -32,6 +46,50 @@ from symphony.bdk.gen.pod_model.message_suppression_response import (
 )
 from symphony.bdk.gen.pod_model.stream_attachment_item import StreamAttachmentItem
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLAST_CHUNK_SIZE = 100
+DEFAULT_BLAST_CONCURRENCY = 5
+DEFAULT_IMPORT_BATCH_SIZE = 100
+DEFAULT_IMPORT_CONCURRENCY = 5
+
+
+class _BlastPayload:
+    """Content of a blasted message whose attachments and previews have been read once, so that the message can be
+    sent several times without re-reading the files.
+    """
+
+    def __init__(self, message: Message):
+        self.content = message.content
+        self.data = message.data
+        self.version = message.version
+        self._attachments = [_read_file(f) for f in message.attachments]
+        self._previews = [_read_file(f) for f in message.previews]
+
+    def attachments(self) -> List[IO]:
+        return [_to_file(name, content) for name, content in self._attachments]
+
+    def previews(self) -> List[IO]:
+        return [_to_file(name, content) for name, content in self._previews]
+
+
+def _read_file(file: IO) -> Tuple[str, bytes]:
+    content = file.read()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return os.path.basename(getattr(file, "name", "attachment")), content
+
+
+def _to_file(name: str, content: bytes) -> IO:
+    file = io.BytesIO(content)
+    file.name = name
+    return file
+
+
+def _to_form_value(value: Union[str, MessageMLBody]):
+    # a new payload is created for each attempt as a streamed payload can only be sent once
+    return value.payload() if isinstance(value, MessageMLBody) else value
+
 
 class OboMessageService:
     """Class exposing OBO enabled endpoints for message management, e.g. send a message."""
@@ -93,8 +151,8 @@ class OboMessageService:
     async def _send_message(
         self,
         stream_id: str,
-        message: str,
-        data: str = "",
+        message: Union[str, MessageMLBody],
+        data: Union[str, MessageMLBody] = "",
         version: str = "",
         attachment: List[IO] = None,
         preview: List[IO] = None,
@@ -118,8 +176,8 @@ class OboMessageService:
             "sid": stream_id,
             "session_token": await self._auth_session.session_token,
             "key_manager_token": await self._auth_session.key_manager_token,
-            "message": message,
-            "data": data,
+            "message": _to_form_value(message),
+            "data": _to_form_value(data),
             "version": version,
         }
         if attachment is not None:
@@ -184,8 +242,8 @@ class OboMessageService:
             "mid": message_id,
             "session_token": await self._auth_session.session_token,
             "key_manager_token": await self._auth_session.key_manager_token,
-            "message": message_object.content,
-            "data": message_object.data,
+            "message": str(message_object.content),
+            "data": str(message_object.data),
             "version": message_object.version,
             "silent": str(message_object.silent),
         }
@@ -245,8 +303,8 @@ class OboMessageService:
     async def _blast_message(
         self,
         stream_ids: List[str],
-        message: str,
-        data: str = "",
+        message: Union[str, MessageMLBody],
+        data: Union[str, MessageMLBody] = "",
         version: str = "",
         attachment: List[IO] = None,
         preview: List[IO] = None,
@@ -270,8 +328,8 @@ class OboMessageService:
             "sids": stream_ids,
             "session_token": await self._auth_session.session_token,
             "key_manager_token": await self._auth_session.key_manager_token,
-            "message": message,
-            "data": data,
+            "message": _to_form_value(message),
+            "data": _to_form_value(data),
             "version": version,
         }
         if attachment is not None:
@@ -281,6 +339,105 @@ class OboMessageService:
 
         return await self._messages_api.v4_multi_attachment_message_blast_post(**params)
 
+    async def bulk_blast_message(
+        self,
+        stream_ids: List[str],
+        message: Union[str, Message],
+        data=None,
+        version: str = "",
+        attachment: List[Union[IO, Tuple[IO, IO]]] = None,
+        chunk_size: int = DEFAULT_BLAST_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BLAST_CONCURRENCY,
+    ) -> BlastReport:
+        """Send a message to a large number of existing streams.
+        Stream ids are split in chunks which are blasted concurrently, see :func:`~OboMessageService.blast_message`.
+        Attachments and previews are read once and re-sent from memory for each chunk and retry.
+
+        A chunk which still fails once the retries are exhausted does not stop the other ones: its streams are
+        reported as failed and it can be re-sent later with :func:`~OboMessageService.retry_bulk_blast`.
+
+        :param stream_ids: The list of stream IDs to send the message to
+        :param message: a :py:class:`Message` instance or a string containing the MessageML content to be sent.
+          If it is a :py:class:`Message` instance, other parameters will be ignored.
+          If it is a string, ``<messageML>`` tags can be omitted.
+        :param data: an object (e.g. dict) that will be serialized into JSON using ``json.dumps``.
+        :param version: Optional message version in the format "major.minor".
+          If empty, defaults to the latest supported version.
+        :param attachment: One or more files (opened in binary or text mode) to be sent along with the message.
+          Elements of the list can be attachment files or tuples of ``(attachment, preview)``.
+          If one attachment has a preview, then all attachments must have a preview.
+        :param chunk_size: the maximum number of stream ids sent in one underlying HTTP call.
+        :param max_concurrency: the maximum number of chunks sent concurrently.
+        :return: a :py:class:`BlastReport` merging the sent messages and errors of all the chunks.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be strictly positive")
+        message_object = (
+            message
+            if isinstance(message, Message)
+            else Message(content=message, data=data, version=version, attachments=attachment)
+        )
+        report = BlastReport(_BlastPayload(message_object))
+        chunks = [stream_ids[i : i + chunk_size] for i in range(0, len(stream_ids), chunk_size)]
+        await self._send_blast_chunks(report, report.payload, chunks, max_concurrency)
+        return report
+
+    async def retry_bulk_blast(
+        self, report: BlastReport, max_concurrency: int = DEFAULT_BLAST_CONCURRENCY
+    ) -> BlastReport:
+        """Re-sends the chunks of a bulk blast which failed, the other ones are not sent again.
+
+        :param report: the report returned by :func:`~OboMessageService.bulk_blast_message`.
+        :param max_concurrency: the maximum number of chunks sent concurrently.
+        :return: the same report, updated with the result of the re-sent chunks.
+        """
+        chunks = report.failed_chunks
+        report.failed_chunks = []
+        await self._send_blast_chunks(report, report.payload, chunks, max_concurrency)
+        return report
+
+    async def _send_blast_chunks(
+        self,
+        report: BlastReport,
+        payload: _BlastPayload,
+        chunks: List[List[str]],
+        max_concurrency: int,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_chunk(chunk):
+            async with semaphore:
+                try:
+                    response = await self._blast_payload(chunk, payload)
+                except (ApiException, ClientConnectionError, TimeoutError) as exc:
+                    logger.warning("Failed to blast message to %s streams: %s", len(chunk), exc)
+                    report.add_failed_chunk(chunk, exc)
+                else:
+                    report.add_response(chunk, response)
+
+        await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+
+    @retry
+    async def _blast_payload(
+        self, stream_ids: List[str], payload: _BlastPayload
+    ) -> V4MessageBlastResponse:
+        params = {
+            "sids": stream_ids,
+            "session_token": await self._auth_session.session_token,
+            "key_manager_token": await self._auth_session.key_manager_token,
+            "message": _to_form_value(payload.content),
+            "data": _to_form_value(payload.data),
+            "version": payload.version,
+        }
+        # files are rebuilt for each attempt as they are closed by the api client once read
+        attachments = payload.attachments()
+        if attachments:
+            params["attachment"] = attachments
+        previews = payload.previews()
+        if previews:
+            params["preview"] = previews
+        return await self._messages_api.v4_multi_attachment_message_blast_post(**params)
+
 
 class MessageService(OboMessageService):
     """Service class for managing messages."""
@@ -348,6 +505,63 @@ class MessageService(OboMessageService):
         import_response_list = await self._messages_api.v4_message_import_post(**params)
         return import_response_list.value
 
+    async def bulk_import_messages(
+        self,
+        messages: Union[Iterable[V4ImportedMessage], AsyncIterable[V4ImportedMessage]],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+        checkpoint_file_path: Path = None,
+    ) -> ImportReport:
+        """Imports a large number of messages to Symphony.
+        Messages are read lazily and split in batches imported concurrently with :func:`~MessageService.import_messages`,
+        so that only the batches being imported are kept in memory.
+
+        A batch which still fails once the retries are exhausted does not stop the import: its messages are reported
+        as failed. If a checkpoint file is provided, the imported batches are recorded in it after each batch, and
+        running the import again with the same messages and batch size skips them. This way, an interrupted import or
+        the failed batches of a previous run can be resumed.
+
+        :param messages: an iterable or an async iterable of messages to import.
+        :param batch_size: the maximum number of messages imported in one underlying HTTP call.
+        :param max_concurrency: the maximum number of batches imported concurrently.
+        :param checkpoint_file_path: the file recording the imported batches. If None, the import cannot be resumed.
+        :return: an :py:class:`ImportReport` aggregating the results of all the batches.
+        :raise ValueError: if the checkpoint file has been written with a different batch size.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be strictly positive")
+        checkpoint = ImportCheckpoint(checkpoint_file_path, batch_size)
+        report = ImportReport()
+        checkpoint.restore(report)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = set()
+
+        async def import_batch(batch_index, batch):
+            try:
+                responses = await self.import_messages(batch)
+            except (ApiException, ClientConnectionError, TimeoutError) as exc:
+                logger.warning("Failed to import batch %s: %s", batch_index, exc)
+                report.failed += len(batch)
+                report.failed_batches.append((batch_index, exc))
+            else:
+                report.add_responses(responses)
+                checkpoint.complete(batch_index, report)
+            finally:
+                semaphore.release()
+
+        async for batch_index, batch in batches(messages, batch_size):
+            if checkpoint.is_completed(batch_index):
+                report.skipped += len(batch)
+                continue
+            # waits for a slot before reading the next batch so that messages are not read faster than imported
+            await semaphore.acquire()
+            task = asyncio.create_task(import_batch(batch_index, batch))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+        return report
+
     async def get_attachment(self, stream_id: str, message_id: str, attachment_id: str) -> str:
         """Downloads the attachment body by the stream ID, message ID and attachment ID.
         See: `Attachment <https://developers.symphony.com/restapi/reference/attachment>`_
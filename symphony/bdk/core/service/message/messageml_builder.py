@@ -0,0 +1,224 @@
+"""This module contains a builder writing the MessageML content and the entity data of large outgoing messages into
+chunked buffers, which are streamed to the agent without being joined into a single string.
+"""
+
+import json
+from contextlib import contextmanager
+from html import escape
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+from symphony.bdk.core.service.exception import MessageCreationError
+from symphony.bdk.core.service.message.messageml_util import escape_special_chars
+from symphony.bdk.core.service.message.model import (
+    MESSAGE_ML_END_TAG,
+    MESSAGE_ML_START_TAG,
+    Message,
+    MessageMLBody,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkedBuffer:
+    """Accumulates strings and encodes them into chunks of about `chunk_size` characters, checking the size limit as
+    it goes. Until they are encoded, the length of pending strings is used as a lower bound of their size in bytes.
+    """
+
+    def __init__(self, name: str, max_size: Optional[int], chunk_size: int):
+        self._name = name
+        self._max_size = max_size
+        self._chunk_size = chunk_size
+        self._chunks = []
+        self._size = 0
+        self._pending = []
+        self._pending_length = 0
+
+    def write(self, text: str) -> None:
+        self._pending.append(text)
+        self._pending_length += len(text)
+        self._check_size(self._size + self._pending_length)
+        if self._pending_length >= self._chunk_size:
+            self._flush()
+
+    def close(self) -> MessageMLBody:
+        self._flush()
+        return MessageMLBody(self._chunks, self._size)
+
+    def _flush(self) -> None:
+        if self._pending:
+            chunk = "".join(self._pending).encode("utf-8")
+            self._pending.clear()
+            self._pending_length = 0
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            self._check_size(self._size)
+
+    def _check_size(self, size: int) -> None:
+        if self._max_size is not None and size > self._max_size:
+            raise MessageCreationError(
+                f"Message {self._name} exceeds the maximum size of {self._max_size} bytes"
+            )
+
+
+class MessageMLBuilder:
+    """Builds a :py:class:`~symphony.bdk.core.service.message.model.Message` with a large MessageML content, such as
+    reports with thousands of table rows, without holding the whole content in a single string.
+
+    Tags, escaped text and entity data are encoded into chunks as they are written, and the chunks are streamed in the
+    multipart request when the message is sent. Size limits are checked while writing, so that a message which would
+    be rejected fails before being fully built::
+
+        builder = MessageMLBuilder(max_content_size=1024 * 1024)
+        with builder.tag("table"):
+            for row in rows:
+                with builder.tag("tr"):
+                    for cell in row:
+                        builder.element("td", cell)
+        await message_service.send_message(stream_id, builder.build())
+    """
+
+    def __init__(
+        self,
+        max_content_size: Optional[int] = None,
+        max_data_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+
+        :param max_content_size: the maximum size in bytes of the MessageML content, unlimited by default.
+        :param max_data_size: the maximum size in bytes of the entity data JSON, unlimited by default.
+        :param chunk_size: the number of characters accumulated before being encoded into a chunk.
+        """
+        self._content = _ChunkedBuffer("content", max_content_size, chunk_size)
+        self._data = _ChunkedBuffer("data", max_data_size, chunk_size)
+        self._open_tags = []
+        self._has_entities = False
+        self._built = False
+        self._content.write(MESSAGE_ML_START_TAG)
+
+    def start_tag(self, name: str, attributes: Dict[str, str] = None) -> "MessageMLBuilder":
+        """Writes a start tag, to be closed with :py:meth:`end_tag`.
+
+        :param name: the tag name, e.g. ``table``.
+        :param attributes: the tag attributes, values are escaped.
+        :return: the builder itself.
+        """
+        self._check_not_built()
+        self._content.write(f"<{name}{_attributes(attributes)}>")
+        self._open_tags.append(name)
+        return self
+
+    def end_tag(self) -> "MessageMLBuilder":
+        """Closes the last opened tag.
+
+        :return: the builder itself.
+        :raise MessageCreationError: if there is no open tag.
+        """
+        self._check_not_built()
+        if not self._open_tags:
+            raise MessageCreationError("There is no open tag to be closed")
+        self._content.write(f"</{self._open_tags.pop()}>")
+        return self
+
+    @contextmanager
+    def tag(self, name: str, attributes: Dict[str, str] = None):
+        """Context manager writing a start tag when entered and the matching end tag when exited.
+
+        :param name: the tag name, e.g. ``table``.
+        :param attributes: the tag attributes, values are escaped.
+        """
+        self.start_tag(name, attributes)
+        yield self
+        self.end_tag()
+
+    def element(
+        self, name: str, text: str = None, attributes: Dict[str, str] = None
+    ) -> "MessageMLBuilder":
+        """Writes a complete element, e.g. a table cell.
+
+        :param name: the tag name, e.g. ``td``.
+        :param text: the text of the element, escaped. If None, a self-closing tag is written.
+        :param attributes: the tag attributes, values are escaped.
+        :return: the builder itself.
+        """
+        self._check_not_built()
+        if text is None:
+            self._content.write(f"<{name}{_attributes(attributes)}/>")
+        else:
+            self._content.write(
+                f"<{name}{_attributes(attributes)}>{escape_special_chars(text)}</{name}>"
+            )
+        return self
+
+    def text(self, text: str) -> "MessageMLBuilder":
+        """Writes text, escaped with :py:func:`~symphony.bdk.core.service.message.messageml_util.escape_special_chars`.
+
+        :param text: the raw text.
+        :return: the builder itself.
+        """
+        self._check_not_built()
+        self._content.write(escape_special_chars(text))
+        return self
+
+    def messageml(self, content: str) -> "MessageMLBuilder":
+        """Writes MessageML as is, without escaping it.
+
+        :param content: a valid MessageML fragment.
+        :return: the builder itself.
+        """
+        self._check_not_built()
+        self._content.write(content)
+        return self
+
+    def entity(self, entity_id: str, value) -> "MessageMLBuilder":
+        """Adds an entity to the message data. The value is serialized into JSON right away.
+
+        :param entity_id: the entity id, as referenced by ``data-entity-id`` attributes of the content.
+        :param value: an object (e.g. dict) that will be serialized into JSON using ``json.dumps``.
+        :return: the builder itself.
+        """
+        self._check_not_built()
+        self._data.write(("," if self._has_entities else "{") + json.dumps(entity_id) + ":")
+        self._data.write(json.dumps(value))
+        self._has_entities = True
+        return self
+
+    def build(
+        self,
+        silent=True,
+        attachments: List[Union[IO, Tuple[IO, IO]]] = None,
+        version: str = "",
+    ) -> Message:
+        """Builds the message. The builder cannot be used anymore afterwards.
+
+        :param silent: the bool flag determine if the updated message will be marked as read (when it
+          is true and it s the default value) or unread (when it is false)
+        :param attachments: list of attachments or list of (attachment, previews).
+        :param version: Optional message version in the format "major.minor".
+        :return: the message, whose content and data are :py:class:`MessageMLBody` instances.
+        :raise MessageCreationError: if a tag is not closed or if a size limit is exceeded.
+        """
+        self._check_not_built()
+        if self._open_tags:
+            raise MessageCreationError(f"Tags are not closed: {self._open_tags}")
+        self._built = True
+        self._content.write(MESSAGE_ML_END_TAG)
+        if self._has_entities:
+            self._data.write("}")
+        return Message(
+            content=self._content.close(),
+            data=self._data.close() if self._has_entities else None,
+            silent=silent,
+            attachments=attachments,
+            version=version,
+        )
+
+    def _check_not_built(self):
+        if self._built:
+            raise MessageCreationError("The message has already been built")
+
+
+def _attributes(attributes: Optional[Dict[str, str]]) -> str:
+    if not attributes:
+        return ""
+    return "".join(f' {name}="{escape(str(value))}"' for name, value in attributes.items())
@@ -1,6 +1,7 @@
 """This module handles pre-processing for an outgoing message in order to have a valid messageML format."""
 
 import re
+from typing import Iterable, Iterator
 
 
 def escape_special_chars(raw_text: str) -> str:
@@ -10,21 +11,19 @@ def escape_special_chars(raw_text: str) -> str:
     :param raw_text: text to be parsed
     :return: text in a valid messageML format
     """
-    current_parsed_index = 0
-    parsed_text = ""
-    matches = re.finditer(_pattern(), raw_text)
-    for match in matches:
-        parsed_text += raw_text[current_parsed_index : match.start()] + _replacement(match.group(0))
-        current_parsed_index = match.end()
-    return parsed_text + raw_text[current_parsed_index:]
+    return _special_chars_pattern.sub(_replacement, raw_text)
 
 
-def _pattern():
-    return "|".join(_special_chars_dict)
+def escape_special_chars_chunks(raw_chunks: Iterable[str]) -> Iterator[str]:
+    """Incremental variant of :py:func:`escape_special_chars`, to escape large texts read or built chunk by chunk
+    without holding the whole raw text in memory. Chunks can be split anywhere, as special characters are escaped one
+    at a time.
 
-
-def _replacement(match):
-    return _special_chars_dict.get(match, _special_chars_dict.get("\\" + match))
+    :param raw_chunks: chunks of the text to be parsed
+    :return: an iterator over the escaped chunks, in a valid messageML format once joined
+    """
+    for raw_chunk in raw_chunks:
+        yield _special_chars_pattern.sub(_replacement, raw_chunk)
 
 
 _special_chars_dict = {
@@ -34,18 +33,24 @@ _special_chars_dict = {
     "'": "&apos;",
     '"': "&quot;",
     "#": "&#35;",
-    "\\$": "&#36;",
+    "$": "&#36;",
     "%": "&#37;",
-    "\\(": "&#40;",
-    "\\)": "&#41;",
-    "\\*": "&#42;",
-    "\\.": "&#46;",
+    "(": "&#40;",
+    ")": "&#41;",
+    "*": "&#42;",
+    ".": "&#46;",
     ";": "&#59;",
     "=": "&#61;",
-    "\\[": "&#91;",
-    "\\\\": "&#92;",
-    "\\]": "&#93;",
+    "[": "&#91;",
+    "\\": "&#92;",
+    "]": "&#93;",
     "`": "&#96;",
-    "\\{": "&#123;",
-    "\\}": "&#125;",
+    "{": "&#123;",
+    "}": "&#125;",
 }
+
+_special_chars_pattern = re.compile("[" + re.escape("".join(_special_chars_dict)) + "]")
+
+
+def _replacement(match):
+    return _special_chars_dict[match.group()]
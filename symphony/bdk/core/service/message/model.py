@@ -1,12 +1,68 @@
 import json
-from typing import IO, List, Tuple, Union
+from typing import IO, AsyncIterator, Dict, List, Sequence, Tuple, Union
+
+from aiohttp.payload import AsyncIterablePayload
 
 from symphony.bdk.core.service.exception import MessageCreationError
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+from symphony.bdk.gen.agent_model.v4_message_blast_response import V4MessageBlastResponse
 
 MESSAGE_ML_END_TAG = "</messageML>"
 MESSAGE_ML_START_TAG = "<messageML>"
 
 
+class MessageMLBody:
+    """Message content or data held as a sequence of UTF-8 encoded chunks, as built by the
+    :py:class:`~symphony.bdk.core.service.message.messageml_builder.MessageMLBuilder`. It is streamed chunk by chunk
+    when the message is sent.
+    """
+
+    def __init__(self, chunks: Sequence[bytes], size: int):
+        """
+
+        :param chunks: the UTF-8 encoded chunks.
+        :param size: the total size of the chunks, in bytes.
+        """
+        self._chunks = tuple(chunks)
+        self._size = size
+
+    @property
+    def chunks(self) -> Tuple[bytes, ...]:
+        """The UTF-8 encoded chunks."""
+        return self._chunks
+
+    @property
+    def size(self) -> int:
+        """The total size of the chunks, in bytes."""
+        return self._size
+
+    def payload(self) -> "MessageMLPayload":
+        """Creates a new multipart form field streaming the chunks. A payload can only be sent once.
+
+        :return: the payload to be passed as form parameter.
+        """
+        return MessageMLPayload(self)
+
+    def __str__(self):
+        return b"".join(self._chunks).decode("utf-8")
+
+
+class MessageMLPayload(AsyncIterablePayload):
+    """Multipart form field streaming the chunks of a :py:class:`MessageMLBody`."""
+
+    def __init__(self, body: MessageMLBody):
+        """
+
+        :param body: the message content or data to be streamed.
+        """
+        super().__init__(_iterate(body.chunks), content_type="text/plain; charset=utf-8")
+
+
+async def _iterate(chunks: Tuple[bytes, ...]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
 class Message:
     """Class holding message information, used in
     :py:class:`~symphony.bdk.core.service.message.message_service.MessageService` to send a message.
@@ -16,7 +72,7 @@ class Message:
 
     def __init__(
         self,
-        content: str,
+        content: Union[str, MessageMLBody],
         data=None,
         silent=True,
         attachments: List[Union[IO, Tuple[IO, IO]]] = None,
@@ -26,7 +82,10 @@ class Message:
 
         :param content: the MessageML content to be sent. This is mandatory
           If there is no <messageML> tags, they will be added to the content.
-        :param data: an object (e.g. dict) that will be serialized into JSON using ``json.dumps``.
+          A :py:class:`MessageMLBody` is sent as is, see
+          :py:class:`~symphony.bdk.core.service.message.messageml_builder.MessageMLBuilder`.
+        :param data: an object (e.g. dict) that will be serialized into JSON using ``json.dumps``,
+          or an already serialized :py:class:`MessageMLBody`.
         :param silent: the bool flag determine if the updated message will be marked as read (when it
           is true and it s the default value) or unread (when it is false)
         :param attachments: list of attachments or list of (attachment, previews).
@@ -38,13 +97,13 @@ class Message:
           or if number of previews different than the number of attachments (in case there is at least one preview).
         """
         self._content = self._get_content(content)
-        self._data = "" if data is None else json.dumps(data)
+        self._data = self._get_data(data)
         self._version = version
         self._silent = silent
         self._attachments, self._previews = self._get_attachments_and_previews(attachments)
 
     @property
-    def content(self) -> str:
+    def content(self) -> Union[str, MessageMLBody]:
         """Message content
 
         :return: the messageML content
@@ -52,7 +111,7 @@ class Message:
         return self._content
 
     @property
-    def data(self) -> str:
+    def data(self) -> Union[str, MessageMLBody]:
         """Message data
 
         :return: the data as a JSON string
@@ -95,12 +154,22 @@ class Message:
     def _get_content(content):
         if content is None:
             raise MessageCreationError("Message content is mandatory")
+        if isinstance(content, MessageMLBody):
+            return content
         if not content.startswith(MESSAGE_ML_START_TAG) and not content.endswith(
             MESSAGE_ML_END_TAG
         ):
             return MESSAGE_ML_START_TAG + content + MESSAGE_ML_END_TAG
         return content
 
+    @staticmethod
+    def _get_data(data):
+        if data is None:
+            return ""
+        if isinstance(data, MessageMLBody):
+            return data
+        return json.dumps(data)
+
     @staticmethod
     def _get_attachments_and_previews(attachments_previews):
         if attachments_previews is None:
@@ -122,3 +191,61 @@ class Message:
             )
 
         return attachments, previews
+
+
+class BlastReport:
+    """Class holding the merged result of a bulk blast sent by
+    :py:meth:`~symphony.bdk.core.service.message.message_service.OboMessageService.bulk_blast_message`.
+
+    Messages and errors are keyed by stream id. An error is either the
+    :py:class:`~symphony.bdk.gen.agent_model.error.Error` returned by the agent for a given stream or,
+    if the whole chunk could not be sent, the exception raised by the call. The report also keeps the blasted payload,
+    so that the failed chunks can be re-sent with
+    :py:meth:`~symphony.bdk.core.service.message.message_service.OboMessageService.retry_bulk_blast`.
+    """
+
+    def __init__(self, payload=None):
+        self.messages: Dict[str, V4Message] = {}
+        self.errors: Dict[str, object] = {}
+        self.failed_chunks: List[List[str]] = []
+        self.payload = payload
+
+    @property
+    def successful_stream_ids(self) -> List[str]:
+        """Ids of the streams the message has been sent to."""
+        return list(self.messages)
+
+    @property
+    def failed_stream_ids(self) -> List[str]:
+        """Ids of the streams the message could not be sent to."""
+        return list(self.errors)
+
+    @property
+    def is_successful(self) -> bool:
+        """True if the message has been sent to all the streams."""
+        return not self.errors
+
+    def add_response(self, stream_ids: List[str], response: V4MessageBlastResponse) -> None:
+        """Merges the response of a blast call into the report.
+
+        :param stream_ids: the ids of the streams of the chunk which has been successfully sent.
+        :param response: the response of the chunk.
+        """
+        for stream_id in stream_ids:
+            self.errors.pop(stream_id, None)
+        for message in response.get("messages") or []:
+            stream_id = message.stream.stream_id
+            self.messages[stream_id] = message
+            self.errors.pop(stream_id, None)
+        for stream_id, error in (response.get("errors") or {}).items():
+            self.errors[stream_id] = error
+
+    def add_failed_chunk(self, stream_ids: List[str], exception: Exception) -> None:
+        """Marks all the streams of a chunk as failed.
+
+        :param stream_ids: the ids of the streams of the chunk.
+        :param exception: the exception raised while sending the chunk.
+        """
+        self.failed_chunks.append(stream_ids)
+        for stream_id in stream_ids:
+            self.errors[stream_id] = exception
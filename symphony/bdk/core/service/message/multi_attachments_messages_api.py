@@ -1,3 +1,4 @@
+from symphony.bdk.core.service.message.model import MessageMLPayload
 from symphony.bdk.gen.agent_api.messages_api import MessagesApi
 from symphony.bdk.gen.agent_model.v4_message import V4Message
 from symphony.bdk.gen.agent_model.v4_message_blast_response import V4MessageBlastResponse
@@ -7,7 +8,8 @@ from symphony.bdk.gen.model_utils import file_type
 
 class MultiAttachmentsMessagesApi(MessagesApi):
     """Message Api inherited the MessagesApi generated by OpenAPI Generator
-    which allows to send or blast a message with multiple attachments and previews
+    which allows to send or blast a message with multiple attachments and previews.
+    The message content and data can also be streamed as :py:class:`MessageMLPayload`.
     """
 
     def __init__(self, api_client=None):
@@ -48,8 +50,8 @@ class MultiAttachmentsMessagesApi(MessagesApi):
                     "session_token": (str,),
                     "sids": ([str],),
                     "key_manager_token": (str,),
-                    "message": (str,),
-                    "data": (str,),
+                    "message": (str, MessageMLPayload),
+                    "data": (str, MessageMLPayload),
                     "version": (str,),
                     "attachment": ([file_type],),
                     "preview": ([file_type],),
@@ -116,8 +118,8 @@ class MultiAttachmentsMessagesApi(MessagesApi):
                     "sid": (str,),
                     "session_token": (str,),
                     "key_manager_token": (str,),
-                    "message": (str,),
-                    "data": (str,),
+                    "message": (str, MessageMLPayload),
+                    "data": (str, MessageMLPayload),
                     "version": (str,),
                     "attachment": ([file_type],),
                     "preview": ([file_type],),
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from collections import deque
+from typing import IO, Deque, Dict, List, Tuple, Union
+
+from symphony.bdk.core.service.exception import SendQueueClosedError
+from symphony.bdk.core.service.message.message_service import OboMessageService
+from symphony.bdk.core.service.message.model import Message
+from symphony.bdk.core.service.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class SendQueueMetrics:
+    """Counters of a :py:class:`MessageSendQueue`."""
+
+    def __init__(self):
+        self.pending = 0
+        self.in_flight = 0
+        self.sent = 0
+        self.failed = 0
+        self.active_streams = 0
+
+    def __repr__(self):
+        return (
+            f"SendQueueMetrics(pending={self.pending}, in_flight={self.in_flight}, sent={self.sent}, "
+            f"failed={self.failed}, active_streams={self.active_streams})"
+        )
+
+
+class MessageSendQueue:
+    """Outbound queue of messages sent through :func:`~OboMessageService.send_message`.
+
+    Messages sent to the same stream are sent one after the other, in the order they have been queued. Messages sent
+    to different streams are sent in parallel, up to a given number of streams at once, and all sends share the same
+    rate limiter so that bursts do not trigger rate limiting errors on the agent.
+    """
+
+    def __init__(
+        self,
+        message_service: OboMessageService,
+        max_concurrent_streams: int = 10,
+        rate_limiter: RateLimiter = None,
+    ):
+        """
+
+        :param message_service: the service used to send the messages.
+        :param max_concurrent_streams: the maximum number of streams messages are sent to at once.
+        :param rate_limiter: the rate limiter applied to all sends. If None, sends are not throttled.
+        """
+        self._message_service = message_service
+        self._max_concurrent_streams = max_concurrent_streams
+        self._rate_limiter = rate_limiter
+        self._semaphore = None
+        self._queues: Dict[str, Deque[Tuple[Message, asyncio.Future]]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._closed = False
+        self._metrics = SendQueueMetrics()
+
+    @property
+    def metrics(self) -> SendQueueMetrics:
+        """The live counters of the queue."""
+        return self._metrics
+
+    @property
+    def closed(self) -> bool:
+        """True if the queue has been closed and does not accept messages anymore."""
+        return self._closed
+
+    def send(
+        self,
+        stream_id: str,
+        message: Union[str, Message],
+        data=None,
+        version: str = "",
+        attachment: List[Union[IO, Tuple[IO, IO]]] = None,
+    ) -> asyncio.Future:
+        """Queues a message to be sent to an existing stream.
+        Parameters are the same as :func:`~OboMessageService.send_message`.
+
+        :param stream_id: the ID of the stream to send the message to
+        :param message: a :py:class:`Message` instance or a string containing the MessageML content to be sent.
+          If it is a :py:class:`Message` instance, other parameters will be ignored.
+          If it is a string, ``<messageML>`` tags can be omitted.
+        :param data: an object (e.g. dict) that will be serialized into JSON using ``json.dumps``.
+        :param version: Optional message version in the format "major.minor".
+          If empty, defaults to the latest supported version.
+        :param attachment: One or more files (opened in binary or text mode) to be sent along with the message.
+        :return: a future resolved with the sent :py:class:`V4Message`, or with the exception raised while sending it.
+          Cancelling the future before the message is sent removes it from the queue.
+        :raise SendQueueClosedError: if the queue has been closed.
+        """
+        if self._closed:
+            raise SendQueueClosedError("Send queue is closed")
+        message_object = (
+            message
+            if isinstance(message, Message)
+            else Message(content=message, data=data, version=version, attachments=attachment)
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(stream_id, deque()).append((message_object, future))
+        self._metrics.pending += 1
+        if stream_id not in self._workers:
+            self._workers[stream_id] = asyncio.create_task(self._send_stream_messages(stream_id))
+            self._metrics.active_streams = len(self._workers)
+        return future
+
+    async def flush(self) -> None:
+        """Waits until all the queued messages have been sent."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values())
+
+    async def close(self) -> None:
+        """Stops accepting new messages and waits until the queued ones have been sent."""
+        self._closed = True
+        await self.flush()
+
+    async def _send_stream_messages(self, stream_id: str) -> None:
+        if self._semaphore is None:
+            # created lazily to be bound to the running event loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_streams)
+        queue = self._queues[stream_id]
+        try:
+            while queue:
+                message, future = queue.popleft()
+                self._metrics.pending -= 1
+                if future.cancelled():
+                    continue
+                # the semaphore is released between messages so that streams with a lot of messages do not starve
+                # the other ones
+                async with self._semaphore:
+                    await self._send(stream_id, message, future)
+        finally:
+            del self._queues[stream_id]
+            del self._workers[stream_id]
+            self._metrics.active_streams = len(self._workers)
+
+    async def _send(self, stream_id: str, message: Message, future: asyncio.Future) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        self._metrics.in_flight += 1
+        try:
+            sent_message = await self._message_service.send_message(stream_id, message)
+        except Exception as exc:
+            # forwarded to the caller through the future
+            logger.debug("Failed to send queued message to stream %s", stream_id, exc_info=True)
+            self._metrics.failed += 1
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            self._metrics.sent += 1
+            if not future.done():
+                future.set_result(sent_message)
+        finally:
+            self._metrics.in_flight -= 1
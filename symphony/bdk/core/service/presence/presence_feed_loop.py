@@ -0,0 +1,236 @@
+"""This module contains the loop reading the presence feed of the pod and the in-memory presence map it keeps up to
+date.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.model.bdk_presence_feed_config import BdkPresenceFeedConfig
+from symphony.bdk.core.retry import retry
+from symphony.bdk.core.retry.strategy import read_presence_feed_retry
+from symphony.bdk.gen.pod_api.presence_api import PresenceApi
+from symphony.bdk.gen.pod_model.v2_presence import V2Presence
+
+logger = logging.getLogger(__name__)
+
+
+class PresenceListener:
+    """Interface for a callback to be invoked when presence changes are read from the presence feed."""
+
+    async def on_presence_changed(self, presences: List[V2Presence]):
+        """Called with the presences which changed since the previous read of the presence feed.
+
+        :param presences: the new presences, at most one per user.
+        """
+
+
+class PresenceMap:
+    """In-memory map of the presence of all users of the pod, seeded with the Get All Presence endpoint and kept up to
+    date by the :py:class:`PresenceFeedLoop`.
+    """
+
+    def __init__(self):
+        self._presences: Dict[int, V2Presence] = {}
+        self._live = False
+
+    def __len__(self):
+        return len(self._presences)
+
+    def __contains__(self, user_id: int):
+        return user_id in self._presences
+
+    @property
+    def is_live(self) -> bool:
+        """True while the map is seeded and kept up to date by a running presence feed loop."""
+        return self._live
+
+    def get(self, user_id: int) -> Optional[V2Presence]:
+        """Returns the presence of a user.
+
+        :param user_id: the id of the user.
+        :return: the last known presence of the user, None if unknown.
+        """
+        return self._presences.get(user_id)
+
+    def update(self, presences: Iterable[V2Presence]) -> List[V2Presence]:
+        """Updates the map with presences, ignoring the ones older than the presence already known for a user.
+
+        :param presences: the presences read from the pod.
+        :return: the presences which have been applied.
+        """
+        applied = []
+        for presence in presences:
+            user_id = presence.get("user_id")
+            if user_id is None:
+                continue
+            known = self._presences.get(user_id)
+            if known is not None and _timestamp(known) > _timestamp(presence):
+                continue
+            self._presences[user_id] = presence
+            applied.append(presence)
+        return applied
+
+
+class PresenceFeedLoop:
+    """A managed loop reading the presence feed of the pod, as the datafeed loops do for real-time events.
+
+    When started, the loop creates a presence feed, seeds the :py:class:`PresenceMap` with the presence of all users
+    and then periodically reads the feed, updating the map and dispatching the changes to the subscribed
+    :py:class:`PresenceListener`. The feed is created before the map is seeded, so that no change is missed. If the
+    feed expires, it is recreated and the map is seeded again, as the changes made while the feed was expired are
+    lost. Reads are retried with the retry configuration of the ``presenceFeed`` section.
+
+    The loop is stopped by calling :func:`~PresenceFeedLoop.stop`, the presence feed is then deleted.
+    """
+
+    def __init__(
+        self,
+        presence_api: PresenceApi,
+        auth_session: AuthSession,
+        config: BdkPresenceFeedConfig,
+    ):
+        """
+
+        :param presence_api: PresenceApi to request the service.
+        :param auth_session: the AuthSession instance used to get the session token.
+        :param config: the presence feed configuration.
+        """
+        self._presence_api = presence_api
+        self._auth_session = auth_session
+        self._config = config
+        self._retry_config = config.retry
+        self._presence_map = PresenceMap()
+        self._listeners = []
+        self._feed_id = None
+        self._running = False
+        self._stop_event = None
+        self._reseed = False
+
+    @property
+    def presence_map(self) -> PresenceMap:
+        """The map of the presence of all users, live while the loop is running."""
+        return self._presence_map
+
+    def subscribe(self, listener: PresenceListener):
+        """Subscribes a new listener to the presence feed loop.
+
+        :param listener: the PresenceListener to be added.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: PresenceListener):
+        """Removes a given listener from the presence feed loop.
+
+        :param listener: the PresenceListener to be removed.
+        """
+        self._listeners.remove(listener)
+
+    async def start(self):
+        """Starts the presence feed loop, returns when the loop is stopped."""
+        if self._running:
+            raise RuntimeError("The presence feed loop is already started")
+        logger.debug("Starting presence feed loop")
+        self._running = True
+        self._stop_event = asyncio.Event()
+        try:
+            await self.recreate_presence_feed()
+            if self._config.seed:
+                await self._seed()
+            self._presence_map._live = True
+            while self._running:
+                await self._run_loop_iteration()
+                await self._wait_poll_interval()
+        finally:
+            self._presence_map._live = False
+            self._running = False
+            await self._delete_presence_feed()
+            logger.debug("Presence feed loop stopped")
+
+    async def stop(self):
+        """Stops the presence feed loop. The loop stops after the ongoing read, if any."""
+        self._running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    @retry
+    async def recreate_presence_feed(self):
+        """Creates a new presence feed, used by the loop from then on. If the presence map is live, it is seeded again
+        at the next iteration of the loop, as the changes made before the feed was created are not read.
+        """
+        string_id = await self._presence_api.v1_presence_feed_create_post(
+            session_token=await self._auth_session.session_token
+        )
+        self._feed_id = string_id.id
+        self._reseed = self._presence_map.is_live and self._config.seed
+
+    async def _seed(self):
+        page_size = self._config.page_size
+        last_user_id = None
+        while True:
+            presences = await self._get_all_presence(last_user_id, page_size)
+            self._presence_map.update(presences)
+            if len(presences) < page_size:
+                break
+            next_user_id = presences[-1].get("user_id")
+            if next_user_id is None or (last_user_id is not None and next_user_id <= last_user_id):
+                break
+            last_user_id = next_user_id
+        logger.debug("Presence map seeded with %s users", len(self._presence_map))
+
+    async def _run_loop_iteration(self):
+        presences = self._presence_map.update(await self._read_presence_feed())
+        if self._reseed:
+            logger.debug("Presence feed recreated, seeding the presence map again")
+            self._reseed = False
+            await self._seed()
+        if presences:
+            await self._dispatch(presences)
+
+    async def _dispatch(self, presences: List[V2Presence]):
+        results = await asyncio.gather(
+            *(listener.on_presence_changed(presences) for listener in self._listeners),
+            return_exceptions=True,
+        )
+        for listener, result in zip(self._listeners, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Exception occurred inside presence listener %s", listener, exc_info=result
+                )
+
+    async def _wait_poll_interval(self):
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), self._config.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    @retry
+    async def _get_all_presence(self, last_user_id: Optional[int], limit: int) -> List[V2Presence]:
+        params = {"session_token": await self._auth_session.session_token, "limit": limit}
+        if last_user_id is not None:
+            params["last_user_id"] = last_user_id
+        presence_list = await self._presence_api.v2_users_presence_get(**params)
+        return presence_list.value
+
+    @retry(retry=read_presence_feed_retry)
+    async def _read_presence_feed(self) -> List[V2Presence]:
+        presence_list = await self._presence_api.v1_presence_feed_feed_id_read_get(
+            session_token=await self._auth_session.session_token, feed_id=self._feed_id
+        )
+        return presence_list.value if presence_list is not None else []
+
+    async def _delete_presence_feed(self):
+        if self._feed_id is None:
+            return
+        try:
+            await self._presence_api.v1_presence_feed_feed_id_delete_post(
+                session_token=await self._auth_session.session_token, feed_id=self._feed_id
+            )
+        except Exception:
+            logger.warning("Could not delete presence feed %s", self._feed_id, exc_info=True)
+        self._feed_id = None
+
+
+def _timestamp(presence: V2Presence) -> int:
+    return presence.get("timestamp") or 0
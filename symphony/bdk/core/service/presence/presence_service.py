@@ -1,14 +1,22 @@
+import logging
 from enum import Enum, auto
-from typing import List
+from typing import AsyncGenerator, AsyncIterable, Iterable, List, Tuple, Union
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.bulk import BulkResult, chunks, run_concurrently
+from symphony.bdk.core.service.presence.presence_feed_loop import PresenceMap
 from symphony.bdk.gen.pod_api.presence_api import PresenceApi
 from symphony.bdk.gen.pod_model.v2_presence import V2Presence
 from symphony.bdk.gen.pod_model.v2_presence_status import V2PresenceStatus
 from symphony.bdk.gen.pod_model.v2_user_presence import V2UserPresence
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_PRESENCE_CONCURRENCY = 10
+DEFAULT_PRESENCE_INTEREST_CHUNK_SIZE = 100
+
 
 class PresenceStatus(Enum):
     """The list of all possible values for the presence status.
@@ -184,6 +192,66 @@ class OboPresenceService:
             session_token=await self._auth_session.session_token, presence=user_presence, soft=soft
         )
 
+    async def bulk_set_user_presence(
+        self,
+        user_presences: Union[
+            Iterable[Tuple[int, PresenceStatus]], AsyncIterable[Tuple[int, PresenceStatus]]
+        ],
+        soft: bool = True,
+        max_concurrency: int = DEFAULT_BULK_PRESENCE_CONCURRENCY,
+    ) -> AsyncGenerator[BulkResult[Tuple[int, PresenceStatus], V2Presence], None]:
+        """Sets the presence of many users, e.g. to reset presences after an outage.
+        Each user is updated with :func:`~OboPresenceService.set_user_presence`, and thus retried with the retry
+        configuration of the service, with at most `max_concurrency` concurrent calls. Pairs are read lazily, so that
+        very large inputs can be streamed, and results are yielded as soon as they are available, in completion order.
+        A user whose update still fails once the retries are exhausted does not stop the others.
+
+        :param user_presences: an iterable or an async iterable of `(user_id, status)` pairs.
+        :param soft: see :func:`~OboPresenceService.set_user_presence`.
+        :param max_concurrency: the maximum number of users updated concurrently.
+        :return: an async generator of :py:class:`~symphony.bdk.core.service.bulk.BulkResult`, one per user, whose
+          item is the `(user_id, status)` pair and value the presence returned by the pod.
+        """
+
+        async def set_presence(user_presence):
+            user_id, status = user_presence
+            return await self.set_user_presence(user_id, status, soft)
+
+        async for result in run_concurrently(user_presences, set_presence, max_concurrency):
+            if not result.is_successful:
+                logger.warning(
+                    "Failed to set presence of user %s: %s", result.item[0], result.error
+                )
+            yield result
+
+    async def bulk_external_presence_interest(
+        self,
+        user_ids: Union[Iterable[int], AsyncIterable[int]],
+        chunk_size: int = DEFAULT_PRESENCE_INTEREST_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_PRESENCE_CONCURRENCY,
+    ) -> AsyncGenerator[BulkResult[int, None], None]:
+        """Registers interest in the presence of many external users.
+        User ids are read lazily and split in chunks registered concurrently with
+        :func:`~OboPresenceService.external_presence_interest`. Results are yielded as soon as a chunk completes.
+
+        :param user_ids: an iterable or an async iterable of user ids.
+        :param chunk_size: the maximum number of user ids registered in one underlying HTTP call.
+        :param max_concurrency: the maximum number of chunks registered concurrently.
+        :return: an async generator of :py:class:`~symphony.bdk.core.service.bulk.BulkResult`, one per user id. Users
+          of a chunk which failed share the same error.
+        """
+        async for result in run_concurrently(
+            chunks(user_ids, chunk_size), self.external_presence_interest, max_concurrency
+        ):
+            if not result.is_successful:
+                logger.warning(
+                    "Failed to register presence interest of %s users: %s",
+                    len(result.item),
+                    result.error,
+                )
+            for user_id in result.item:
+                yield BulkResult(user_id, error=result.error)
+
 
 class PresenceService(OboPresenceService):
     """Service class for managing user presence information.
@@ -197,3 +265,36 @@ class PresenceService(OboPresenceService):
     * Read a created presence feed
     * Delete a created presence feed
     """
+
+    def __init__(
+        self, presence_api: PresenceApi, auth_session: AuthSession, retry_config: BdkRetryConfig
+    ):
+        super().__init__(presence_api, auth_session, retry_config)
+        self._presence_map = None
+
+    def use_presence_map(self, presence_map: PresenceMap) -> None:
+        """Makes :func:`~PresenceService.get_user_presence` answer from a presence map while it is live, instead of
+        calling the pod for each user.
+
+        :param presence_map: the :py:class:`~symphony.bdk.core.service.presence.presence_feed_loop.PresenceMap` kept
+          up to date by a running presence feed loop.
+        """
+        self._presence_map = presence_map
+
+    async def get_user_presence(self, user_id: int, local: bool) -> V2Presence:
+        """Get the presence info of a specified user. If a presence map is used and live, the presence of the users
+        it contains is returned without calling the pod, unless a local query is requested: the pod then reports
+        external users as OFFLINE, which the map does not.
+        See: `Get User Presence <https://developers.symphony.com/restapi/reference/user-presence-v3>`_.
+
+        :param user_id: User Id
+        :param local: If true then Perform a local query and set the presence to OFFLINE for  users who are not local to
+          the calling user’s pod. If false or absent then query the presence of all local  and external users who are
+          connected to the calling user.
+        :return: Presence info of the looked up user.
+        """
+        if not local and self._presence_map is not None and self._presence_map.is_live:
+            presence = self._presence_map.get(user_id)
+            if presence is not None:
+                return presence
+        return await super().get_user_presence(user_id, local)
@@ -0,0 +1,53 @@
+"""This module contains a token bucket rate limiter, used to share a throughput limit between concurrent calls to the
+Symphony APIs.
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Token bucket rate limiter: up to `burst` calls can be made at once, then calls are spread so that on average no
+    more than `rate` calls are made per second. Waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        """
+
+        :param rate: the maximum average number of calls per second.
+        :param burst: the maximum number of calls which can be made at once.
+        :param clock: the function returning the current time in seconds, mostly intended for tests.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be strictly positive")
+        if burst < 1:
+            raise ValueError("Burst must be greater than or equal to 1")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = None
+
+    @property
+    def rate(self) -> float:
+        """The maximum average number of calls per second."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Waits until a call can be made."""
+        if self._lock is None:
+            # created lazily to be bound to the running event loop
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
@@ -1,17 +1,98 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Tuple
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.bulk import chunks, run_concurrently
 from symphony.bdk.core.service.pagination import offset_based_pagination
 from symphony.bdk.gen.agent_api.signals_api import SignalsApi
 from symphony.bdk.gen.agent_model.base_signal import BaseSignal
 from symphony.bdk.gen.agent_model.channel_subscriber import ChannelSubscriber
 from symphony.bdk.gen.agent_model.channel_subscriber_response import ChannelSubscriberResponse
+from symphony.bdk.gen.agent_model.channel_subscription_error import ChannelSubscriptionError
 from symphony.bdk.gen.agent_model.channel_subscription_response import ChannelSubscriptionResponse
 from symphony.bdk.gen.agent_model.signal import Signal
 from symphony.bdk.gen.agent_model.signal_list import SignalList
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUBSCRIPTION_CHUNK_SIZE = 100
+DEFAULT_SUBSCRIPTION_CONCURRENCY = 5
+MAX_SUBSCRIBERS_PAGE_SIZE = 100
+
+
+class SignalSubscriptionReport:
+    """Merged result of the chunked subscriptions or unsubscriptions of users to a signal.
+
+    * `requested`, `successful` and `failed`: the number of users, summed over all the chunks,
+    * `subscription_errors`: the errors returned by the agent for single users,
+    * `failed_chunks`: the user ids of the chunks which could not be sent and the exceptions raised by the calls.
+      Users of these chunks are counted as failed.
+    """
+
+    def __init__(self, signal_id: str):
+        self.signal_id = signal_id
+        self.requested = 0
+        self.successful = 0
+        self.failed = 0
+        self.subscription_errors: List[ChannelSubscriptionError] = []
+        self.failed_chunks: List[Tuple[List[int], Exception]] = []
+
+    @property
+    def is_successful(self) -> bool:
+        """True if all the users have been processed successfully."""
+        return self.failed == 0
+
+    def add_response(self, response: ChannelSubscriptionResponse) -> None:
+        """Merges the response of a chunk into the report.
+
+        :param response: the response returned by the agent for the chunk.
+        """
+        self.requested += response.get("requested_subscription") or 0
+        self.successful += response.get("successful_subscription") or 0
+        self.failed += response.get("failed_subscription") or 0
+        self.subscription_errors.extend(response.get("subscription_errors") or [])
+
+    def add_failed_chunk(self, user_ids: List[int], exception: Exception) -> None:
+        """Marks all the users of a chunk as failed.
+
+        :param user_ids: the user ids of the chunk.
+        :param exception: the exception raised while sending the chunk.
+        """
+        self.requested += len(user_ids)
+        self.failed += len(user_ids)
+        self.failed_chunks.append((user_ids, exception))
+
+    def __repr__(self):
+        return (
+            f"SignalSubscriptionReport(signal_id={self.signal_id}, requested={self.requested}, "
+            f"successful={self.successful}, failed={self.failed})"
+        )
+
+
+class SignalSubscribersSync:
+    """Result of :func:`~OboSignalService.sync_subscribers`: the reports of the subscriptions of the missing users and
+    of the unsubscriptions of the extra ones.
+    """
+
+    def __init__(
+        self, subscribed: SignalSubscriptionReport, unsubscribed: SignalSubscriptionReport
+    ):
+        self.subscribed = subscribed
+        self.unsubscribed = unsubscribed
+
+    @property
+    def is_successful(self) -> bool:
+        """True if the subscribers of the signal are now the desired ones."""
+        return self.subscribed.is_successful and self.unsubscribed.is_successful
+
+    def __repr__(self):
+        return (
+            f"SignalSubscribersSync(subscribed={self.subscribed}, unsubscribed={self.unsubscribed})"
+        )
+
 
 class OboSignalService:
     """Service class exposing OBO-enabled endpoints to manage signal information.
@@ -221,6 +302,167 @@ class OboSignalService:
 
         return offset_based_pagination(list_subscribers_one_page, chunk_size, max_number)
 
+    async def bulk_subscribe_users_to_signals(
+        self,
+        signal_ids: Iterable[str],
+        pushed: bool,
+        user_ids: Iterable[int],
+        chunk_size: int = DEFAULT_SUBSCRIPTION_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_SUBSCRIPTION_CONCURRENCY,
+    ) -> Dict[str, SignalSubscriptionReport]:
+        """Subscribes a large number of users to one or several signals.
+        User ids are split in chunks sent with :func:`~OboSignalService.subscribe_users_to_signal`, the chunks of all
+        the signals being sent concurrently. A chunk which still fails once the retries are exhausted does not stop
+        the others.
+
+        :param signal_ids: the ids of the signals to be subscribed.
+        :param pushed: Prevents the users from unsubscribing from the signals.
+        :param user_ids: the ids of the users to subscribe, duplicates are ignored.
+        :param chunk_size: the maximum number of user ids sent in one underlying HTTP call.
+        :param max_concurrency: the maximum number of chunks sent concurrently, all signals included.
+        :return: the :py:class:`SignalSubscriptionReport` of each signal, keyed by signal id.
+        """
+
+        async def subscribe(signal_id, chunk):
+            return await self.subscribe_users_to_signal(signal_id, pushed, chunk)
+
+        return await self._send_in_chunks(
+            signal_ids, user_ids, subscribe, chunk_size, max_concurrency
+        )
+
+    async def bulk_unsubscribe_users_from_signals(
+        self,
+        signal_ids: Iterable[str],
+        user_ids: Iterable[int],
+        chunk_size: int = DEFAULT_SUBSCRIPTION_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_SUBSCRIPTION_CONCURRENCY,
+    ) -> Dict[str, SignalSubscriptionReport]:
+        """Unsubscribes a large number of users from one or several signals.
+        User ids are split in chunks sent with :func:`~OboSignalService.unsubscribe_users_to_signal`, the chunks of all
+        the signals being sent concurrently. A chunk which still fails once the retries are exhausted does not stop
+        the others.
+
+        :param signal_ids: the ids of the signals to be unsubscribed.
+        :param user_ids: the ids of the users to unsubscribe, duplicates are ignored.
+        :param chunk_size: the maximum number of user ids sent in one underlying HTTP call.
+        :param max_concurrency: the maximum number of chunks sent concurrently, all signals included.
+        :return: the :py:class:`SignalSubscriptionReport` of each signal, keyed by signal id.
+        """
+        return await self._send_in_chunks(
+            signal_ids, user_ids, self.unsubscribe_users_to_signal, chunk_size, max_concurrency
+        )
+
+    async def sync_subscribers(
+        self,
+        signal_id: str,
+        desired_user_ids: Iterable[int],
+        pushed: bool = False,
+        chunk_size: int = DEFAULT_SUBSCRIPTION_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_SUBSCRIPTION_CONCURRENCY,
+    ) -> SignalSubscribersSync:
+        """Makes the subscribers of a signal match the desired users, by only subscribing the missing users and
+        unsubscribing the extra ones. The owner of the signal is never unsubscribed.
+
+        Current subscribers are listed with :func:`~OboSignalService.list_subscribers`: once the first page has given
+        the total number of subscribers, the remaining pages are fetched concurrently. The missing users are then
+        subscribed before the extra ones are unsubscribed.
+
+        :param signal_id: the id of the signal.
+        :param desired_user_ids: the ids of the users who should be subscribed to the signal.
+        :param pushed: Prevents the subscribed users from unsubscribing from the signal.
+        :param chunk_size: the maximum number of user ids sent in one underlying HTTP call.
+        :param max_concurrency: the maximum number of pages fetched or chunks sent concurrently.
+        :return: the reports of the subscriptions and of the unsubscriptions.
+        """
+        desired_user_ids = list(dict.fromkeys(desired_user_ids))
+        subscribers = await self._get_all_subscribers(signal_id, max_concurrency)
+        desired = set(desired_user_ids)
+        to_subscribe = [user_id for user_id in desired_user_ids if user_id not in subscribers]
+        to_unsubscribe = [
+            user_id
+            for user_id, subscriber in subscribers.items()
+            if user_id not in desired and not subscriber.get("owner")
+        ]
+        logger.debug(
+            "Syncing subscribers of signal %s: %s to subscribe, %s to unsubscribe",
+            signal_id,
+            len(to_subscribe),
+            len(to_unsubscribe),
+        )
+        subscribed = await self.bulk_subscribe_users_to_signals(
+            [signal_id], pushed, to_subscribe, chunk_size, max_concurrency
+        )
+        unsubscribed = await self.bulk_unsubscribe_users_from_signals(
+            [signal_id], to_unsubscribe, chunk_size, max_concurrency
+        )
+        return SignalSubscribersSync(subscribed[signal_id], unsubscribed[signal_id])
+
+    async def _send_in_chunks(
+        self,
+        signal_ids: Iterable[str],
+        user_ids: Iterable[int],
+        call: Callable[[str, List[int]], Awaitable[ChannelSubscriptionResponse]],
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> Dict[str, SignalSubscriptionReport]:
+        user_ids = list(dict.fromkeys(user_ids))
+        reports = {signal_id: SignalSubscriptionReport(signal_id) for signal_id in signal_ids}
+
+        async def send_chunk(report_and_chunk):
+            report, chunk = report_and_chunk
+            return await call(report.signal_id, chunk)
+
+        async def chunks_of_all_signals():
+            async for chunk in chunks(user_ids, chunk_size):
+                for report in reports.values():
+                    yield report, chunk
+
+        async for result in run_concurrently(chunks_of_all_signals(), send_chunk, max_concurrency):
+            report, chunk = result.item
+            if result.is_successful:
+                report.add_response(result.value)
+            else:
+                logger.warning(
+                    "Failed to update %s subscriptions of signal %s: %s",
+                    len(chunk),
+                    report.signal_id,
+                    result.error,
+                )
+                report.add_failed_chunk(chunk, result.error)
+        return reports
+
+    async def _get_all_subscribers(
+        self, signal_id: str, max_concurrency: int
+    ) -> Dict[int, ChannelSubscriber]:
+        page_size = MAX_SUBSCRIBERS_PAGE_SIZE
+        first_page = await self.list_subscribers(signal_id, 0, page_size)
+        pages = [first_page]
+        total = first_page.get("total") if first_page else None
+        if total is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def list_page(skip):
+                async with semaphore:
+                    return await self.list_subscribers(signal_id, skip, page_size)
+
+            pages += await asyncio.gather(
+                *(list_page(skip) for skip in range(page_size, total, page_size))
+            )
+        else:
+            # the total is unknown, pages are fetched one after the other
+            skip = page_size
+            page = first_page
+            while page and len(page.get("data") or []) == page_size:
+                page = await self.list_subscribers(signal_id, skip, page_size)
+                pages.append(page)
+                skip += page_size
+        return {
+            subscriber.user_id: subscriber
+            for page in pages
+            if page
+            for subscriber in page.get("data") or []
+        }
+
 
 class SignalService(OboSignalService):
     """Service class for managing signal information.
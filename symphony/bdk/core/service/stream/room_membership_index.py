@@ -0,0 +1,239 @@
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.stream.stream_service import StreamService
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
+from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
+from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
+from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
+from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_admin_stream_filter import V2AdminStreamFilter
+from symphony.bdk.gen.pod_model.v2_admin_stream_type import V2AdminStreamType
+
+logger = logging.getLogger(__name__)
+
+ROOM_STREAM_TYPE = "ROOM"
+ACTIVE_STATUS = "ACTIVE"
+HANDLED_EVENT_TYPES = {
+    "USERJOINEDROOM",
+    "USERLEFTROOM",
+    "ROOMCREATED",
+    "ROOMDEACTIVATED",
+    "ROOMREACTIVATED",
+}
+
+
+class RoomMembershipIndex(RealTimeEventListener):
+    """In-memory index of room memberships, answering both "which rooms is this user in" and "who is in this room"
+    without calling the pod.
+
+    The index is seeded once with :func:`~StreamService.list_all_streams_admin` and
+    :func:`~StreamService.list_all_stream_members`, then kept up to date from the USERJOINEDROOM, USERLEFTROOM,
+    ROOMCREATED, ROOMDEACTIVATED and ROOMREACTIVATED datafeed events once subscribed to the datafeed loop.
+    Seeding requires the service account to have the permissions needed by these admin endpoints.
+
+    The index can be persisted to a local snapshot file to avoid a full reseed on restart.
+    """
+
+    def __init__(
+        self,
+        stream_service: StreamService,
+        snapshot_file_path: Path = None,
+        concurrency: int = 10,
+    ):
+        """
+
+        :param stream_service: the StreamService used to seed the index.
+        :param snapshot_file_path: the file the index is saved to and loaded from. If None, the index is not persisted.
+        :param concurrency: the maximum number of rooms whose members are retrieved concurrently while seeding.
+        """
+        self._stream_service = stream_service
+        self._snapshot_file_path = snapshot_file_path
+        self._concurrency = concurrency
+        self._room_members: Dict[str, Set[int]] = {}
+        self._user_rooms: Dict[int, Set[str]] = {}
+
+    def __len__(self):
+        return len(self._room_members)
+
+    @property
+    def room_ids(self) -> Set[str]:
+        """The ids of all the indexed rooms."""
+        return set(self._room_members)
+
+    def get_room_members(self, room_id: str) -> Set[int]:
+        """Returns the members of a room.
+
+        :param room_id: the id of the room.
+        :return: a copy of the set of member user ids, empty if the room is not indexed.
+        """
+        return set(self._room_members.get(room_id, ()))
+
+    def get_user_rooms(self, user_id: int) -> Set[str]:
+        """Returns the rooms a user is member of.
+
+        :param user_id: the id of the user.
+        :return: a copy of the set of room ids, empty if the user is not member of any indexed room.
+        """
+        return set(self._user_rooms.get(user_id, ()))
+
+    def is_member(self, user_id: int, room_id: str) -> bool:
+        """Checks if a user is member of a room.
+
+        :param user_id: the id of the user.
+        :param room_id: the id of the room.
+        :return: True if the user is member of the room, False otherwise.
+        """
+        return user_id in self._room_members.get(room_id, ())
+
+    async def initialize(self, stream_filter: V2AdminStreamFilter = None) -> None:
+        """Loads the index from the snapshot file if any, seeds it otherwise.
+
+        :param stream_filter: the filter used to list the rooms to be indexed if the index is seeded.
+        """
+        if not self.load_snapshot():
+            await self.seed(stream_filter)
+
+    async def seed(self, stream_filter: V2AdminStreamFilter = None, chunk_size: int = 100) -> None:
+        """Rebuilds the index by listing all the rooms of the pod and their members.
+
+        :param stream_filter: the filter used to list the rooms to be indexed.
+          Defaults to all the active rooms.
+        :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call.
+        """
+        if stream_filter is None:
+            stream_filter = V2AdminStreamFilter(
+                stream_types=[V2AdminStreamType(type=ROOM_STREAM_TYPE)], status=ACTIVE_STATUS
+            )
+        room_ids = [
+            stream.id
+            async for stream in await self._stream_service.list_all_streams_admin(
+                stream_filter, chunk_size
+            )
+        ]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def list_room_member_ids(room_id):
+            async with semaphore:
+                members = await self._stream_service.list_all_stream_members(room_id, chunk_size)
+                return room_id, [member.user.user_id async for member in members if member.user]
+
+        room_members = await asyncio.gather(*(list_room_member_ids(r) for r in room_ids))
+
+        self._room_members.clear()
+        self._user_rooms.clear()
+        for room_id, member_ids in room_members:
+            self._set_room_members(room_id, member_ids)
+        logger.debug("Room membership index seeded with %s rooms", len(self._room_members))
+
+    def add_member(self, room_id: str, user_id: int) -> None:
+        """Adds a member to a room, creating the room in the index if needed."""
+        self._room_members.setdefault(room_id, set()).add(user_id)
+        self._user_rooms.setdefault(user_id, set()).add(room_id)
+
+    def remove_member(self, room_id: str, user_id: int) -> None:
+        """Removes a member from a room."""
+        self._room_members.get(room_id, set()).discard(user_id)
+        rooms = self._user_rooms.get(user_id)
+        if rooms is not None:
+            rooms.discard(room_id)
+            if not rooms:
+                del self._user_rooms[user_id]
+
+    def remove_room(self, room_id: str) -> None:
+        """Removes a room and all its memberships from the index."""
+        for user_id in self._room_members.pop(room_id, set()):
+            self.remove_member(room_id, user_id)
+
+    def _set_room_members(self, room_id: str, member_ids: Iterable[int]) -> None:
+        self.remove_room(room_id)
+        self._room_members[room_id] = set()
+        for user_id in member_ids:
+            self.add_member(room_id, user_id)
+
+    @staticmethod
+    async def is_accepting_event(event: V4Event, bot_info: UserV2) -> bool:
+        """Accepts all the membership related events, including the ones initiated by the bot itself."""
+        return getattr(event, "type", None) in HANDLED_EVENT_TYPES
+
+    async def on_user_joined_room(self, initiator: V4Initiator, event: V4UserJoinedRoom):
+        if event.stream and event.affected_user:
+            self.add_member(event.stream.stream_id, event.affected_user.user_id)
+
+    async def on_user_left_room(self, initiator: V4Initiator, event: V4UserLeftRoom):
+        if event.stream and event.affected_user:
+            self.remove_member(event.stream.stream_id, event.affected_user.user_id)
+
+    async def on_room_created(self, initiator: V4Initiator, event: V4RoomCreated):
+        if event.stream:
+            member_ids = [member.user_id for member in event.stream.members or []]
+            if initiator and initiator.user:
+                # room creator is the first member of the room
+                member_ids.append(initiator.user.user_id)
+            self._set_room_members(event.stream.stream_id, member_ids)
+
+    async def on_room_deactivated(self, initiator: V4Initiator, event: V4RoomDeactivated):
+        if event.stream:
+            self.remove_room(event.stream.stream_id)
+
+    async def on_room_reactivated(self, initiator: V4Initiator, event: V4RoomReactivated):
+        if event.stream:
+            room_id = event.stream.stream_id
+            members = await self._stream_service.list_all_stream_members(room_id)
+            self._set_room_members(
+                room_id, [member.user.user_id async for member in members if member.user]
+            )
+
+    def load_snapshot(self) -> bool:
+        """Loads the index from the snapshot file.
+
+        :return: True if the index has been loaded, False if there is no snapshot or if it could not be read.
+        """
+        if self._snapshot_file_path is None or not os.path.exists(self._snapshot_file_path):
+            return False
+        try:
+            snapshot = json.loads(self._snapshot_file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning(
+                "Could not read room membership snapshot %s",
+                self._snapshot_file_path,
+                exc_info=True,
+            )
+            return False
+
+        self._room_members.clear()
+        self._user_rooms.clear()
+        for room_id, member_ids in snapshot.items():
+            self._set_room_members(room_id, member_ids)
+        logger.debug("Loaded %s rooms from room membership snapshot", len(self._room_members))
+        return True
+
+    def save_snapshot(self) -> bool:
+        """Persists the index to the snapshot file.
+
+        :return: True if the index has been written, False if there is no snapshot file or if it could not be
+          written.
+        """
+        if self._snapshot_file_path is None:
+            return False
+        snapshot = {room_id: sorted(members) for room_id, members in self._room_members.items()}
+        tmp_file_path = self._snapshot_file_path.with_name(self._snapshot_file_path.name + ".tmp")
+        try:
+            tmp_file_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            os.replace(tmp_file_path, self._snapshot_file_path)
+        except OSError:
+            logger.warning(
+                "Could not write room membership snapshot %s",
+                self._snapshot_file_path,
+                exc_info=True,
+            )
+            return False
+        return True
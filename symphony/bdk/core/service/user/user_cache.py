@@ -0,0 +1,228 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from symphony.bdk.core.service.cache import LruTtlCache
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.api_client import ApiClient, validate_and_convert_types
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DETAILS = "details"
+SNAPSHOT_USERS = "users"
+
+
+class UserCache(RealTimeEventListener):
+    """Cache of user details and user lookups used by the
+    :py:class:`~symphony.bdk.core.service.user.user_service.UserService`.
+
+    It holds two size-bounded LRU caches with time-to-live expiry:
+
+    * :py:class:`V2UserDetail` retrieved by :func:`UserService.get_user_detail`, keyed by user id,
+    * :py:class:`UserV2` retrieved by :func:`UserService.list_users_by_ids`, keyed by user id and `local` flag.
+
+    When subscribed to the datafeed loop, entries whose names or email no longer match the initiator of a received
+    event are invalidated. Entries can be persisted to a local snapshot file to be reloaded on restart.
+    """
+
+    def __init__(self, max_size: int, ttl: float, snapshot_file_path: Path = None):
+        """
+
+        :param max_size: the maximum number of entries of each of the underlying caches.
+        :param ttl: the time-to-live of the entries, in seconds.
+        :param snapshot_file_path: the file the cache is saved to and loaded from. If None, the cache is not persisted.
+        """
+        self._details = LruTtlCache(max_size, ttl)
+        self._users = LruTtlCache(max_size, ttl)
+        self._snapshot_file_path = snapshot_file_path
+
+    @property
+    def details(self) -> LruTtlCache:
+        """The cache of user details, keyed by user id."""
+        return self._details
+
+    @property
+    def users(self) -> LruTtlCache:
+        """The cache of users, keyed by a `(user_id, local)` tuple."""
+        return self._users
+
+    def stats(self) -> dict:
+        """Returns the hit, miss, eviction and expiration counters of the underlying caches.
+
+        :return: a dict with the `details` and `users` keys mapping to their
+          :py:class:`~symphony.bdk.core.service.cache.CacheStats`.
+        """
+        return {SNAPSHOT_DETAILS: self._details.stats, SNAPSHOT_USERS: self._users.stats}
+
+    def get_user_detail(self, user_id: int) -> Optional[V2UserDetail]:
+        """Returns the cached details of a user, None if not cached or expired."""
+        return self._details.get(user_id)
+
+    def put_user_detail(self, user_detail: V2UserDetail) -> None:
+        """Caches the details of a user, ignored if the details do not contain the user id."""
+        user_id = _get_user_detail_id(user_detail)
+        if user_id is not None:
+            self._details.put(user_id, user_detail)
+
+    def get_user(self, user_id: int, local: bool) -> Optional[UserV2]:
+        """Returns a user cached from a lookup with the same `local` flag, None if not cached or expired."""
+        return self._users.get((user_id, local))
+
+    def put_user(self, user: UserV2, local: bool) -> None:
+        """Caches a user returned by a lookup with the given `local` flag."""
+        user_id = getattr(user, "id", None)
+        if user_id is not None:
+            self._users.put((user_id, local), user)
+
+    def invalidate(self, user_id: int) -> None:
+        """Removes all entries related to a given user.
+
+        :param user_id: the id of the user.
+        """
+        self._details.invalidate(user_id)
+        self._users.invalidate((user_id, True))
+        self._users.invalidate((user_id, False))
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._details.clear()
+        self._users.clear()
+
+    async def is_accepting_event(self, event: V4Event, bot_info: UserV2) -> bool:
+        """Invalidates the cached entries of the event initiator if they are outdated.
+
+        The cache does not need to be called for any specific event type, so all events are rejected: no listener
+        task is created for it.
+
+        :param event: the received event.
+        :param bot_info: the bot service account information.
+        :return: always False.
+        """
+        user = getattr(getattr(event, "initiator", None), "user", None)
+        if user is not None and user.user_id is not None and self._is_outdated(user):
+            logger.debug("Invalidating cached user %s", user.user_id)
+            self.invalidate(user.user_id)
+        return False
+
+    def _is_outdated(self, user: V4User) -> bool:
+        detail = self._details.peek(user.user_id)
+        if detail is not None:
+            attributes = detail.user_attributes
+            if attributes is not None and not _match(
+                user,
+                attributes.display_name,
+                attributes.first_name,
+                attributes.last_name,
+                attributes.email_address,
+                attributes.user_name,
+            ):
+                return True
+        for local in (True, False):
+            cached_user = self._users.peek((user.user_id, local))
+            if cached_user is not None and not _match(
+                user,
+                cached_user.display_name,
+                cached_user.first_name,
+                cached_user.last_name,
+                cached_user.email_address,
+                cached_user.username,
+            ):
+                return True
+        return False
+
+    def load_snapshot(self) -> int:
+        """Loads the entries persisted in the snapshot file, expired entries are skipped.
+
+        :return: the number of loaded entries.
+        """
+        if self._snapshot_file_path is None or not os.path.exists(self._snapshot_file_path):
+            return 0
+        try:
+            snapshot = json.loads(self._snapshot_file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning(
+                "Could not read user cache snapshot %s", self._snapshot_file_path, exc_info=True
+            )
+            return 0
+
+        for entry in snapshot.get(SNAPSHOT_DETAILS, []):
+            self._details.put(
+                entry["key"], _deserialize(entry["value"], V2UserDetail), entry["expiresAt"]
+            )
+        for entry in snapshot.get(SNAPSHOT_USERS, []):
+            self._users.put(
+                tuple(entry["key"]), _deserialize(entry["value"], UserV2), entry["expiresAt"]
+            )
+        # drops the entries which expired while the bot was stopped
+        self._details.purge_expired()
+        self._users.purge_expired()
+        loaded = len(self._details) + len(self._users)
+        logger.debug("Loaded %s entries from user cache snapshot", loaded)
+        return loaded
+
+    def save_snapshot(self) -> bool:
+        """Persists the entries which are not expired yet to the snapshot file.
+
+        :return: True if the snapshot has been written, False if there is no snapshot file or if it could not be
+          written.
+        """
+        if self._snapshot_file_path is None:
+            return False
+        snapshot = {
+            SNAPSHOT_DETAILS: _serialize_entries(self._details),
+            SNAPSHOT_USERS: _serialize_entries(self._users),
+        }
+        tmp_file_path = self._snapshot_file_path.with_name(self._snapshot_file_path.name + ".tmp")
+        try:
+            tmp_file_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            os.replace(tmp_file_path, self._snapshot_file_path)
+        except OSError:
+            logger.warning(
+                "Could not write user cache snapshot %s", self._snapshot_file_path, exc_info=True
+            )
+            return False
+        return True
+
+
+def _get_user_detail_id(user_detail: V2UserDetail) -> Optional[int]:
+    return getattr(getattr(user_detail, "user_system_info", None), "id", None)
+
+
+def _match(user: V4User, display_name, first_name, last_name, email, username) -> bool:
+    expected = (
+        (user.display_name, display_name),
+        (user.first_name, first_name),
+        (user.last_name, last_name),
+        (user.email, email),
+        (user.username, username),
+    )
+    return all(event_value is None or event_value == value for event_value, value in expected)
+
+
+def _serialize_entries(cache: LruTtlCache) -> list:
+    return [
+        {
+            "key": key,
+            "expiresAt": expires_at,
+            "value": ApiClient.sanitize_for_serialization(value),
+        }
+        for key, expires_at, value in cache.items()
+    ]
+
+
+def _deserialize(payload, model):
+    return validate_and_convert_types(
+        input_value=payload,
+        required_types_mixed=(model,),
+        path_to_item=["snapshot"],
+        spec_property_naming=True,
+        _check_type=True,
+        configuration=Configuration(discard_unknown_keys=True),
+    )
@@ -6,11 +6,19 @@ from typing import AsyncGenerator, Union
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.delta_sync import (
+    DeltaSync,
+    DeltaSyncResult,
+    SnapshotStore,
+    content_fingerprint,
+)
 from symphony.bdk.core.service.pagination import cursor_based_pagination, offset_based_pagination
 from symphony.bdk.core.service.user.model.delegate_action_enum import DelegateActionEnum
 from symphony.bdk.core.service.user.model.role_id import RoleId
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.gen.agent_api.audit_trail_api import AuditTrailApi
 from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_list import V1AuditTrailInitiatorList
+from symphony.bdk.gen.api_client import ApiClient
 from symphony.bdk.gen.pod_api.system_api import SystemApi
 from symphony.bdk.gen.pod_api.user_api import UserApi
 from symphony.bdk.gen.pod_api.users_api import UsersApi
@@ -236,6 +244,9 @@ class UserService(OboUserService):
     * Get, assign or unassign disclaimer to a user
     * Get, update feature entitlements of a user
     * Get, update status of a user
+
+    If a :py:class:`~symphony.bdk.core.service.user.user_cache.UserCache` is given, user details and users looked up
+    by ids are served from it when possible.
     """
 
     def __init__(
@@ -247,13 +258,81 @@ class UserService(OboUserService):
         auth_session: AuthSession,
         retry_config: BdkRetryConfig,
         manifest: str,
+        user_cache: UserCache = None,
     ):
         super().__init__(user_api, users_api, auth_session, retry_config)
         self._audit_trail_api = audit_trail_api
         self._system_api = system_api
         self._manifest = manifest
+        self._user_cache = user_cache
+
+    @property
+    def user_cache(self) -> UserCache:
+        """The user cache used by this service.
+
+        :return: the :py:class:`UserCache` instance, None if the cache is not enabled.
+        """
+        return self._user_cache
+
+    async def warm_up_user_cache(self, chunk_size: int = 100, max_number: int = None) -> int:
+        """Fills the user cache with the details of the users of the company (pod), using
+        :func:`~list_all_user_details`. Does nothing if the cache is not enabled.
+
+        :param chunk_size: the maximum number of user details to retrieve in one underlying HTTP call.
+        :param max_number: the total maximum number of user details to retrieve. If set to None, we retrieve
+                           all users until the last page.
+        :return: the number of user details put in the cache.
+        """
+        if self._user_cache is None:
+            return 0
+        count = 0
+        async for user_detail in await self.list_all_user_details(chunk_size, max_number):
+            self._user_cache.put_user_detail(user_detail)
+            count += 1
+        return count
+
+    async def list_users_by_ids(
+        self, user_ids: [int], local: bool = False, active: bool = None
+    ) -> V2UserList:
+        """Search users by user ids.
+        See : `Users Lookup v3 <https://developers.symphony.com/restapi/reference/users-lookup-v3>`_
+
+        If the user cache is enabled and `active` is not set, only the users missing from the cache are looked up.
+
+        :param user_ids:    List of user ids.
+        :param local:       If true then a local DB search will be performed and only local pod users will be
+                            returned. If absent or false then a directory search will be performed and users
+                            from other pods who are visible to the calling user will also be returned.
+        :param active:      If not set all user status will be returned,
+                            if true all active users will be returned,
+                            if false all inactive users will be returned.
+
+        :return: Users found by user ids.
+        """
+        if self._user_cache is None or active is not None:
+            return await super().list_users_by_ids(user_ids, local, active)
+
+        user_ids = list(dict.fromkeys(user_ids))
+        users_by_id = {}
+        missing_user_ids = []
+        for user_id in user_ids:
+            user = self._user_cache.get_user(user_id, local)
+            if user is None:
+                missing_user_ids.append(user_id)
+            else:
+                users_by_id[user_id] = user
+        errors = []
+        if missing_user_ids:
+            user_list = await super().list_users_by_ids(missing_user_ids, local)
+            for user in getattr(user_list, "users", None) or []:
+                self._user_cache.put_user(user, local)
+                users_by_id[user.id] = user
+            errors = getattr(user_list, "errors", None) or []
+
+        # users are returned in the order of the requested ids, whether they were cached or not
+        users = [users_by_id.pop(user_id) for user_id in user_ids if user_id in users_by_id]
+        return V2UserList(users=users + list(users_by_id.values()), errors=errors)
 
-    @retry
     async def get_user_detail(self, user_id: int) -> V2UserDetail:
         """Retrieve user details of a particular user.
         See: 'Get User v2 <https://developers.symphony.com/restapi/reference/get-user-v2>'_
@@ -261,9 +340,24 @@ class UserService(OboUserService):
         :param user_id: User Id
         :return: Details of the user.
         """
+        if self._user_cache is not None:
+            user_detail = self._user_cache.get_user_detail(user_id)
+            if user_detail is not None:
+                return user_detail
+        user_detail = await self._get_user_detail(user_id)
+        if self._user_cache is not None:
+            self._user_cache.put_user_detail(user_detail)
+        return user_detail
+
+    @retry
+    async def _get_user_detail(self, user_id: int) -> V2UserDetail:
         params = {"uid": user_id, "session_token": await self._auth_session.session_token}
         return await self._user_api.v2_admin_user_uid_get(**params)
 
+    def _invalidate_cached_user(self, user_id: int) -> None:
+        if self._user_cache is not None:
+            self._user_cache.invalidate(user_id)
+
     @retry
     async def list_user_details(self, skip: int = 0, limit: int = 50) -> [V2UserDetail]:
         """Retrieve all users in the company (pod).
@@ -296,6 +390,27 @@ class UserService(OboUserService):
         """
         return offset_based_pagination(self.list_user_details, chunk_size, max_number)
 
+    async def sync_user_details(
+        self, store: SnapshotStore, chunk_size: int = 50
+    ) -> DeltaSyncResult[V2UserDetail]:
+        """Walks all users in the company (pod) and returns the ones added, changed or removed since the last sync
+        committed to the same snapshot store. Users are identified by their user id and fingerprinted by their whole
+        content but their last login date, so that users who only logged in are not reported as changed. As the
+        underlying API has no filter on the last update date, all users are listed, but only the changes have to be
+        processed by the caller, who then commits them with ``store.commit(result)``.
+        See: :py:class:`~symphony.bdk.core.service.delta_sync.DeltaSync`
+
+        :param store: the store of the snapshot of the last committed sync.
+        :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
+        :return: the added and changed user details, and the ids of the removed users, as strings.
+        """
+        delta_sync = DeltaSync(
+            store,
+            key=lambda user_detail: user_detail.user_system_info.id,
+            fingerprint=_user_detail_fingerprint,
+        )
+        return await delta_sync.sync(await self.list_all_user_details(chunk_size=chunk_size))
+
     @retry
     async def list_user_details_by_filter(
         self, user_filter: UserFilter, skip: int = 0, limit: int = 50
@@ -351,6 +466,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_roles_add_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def list_roles(self) -> [RoleDetail]:
@@ -377,6 +493,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_roles_remove_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def get_avatar(self, user_id: int) -> [Avatar]:
@@ -407,6 +524,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_avatar_update_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def get_disclaimer(self, user_id: int) -> Disclaimer:
@@ -428,6 +546,7 @@ class UserService(OboUserService):
         """
         params = {"uid": user_id, "session_token": await self._auth_session.session_token}
         await self._user_api.v1_admin_user_uid_disclaimer_delete(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def add_disclaimer(self, user_id: int, disclaimer_id: str) -> None:
@@ -443,6 +562,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_disclaimer_update_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def get_delegates(self, user_id: int) -> [int]:
@@ -500,6 +620,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_features_update_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def get_status(self, user_id: int) -> UserStatus:
@@ -526,6 +647,7 @@ class UserService(OboUserService):
             "session_token": await self._auth_session.session_token,
         }
         await self._user_api.v1_admin_user_uid_status_update_post(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def list_user_followers(
@@ -638,7 +760,9 @@ class UserService(OboUserService):
             "payload": payload,
             "session_token": await self._auth_session.session_token,
         }
-        return await self._user_api.v2_admin_user_uid_update_post(**params)
+        user_detail = await self._user_api.v2_admin_user_uid_update_post(**params)
+        self._invalidate_cached_user(user_id)
+        return user_detail
 
     @retry
     async def list_audit_trail(
@@ -732,6 +856,7 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def suspend(self, user_id: int, reason: str = None, until: int = None) -> None:
@@ -754,6 +879,7 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def unsuspend(self, user_id: int) -> None:
@@ -771,6 +897,7 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate_cached_user(user_id)
 
     @retry
     async def update_manifest_from_json(self, manifest_data: str) -> None:
@@ -810,3 +937,9 @@ class UserService(OboUserService):
         return await self._user_api.v1_user_manifest_own_get(
             session_token=await self._auth_session.session_token
         )
+
+
+def _user_detail_fingerprint(user_detail: V2UserDetail) -> str:
+    content = ApiClient.sanitize_for_serialization(user_detail)
+    (content.get("userSystemInfo") or {}).pop("lastLoginDate", None)
+    return content_fingerprint(content)
@@ -4,6 +4,7 @@ from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.client.api_client_factory import ApiClientFactory
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.service.application.application_service import ApplicationService
+from symphony.bdk.core.service.connection.connection_cache import ConnectionCache
 from symphony.bdk.core.service.connection.connection_service import (
     ConnectionService,
     OboConnectionService,
@@ -21,10 +22,15 @@ from symphony.bdk.core.service.message.message_service import MessageService, Ob
 from symphony.bdk.core.service.message.multi_attachments_messages_api import (
     MultiAttachmentsMessagesApi,
 )
+from symphony.bdk.core.service.message.send_queue import MessageSendQueue
+from symphony.bdk.core.service.presence.presence_feed_loop import PresenceFeedLoop
 from symphony.bdk.core.service.presence.presence_service import OboPresenceService, PresenceService
+from symphony.bdk.core.service.rate_limiter import RateLimiter
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import OboSignalService, SignalService
+from symphony.bdk.core.service.stream.room_membership_index import RoomMembershipIndex
 from symphony.bdk.core.service.stream.stream_service import OboStreamService, StreamService
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.core.service.user.user_service import OboUserService, UserService
 from symphony.bdk.core.service.version.agent_version_service import AgentVersionService
 from symphony.bdk.gen.agent_api.attachments_api import AttachmentsApi
@@ -33,6 +39,7 @@ from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
 from symphony.bdk.gen.agent_api.share_api import ShareApi
 from symphony.bdk.gen.agent_api.signals_api import SignalsApi
 from symphony.bdk.gen.agent_api.system_api import SystemApi as AgentSystemApi
+from symphony.bdk.gen.api_client import ApiClient
 from symphony.bdk.gen.pod_api.app_entitlement_api import AppEntitlementApi
 from symphony.bdk.gen.pod_api.application_api import ApplicationApi
 from symphony.bdk.gen.pod_api.connection_api import ConnectionApi
@@ -63,13 +70,18 @@ class ServiceFactory:
     def __init__(
         self, api_client_factory: ApiClientFactory, auth_session: AuthSession, config: BdkConfig
     ):
-        self._pod_client = api_client_factory.get_pod_client()
-        self._agent_client = api_client_factory.get_agent_client()
+        self._api_client_factory = api_client_factory
         self._auth_session = auth_session
         self._config = config
-        self._session_service = SessionService(
-            SessionApi(self._pod_client), self._auth_session, self._config.retry
-        )
+        self._session_service = None
+
+    @property
+    def _pod_client(self) -> ApiClient:
+        return self._api_client_factory.get_pod_client()
+
+    @property
+    def _agent_client(self) -> ApiClient:
+        return self._api_client_factory.get_agent_client()
 
     def get_user_service(self) -> UserService:
         """Returns a fully initialized UserService
@@ -84,8 +96,21 @@ class ServiceFactory:
             self._auth_session,
             self._config.retry,
             self._config.manifest,
+            self._get_user_cache(),
         )
 
+    def _get_user_cache(self) -> UserCache:
+        user_cache_config = self._config.user_cache
+        if not user_cache_config.enabled:
+            return None
+        user_cache = UserCache(
+            user_cache_config.max_size,
+            user_cache_config.ttl.total_seconds(),
+            user_cache_config.snapshot_file_path,
+        )
+        user_cache.load_snapshot()
+        return user_cache
+
     def get_message_service(self) -> MessageService:
         """Returns a fully initialized MessageService
 
@@ -103,13 +128,41 @@ class ServiceFactory:
             self._config.retry,
         )
 
+    def get_send_queue(self) -> MessageSendQueue:
+        """Returns a MessageSendQueue if enabled in the configuration.
+
+        :return: a new MessageSendQueue instance, None if not enabled.
+        """
+        queue_config = self._config.send_queue
+        if not queue_config.enabled:
+            return None
+        rate_limiter = (
+            RateLimiter(queue_config.rate_limit, queue_config.burst)
+            if queue_config.rate_limit
+            else None
+        )
+        return MessageSendQueue(
+            self.get_message_service(), queue_config.max_concurrent_streams, rate_limiter
+        )
+
     def get_connection_service(self) -> ConnectionService:
         """Returns a fully initialized ConnectionService
 
         :return: a new ConnectionService instance.
         """
         return ConnectionService(
-            ConnectionApi(self._pod_client), self._auth_session, self._config.retry
+            ConnectionApi(self._pod_client),
+            self._auth_session,
+            self._config.retry,
+            self._get_connection_cache(),
+        )
+
+    def _get_connection_cache(self) -> ConnectionCache:
+        connection_cache_config = self._config.connection_cache
+        if not connection_cache_config.enabled:
+            return None
+        return ConnectionCache(
+            connection_cache_config.max_size, connection_cache_config.ttl.total_seconds()
         )
 
     def get_stream_service(self) -> StreamService:
@@ -125,6 +178,18 @@ class ServiceFactory:
             self._config.retry,
         )
 
+    def get_room_membership_index(self) -> RoomMembershipIndex:
+        """Returns a RoomMembershipIndex if enabled in the configuration. The index still has to be initialized.
+
+        :return: a new RoomMembershipIndex instance, None if not enabled.
+        """
+        index_config = self._config.room_membership_index
+        if not index_config.enabled:
+            return None
+        return RoomMembershipIndex(
+            self.get_stream_service(), index_config.snapshot_file_path, index_config.concurrency
+        )
+
     def get_application_service(self) -> ApplicationService:
         """Returns a fully initialized ApplicationService
 
@@ -145,10 +210,14 @@ class ServiceFactory:
         return SignalService(SignalsApi(self._agent_client), self._auth_session, self._config.retry)
 
     def get_session_service(self) -> SessionService:
-        """Returns a fully initialized SessionService
+        """Returns a fully initialized SessionService, shared with the datafeed and datahose loops
 
-        :return: a new SessionService instance
+        :return: the SessionService instance
         """
+        if self._session_service is None:
+            self._session_service = SessionService(
+                SessionApi(self._pod_client), self._auth_session, self._config.retry
+            )
         return self._session_service
 
     def get_datafeed_loop(self) -> AbstractDatafeedLoop:
@@ -160,12 +229,15 @@ class ServiceFactory:
         if df_version.lower() == DatafeedVersion.V1.value.lower():
             return DatafeedLoopV1(
                 DatafeedApi(self._agent_client),
-                self._session_service,
+                self.get_session_service(),
                 self._auth_session,
                 self._config,
             )
         return DatafeedLoopV2(
-            DatafeedApi(self._agent_client), self._session_service, self._auth_session, self._config
+            DatafeedApi(self._agent_client),
+            self.get_session_service(),
+            self._auth_session,
+            self._config,
         )
 
     def get_datahose_loop(self) -> AbstractDatahoseLoop:
@@ -176,7 +248,7 @@ class ServiceFactory:
         if self._config.datahose is not None:
             return DatahoseLoop(
                 DatafeedApi(self._agent_client),
-                self._session_service,
+                self.get_session_service(),
                 self._auth_session,
                 self._config,
             )
@@ -199,6 +271,15 @@ class ServiceFactory:
             PresenceApi(self._pod_client), self._auth_session, self._config.retry
         )
 
+    def get_presence_feed_loop(self) -> PresenceFeedLoop:
+        """Returns a fully initialized PresenceFeedLoop
+
+        :return: a new PresenceFeedLoop instance
+        """
+        return PresenceFeedLoop(
+            PresenceApi(self._pod_client), self._auth_session, self._config.presence_feed
+        )
+
     def get_agent_version_service(self) -> AgentVersionService:
         """Returns a fully initialized AgentVersionService
 
@@ -221,11 +302,18 @@ class OboServiceFactory:
     def __init__(
         self, api_client_factory: ApiClientFactory, auth_session: AuthSession, config: BdkConfig
     ):
-        self._pod_client = api_client_factory.get_pod_client()
-        self._agent_client = api_client_factory.get_agent_client()
+        self._api_client_factory = api_client_factory
         self._auth_session = auth_session
         self._config = config
 
+    @property
+    def _pod_client(self) -> ApiClient:
+        return self._api_client_factory.get_pod_client()
+
+    @property
+    def _agent_client(self) -> ApiClient:
+        return self._api_client_factory.get_agent_client()
+
     def get_user_service(self) -> OboUserService:
         """Returns a fully initialized OboUserService
 
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+from typing import Optional
 
 from symphony.bdk.core.activity.registry import ActivityRegistry
 from symphony.bdk.core.auth.auth_session import AuthSession, OboAuthSession
@@ -11,19 +12,24 @@ from symphony.bdk.core.auth.ext_app_authenticator import ExtensionAppAuthenticat
 from symphony.bdk.core.client.api_client_factory import ApiClientFactory
 from symphony.bdk.core.config.exception import BdkConfigError, BotNotConfiguredError
 from symphony.bdk.core.extension import ExtensionService
+from symphony.bdk.core.metrics import BdkMetrics, get_metrics, set_metrics
 from symphony.bdk.core.service.application.application_service import ApplicationService
 from symphony.bdk.core.service.connection.connection_service import ConnectionService
 from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop
 from symphony.bdk.core.service.datafeed.abstract_datahose_loop import AbstractDatahoseLoop
 from symphony.bdk.core.service.health.health_service import HealthService
 from symphony.bdk.core.service.message.message_service import MessageService
+from symphony.bdk.core.service.message.send_queue import MessageSendQueue
 from symphony.bdk.core.service.obo_services import OboServices
+from symphony.bdk.core.service.presence.presence_feed_loop import PresenceFeedLoop
 from symphony.bdk.core.service.presence.presence_service import PresenceService
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import SignalService
+from symphony.bdk.core.service.stream.room_membership_index import RoomMembershipIndex
 from symphony.bdk.core.service.stream.stream_service import StreamService
 from symphony.bdk.core.service.user.user_service import UserService
 from symphony.bdk.core.service_factory import ServiceFactory
+from symphony.bdk.core.tracing import Tracer, get_tracer, set_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -70,16 +76,35 @@ class SymphonyBdk:
     """BDK entry point"""
 
     async def __aenter__(self):
+        if self._service_factory is not None:
+            if self._config.user_cache.enabled and self._config.user_cache.warm_up:
+                await self.users().warm_up_user_cache()
+            if self._config.connection_cache.enabled and self._config.connection_cache.warm_up:
+                await self.connections().warm_up_connection_cache()
+            if self._config.room_membership_index.enabled:
+                await self.room_memberships().initialize()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close_clients()
 
-    def __init__(self, config):
+    def __init__(self, config, metrics: BdkMetrics = None, tracer: Tracer = None):
+        """
+
+        :param config: the bot configuration.
+        :param metrics: the :py:class:`~symphony.bdk.core.metrics.BdkMetrics` to report API calls, retries,
+          authentication refreshes and datafeed loop iterations to. Metrics are registered process wide.
+          If None, previously registered metrics are kept, none by default.
+        :param tracer: the :py:class:`~symphony.bdk.core.tracing.Tracer` creating spans for datafeed event dispatches
+          and API calls. The tracer is registered process wide. If None, a previously registered tracer is kept,
+          none by default.
+        """
+        if metrics is not None:
+            set_metrics(metrics)
+        if tracer is not None:
+            set_tracer(tracer)
         self._config = config
         self._api_client_factory = ApiClientFactory(config)
-        self._pod_client = self._api_client_factory.get_pod_client()
-        self._agent_client = self._api_client_factory.get_agent_client()
         self._authenticator_factory = AuthenticatorFactory(
             config, api_client_factory=self._api_client_factory
         )
@@ -98,7 +123,11 @@ class SymphonyBdk:
         self._datahose_loop = None
         self._health_service = None
         self._presence_service = None
+        self._presence_feed_loop = None
         self._activity_registry = None
+        self._room_membership_index = None
+        self._send_queue = None
+        self._extension_service = None
 
         if self._config.bot.is_authentication_configured():
             self._initialize_bot_services()
@@ -111,28 +140,28 @@ class SymphonyBdk:
     def _initialize_bot_services(self):
         bot_authenticator = self._authenticator_factory.get_bot_authenticator()
         self._bot_session = AuthSession(bot_authenticator)
+        # services, and the api clients they rely on, are created on first access
         self._service_factory = ServiceFactory(
             self._api_client_factory, self._bot_session, self._config
         )
-        self._user_service = self._service_factory.get_user_service()
-        self._message_service = self._service_factory.get_message_service()
-        self._connection_service = self._service_factory.get_connection_service()
-        self._stream_service = self._service_factory.get_stream_service()
-        self._application_service = self._service_factory.get_application_service()
-        self._signal_service = self._service_factory.get_signal_service()
-        self._session_service = self._service_factory.get_session_service()
-        self._datafeed_loop = self._service_factory.get_datafeed_loop()
-        self._datahose_loop = self._service_factory.get_datahose_loop()
-        self._health_service = self._service_factory.get_health_service()
-        self._presence_service = self._service_factory.get_presence_service()
-        # creates ActivityRegistry that subscribes to DF Loop events
-        self._activity_registry = ActivityRegistry(self._session_service)
-        self._datafeed_loop.subscribe(self._activity_registry)
-        # initialises extension service and register decorated extensions
-        self._extension_service = ExtensionService(
-            self._api_client_factory, self._bot_session, self._config
+        bot_authenticator.set_agent_version_service_factory(
+            self._service_factory.get_agent_version_service
         )
-        bot_authenticator.agent_version_service = self._service_factory.get_agent_version_service()
+
+    def metrics(self) -> BdkMetrics:
+        """Get the metrics the BDK reports to.
+
+        :return: the registered :py:class:`~symphony.bdk.core.metrics.BdkMetrics`, a no-op instance if none was
+          registered.
+        """
+        return get_metrics()
+
+    def tracer(self) -> Optional[Tracer]:
+        """Get the tracer creating spans for datafeed event dispatches and API calls.
+
+        :return: the registered :py:class:`~symphony.bdk.core.tracing.Tracer`, None if tracing is disabled.
+        """
+        return get_tracer()
 
     @bot_service
     def bot_session(self) -> AuthSession:
@@ -188,22 +217,56 @@ class SymphonyBdk:
 
         :return: The MessageService instance.
         """
+        if self._message_service is None:
+            self._message_service = self._service_factory.get_message_service()
         return self._message_service
 
+    @bot_service
+    def send_queue(self) -> MessageSendQueue:
+        """Get the MessageSendQueue from the BDK entry point.
+
+        :return: The MessageSendQueue instance, None if not enabled in the configuration.
+        """
+        if self._send_queue is None:
+            self._send_queue = self._service_factory.get_send_queue()
+        return self._send_queue
+
     @bot_service
     def streams(self) -> StreamService:
         """Get the StreamService from the BDK entry point.
 
         :return: The StreamService instance.
         """
+        if self._stream_service is None:
+            self._stream_service = self._service_factory.get_stream_service()
         return self._stream_service
 
+    @bot_service
+    def room_memberships(self) -> RoomMembershipIndex:
+        """Get the RoomMembershipIndex from the BDK entry point.
+
+        :return: The RoomMembershipIndex instance, None if not enabled in the configuration.
+        """
+        if self._room_membership_index is None:
+            self._room_membership_index = self._service_factory.get_room_membership_index()
+        return self._room_membership_index
+
     @bot_service
     def datafeed(self) -> AbstractDatafeedLoop:
         """Get the Datafeed loop from the BDK entry point.
 
         :return: The Datafeed Loop instance.
         """
+        if self._datafeed_loop is None:
+            self._datafeed_loop = self._service_factory.get_datafeed_loop()
+            # keeps activities, cached users and connections and room memberships up to date from DF Loop events
+            self._datafeed_loop.subscribe(self.activities())
+            if self._config.user_cache.enabled:
+                self._datafeed_loop.subscribe(self.users().user_cache)
+            if self._config.connection_cache.enabled:
+                self._datafeed_loop.subscribe(self.connections().connection_cache)
+            if self._config.room_membership_index.enabled:
+                self._datafeed_loop.subscribe(self.room_memberships())
         return self._datafeed_loop
 
     @bot_service
@@ -212,6 +275,8 @@ class SymphonyBdk:
 
         :return:
         """
+        if self._datahose_loop is None:
+            self._datahose_loop = self._service_factory.get_datahose_loop()
         return self._datahose_loop
 
     @bot_service
@@ -220,6 +285,8 @@ class SymphonyBdk:
 
         :return: The UserService instance.
         """
+        if self._user_service is None:
+            self._user_service = self._service_factory.get_user_service()
         return self._user_service
 
     @bot_service
@@ -228,6 +295,8 @@ class SymphonyBdk:
 
         :return: The ConnectionService instance.
         """
+        if self._connection_service is None:
+            self._connection_service = self._service_factory.get_connection_service()
         return self._connection_service
 
     @bot_service
@@ -236,6 +305,8 @@ class SymphonyBdk:
 
         :return: The ApplicationService instance.
         """
+        if self._application_service is None:
+            self._application_service = self._service_factory.get_application_service()
         return self._application_service
 
     @bot_service
@@ -244,6 +315,8 @@ class SymphonyBdk:
 
         :return: The SignalService instance.
         """
+        if self._signal_service is None:
+            self._signal_service = self._service_factory.get_signal_service()
         return self._signal_service
 
     @bot_service
@@ -252,6 +325,8 @@ class SymphonyBdk:
 
         :return: The SessionService instance.
         """
+        if self._session_service is None:
+            self._session_service = self._service_factory.get_session_service()
         return self._session_service
 
     @bot_service
@@ -260,6 +335,8 @@ class SymphonyBdk:
 
         :return: The HealthService instance.
         """
+        if self._health_service is None:
+            self._health_service = self._service_factory.get_health_service()
         return self._health_service
 
     @bot_service
@@ -268,8 +345,22 @@ class SymphonyBdk:
 
         :return: The PresenceService instance.
         """
+        if self._presence_service is None:
+            self._presence_service = self._service_factory.get_presence_service()
         return self._presence_service
 
+    @bot_service
+    def presence_feed(self) -> PresenceFeedLoop:
+        """Get the PresenceFeedLoop from the BDK entry point.
+
+        :return: The PresenceFeedLoop instance.
+        """
+        if self._presence_feed_loop is None:
+            self._presence_feed_loop = self._service_factory.get_presence_feed_loop()
+            # answers get_user_presence from the presence map while the loop is running
+            self.presence().use_presence_map(self._presence_feed_loop.presence_map)
+        return self._presence_feed_loop
+
     @bot_service
     def activities(self) -> ActivityRegistry:
         """Get the :class:`ActivityRegistry` from the BDK entry point.
@@ -277,6 +368,8 @@ class SymphonyBdk:
         :return: The :class:`ActivityRegistry` instance.
 
         """
+        if self._activity_registry is None:
+            self._activity_registry = ActivityRegistry(self.sessions())
         return self._activity_registry
 
     @bot_service
@@ -284,8 +377,23 @@ class SymphonyBdk:
         """
         :return: The :class:`ExtensionService` instance
         """
+        if self._extension_service is None:
+            self._extension_service = ExtensionService(
+                self._api_client_factory, self._bot_session, self._config
+            )
         return self._extension_service
 
     async def close_clients(self):
-        """Close all the existing api clients created by the api client factory."""
-        await self._api_client_factory.close_clients()
+        """Close all the existing api clients created by the api client factory.
+        The send queue, if enabled, is closed and flushed beforehand. The user cache and the room membership index,
+        if enabled, are persisted to their snapshot files.
+        """
+        try:
+            if self._send_queue is not None:
+                await self._send_queue.close()
+            if self._user_service is not None and self._user_service.user_cache is not None:
+                self._user_service.user_cache.save_snapshot()
+            if self._room_membership_index is not None:
+                self._room_membership_index.save_snapshot()
+        finally:
+            await self._api_client_factory.close_clients()
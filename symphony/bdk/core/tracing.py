@@ -0,0 +1,256 @@
+"""Module containing the optional span based tracing of datafeed event dispatches and of the API calls they make.
+
+Spans follow the OpenTelemetry model: they share a 128-bit trace id with their parent, have a 64-bit span id, a
+start and end time in nanoseconds since epoch, attributes named after the OpenTelemetry semantic conventions and an
+`OK` or `ERROR` status. Finished spans are handed to a :py:class:`SpanExporter`, which can forward them to any
+collector.
+
+A :py:class:`Tracer` is registered process wide with :func:`set_tracer`, which is done by
+:py:class:`~symphony.bdk.core.symphony_bdk.SymphonyBdk` when it is given one. When no tracer is registered, no span is
+created.
+"""
+
+import functools
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from symphony.bdk.gen.exceptions import ApiException
+
+HTTP_REQUEST_METHOD = "http.request.method"
+HTTP_RESPONSE_STATUS_CODE = "http.response.status_code"
+URL_TEMPLATE = "url.template"
+OPERATION_ID = "symphony.operation_id"
+EVENT_TYPE = "symphony.event.type"
+EVENT_ID = "symphony.event.id"
+LISTENER = "symphony.listener"
+HTTP_REQUEST_RESEND_COUNT = "http.request.resend_count"
+
+API_CALL_SPAN_NAME = "symphony.api_call"
+DATAFEED_DISPATCH_SPAN_NAME = "symphony.datafeed.dispatch"
+
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+_current_span = ContextVar("_current_span", default=None)
+_retry_attempt = ContextVar("_retry_attempt", default=None)
+
+
+class Span:
+    """A timed operation, possibly child of another span."""
+
+    def __init__(
+        self, name: str, trace_id: str, span_id: str, parent_span_id: str = None, attributes=None
+    ):
+        """
+
+        :param name: the name of the span.
+        :param trace_id: the 32 hexadecimal characters id of the trace the span belongs to.
+        :param span_id: the 16 hexadecimal characters id of the span.
+        :param parent_span_id: the id of the parent span, None for a root span.
+        :param attributes: the initial attributes of the span.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes) if attributes else {}
+        self.events = []
+        self.status = STATUS_OK
+        self.start_time = time.time_ns()
+        self.end_time = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The duration of the span in seconds, None if it has not ended yet."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value) -> None:
+        """Sets an attribute of the span.
+
+        :param key: the attribute name.
+        :param value: the attribute value.
+        """
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes=None) -> None:
+        """Records an event which happened during the span.
+
+        :param name: the name of the event.
+        :param attributes: the attributes of the event.
+        """
+        self.events.append((name, time.time_ns(), dict(attributes) if attributes else {}))
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Records an exception and sets the span status to `ERROR`.
+
+        :param exception: the raised exception.
+        """
+        self.status = STATUS_ERROR
+        self.add_event(
+            "exception",
+            {"exception.type": type(exception).__name__, "exception.message": str(exception)},
+        )
+
+    def end(self) -> None:
+        """Ends the span."""
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+
+    def __repr__(self):
+        return (
+            f"Span(name={self.name!r}, trace_id={self.trace_id}, span_id={self.span_id}, "
+            f"parent_span_id={self.parent_span_id}, status={self.status}, duration={self.duration})"
+        )
+
+
+class SpanExporter:
+    """Receives the finished spans. This implementation drops them."""
+
+    def export(self, span: Span) -> None:
+        """Called once a span has ended. It is called synchronously on the event loop and must return quickly.
+
+        :param span: the finished span.
+        """
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the finished spans in memory, mostly intended for tests."""
+
+    def __init__(self):
+        self._spans = []
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def get_finished_spans(self, name: str = None) -> List[Span]:
+        """Returns the finished spans, in the order they ended.
+
+        :param name: if set, only the spans with this name are returned.
+        :return: the list of spans.
+        """
+        return [span for span in self._spans if name is None or span.name == name]
+
+    def clear(self) -> None:
+        """Removes all the finished spans."""
+        self._spans.clear()
+
+
+class Tracer:
+    """Creates spans and hands them to an exporter once finished."""
+
+    def __init__(self, exporter: SpanExporter = None):
+        """
+
+        :param exporter: the exporter of the finished spans. Spans are dropped if None.
+        """
+        self._exporter = exporter if exporter is not None else SpanExporter()
+
+    @contextmanager
+    def start_span(self, name: str, attributes=None) -> Iterator[Span]:
+        """Starts a span, child of the current one if any, and makes it the current span until the context exits.
+        An exception raised in the context is recorded in the span and propagated.
+
+        :param name: the name of the span.
+        :param attributes: the initial attributes of the span.
+        :return: a context manager yielding the started span.
+        """
+        parent = _current_span.get()
+        span = Span(
+            name,
+            parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}",
+            f"{random.getrandbits(64):016x}",
+            parent.span_id if parent is not None else None,
+            attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._exporter.export(span)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns the registered tracer.
+
+    :return: the registered :py:class:`Tracer`, None if tracing is disabled.
+    """
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Registers the tracer used to create spans.
+
+    :param tracer: the :py:class:`Tracer` instance, None to disable tracing.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def get_current_span() -> Optional[Span]:
+    """Returns the span of the current context.
+
+    :return: the current :py:class:`Span`, None if there is none.
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def retry_attempt(attempt_number: int) -> Iterator[None]:
+    """Context manager marking the API calls made within it as belonging to a given attempt of a retried call, so
+    that their spans carry the number of times the request has been resent.
+
+    :param attempt_number: the number of the attempt, starting at 1.
+    """
+    token = _retry_attempt.set(attempt_number)
+    try:
+        yield
+    finally:
+        _retry_attempt.reset(token)
+
+
+def trace_api_call(api_client, call_api):
+    """Decorator of ApiClient.__call_api function so that each HTTP call is recorded in a span, child of the current
+    span if any.
+
+    :param api_client: the ApiClient instance whose function is decorated, used to read the response status.
+    :param call_api: the function to be decorated.
+    :return: the decorated function.
+    """
+
+    @functools.wraps(call_api)
+    async def traced_call_api(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return await call_api(*args, **kwargs)
+
+        attributes = {OPERATION_ID: kwargs.get("_operation_id")}
+        if len(args) > 1:
+            attributes[URL_TEMPLATE] = args[0]
+            attributes[HTTP_REQUEST_METHOD] = args[1]
+        attempt_number = _retry_attempt.get()
+        if attempt_number is not None and attempt_number > 1:
+            attributes[HTTP_REQUEST_RESEND_COUNT] = attempt_number - 1
+        with tracer.start_span(API_CALL_SPAN_NAME, attributes) as span:
+            try:
+                result = await call_api(*args, **kwargs)
+            except ApiException as exc:
+                span.set_attribute(HTTP_RESPONSE_STATUS_CODE, exc.status)
+                raise
+            if api_client.last_response is not None:
+                span.set_attribute(HTTP_RESPONSE_STATUS_CODE, api_client.last_response.status)
+            return result
+
+    return traced_call_api
@@ -1,5 +1,13 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+import time
+from asyncio import TimeoutError
+from contextvars import ContextVar
+from typing import AsyncGenerator, Dict, Iterable, List, Optional
 
+from aiohttp import ClientConnectionError
+
+from symphony.bdk.core.auth.jwt_helper import extract_token_claims
 from symphony.bdk.core.extension import (
     BdkApiClientFactoryAware,
     BdkAuthenticationAware,
@@ -8,10 +16,18 @@ from symphony.bdk.core.extension import (
 )
 from symphony.bdk.core.retry import retry
 from symphony.bdk.core.retry.strategy import is_network_or_minor_error, is_unauthorized
+from symphony.bdk.core.service.delta_sync import (
+    DeltaSync,
+    DeltaSyncResult,
+    SnapshotStore,
+    content_fingerprint,
+)
 from symphony.bdk.core.service.pagination import cursor_based_pagination
 from symphony.bdk.core.service.user.user_util import extract_tenant_id
+from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.group_api.group_api import GroupApi
 from symphony.bdk.gen.group_model.add_member import AddMember
+from symphony.bdk.gen.group_model.base_profile import BaseProfile
 from symphony.bdk.gen.group_model.create_group import CreateGroup
 from symphony.bdk.gen.group_model.group_list import GroupList
 from symphony.bdk.gen.group_model.member import Member
@@ -21,6 +37,18 @@ from symphony.bdk.gen.group_model.status import Status
 from symphony.bdk.gen.group_model.update_group import UpdateGroup
 from symphony.bdk.gen.group_model.upload_avatar import UploadAvatar
 from symphony.bdk.gen.login_api.authentication_api import AuthenticationApi
+from symphony.bdk.gen.login_model.jwt_token import JwtToken
+
+logger = logging.getLogger(__name__)
+
+BEARER_TOKEN_RENEWAL_MARGIN_SECONDS = 60
+DEFAULT_SYNC_BATCH_SIZE = 500
+DEFAULT_SYNC_CONCURRENCY = 5
+DEFAULT_SYNC_MAX_CONFLICTS = 3
+ETAG_CONFLICT_STATUSES = (409, 412)
+
+# bearer token sent by the current call, to know whether it has already been refreshed when the call is unauthorized
+_sent_bearer_token: ContextVar[Optional[str]] = ContextVar("_sent_bearer_token", default=None)
 
 
 async def refresh_bearer_token_if_unauthorized(retry_state):
@@ -33,11 +61,71 @@ async def refresh_bearer_token_if_unauthorized(retry_state):
         exception = retry_state.outcome.exception()
         if is_network_or_minor_error(exception):
             if is_unauthorized(exception):
-                await retry_state.args[0]._oauth_session.refresh()
+                await retry_state.args[0]._oauth_session.refresh_if_unchanged()
             return True
     return False
 
 
+class GroupSyncResult:
+    """Changes applied to the members of a group by
+    :py:meth:`~SymphonyGroupService.sync_group_members`.
+    """
+
+    def __init__(self, group_id: str):
+        self.group_id = group_id
+        self.added: List[int] = []
+        self.removed: List[int] = []
+        self.updates = 0
+        self.conflicts = 0
+        self.group: Optional[ReadGroup] = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def changed(self) -> bool:
+        """True if members have been added or removed."""
+        return bool(self.added or self.removed)
+
+    @property
+    def is_successful(self) -> bool:
+        """True if the members of the group are the desired ones."""
+        return self.error is None
+
+    def __repr__(self):
+        return (
+            f"GroupSyncResult(group_id={self.group_id!r}, added={len(self.added)}, "
+            f"removed={len(self.removed)}, updates={self.updates}, conflicts={self.conflicts}, "
+            f"error={self.error!r})"
+        )
+
+
+class GroupSyncReport:
+    """Results of :py:meth:`~SymphonyGroupService.bulk_sync_group_members`, keyed by group id."""
+
+    def __init__(self):
+        self.results: Dict[str, GroupSyncResult] = {}
+
+    @property
+    def changed_group_ids(self) -> List[str]:
+        """Ids of the groups whose members have been changed."""
+        return [group_id for group_id, result in self.results.items() if result.changed]
+
+    @property
+    def failed_group_ids(self) -> List[str]:
+        """Ids of the groups which could not be synchronized."""
+        return [group_id for group_id, result in self.results.items() if not result.is_successful]
+
+    @property
+    def is_successful(self) -> bool:
+        """True if all the groups have been synchronized."""
+        return not self.failed_group_ids
+
+    def __repr__(self):
+        return (
+            f"GroupSyncReport(groups={len(self.results)}, changed={len(self.changed_group_ids)}, "
+            f"failed={len(self.failed_group_ids)})"
+        )
+
+
 class SymphonyGroupBdkExtension(
     BdkAuthenticationAware, BdkApiClientFactoryAware, BdkConfigAware, BdkExtensionServiceProvider
 ):
@@ -140,6 +228,25 @@ class SymphonyGroupService:
 
         return cursor_based_pagination(groups_one_page, chunk_size, max_number)
 
+    async def sync_groups(
+        self, store: SnapshotStore, status: Status = None, chunk_size: int = 100
+    ) -> DeltaSyncResult[ReadGroup]:
+        """Walks the groups of type SDL and returns the ones added, changed or removed since the last sync committed to
+        the same snapshot store. Groups are identified by their id and fingerprinted by their eTag, which changes at
+        each update. As the underlying API has no filter on the last update date, all groups are listed, but only the
+        changes have to be processed by the caller, who then commits them with ``store.commit(result)``.
+        See: :py:class:`~symphony.bdk.core.service.delta_sync.DeltaSync`
+
+        :param store:       the store of the snapshot of the last committed sync.
+        :param status:      filter by status, active or deleted. If not specified, all of them are returned.
+        :param chunk_size:  the maximum number of groups to return in one HTTP call. Default: 100.
+        :return:            the added and changed groups, and the ids of the removed groups.
+        """
+        delta_sync = DeltaSync(store, key=lambda group: group.id, fingerprint=_group_fingerprint)
+        return await delta_sync.sync(
+            await self.list_all_groups(status=status, chunk_size=chunk_size)
+        )
+
     @retry(retry=refresh_bearer_token_if_unauthorized)
     async def update_group(
         self, if_match: str, group_id: str, update_group: UpdateGroup
@@ -181,6 +288,125 @@ class SymphonyGroupService:
         """
         return await self._group_api.get_group(x_symphony_host="", group_id=group_id)
 
+    async def sync_group_members(
+        self,
+        group_id: str,
+        member_ids: Iterable[int],
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        max_conflicts: int = DEFAULT_SYNC_MAX_CONFLICTS,
+    ) -> GroupSyncResult:
+        """Makes the members of a group match the given user ids. The current members are diffed against the desired
+        ones and the changes are applied by :py:meth:`update_group` calls of at most `batch_size` additions and
+        removals each. When the group has been modified concurrently, i.e. its eTag changed, the group is retrieved
+        again and the remaining changes are computed from its latest version. Members which have been sent once in a
+        successful update are not sent again, even if the pod did not apply them, e.g. an invalid user id.
+
+        :param group_id: the ID of the group.
+        :param member_ids: the IDs of the users who should be members of the group.
+        :param batch_size: the maximum number of members added or removed by a single update. Default: 500.
+        :param max_conflicts: the maximum number of eTag conflicts before giving up. Default: 3.
+        :return: the members added and removed, and the updated group.
+        :raise ApiException: if the group could not be retrieved or updated.
+        :raise ValueError: if the batch size is not strictly positive.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be strictly positive")
+        result = GroupSyncResult(group_id)
+        await self._sync_group_members(result, member_ids, batch_size, max_conflicts)
+        return result
+
+    async def _sync_group_members(
+        self,
+        result: GroupSyncResult,
+        member_ids: Iterable[int],
+        batch_size: int,
+        max_conflicts: int,
+    ):
+        group_id = result.group_id
+        desired_ids = set(member_ids)
+        sent_ids = set()
+        group = await self.get_group(group_id)
+        while True:
+            current_ids = _member_ids(group)
+            to_add = [
+                member_id
+                for member_id in desired_ids
+                if member_id not in current_ids and member_id not in sent_ids
+            ]
+            to_remove = [
+                member_id
+                for member_id in current_ids
+                if member_id not in desired_ids and member_id not in sent_ids
+            ]
+            if not to_add and not to_remove:
+                break
+
+            added = to_add[:batch_size]
+            removed = to_remove[: batch_size - len(added)]
+            try:
+                group = await self.update_group(
+                    group.e_tag, group_id, _to_update_group(group, set(removed), added)
+                )
+            except ApiException as exc:
+                if exc.status not in ETAG_CONFLICT_STATUSES or result.conflicts >= max_conflicts:
+                    raise
+                result.conflicts += 1
+                logger.debug("Group %s modified concurrently, retrieving it again", group_id)
+                group = await self.get_group(group_id)
+                continue
+            sent_ids.update(added)
+            sent_ids.update(removed)
+            updated_ids = set(_member_ids(group))
+            result.updates += 1
+            result.group = group
+            result.added.extend(member_id for member_id in added if member_id in updated_ids)
+            result.removed.extend(
+                member_id for member_id in removed if member_id not in updated_ids
+            )
+
+        result.group = group
+
+    async def bulk_sync_group_members(
+        self,
+        members_by_group_id: Dict[str, Iterable[int]],
+        max_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        max_conflicts: int = DEFAULT_SYNC_MAX_CONFLICTS,
+    ) -> GroupSyncReport:
+        """Synchronizes the members of several groups concurrently, see :py:meth:`sync_group_members`. A group which
+        fails to be synchronized does not stop the other ones, its error is kept in the report along with the changes
+        applied before the failure.
+
+        :param members_by_group_id: the IDs of the users who should be members of each group, keyed by group ID.
+        :param max_concurrency: the maximum number of groups synchronized at once. Default: 5.
+        :param batch_size: the maximum number of members added or removed by a single update. Default: 500.
+        :param max_conflicts: the maximum number of eTag conflicts per group before giving up. Default: 3.
+        :return: the report of the changes applied to each group.
+        :raise ValueError: if the batch size is not strictly positive.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be strictly positive")
+        report = GroupSyncReport()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def sync_group(group_id, member_ids):
+            result = GroupSyncResult(group_id)
+            report.results[group_id] = result
+            async with semaphore:
+                try:
+                    await self._sync_group_members(result, member_ids, batch_size, max_conflicts)
+                except (ApiException, ClientConnectionError, TimeoutError) as exc:
+                    logger.warning("Failed to synchronize members of group %s: %s", group_id, exc)
+                    result.error = exc
+
+        await asyncio.gather(
+            *(
+                sync_group(group_id, member_ids)
+                for group_id, member_ids in members_by_group_id.items()
+            )
+        )
+        return report
+
     @retry(retry=refresh_bearer_token_if_unauthorized)
     async def add_member_to_group(self, group_id: str, user_id: int) -> ReadGroup:
         """Add a new user to an existing group.
@@ -197,38 +423,138 @@ class SymphonyGroupService:
 
 
 class OAuthSession:
-    """Used to handle the bearer token needed to call Groups endpoints."""
+    """Used to handle the bearer token needed to call Groups endpoints.
+
+    Concurrent refreshes share a single IDM token request, and the token is renewed before it expires, based on the
+    expiration of its claims.
+    """
 
     def __init__(self, login_client, session, retry_config):
         self._authentication_api = AuthenticationApi(login_client)
         self._auth_session = session
         self._bearer_token = None
+        self._expire_at = None
+        self._auth_settings = None
+        self._refresh_task = None
         self._retry_config = retry_config
 
-    @retry
     async def refresh(self):
-        """Refreshes internal Bearer authentication token from the bot sessionToken."""
-        jwt_token = await self._authentication_api.idm_tokens_post(
-            await self._auth_session.session_token, scope="profile-manager"
-        )
-        self._bearer_token = jwt_token.access_token
+        """Refreshes internal Bearer authentication token from the bot sessionToken.
+        If a refresh is already in progress, waits for it instead of requesting another token.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refresh_task)
+
+    async def refresh_if_unchanged(self):
+        """Refreshes the bearer token after the current call has been rejected as unauthorized, unless the token sent
+        by the call has already been refreshed in the meantime, e.g. by another concurrent call.
+        """
+        sent_bearer_token = _sent_bearer_token.get()
+        if sent_bearer_token is not None and sent_bearer_token != self._bearer_token:
+            logger.debug("Bearer token already refreshed")
+            return
+        await self.refresh()
 
     async def get_auth_settings(self):
         """Used to set the authorization header defined in api_client.ApiClient.update_params_for_auth
 
         :return: the map of auth_settings containing the header value with the current bearer token
         """
-        return {
+        bearer_token = await self._get_bearer_token()
+        _sent_bearer_token.set(bearer_token)
+        return self._auth_settings
+
+    @retry
+    async def _refresh(self):
+        jwt_token = await self._authentication_api.idm_tokens_post(
+            await self._auth_session.session_token, scope="profile-manager"
+        )
+        self._set_bearer_token(jwt_token)
+
+    def _set_bearer_token(self, jwt_token: JwtToken):
+        self._bearer_token = jwt_token.access_token
+        self._expire_at = _get_expiration(jwt_token)
+        self._auth_settings = {
             "bearerAuth": {
                 "in": "header",
                 "type": "bearer",
                 "key": "Authorization",
-                "value": "Bearer " + await self._get_bearer_token(),
+                "value": "Bearer " + self._bearer_token,
             }
         }
 
     async def _get_bearer_token(self):
-        """Returns the bearer token"""
-        if self._bearer_token is None:
+        """Returns the bearer token, renewed if it is about to expire"""
+        if self._bearer_token is None or (
+            self._expire_at is not None
+            and time.time() >= self._expire_at - BEARER_TOKEN_RENEWAL_MARGIN_SECONDS
+        ):
             await self.refresh()
         return self._bearer_token
+
+
+def _group_fingerprint(group: ReadGroup) -> str:
+    e_tag = getattr(group, "e_tag", None)
+    return e_tag if e_tag else content_fingerprint(group)
+
+
+def _member_ids(group: ReadGroup) -> List[int]:
+    return [
+        member.member_id for member in group.get("members") or [] if member.member_id is not None
+    ]
+
+
+def _to_update_group(group: ReadGroup, removed_ids: set, added_ids: List[int]) -> UpdateGroup:
+    """Builds the update of a group keeping all its fields but the members"""
+    members = [
+        Member(member_id=member.member_id, member_tenant=member.member_tenant)
+        for member in group.get("members") or []
+        if member.member_id is not None and member.member_id not in removed_ids
+    ]
+    members.extend(
+        Member(member_id=member_id, member_tenant=extract_tenant_id(member_id))
+        for member_id in added_ids
+    )
+    optional_fields = {
+        field: group.get(field)
+        for field in (
+            "sub_type",
+            "referrer",
+            "visibility_restriction",
+            "implicit_connection",
+            "interaction_transfer",
+            "status",
+        )
+        if group.get(field) is not None
+    }
+    profile = group.get("profile")
+    if profile is not None:
+        optional_fields["profile"] = BaseProfile(
+            **{
+                field: value
+                for field, value in profile.to_dict().items()
+                if field in BaseProfile.attribute_map and value is not None
+            }
+        )
+    return UpdateGroup(
+        type=group.type,
+        owner_type=group.owner_type,
+        owner_id=group.owner_id,
+        name=group.name,
+        id=group.id,
+        e_tag=group.e_tag,
+        members=members,
+        **optional_fields,
+    )
+
+
+def _get_expiration(jwt_token: JwtToken) -> Optional[float]:
+    """Returns the expiration timestamp in seconds of the token, from its claims or from its expires_in field"""
+    expiration = extract_token_claims(jwt_token.access_token).get("exp")
+    if expiration is not None:
+        return float(expiration)
+    expires_in = getattr(jwt_token, "expires_in", None)
+    if expires_in is not None:
+        return time.time() + expires_in
+    return None
@@ -1 +1,171 @@
 # do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from symphony.bdk.gen.agent_model import AckId`
+import importlib
+
+_MODEL_MODULES = {
+    "AckId": "ack_id",
+    "AgentInfo": "agent_info",
+    "AttachmentInfo": "attachment_info",
+    "BaseMessage": "base_message",
+    "BaseSignal": "base_signal",
+    "ChannelSubscriber": "channel_subscriber",
+    "ChannelSubscriberResponse": "channel_subscriber_response",
+    "ChannelSubscriptionError": "channel_subscription_error",
+    "ChannelSubscriptionResponse": "channel_subscription_response",
+    "ConnectionRequestMessage": "connection_request_message",
+    "ConnectionRequestMessageAllOf": "connection_request_message_all_of",
+    "Datafeed": "datafeed",
+    "Error": "error",
+    "ImportResponse": "import_response",
+    "ImportResponseList": "import_response_list",
+    "ImportedMessage": "imported_message",
+    "IngestionError": "ingestion_error",
+    "Message": "message",
+    "MessageAllOf": "message_all_of",
+    "MessageImportList": "message_import_list",
+    "MessageList": "message_list",
+    "MessageSearchQuery": "message_search_query",
+    "MessageSubmission": "message_submission",
+    "Pagination": "pagination",
+    "PaginationCursors": "pagination_cursors",
+    "RoomCreatedMessage": "room_created_message",
+    "RoomCreatedMessageAllOf": "room_created_message_all_of",
+    "RoomDeactivatedMessage": "room_deactivated_message",
+    "RoomDeactivatedMessageAllOf": "room_deactivated_message_all_of",
+    "RoomMemberDemotedFromOwnerMessage": "room_member_demoted_from_owner_message",
+    "RoomMemberDemotedFromOwnerMessageAllOf": "room_member_demoted_from_owner_message_all_of",
+    "RoomMemberPromotedToOwnerMessage": "room_member_promoted_to_owner_message",
+    "RoomMemberPromotedToOwnerMessageAllOf": "room_member_promoted_to_owner_message_all_of",
+    "RoomReactivatedMessage": "room_reactivated_message",
+    "RoomReactivatedMessageAllOf": "room_reactivated_message_all_of",
+    "RoomTag": "room_tag",
+    "RoomUpdatedMessage": "room_updated_message",
+    "RoomUpdatedMessageAllOf": "room_updated_message_all_of",
+    "ShareArticle": "share_article",
+    "ShareContent": "share_content",
+    "Signal": "signal",
+    "SignalAllOf": "signal_all_of",
+    "SignalList": "signal_list",
+    "SimpleMessage": "simple_message",
+    "SuccessResponse": "success_response",
+    "UserJoinedRoomMessage": "user_joined_room_message",
+    "UserJoinedRoomMessageAllOf": "user_joined_room_message_all_of",
+    "UserLeftRoomMessage": "user_left_room_message",
+    "UserLeftRoomMessageAllOf": "user_left_room_message_all_of",
+    "V1AuditTrailInitiatorList": "v1_audit_trail_initiator_list",
+    "V1AuditTrailInitiatorResponse": "v1_audit_trail_initiator_response",
+    "V1DLPContentType": "v1_dlp_content_type",
+    "V1DLPDictionary": "v1_dlp_dictionary",
+    "V1DLPDictionaryContent": "v1_dlp_dictionary_content",
+    "V1DLPDictionaryMetadata": "v1_dlp_dictionary_metadata",
+    "V1DLPDictionaryMetadataCollectionResponse": "v1_dlp_dictionary_metadata_collection_response",
+    "V1DLPDictionaryMetadataCreateRequest": "v1_dlp_dictionary_metadata_create_request",
+    "V1DLPDictionaryMetadataResponse": "v1_dlp_dictionary_metadata_response",
+    "V1DLPDictionaryMetadataUpdateRequest": "v1_dlp_dictionary_metadata_update_request",
+    "V1DLPDictionaryRef": "v1_dlp_dictionary_ref",
+    "V1DLPMatchedPolicy": "v1_dlp_matched_policy",
+    "V1DLPMatchedPolicyList": "v1_dlp_matched_policy_list",
+    "V1DLPOutcome": "v1_dlp_outcome",
+    "V1DLPPoliciesCollectionResponse": "v1_dlp_policies_collection_response",
+    "V1DLPPolicy": "v1_dlp_policy",
+    "V1DLPPolicyRequest": "v1_dlp_policy_request",
+    "V1DLPPolicyResponse": "v1_dlp_policy_response",
+    "V1DLPSignal": "v1_dlp_signal",
+    "V1DLPStream": "v1_dlp_stream",
+    "V1DLPViolation": "v1_dlp_violation",
+    "V1DLPViolationMessage": "v1_dlp_violation_message",
+    "V1DLPViolationMessageResponse": "v1_dlp_violation_message_response",
+    "V1DLPViolationSignal": "v1_dlp_violation_signal",
+    "V1DLPViolationSignalResponse": "v1_dlp_violation_signal_response",
+    "V1DLPViolationStream": "v1_dlp_violation_stream",
+    "V1DLPViolationStreamResponse": "v1_dlp_violation_stream_response",
+    "V1HealthCheckResponse": "v1_health_check_response",
+    "V2BaseMessage": "v2_base_message",
+    "V2Error": "v2_error",
+    "V2HealthCheckResponse": "v2_health_check_response",
+    "V2ImportResponse": "v2_import_response",
+    "V2ImportResponseList": "v2_import_response_list",
+    "V2ImportedMessage": "v2_imported_message",
+    "V2Message": "v2_message",
+    "V2MessageAllOf": "v2_message_all_of",
+    "V2MessageImportList": "v2_message_import_list",
+    "V2MessageList": "v2_message_list",
+    "V2MessageSubmission": "v2_message_submission",
+    "V3DLPDictionaryMeta": "v3_dlp_dictionary_meta",
+    "V3DLPFileClassifierConfig": "v3_dlp_file_classifier_config",
+    "V3DLPFileExtensionConfig": "v3_dlp_file_extension_config",
+    "V3DLPFilePasswordConfig": "v3_dlp_file_password_config",
+    "V3DLPFileSizeConfig": "v3_dlp_file_size_config",
+    "V3DLPPoliciesCollectionResponse": "v3_dlp_policies_collection_response",
+    "V3DLPPolicy": "v3_dlp_policy",
+    "V3DLPPolicyAppliesTo": "v3_dlp_policy_applies_to",
+    "V3DLPPolicyRequest": "v3_dlp_policy_request",
+    "V3DLPPolicyResponse": "v3_dlp_policy_response",
+    "V3DLPRule": "v3_dlp_rule",
+    "V3DLPTextMatchConfig": "v3_dlp_text_match_config",
+    "V3DLPViolation": "v3_dlp_violation",
+    "V3DLPViolationMessage": "v3_dlp_violation_message",
+    "V3DLPViolationMessageResponse": "v3_dlp_violation_message_response",
+    "V3DLPViolationSignal": "v3_dlp_violation_signal",
+    "V3DLPViolationSignalResponse": "v3_dlp_violation_signal_response",
+    "V3DLPViolationStream": "v3_dlp_violation_stream",
+    "V3DLPViolationStreamResponse": "v3_dlp_violation_stream_response",
+    "V3Health": "v3_health",
+    "V3HealthAuthType": "v3_health_auth_type",
+    "V3HealthComponent": "v3_health_component",
+    "V3HealthStatus": "v3_health_status",
+    "V4AttachmentInfo": "v4_attachment_info",
+    "V4ConnectionAccepted": "v4_connection_accepted",
+    "V4ConnectionRequested": "v4_connection_requested",
+    "V4Event": "v4_event",
+    "V4EventList": "v4_event_list",
+    "V4GenericSystemEvent": "v4_generic_system_event",
+    "V4ImportResponse": "v4_import_response",
+    "V4ImportResponseList": "v4_import_response_list",
+    "V4ImportedMessage": "v4_imported_message",
+    "V4ImportedMessageAttachment": "v4_imported_message_attachment",
+    "V4Initiator": "v4_initiator",
+    "V4InstantMessageCreated": "v4_instant_message_created",
+    "V4KeyValuePair": "v4_key_value_pair",
+    "V4Message": "v4_message",
+    "V4MessageBlastResponse": "v4_message_blast_response",
+    "V4MessageImportList": "v4_message_import_list",
+    "V4MessageList": "v4_message_list",
+    "V4MessageSent": "v4_message_sent",
+    "V4MessageSuppressed": "v4_message_suppressed",
+    "V4Payload": "v4_payload",
+    "V4RoomCreated": "v4_room_created",
+    "V4RoomDeactivated": "v4_room_deactivated",
+    "V4RoomMemberDemotedFromOwner": "v4_room_member_demoted_from_owner",
+    "V4RoomMemberPromotedToOwner": "v4_room_member_promoted_to_owner",
+    "V4RoomProperties": "v4_room_properties",
+    "V4RoomReactivated": "v4_room_reactivated",
+    "V4RoomUpdated": "v4_room_updated",
+    "V4SharedPost": "v4_shared_post",
+    "V4Stream": "v4_stream",
+    "V4SymphonyElementsAction": "v4_symphony_elements_action",
+    "V4ThumbnailInfo": "v4_thumbnail_info",
+    "V4User": "v4_user",
+    "V4UserJoinedRoom": "v4_user_joined_room",
+    "V4UserLeftRoom": "v4_user_left_room",
+    "V4UserRequestedToJoinRoom": "v4_user_requested_to_join_room",
+    "V5Datafeed": "v5_datafeed",
+    "V5DatafeedCreateBody": "v5_datafeed_create_body",
+    "V5DatafeedEventType": "v5_datafeed_event_type",
+    "V5DatafeedType": "v5_datafeed_type",
+    "V5EventList": "v5_event_list",
+    "V5EventsReadBody": "v5_events_read_body",
+}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.channel_subscription_error import ChannelSubscriptionError
-globals()['ChannelSubscriptionError'] = ChannelSubscriptionError
+def lazy_import():
+    from symphony.bdk.gen.agent_model.channel_subscription_error import ChannelSubscriptionError
+    globals()['ChannelSubscriptionError'] = ChannelSubscriptionError
 
 class ChannelSubscriptionResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class ChannelSubscriptionResponse(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class ChannelSubscriptionResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'requested_subscription': (int, none_type),  # noqa: E501
             'successful_subscription': (int, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class ChannelSubscriptionResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.room_member_promoted_to_owner_message_all_of import RoomMemberPromotedToOwnerMessageAllOf
-from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
-globals()['RoomMemberPromotedToOwnerMessageAllOf'] = RoomMemberPromotedToOwnerMessageAllOf
-globals()['V2BaseMessage'] = V2BaseMessage
+def lazy_import():
+    from symphony.bdk.gen.agent_model.room_member_promoted_to_owner_message_all_of import RoomMemberPromotedToOwnerMessageAllOf
+    from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
+    globals()['RoomMemberPromotedToOwnerMessageAllOf'] = RoomMemberPromotedToOwnerMessageAllOf
+    globals()['V2BaseMessage'] = V2BaseMessage
 
 class RoomMemberPromotedToOwnerMessage(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class RoomMemberPromotedToOwnerMessage(ModelComposed):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class RoomMemberPromotedToOwnerMessage(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'timestamp': (str,),  # noqa: E501
             'v2message_type': (str,),  # noqa: E501
@@ -96,6 +99,7 @@ class RoomMemberPromotedToOwnerMessage(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         val = {
         }
         if not val:
@@ -319,6 +323,7 @@ class RoomMemberPromotedToOwnerMessage(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
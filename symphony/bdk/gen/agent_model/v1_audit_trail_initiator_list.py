@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.pagination import Pagination
-from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_response import V1AuditTrailInitiatorResponse
-globals()['Pagination'] = Pagination
-globals()['V1AuditTrailInitiatorResponse'] = V1AuditTrailInitiatorResponse
+def lazy_import():
+    from symphony.bdk.gen.agent_model.pagination import Pagination
+    from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_response import V1AuditTrailInitiatorResponse
+    globals()['Pagination'] = Pagination
+    globals()['V1AuditTrailInitiatorResponse'] = V1AuditTrailInitiatorResponse
 
 class V1AuditTrailInitiatorList(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V1AuditTrailInitiatorList(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V1AuditTrailInitiatorList(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'items': ([V1AuditTrailInitiatorResponse], none_type),  # noqa: E501
             'pagination': (Pagination, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V1AuditTrailInitiatorList(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
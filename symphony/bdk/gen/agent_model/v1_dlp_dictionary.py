@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_dictionary_content import V1DLPDictionaryContent
-from symphony.bdk.gen.agent_model.v1_dlp_dictionary_metadata import V1DLPDictionaryMetadata
-globals()['V1DLPDictionaryContent'] = V1DLPDictionaryContent
-globals()['V1DLPDictionaryMetadata'] = V1DLPDictionaryMetadata
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_dictionary_content import V1DLPDictionaryContent
+    from symphony.bdk.gen.agent_model.v1_dlp_dictionary_metadata import V1DLPDictionaryMetadata
+    globals()['V1DLPDictionaryContent'] = V1DLPDictionaryContent
+    globals()['V1DLPDictionaryMetadata'] = V1DLPDictionaryMetadata
 
 class V1DLPDictionary(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V1DLPDictionary(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V1DLPDictionary(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'dictionary_metadata': (V1DLPDictionaryMetadata,),  # noqa: E501
             'content': (V1DLPDictionaryContent, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V1DLPDictionary(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
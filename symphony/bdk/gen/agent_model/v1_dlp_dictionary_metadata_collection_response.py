@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_dictionary_metadata import V1DLPDictionaryMetadata
-globals()['V1DLPDictionaryMetadata'] = V1DLPDictionaryMetadata
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_dictionary_metadata import V1DLPDictionaryMetadata
+    globals()['V1DLPDictionaryMetadata'] = V1DLPDictionaryMetadata
 
 class V1DLPDictionaryMetadataCollectionResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class V1DLPDictionaryMetadataCollectionResponse(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class V1DLPDictionaryMetadataCollectionResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'items': ([V1DLPDictionaryMetadata],),  # noqa: E501
             'page': (int, none_type),  # noqa: E501
@@ -91,6 +94,7 @@ class V1DLPDictionaryMetadataCollectionResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
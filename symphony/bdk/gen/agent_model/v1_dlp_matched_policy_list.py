@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_matched_policy import V1DLPMatchedPolicy
-globals()['V1DLPMatchedPolicy'] = V1DLPMatchedPolicy
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_matched_policy import V1DLPMatchedPolicy
+    globals()['V1DLPMatchedPolicy'] = V1DLPMatchedPolicy
 
 class V1DLPMatchedPolicyList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V1DLPMatchedPolicyList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V1DLPMatchedPolicy],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
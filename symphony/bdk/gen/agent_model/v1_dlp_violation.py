@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_content_type import V1DLPContentType
-from symphony.bdk.gen.agent_model.v1_dlp_matched_policy_list import V1DLPMatchedPolicyList
-from symphony.bdk.gen.agent_model.v1_dlp_outcome import V1DLPOutcome
-globals()['V1DLPContentType'] = V1DLPContentType
-globals()['V1DLPMatchedPolicyList'] = V1DLPMatchedPolicyList
-globals()['V1DLPOutcome'] = V1DLPOutcome
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_content_type import V1DLPContentType
+    from symphony.bdk.gen.agent_model.v1_dlp_matched_policy_list import V1DLPMatchedPolicyList
+    from symphony.bdk.gen.agent_model.v1_dlp_outcome import V1DLPOutcome
+    globals()['V1DLPContentType'] = V1DLPContentType
+    globals()['V1DLPMatchedPolicyList'] = V1DLPMatchedPolicyList
+    globals()['V1DLPOutcome'] = V1DLPOutcome
 
 class V1DLPViolation(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V1DLPViolation(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V1DLPViolation(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'enforcement_event_id': (str, none_type),  # noqa: E501
             'entity_id': (str, none_type),  # noqa: E501
@@ -103,6 +106,7 @@ class V1DLPViolation(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
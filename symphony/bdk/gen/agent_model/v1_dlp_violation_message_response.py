@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_violation_message import V1DLPViolationMessage
-globals()['V1DLPViolationMessage'] = V1DLPViolationMessage
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_violation_message import V1DLPViolationMessage
+    globals()['V1DLPViolationMessage'] = V1DLPViolationMessage
 
 class V1DLPViolationMessageResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class V1DLPViolationMessageResponse(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class V1DLPViolationMessageResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'violations': ([V1DLPViolationMessage],),  # noqa: E501
             'next_offset': (str, none_type),  # noqa: E501
@@ -90,6 +93,7 @@ class V1DLPViolationMessageResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v2_import_response import V2ImportResponse
-globals()['V2ImportResponse'] = V2ImportResponse
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v2_import_response import V2ImportResponse
+    globals()['V2ImportResponse'] = V2ImportResponse
 
 class V2ImportResponseList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V2ImportResponseList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V2ImportResponse],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.attachment_info import AttachmentInfo
-from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
-from symphony.bdk.gen.agent_model.v2_message_all_of import V2MessageAllOf
-globals()['AttachmentInfo'] = AttachmentInfo
-globals()['V2BaseMessage'] = V2BaseMessage
-globals()['V2MessageAllOf'] = V2MessageAllOf
+def lazy_import():
+    from symphony.bdk.gen.agent_model.attachment_info import AttachmentInfo
+    from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
+    from symphony.bdk.gen.agent_model.v2_message_all_of import V2MessageAllOf
+    globals()['AttachmentInfo'] = AttachmentInfo
+    globals()['V2BaseMessage'] = V2BaseMessage
+    globals()['V2MessageAllOf'] = V2MessageAllOf
 
 class V2Message(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V2Message(ModelComposed):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V2Message(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'message': (str,),  # noqa: E501
             'from_user_id': (int,),  # noqa: E501
@@ -99,6 +102,7 @@ class V2Message(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         val = {
         }
         if not val:
@@ -326,6 +330,7 @@ class V2Message(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
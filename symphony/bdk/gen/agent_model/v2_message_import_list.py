@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v2_imported_message import V2ImportedMessage
-globals()['V2ImportedMessage'] = V2ImportedMessage
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v2_imported_message import V2ImportedMessage
+    globals()['V2ImportedMessage'] = V2ImportedMessage
 
 class V2MessageImportList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V2MessageImportList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V2ImportedMessage],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
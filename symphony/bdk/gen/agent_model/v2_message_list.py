@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
-globals()['V2BaseMessage'] = V2BaseMessage
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v2_base_message import V2BaseMessage
+    globals()['V2BaseMessage'] = V2BaseMessage
 
 class V2MessageList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V2MessageList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V2BaseMessage],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.attachment_info import AttachmentInfo
-globals()['AttachmentInfo'] = AttachmentInfo
+def lazy_import():
+    from symphony.bdk.gen.agent_model.attachment_info import AttachmentInfo
+    globals()['AttachmentInfo'] = AttachmentInfo
 
 class V2MessageSubmission(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V2MessageSubmission(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V2MessageSubmission(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'format': (str, none_type),  # noqa: E501
             'message': (str, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class V2MessageSubmission(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,16 +30,17 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v3_dlp_file_classifier_config import V3DLPFileClassifierConfig
-from symphony.bdk.gen.agent_model.v3_dlp_file_extension_config import V3DLPFileExtensionConfig
-from symphony.bdk.gen.agent_model.v3_dlp_file_password_config import V3DLPFilePasswordConfig
-from symphony.bdk.gen.agent_model.v3_dlp_file_size_config import V3DLPFileSizeConfig
-from symphony.bdk.gen.agent_model.v3_dlp_text_match_config import V3DLPTextMatchConfig
-globals()['V3DLPFileClassifierConfig'] = V3DLPFileClassifierConfig
-globals()['V3DLPFileExtensionConfig'] = V3DLPFileExtensionConfig
-globals()['V3DLPFilePasswordConfig'] = V3DLPFilePasswordConfig
-globals()['V3DLPFileSizeConfig'] = V3DLPFileSizeConfig
-globals()['V3DLPTextMatchConfig'] = V3DLPTextMatchConfig
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v3_dlp_file_classifier_config import V3DLPFileClassifierConfig
+    from symphony.bdk.gen.agent_model.v3_dlp_file_extension_config import V3DLPFileExtensionConfig
+    from symphony.bdk.gen.agent_model.v3_dlp_file_password_config import V3DLPFilePasswordConfig
+    from symphony.bdk.gen.agent_model.v3_dlp_file_size_config import V3DLPFileSizeConfig
+    from symphony.bdk.gen.agent_model.v3_dlp_text_match_config import V3DLPTextMatchConfig
+    globals()['V3DLPFileClassifierConfig'] = V3DLPFileClassifierConfig
+    globals()['V3DLPFileExtensionConfig'] = V3DLPFileExtensionConfig
+    globals()['V3DLPFilePasswordConfig'] = V3DLPFilePasswordConfig
+    globals()['V3DLPFileSizeConfig'] = V3DLPFileSizeConfig
+    globals()['V3DLPTextMatchConfig'] = V3DLPTextMatchConfig
 
 class V3DLPRule(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -77,6 +78,7 @@ class V3DLPRule(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -91,6 +93,7 @@ class V3DLPRule(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'type': (str,),  # noqa: E501
             'name': (str,),  # noqa: E501
@@ -104,6 +107,7 @@ class V3DLPRule(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
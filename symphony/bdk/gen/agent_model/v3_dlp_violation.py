@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v1_dlp_outcome import V1DLPOutcome
-globals()['V1DLPOutcome'] = V1DLPOutcome
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v1_dlp_outcome import V1DLPOutcome
+    globals()['V1DLPOutcome'] = V1DLPOutcome
 
 class V3DLPViolation(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class V3DLPViolation(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class V3DLPViolation(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'enforcement_event_id': (str, none_type),  # noqa: E501
             'entity_id': (str, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class V3DLPViolation(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
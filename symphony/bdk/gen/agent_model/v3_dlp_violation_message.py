@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v3_dlp_violation import V3DLPViolation
-from symphony.bdk.gen.agent_model.v4_message import V4Message
-globals()['V3DLPViolation'] = V3DLPViolation
-globals()['V4Message'] = V4Message
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v3_dlp_violation import V3DLPViolation
+    from symphony.bdk.gen.agent_model.v4_message import V4Message
+    globals()['V3DLPViolation'] = V3DLPViolation
+    globals()['V4Message'] = V4Message
 
 class V3DLPViolationMessage(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V3DLPViolationMessage(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V3DLPViolationMessage(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'violation': (V3DLPViolation, none_type),  # noqa: E501
             'message': (V4Message, none_type),  # noqa: E501
@@ -94,6 +97,7 @@ class V3DLPViolationMessage(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
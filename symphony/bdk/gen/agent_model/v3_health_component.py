@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v3_health_auth_type import V3HealthAuthType
-from symphony.bdk.gen.agent_model.v3_health_status import V3HealthStatus
-globals()['V3HealthAuthType'] = V3HealthAuthType
-globals()['V3HealthStatus'] = V3HealthStatus
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v3_health_auth_type import V3HealthAuthType
+    from symphony.bdk.gen.agent_model.v3_health_status import V3HealthStatus
+    globals()['V3HealthAuthType'] = V3HealthAuthType
+    globals()['V3HealthStatus'] = V3HealthStatus
 
 class V3HealthComponent(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V3HealthComponent(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V3HealthComponent(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'auth_type': (V3HealthAuthType, none_type),  # noqa: E501
             'message': (str, none_type),  # noqa: E501
@@ -94,6 +97,7 @@ class V3HealthComponent(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
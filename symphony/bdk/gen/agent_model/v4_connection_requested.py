@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_user import V4User
-globals()['V4User'] = V4User
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_user import V4User
+    globals()['V4User'] = V4User
 
 class V4ConnectionRequested(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class V4ConnectionRequested(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,12 +85,14 @@ class V4ConnectionRequested(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'to_user': (V4User, none_type),  # noqa: E501
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
-from symphony.bdk.gen.agent_model.v4_payload import V4Payload
-globals()['V4Initiator'] = V4Initiator
-globals()['V4Payload'] = V4Payload
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+    from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+    globals()['V4Initiator'] = V4Initiator
+    globals()['V4Payload'] = V4Payload
 
 class V4Event(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V4Event(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V4Event(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'message_id': (str, none_type),  # noqa: E501
@@ -97,6 +100,7 @@ class V4Event(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
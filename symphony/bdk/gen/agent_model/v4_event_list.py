@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_event import V4Event
-globals()['V4Event'] = V4Event
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_event import V4Event
+    globals()['V4Event'] = V4Event
 
 class V4EventList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V4EventList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V4Event],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
-globals()['V4ImportResponse'] = V4ImportResponse
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
+    globals()['V4ImportResponse'] = V4ImportResponse
 
 class V4ImportResponseList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V4ImportResponseList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V4ImportResponse],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_attachment_info import V4AttachmentInfo
-from symphony.bdk.gen.agent_model.v4_stream import V4Stream
-from symphony.bdk.gen.agent_model.v4_user import V4User
-globals()['V4AttachmentInfo'] = V4AttachmentInfo
-globals()['V4Stream'] = V4Stream
-globals()['V4User'] = V4User
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_attachment_info import V4AttachmentInfo
+    from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+    from symphony.bdk.gen.agent_model.v4_user import V4User
+    globals()['V4AttachmentInfo'] = V4AttachmentInfo
+    globals()['V4Stream'] = V4Stream
+    globals()['V4User'] = V4User
 
 class V4Message(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V4Message(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V4Message(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'message_id': (str, none_type),  # noqa: E501
             'parent_message_id': (str, none_type),  # noqa: E501
@@ -112,6 +115,7 @@ class V4Message(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
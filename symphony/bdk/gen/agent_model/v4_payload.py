@@ -30,40 +30,41 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_connection_accepted import V4ConnectionAccepted
-from symphony.bdk.gen.agent_model.v4_connection_requested import V4ConnectionRequested
-from symphony.bdk.gen.agent_model.v4_generic_system_event import V4GenericSystemEvent
-from symphony.bdk.gen.agent_model.v4_instant_message_created import V4InstantMessageCreated
-from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
-from symphony.bdk.gen.agent_model.v4_message_suppressed import V4MessageSuppressed
-from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
-from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
-from symphony.bdk.gen.agent_model.v4_room_member_demoted_from_owner import V4RoomMemberDemotedFromOwner
-from symphony.bdk.gen.agent_model.v4_room_member_promoted_to_owner import V4RoomMemberPromotedToOwner
-from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
-from symphony.bdk.gen.agent_model.v4_room_updated import V4RoomUpdated
-from symphony.bdk.gen.agent_model.v4_shared_post import V4SharedPost
-from symphony.bdk.gen.agent_model.v4_symphony_elements_action import V4SymphonyElementsAction
-from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
-from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
-from symphony.bdk.gen.agent_model.v4_user_requested_to_join_room import V4UserRequestedToJoinRoom
-globals()['V4ConnectionAccepted'] = V4ConnectionAccepted
-globals()['V4ConnectionRequested'] = V4ConnectionRequested
-globals()['V4GenericSystemEvent'] = V4GenericSystemEvent
-globals()['V4InstantMessageCreated'] = V4InstantMessageCreated
-globals()['V4MessageSent'] = V4MessageSent
-globals()['V4MessageSuppressed'] = V4MessageSuppressed
-globals()['V4RoomCreated'] = V4RoomCreated
-globals()['V4RoomDeactivated'] = V4RoomDeactivated
-globals()['V4RoomMemberDemotedFromOwner'] = V4RoomMemberDemotedFromOwner
-globals()['V4RoomMemberPromotedToOwner'] = V4RoomMemberPromotedToOwner
-globals()['V4RoomReactivated'] = V4RoomReactivated
-globals()['V4RoomUpdated'] = V4RoomUpdated
-globals()['V4SharedPost'] = V4SharedPost
-globals()['V4SymphonyElementsAction'] = V4SymphonyElementsAction
-globals()['V4UserJoinedRoom'] = V4UserJoinedRoom
-globals()['V4UserLeftRoom'] = V4UserLeftRoom
-globals()['V4UserRequestedToJoinRoom'] = V4UserRequestedToJoinRoom
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_connection_accepted import V4ConnectionAccepted
+    from symphony.bdk.gen.agent_model.v4_connection_requested import V4ConnectionRequested
+    from symphony.bdk.gen.agent_model.v4_generic_system_event import V4GenericSystemEvent
+    from symphony.bdk.gen.agent_model.v4_instant_message_created import V4InstantMessageCreated
+    from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+    from symphony.bdk.gen.agent_model.v4_message_suppressed import V4MessageSuppressed
+    from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
+    from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
+    from symphony.bdk.gen.agent_model.v4_room_member_demoted_from_owner import V4RoomMemberDemotedFromOwner
+    from symphony.bdk.gen.agent_model.v4_room_member_promoted_to_owner import V4RoomMemberPromotedToOwner
+    from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
+    from symphony.bdk.gen.agent_model.v4_room_updated import V4RoomUpdated
+    from symphony.bdk.gen.agent_model.v4_shared_post import V4SharedPost
+    from symphony.bdk.gen.agent_model.v4_symphony_elements_action import V4SymphonyElementsAction
+    from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
+    from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
+    from symphony.bdk.gen.agent_model.v4_user_requested_to_join_room import V4UserRequestedToJoinRoom
+    globals()['V4ConnectionAccepted'] = V4ConnectionAccepted
+    globals()['V4ConnectionRequested'] = V4ConnectionRequested
+    globals()['V4GenericSystemEvent'] = V4GenericSystemEvent
+    globals()['V4InstantMessageCreated'] = V4InstantMessageCreated
+    globals()['V4MessageSent'] = V4MessageSent
+    globals()['V4MessageSuppressed'] = V4MessageSuppressed
+    globals()['V4RoomCreated'] = V4RoomCreated
+    globals()['V4RoomDeactivated'] = V4RoomDeactivated
+    globals()['V4RoomMemberDemotedFromOwner'] = V4RoomMemberDemotedFromOwner
+    globals()['V4RoomMemberPromotedToOwner'] = V4RoomMemberPromotedToOwner
+    globals()['V4RoomReactivated'] = V4RoomReactivated
+    globals()['V4RoomUpdated'] = V4RoomUpdated
+    globals()['V4SharedPost'] = V4SharedPost
+    globals()['V4SymphonyElementsAction'] = V4SymphonyElementsAction
+    globals()['V4UserJoinedRoom'] = V4UserJoinedRoom
+    globals()['V4UserLeftRoom'] = V4UserLeftRoom
+    globals()['V4UserRequestedToJoinRoom'] = V4UserRequestedToJoinRoom
 
 class V4Payload(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -101,6 +102,7 @@ class V4Payload(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -115,6 +117,7 @@ class V4Payload(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'message_sent': (V4MessageSent, none_type),  # noqa: E501
             'shared_post': (V4SharedPost, none_type),  # noqa: E501
@@ -137,6 +140,7 @@ class V4Payload(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
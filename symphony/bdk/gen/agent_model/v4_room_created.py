@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.agent_model.v4_room_properties import V4RoomProperties
-from symphony.bdk.gen.agent_model.v4_stream import V4Stream
-globals()['V4RoomProperties'] = V4RoomProperties
-globals()['V4Stream'] = V4Stream
+def lazy_import():
+    from symphony.bdk.gen.agent_model.v4_room_properties import V4RoomProperties
+    from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+    globals()['V4RoomProperties'] = V4RoomProperties
+    globals()['V4Stream'] = V4Stream
 
 class V4RoomCreated(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V4RoomCreated(ModelNormal):
         This must be a method because a agent_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V4RoomCreated(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'stream': (V4Stream, none_type),  # noqa: E501
             'room_properties': (V4RoomProperties, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V4RoomCreated(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
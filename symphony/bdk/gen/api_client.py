@@ -10,15 +10,19 @@
 
 import json
 import atexit
+import functools
 import mimetypes
 from multiprocessing.pool import ThreadPool
 import io
 import os
 import re
+import time
 import typing
 from urllib.parse import quote
 from urllib3.fields import RequestField
 
+from aiohttp.payload import Payload
+
 from symphony.bdk.gen import rest
 from symphony.bdk.gen.configuration import Configuration
 from symphony.bdk.gen.exceptions import ApiTypeError, ApiValueError, ApiException
@@ -32,11 +36,17 @@ from symphony.bdk.gen.model_utils import (
     datetime,
     deserialize_file,
     file_type,
+    get_required_type_classes,
     model_to_dict,
     none_type,
+    remove_uncoercible,
     validate_and_convert_types
 )
 
+# sample instances of the classes which validate_and_convert_types can return unchanged
+_PASSTHROUGH_SAMPLES = {str: '', int: 0, float: 0.0, bool: False, none_type: None}
+_PATH_PARAM_PATTERN = re.compile(r'{([^{}]+)}')
+
 
 class ApiClient(object):
     """Generic API client for OpenAPI client library builds.
@@ -74,6 +84,8 @@ class ApiClient(object):
         if header_name is not None:
             self.default_headers[header_name] = header_value
         self.cookie = cookie
+        # optional object notified of each HTTP call through its on_api_call method
+        self.metrics = None
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
 
@@ -132,7 +144,8 @@ class ApiClient(object):
         _request_timeout: typing.Optional[typing.Union[int, float, typing.Tuple]] = None,
         _host: typing.Optional[str] = None,
         _check_type: typing.Optional[bool] = None,
-        _content_type: typing.Optional[str] = None
+        _content_type: typing.Optional[str] = None,
+        _operation_id: typing.Optional[str] = None
     ):
 
         config = self.configuration
@@ -142,35 +155,40 @@ class ApiClient(object):
         header_params.update(self.default_headers)
         if self.cookie:
             header_params['Cookie'] = self.cookie
-        if header_params:
+        if header_params and not _are_plain_params(header_params, collection_formats):
             header_params = self.sanitize_for_serialization(header_params)
             header_params = dict(self.parameters_to_tuples(header_params,
                                                            collection_formats))
 
         # path parameters
         if path_params:
-            path_params = self.sanitize_for_serialization(path_params)
-            path_params = self.parameters_to_tuples(path_params,
-                                                    collection_formats)
-            for k, v in path_params:
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
+            if _are_plain_params(path_params, collection_formats):
+                path_params = path_params.items()
+            else:
+                path_params = self.sanitize_for_serialization(path_params)
+                path_params = self.parameters_to_tuples(path_params,
+                                                        collection_formats)
+            resource_path = _render_path(resource_path, path_params,
+                                         config.safe_chars_for_path_param)
 
         # query parameters
         if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            query_params = self.parameters_to_tuples(query_params,
-                                                     collection_formats)
+            if _are_plain_params(query_params, collection_formats):
+                query_params = list(query_params)
+            else:
+                query_params = self.sanitize_for_serialization(query_params)
+                query_params = self.parameters_to_tuples(query_params,
+                                                         collection_formats)
 
         # post parameters
         if post_params or files:
             post_params = post_params if post_params else []
-            post_params = self.sanitize_for_serialization(post_params)
-            post_params = self.parameters_to_tuples(post_params,
-                                                    collection_formats)
+            if _are_plain_params(post_params, collection_formats):
+                post_params = list(post_params)
+            else:
+                post_params = self.sanitize_for_serialization(post_params)
+                post_params = self.parameters_to_tuples(post_params,
+                                                        collection_formats)
             post_params.extend(self.files_parameters(files))
             if header_params['Content-Type'].startswith("multipart"):
                 post_params = self.parameters_to_multipart(post_params,
@@ -191,6 +209,9 @@ class ApiClient(object):
             # use server/host defined in path or operation instead
             url = _host + resource_path
 
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.monotonic()
         try:
             # perform request and return response
             response_data = await self.request(
@@ -199,8 +220,18 @@ class ApiClient(object):
                 _preload_content=_preload_content,
                 _request_timeout=_request_timeout)
         except ApiException as e:
+            if metrics is not None:
+                metrics.on_api_call(_operation_id, method, e.status, time.monotonic() - start,
+                                    len(e.body or b''))
             e.body = e.body.decode('utf-8')
             raise e
+        except BaseException:
+            if metrics is not None:
+                metrics.on_api_call(_operation_id, method, None, time.monotonic() - start, 0)
+            raise
+        if metrics is not None:
+            metrics.on_api_call(_operation_id, method, response_data.status, time.monotonic() - start,
+                                len(response_data.data or b'') if _preload_content else 0)
 
         self.last_response = response_data
 
@@ -281,6 +312,9 @@ class ApiClient(object):
             return [cls.sanitize_for_serialization(item) for item in obj]
         if isinstance(obj, dict):
             return {key: cls.sanitize_for_serialization(val) for key, val in obj.items()}
+        if isinstance(obj, Payload):
+            # streamed multipart form field, sent as is
+            return obj
         raise ApiValueError('Unable to prepare type {} for serialization'.format(obj.__class__.__name__))
 
     def deserialize(self, response, response_type, _check_type):
@@ -346,7 +380,8 @@ class ApiClient(object):
         _preload_content: bool = True,
         _request_timeout: typing.Optional[typing.Union[int, float, typing.Tuple]] = None,
         _host: typing.Optional[str] = None,
-        _check_type: typing.Optional[bool] = None
+        _check_type: typing.Optional[bool] = None,
+        _operation_id: typing.Optional[str] = None
     ):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
@@ -394,6 +429,9 @@ class ApiClient(object):
         :param _check_type: boolean describing if the data back from the server
             should have its type checked.
         :type _check_type: bool, optional
+        :param _operation_id: identifier of the called endpoint, reported to
+            the metrics.
+        :type _operation_id: str, optional
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
@@ -408,7 +446,7 @@ class ApiClient(object):
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
                                    _preload_content, _request_timeout, _host,
-                                   _check_type)
+                                   _check_type, _operation_id=_operation_id)
 
         return self.pool.apply_async(self.__call_api, (resource_path,
                                                        method, path_params,
@@ -421,7 +459,8 @@ class ApiClient(object):
                                                        collection_formats,
                                                        _preload_content,
                                                        _request_timeout,
-                                                       _host, _check_type))
+                                                       _host, _check_type),
+                                     dict(_operation_id=_operation_id))
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -618,6 +657,53 @@ class ApiClient(object):
                     )
 
 
+def _passthrough_classes(openapi_types):
+    """Returns the classes of the values that validate_and_convert_types would return unchanged for the given types:
+    simple values of a valid class which cannot be upconverted to another valid class.
+    """
+    valid_classes, _ = get_required_type_classes(openapi_types, False)
+    return frozenset(
+        cls for cls, sample in _PASSTHROUGH_SAMPLES.items()
+        if cls in valid_classes and not remove_uncoercible(valid_classes, sample, False, must_convert=False)
+    )
+
+
+def _are_plain_params(params, collection_formats):
+    """Returns True if the parameters only hold simple values without collection format, i.e. values that
+    sanitize_for_serialization and parameters_to_tuples would leave unchanged.
+    """
+    for key, value in params.items() if isinstance(params, dict) else params:
+        if type(value) not in _PASSTHROUGH_SAMPLES or (collection_formats and key in collection_formats):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(resource_path):
+    """Splits a resource path such as '/v1/stream/{sid}/info' into its literal parts and path parameter names."""
+    parts = _PATH_PARAM_PATTERN.split(resource_path)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def _render_path(resource_path, path_params, safe_chars):
+    """Replaces the path parameter placeholders of a resource path by their url encoded values. Placeholders without
+    value are kept as is.
+    """
+    values = {}
+    for key, value in path_params:
+        values.setdefault(key, value)
+    literals, names = _compile_path(resource_path)
+    parts = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        if name in values:
+            # specified safe chars, encode everything
+            parts.append(quote(str(values[name]), safe=safe_chars))
+        else:
+            parts.append('{%s}' % name)
+        parts.append(literal)
+    return ''.join(parts)
+
+
 class Endpoint(object):
     def __init__(self, settings=None, params_map=None, root_map=None,
                  headers_map=None, api_client=None, callable=None):
@@ -689,9 +775,42 @@ class Endpoint(object):
         self.headers_map = headers_map
         self.api_client = api_client
         self.callable = callable
+        self.__compile()
+
+    def __compile(self):
+        """Precomputes, once per endpoint, everything call_with_http_info would otherwise derive from the maps on
+        each call."""
+        self._all_params = frozenset(self.params_map['all'])
+        self._nullable_params = frozenset(self.params_map['nullable'])
+        self._required_params = tuple(self.params_map['required'])
+        self._enum_params = tuple(self.params_map['enum'])
+        self._validation_params = tuple(self.params_map['validation'])
+        # classes whose values are returned as is by validate_and_convert_types, so the call can be skipped
+        self._passthrough_classes = {
+            name: _passthrough_classes(types) for name, types in self.openapi_types.items()
+        }
+        # (location, base name, file kind, collection format) of each parameter sent in the request
+        self._param_binders = {}
+        for name, location in self.location_map.items():
+            if not location:
+                continue
+            file_kind = None
+            if location == 'form' and self.openapi_types.get(name) == (file_type,):
+                file_kind = 'file'
+            elif location == 'form' and self.openapi_types.get(name) == ([file_type],):
+                file_kind = 'files'
+            self._param_binders[name] = (
+                location,
+                self.attribute_map.get(name),
+                file_kind,
+                self.collection_format_map.get(name),
+            )
+        accept_headers_list = self.headers_map['accept']
+        self._accept_header = self.api_client.select_header_accept(
+            accept_headers_list) if accept_headers_list else None
 
     def __validate_inputs(self, kwargs):
-        for param in self.params_map['enum']:
+        for param in self._enum_params:
             if param in kwargs:
                 check_allowed_values(
                     self.allowed_values,
@@ -699,7 +818,7 @@ class Endpoint(object):
                     kwargs[param]
                 )
 
-        for param in self.params_map['validation']:
+        for param in self._validation_params:
             if param in kwargs:
                 check_validations(
                     self.validations,
@@ -712,6 +831,8 @@ class Endpoint(object):
             return
 
         for key, value in kwargs.items():
+            if type(value) in self._passthrough_classes[key]:
+                continue
             fixed_val = validate_and_convert_types(
                 value,
                 self.openapi_types[key],
@@ -734,29 +855,24 @@ class Endpoint(object):
         }
 
         for param_name, param_value in kwargs.items():
-            param_location = self.location_map.get(param_name)
-            if param_location is None:
+            binder = self._param_binders.get(param_name)
+            if binder is None:
                 continue
-            if param_location:
-                if param_location == 'body':
-                    params['body'] = param_value
-                    continue
-                base_name = self.attribute_map[param_name]
-                if (param_location == 'form' and
-                        self.openapi_types[param_name] == (file_type,)):
-                    params['file'][base_name] = [param_value]
-                elif (param_location == 'form' and
-                        self.openapi_types[param_name] == ([file_type],)):
-                    # param_value is already a list
-                    params['file'][base_name] = param_value
-                elif param_location in {'form', 'query'}:
-                    param_value_full = (base_name, param_value)
-                    params[param_location].append(param_value_full)
-                if param_location not in {'form', 'query'}:
-                    params[param_location][base_name] = param_value
-                collection_format = self.collection_format_map.get(param_name)
-                if collection_format:
-                    params['collection_format'][base_name] = collection_format
+            param_location, base_name, file_kind, collection_format = binder
+            if param_location == 'body':
+                params['body'] = param_value
+                continue
+            if file_kind == 'file':
+                params['file'][base_name] = [param_value]
+            elif file_kind == 'files':
+                # param_value is already a list
+                params['file'][base_name] = param_value
+            elif param_location == 'form' or param_location == 'query':
+                params[param_location].append((base_name, param_value))
+            if param_location != 'form' and param_location != 'query':
+                params[param_location][base_name] = param_value
+            if collection_format:
+                params['collection_format'][base_name] = collection_format
 
         return params
 
@@ -794,7 +910,7 @@ class Endpoint(object):
             _host = None
 
         for key, value in kwargs.items():
-            if key not in self.params_map['all']:
+            if key not in self._all_params:
                 raise ApiTypeError(
                     "Got an unexpected parameter '%s'"
                     " to method `%s`" %
@@ -803,7 +919,7 @@ class Endpoint(object):
             # only throw this nullable ApiValueError if _check_input_type
             # is False, if _check_input_type==True we catch this case
             # in self.__validate_inputs
-            if (key not in self.params_map['nullable'] and value is None
+            if (key not in self._nullable_params and value is None
                     and kwargs['_check_input_type'] is False):
                 raise ApiValueError(
                     "Value may not be None for non-nullable parameter `%s`"
@@ -811,8 +927,8 @@ class Endpoint(object):
                     (key, self.settings['operation_id'])
                 )
 
-        for key in self.params_map['required']:
-            if key not in kwargs.keys():
+        for key in self._required_params:
+            if key not in kwargs:
                 raise ApiValueError(
                     "Missing the required parameter `%s` when calling "
                     "`%s`" % (key, self.settings['operation_id'])
@@ -822,10 +938,8 @@ class Endpoint(object):
 
         params = self.__gather_params(kwargs)
 
-        accept_headers_list = self.headers_map['accept']
-        if accept_headers_list:
-            params['header']['Accept'] = self.api_client.select_header_accept(
-                accept_headers_list)
+        if self._accept_header:
+            params['header']['Accept'] = self._accept_header
 
         if kwargs.get('_content_type'):
             params['header']['Content-Type'] = kwargs['_content_type']
@@ -854,4 +968,5 @@ class Endpoint(object):
             _preload_content=kwargs['_preload_content'],
             _request_timeout=kwargs['_request_timeout'],
             _host=_host,
-            collection_formats=params['collection_format'])
+            collection_formats=params['collection_format'],
+            _operation_id=self.settings['operation_id'])
@@ -1 +1,26 @@
 # do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from symphony.bdk.gen.auth_model import Error`
+import importlib
+
+_MODEL_MODULES = {
+    "Error": "error",
+    "ExtensionAppAuthenticateRequest": "extension_app_authenticate_request",
+    "ExtensionAppTokens": "extension_app_tokens",
+    "OboAuthResponse": "obo_auth_response",
+    "PodCertificate": "pod_certificate",
+    "SuccessResponse": "success_response",
+    "Token": "token",
+}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
@@ -1 +1,56 @@
 # do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from symphony.bdk.gen.group_model import AddMember`
+import importlib
+
+_MODEL_MODULES = {
+    "AddMember": "add_member",
+    "Avatar": "avatar",
+    "BaseGroup": "base_group",
+    "BaseProfile": "base_profile",
+    "BaseType": "base_type",
+    "CreateGroup": "create_group",
+    "CreateGroupAllOf": "create_group_all_of",
+    "Error": "error",
+    "GroupImplicitConnection": "group_implicit_connection",
+    "GroupInteractionTransfer": "group_interaction_transfer",
+    "GroupList": "group_list",
+    "GroupVisibilityRestriction": "group_visibility_restriction",
+    "ImplicitConnection": "implicit_connection",
+    "InteractionControl": "interaction_control",
+    "InteractionTransfer": "interaction_transfer",
+    "Member": "member",
+    "MembershipControl": "membership_control",
+    "Owner": "owner",
+    "Pagination": "pagination",
+    "PaginationCursors": "pagination_cursors",
+    "Profile": "profile",
+    "ProfileAllOf": "profile_all_of",
+    "ProfileControl": "profile_control",
+    "ReadGroup": "read_group",
+    "ReadGroupAllOf": "read_group_all_of",
+    "ReadMember": "read_member",
+    "ReadMemberAllOf": "read_member_all_of",
+    "SortOrder": "sort_order",
+    "Status": "status",
+    "TransferView": "transfer_view",
+    "Type": "type",
+    "TypeAllOf": "type_all_of",
+    "TypeList": "type_list",
+    "UpdateGroup": "update_group",
+    "UpdateGroupAllOf": "update_group_all_of",
+    "UploadAvatar": "upload_avatar",
+    "VisibilityRestriction": "visibility_restriction",
+}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.owner import Owner
-from symphony.bdk.gen.group_model.status import Status
-globals()['Owner'] = Owner
-globals()['Status'] = Status
+def lazy_import():
+    from symphony.bdk.gen.group_model.owner import Owner
+    from symphony.bdk.gen.group_model.status import Status
+    globals()['Owner'] = Owner
+    globals()['Status'] = Status
 
 class BaseType(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class BaseType(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class BaseType(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'owner_type': (Owner, none_type),  # noqa: E501
@@ -94,6 +97,7 @@ class BaseType(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
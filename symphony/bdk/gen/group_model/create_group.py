@@ -30,22 +30,23 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_group import BaseGroup
-from symphony.bdk.gen.group_model.base_profile import BaseProfile
-from symphony.bdk.gen.group_model.create_group_all_of import CreateGroupAllOf
-from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
-from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
-from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
-from symphony.bdk.gen.group_model.member import Member
-from symphony.bdk.gen.group_model.owner import Owner
-globals()['BaseGroup'] = BaseGroup
-globals()['BaseProfile'] = BaseProfile
-globals()['CreateGroupAllOf'] = CreateGroupAllOf
-globals()['GroupImplicitConnection'] = GroupImplicitConnection
-globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
-globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
-globals()['Member'] = Member
-globals()['Owner'] = Owner
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_group import BaseGroup
+    from symphony.bdk.gen.group_model.base_profile import BaseProfile
+    from symphony.bdk.gen.group_model.create_group_all_of import CreateGroupAllOf
+    from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
+    from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
+    from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
+    from symphony.bdk.gen.group_model.member import Member
+    from symphony.bdk.gen.group_model.owner import Owner
+    globals()['BaseGroup'] = BaseGroup
+    globals()['BaseProfile'] = BaseProfile
+    globals()['CreateGroupAllOf'] = CreateGroupAllOf
+    globals()['GroupImplicitConnection'] = GroupImplicitConnection
+    globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
+    globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
+    globals()['Member'] = Member
+    globals()['Owner'] = Owner
 
 class CreateGroup(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -93,6 +94,7 @@ class CreateGroup(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -107,6 +109,7 @@ class CreateGroup(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'type': (str,),  # noqa: E501
             'owner_type': (Owner,),  # noqa: E501
@@ -123,6 +126,7 @@ class CreateGroup(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -363,6 +367,7 @@ class CreateGroup(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
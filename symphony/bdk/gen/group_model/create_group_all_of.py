@@ -30,16 +30,17 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_profile import BaseProfile
-from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
-from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
-from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
-from symphony.bdk.gen.group_model.member import Member
-globals()['BaseProfile'] = BaseProfile
-globals()['GroupImplicitConnection'] = GroupImplicitConnection
-globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
-globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
-globals()['Member'] = Member
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_profile import BaseProfile
+    from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
+    from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
+    from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
+    from symphony.bdk.gen.group_model.member import Member
+    globals()['BaseProfile'] = BaseProfile
+    globals()['GroupImplicitConnection'] = GroupImplicitConnection
+    globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
+    globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
+    globals()['Member'] = Member
 
 class CreateGroupAllOf(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -81,6 +82,7 @@ class CreateGroupAllOf(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -95,6 +97,7 @@ class CreateGroupAllOf(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'sub_type': (str, none_type),  # noqa: E501
             'referrer': (str, none_type),  # noqa: E501
@@ -107,6 +110,7 @@ class CreateGroupAllOf(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
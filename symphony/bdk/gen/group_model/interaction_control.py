@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.interaction_transfer import InteractionTransfer
-globals()['InteractionTransfer'] = InteractionTransfer
+def lazy_import():
+    from symphony.bdk.gen.group_model.interaction_transfer import InteractionTransfer
+    globals()['InteractionTransfer'] = InteractionTransfer
 
 class InteractionControl(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class InteractionControl(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class InteractionControl(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'allow_ims': (bool, none_type),  # noqa: E501
             'allow_rooms': (bool, none_type),  # noqa: E501
@@ -93,6 +96,7 @@ class InteractionControl(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
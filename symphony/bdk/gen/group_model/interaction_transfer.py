@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.transfer_view import TransferView
-globals()['TransferView'] = TransferView
+def lazy_import():
+    from symphony.bdk.gen.group_model.transfer_view import TransferView
+    globals()['TransferView'] = TransferView
 
 class InteractionTransfer(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -74,6 +75,7 @@ class InteractionTransfer(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -88,6 +90,7 @@ class InteractionTransfer(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'target': (str, none_type),  # noqa: E501
             'update_interaction_ongroup_update': (bool, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class InteractionTransfer(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.avatar import Avatar
-from symphony.bdk.gen.group_model.base_profile import BaseProfile
-from symphony.bdk.gen.group_model.profile_all_of import ProfileAllOf
-globals()['Avatar'] = Avatar
-globals()['BaseProfile'] = BaseProfile
-globals()['ProfileAllOf'] = ProfileAllOf
+def lazy_import():
+    from symphony.bdk.gen.group_model.avatar import Avatar
+    from symphony.bdk.gen.group_model.base_profile import BaseProfile
+    from symphony.bdk.gen.group_model.profile_all_of import ProfileAllOf
+    globals()['Avatar'] = Avatar
+    globals()['BaseProfile'] = BaseProfile
+    globals()['ProfileAllOf'] = ProfileAllOf
 
 class Profile(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -84,6 +85,7 @@ class Profile(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -98,6 +100,7 @@ class Profile(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'display_name': (str, none_type),  # noqa: E501
             'company_name': (str, none_type),  # noqa: E501
@@ -121,6 +124,7 @@ class Profile(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -389,6 +393,7 @@ class Profile(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
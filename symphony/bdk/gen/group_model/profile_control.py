@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.implicit_connection import ImplicitConnection
-from symphony.bdk.gen.group_model.visibility_restriction import VisibilityRestriction
-globals()['ImplicitConnection'] = ImplicitConnection
-globals()['VisibilityRestriction'] = VisibilityRestriction
+def lazy_import():
+    from symphony.bdk.gen.group_model.implicit_connection import ImplicitConnection
+    from symphony.bdk.gen.group_model.visibility_restriction import VisibilityRestriction
+    globals()['ImplicitConnection'] = ImplicitConnection
+    globals()['VisibilityRestriction'] = VisibilityRestriction
 
 class ProfileControl(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -75,6 +76,7 @@ class ProfileControl(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -89,6 +91,7 @@ class ProfileControl(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'visibility_restriction': (VisibilityRestriction, none_type),  # noqa: E501
             'implicit_connection': (ImplicitConnection, none_type),  # noqa: E501
@@ -100,6 +103,7 @@ class ProfileControl(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
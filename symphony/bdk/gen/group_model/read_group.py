@@ -30,24 +30,25 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_group import BaseGroup
-from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
-from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
-from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
-from symphony.bdk.gen.group_model.owner import Owner
-from symphony.bdk.gen.group_model.profile import Profile
-from symphony.bdk.gen.group_model.read_group_all_of import ReadGroupAllOf
-from symphony.bdk.gen.group_model.read_member import ReadMember
-from symphony.bdk.gen.group_model.status import Status
-globals()['BaseGroup'] = BaseGroup
-globals()['GroupImplicitConnection'] = GroupImplicitConnection
-globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
-globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
-globals()['Owner'] = Owner
-globals()['Profile'] = Profile
-globals()['ReadGroupAllOf'] = ReadGroupAllOf
-globals()['ReadMember'] = ReadMember
-globals()['Status'] = Status
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_group import BaseGroup
+    from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
+    from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
+    from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
+    from symphony.bdk.gen.group_model.owner import Owner
+    from symphony.bdk.gen.group_model.profile import Profile
+    from symphony.bdk.gen.group_model.read_group_all_of import ReadGroupAllOf
+    from symphony.bdk.gen.group_model.read_member import ReadMember
+    from symphony.bdk.gen.group_model.status import Status
+    globals()['BaseGroup'] = BaseGroup
+    globals()['GroupImplicitConnection'] = GroupImplicitConnection
+    globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
+    globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
+    globals()['Owner'] = Owner
+    globals()['Profile'] = Profile
+    globals()['ReadGroupAllOf'] = ReadGroupAllOf
+    globals()['ReadMember'] = ReadMember
+    globals()['Status'] = Status
 
 class ReadGroup(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -95,6 +96,7 @@ class ReadGroup(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -109,6 +111,7 @@ class ReadGroup(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'type': (str,),  # noqa: E501
             'owner_type': (Owner,),  # noqa: E501
@@ -132,6 +135,7 @@ class ReadGroup(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -400,6 +404,7 @@ class ReadGroup(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
@@ -30,18 +30,19 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
-from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
-from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
-from symphony.bdk.gen.group_model.profile import Profile
-from symphony.bdk.gen.group_model.read_member import ReadMember
-from symphony.bdk.gen.group_model.status import Status
-globals()['GroupImplicitConnection'] = GroupImplicitConnection
-globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
-globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
-globals()['Profile'] = Profile
-globals()['ReadMember'] = ReadMember
-globals()['Status'] = Status
+def lazy_import():
+    from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
+    from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
+    from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
+    from symphony.bdk.gen.group_model.profile import Profile
+    from symphony.bdk.gen.group_model.read_member import ReadMember
+    from symphony.bdk.gen.group_model.status import Status
+    globals()['GroupImplicitConnection'] = GroupImplicitConnection
+    globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
+    globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
+    globals()['Profile'] = Profile
+    globals()['ReadMember'] = ReadMember
+    globals()['Status'] = Status
 
 class ReadGroupAllOf(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -83,6 +84,7 @@ class ReadGroupAllOf(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -97,6 +99,7 @@ class ReadGroupAllOf(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'created_date': (datetime, none_type),  # noqa: E501
@@ -116,6 +119,7 @@ class ReadGroupAllOf(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
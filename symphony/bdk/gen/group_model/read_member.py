@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.member import Member
-from symphony.bdk.gen.group_model.read_member_all_of import ReadMemberAllOf
-globals()['Member'] = Member
-globals()['ReadMemberAllOf'] = ReadMemberAllOf
+def lazy_import():
+    from symphony.bdk.gen.group_model.member import Member
+    from symphony.bdk.gen.group_model.read_member_all_of import ReadMemberAllOf
+    globals()['Member'] = Member
+    globals()['ReadMemberAllOf'] = ReadMemberAllOf
 
 class ReadMember(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -75,6 +76,7 @@ class ReadMember(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -89,6 +91,7 @@ class ReadMember(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'member_tenant': (int, none_type),  # noqa: E501
             'member_id': (int, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class ReadMember(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -310,6 +314,7 @@ class ReadMember(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
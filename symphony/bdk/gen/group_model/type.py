@@ -30,20 +30,21 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_type import BaseType
-from symphony.bdk.gen.group_model.interaction_control import InteractionControl
-from symphony.bdk.gen.group_model.membership_control import MembershipControl
-from symphony.bdk.gen.group_model.owner import Owner
-from symphony.bdk.gen.group_model.profile_control import ProfileControl
-from symphony.bdk.gen.group_model.status import Status
-from symphony.bdk.gen.group_model.type_all_of import TypeAllOf
-globals()['BaseType'] = BaseType
-globals()['InteractionControl'] = InteractionControl
-globals()['MembershipControl'] = MembershipControl
-globals()['Owner'] = Owner
-globals()['ProfileControl'] = ProfileControl
-globals()['Status'] = Status
-globals()['TypeAllOf'] = TypeAllOf
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_type import BaseType
+    from symphony.bdk.gen.group_model.interaction_control import InteractionControl
+    from symphony.bdk.gen.group_model.membership_control import MembershipControl
+    from symphony.bdk.gen.group_model.owner import Owner
+    from symphony.bdk.gen.group_model.profile_control import ProfileControl
+    from symphony.bdk.gen.group_model.status import Status
+    from symphony.bdk.gen.group_model.type_all_of import TypeAllOf
+    globals()['BaseType'] = BaseType
+    globals()['InteractionControl'] = InteractionControl
+    globals()['MembershipControl'] = MembershipControl
+    globals()['Owner'] = Owner
+    globals()['ProfileControl'] = ProfileControl
+    globals()['Status'] = Status
+    globals()['TypeAllOf'] = TypeAllOf
 
 class Type(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -81,6 +82,7 @@ class Type(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -95,6 +97,7 @@ class Type(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'owner_type': (Owner, none_type),  # noqa: E501
@@ -107,6 +110,7 @@ class Type(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -331,6 +335,7 @@ class Type(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
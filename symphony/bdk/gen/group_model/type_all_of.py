@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.interaction_control import InteractionControl
-from symphony.bdk.gen.group_model.membership_control import MembershipControl
-from symphony.bdk.gen.group_model.profile_control import ProfileControl
-globals()['InteractionControl'] = InteractionControl
-globals()['MembershipControl'] = MembershipControl
-globals()['ProfileControl'] = ProfileControl
+def lazy_import():
+    from symphony.bdk.gen.group_model.interaction_control import InteractionControl
+    from symphony.bdk.gen.group_model.membership_control import MembershipControl
+    from symphony.bdk.gen.group_model.profile_control import ProfileControl
+    globals()['InteractionControl'] = InteractionControl
+    globals()['MembershipControl'] = MembershipControl
+    globals()['ProfileControl'] = ProfileControl
 
 class TypeAllOf(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class TypeAllOf(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class TypeAllOf(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'profile_control': (ProfileControl, none_type),  # noqa: E501
             'membership_control': (MembershipControl, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class TypeAllOf(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_type import BaseType
-from symphony.bdk.gen.group_model.pagination import Pagination
-globals()['BaseType'] = BaseType
-globals()['Pagination'] = Pagination
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_type import BaseType
+    from symphony.bdk.gen.group_model.pagination import Pagination
+    globals()['BaseType'] = BaseType
+    globals()['Pagination'] = Pagination
 
 class TypeList(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class TypeList(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class TypeList(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'pagination': (Pagination, none_type),  # noqa: E501
             'data': ([BaseType], none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class TypeList(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,24 +30,25 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.base_profile import BaseProfile
-from symphony.bdk.gen.group_model.create_group import CreateGroup
-from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
-from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
-from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
-from symphony.bdk.gen.group_model.member import Member
-from symphony.bdk.gen.group_model.owner import Owner
-from symphony.bdk.gen.group_model.status import Status
-from symphony.bdk.gen.group_model.update_group_all_of import UpdateGroupAllOf
-globals()['BaseProfile'] = BaseProfile
-globals()['CreateGroup'] = CreateGroup
-globals()['GroupImplicitConnection'] = GroupImplicitConnection
-globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
-globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
-globals()['Member'] = Member
-globals()['Owner'] = Owner
-globals()['Status'] = Status
-globals()['UpdateGroupAllOf'] = UpdateGroupAllOf
+def lazy_import():
+    from symphony.bdk.gen.group_model.base_profile import BaseProfile
+    from symphony.bdk.gen.group_model.create_group import CreateGroup
+    from symphony.bdk.gen.group_model.group_implicit_connection import GroupImplicitConnection
+    from symphony.bdk.gen.group_model.group_interaction_transfer import GroupInteractionTransfer
+    from symphony.bdk.gen.group_model.group_visibility_restriction import GroupVisibilityRestriction
+    from symphony.bdk.gen.group_model.member import Member
+    from symphony.bdk.gen.group_model.owner import Owner
+    from symphony.bdk.gen.group_model.status import Status
+    from symphony.bdk.gen.group_model.update_group_all_of import UpdateGroupAllOf
+    globals()['BaseProfile'] = BaseProfile
+    globals()['CreateGroup'] = CreateGroup
+    globals()['GroupImplicitConnection'] = GroupImplicitConnection
+    globals()['GroupInteractionTransfer'] = GroupInteractionTransfer
+    globals()['GroupVisibilityRestriction'] = GroupVisibilityRestriction
+    globals()['Member'] = Member
+    globals()['Owner'] = Owner
+    globals()['Status'] = Status
+    globals()['UpdateGroupAllOf'] = UpdateGroupAllOf
 
 class UpdateGroup(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -101,6 +102,7 @@ class UpdateGroup(ModelComposed):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -115,6 +117,7 @@ class UpdateGroup(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'type': (str,),  # noqa: E501
             'owner_type': (Owner,),  # noqa: E501
@@ -134,6 +137,7 @@ class UpdateGroup(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -386,6 +390,7 @@ class UpdateGroup(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.group_model.status import Status
-globals()['Status'] = Status
+def lazy_import():
+    from symphony.bdk.gen.group_model.status import Status
+    globals()['Status'] = Status
 
 class UpdateGroupAllOf(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -75,6 +76,7 @@ class UpdateGroupAllOf(ModelNormal):
         This must be a method because a group_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -89,6 +91,7 @@ class UpdateGroupAllOf(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'status': (Status, none_type),  # noqa: E501
@@ -97,6 +100,7 @@ class UpdateGroupAllOf(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
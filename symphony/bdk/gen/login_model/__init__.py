@@ -1 +1,27 @@
 # do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from symphony.bdk.gen.login_model import AuthenticateExtensionAppRequest`
+import importlib
+
+_MODEL_MODULES = {
+    "AuthenticateExtensionAppRequest": "authenticate_extension_app_request",
+    "AuthenticateRequest": "authenticate_request",
+    "Error": "error",
+    "ExtensionAppTokens": "extension_app_tokens",
+    "Jwks": "jwks",
+    "JwksEntry": "jwks_entry",
+    "JwtToken": "jwt_token",
+    "Token": "token",
+}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
@@ -1 +1,208 @@
 # do not import all models into this module because that uses a lot of memory and stack frames
+# models are imported on first access instead, e.g. `from symphony.bdk.gen.pod_model import AdminJustifiedAction`
+import importlib
+
+_MODEL_MODULES = {
+    "AdminJustifiedAction": "admin_justified_action",
+    "AdminJustifiedUserAction": "admin_justified_user_action",
+    "AdminStreamAttributes": "admin_stream_attributes",
+    "AdminStreamFilter": "admin_stream_filter",
+    "AdminStreamInfo": "admin_stream_info",
+    "AdminStreamInfoList": "admin_stream_info_list",
+    "AdminStreamList": "admin_stream_list",
+    "AdminStreamTypeEnum": "admin_stream_type_enum",
+    "AppAuthenticationKey": "app_authentication_key",
+    "AppAuthenticationKeys": "app_authentication_keys",
+    "AppNotification": "app_notification",
+    "AppProperties": "app_properties",
+    "AppProperty": "app_property",
+    "ApplicationDetail": "application_detail",
+    "ApplicationInfo": "application_info",
+    "AssigneeCandidate": "assignee_candidate",
+    "AssigneeCandidates": "assignee_candidates",
+    "AttachmentPreview": "attachment_preview",
+    "Avatar": "avatar",
+    "AvatarList": "avatar_list",
+    "AvatarUpdate": "avatar_update",
+    "BulkActionResult": "bulk_action_result",
+    "CertInfo": "cert_info",
+    "CertInfoItem": "cert_info_item",
+    "CompanyCert": "company_cert",
+    "CompanyCertAttributes": "company_cert_attributes",
+    "CompanyCertDetail": "company_cert_detail",
+    "CompanyCertInfo": "company_cert_info",
+    "CompanyCertInfoList": "company_cert_info_list",
+    "CompanyCertStatus": "company_cert_status",
+    "CompanyCertType": "company_cert_type",
+    "CompanyCertTypeList": "company_cert_type_list",
+    "ConversationSpecificStreamAttributes": "conversation_specific_stream_attributes",
+    "DelegateAction": "delegate_action",
+    "Disclaimer": "disclaimer",
+    "DisclaimerList": "disclaimer_list",
+    "DownloadReceiptCount": "download_receipt_count",
+    "Error": "error",
+    "FacetedMatchCount": "faceted_match_count",
+    "Feature": "feature",
+    "FeatureList": "feature_list",
+    "FileExtension": "file_extension",
+    "FileExtensionsResponse": "file_extensions_response",
+    "FollowersList": "followers_list",
+    "FollowersListResponse": "followers_list_response",
+    "FollowingListResponse": "following_list_response",
+    "Group": "group",
+    "GroupItem": "group_item",
+    "GroupList": "group_list",
+    "GroupRoleScope": "group_role_scope",
+    "IMSystemInfo": "im_system_info",
+    "ImmutableRoomAttributes": "immutable_room_attributes",
+    "IntegerList": "integer_list",
+    "Languages": "languages",
+    "MemberInfo": "member_info",
+    "MembershipData": "membership_data",
+    "MembershipList": "membership_list",
+    "MessageDetail": "message_detail",
+    "MessageDetails": "message_details",
+    "MessageDownloadReceiptCount": "message_download_receipt_count",
+    "MessageIds": "message_ids",
+    "MessageIdsFromStream": "message_ids_from_stream",
+    "MessageMetadataResponse": "message_metadata_response",
+    "MessageMetadataResponseParent": "message_metadata_response_parent",
+    "MessageReceiptDetail": "message_receipt_detail",
+    "MessageReceiptDetailResponse": "message_receipt_detail_response",
+    "MessageStatus": "message_status",
+    "MessageStatusUser": "message_status_user",
+    "MessageStream": "message_stream",
+    "MessageSuppressionResponse": "message_suppression_response",
+    "MessageUser": "message_user",
+    "NameValuePair": "name_value_pair",
+    "Pagination": "pagination",
+    "PaginationCursors": "pagination_cursors",
+    "Password": "password",
+    "PasswordReset": "password_reset",
+    "PodAppEntitlement": "pod_app_entitlement",
+    "PodAppEntitlementList": "pod_app_entitlement_list",
+    "PodCertificate": "pod_certificate",
+    "Policy": "policy",
+    "PolicyList": "policy_list",
+    "Presence": "presence",
+    "Product": "product",
+    "ProductList": "product_list",
+    "Protocol": "protocol",
+    "Role": "role",
+    "RoleDetail": "role_detail",
+    "RoleDetailList": "role_detail_list",
+    "RoleList": "role_list",
+    "RoomAttributes": "room_attributes",
+    "RoomCreate": "room_create",
+    "RoomDetail": "room_detail",
+    "RoomSearchCriteria": "room_search_criteria",
+    "RoomSearchResults": "room_search_results",
+    "RoomSpecificStreamAttributes": "room_specific_stream_attributes",
+    "RoomSystemInfo": "room_system_info",
+    "RoomTag": "room_tag",
+    "ServiceAccountManifest": "service_account_manifest",
+    "SessionInfo": "session_info",
+    "Stream": "stream",
+    "StreamAttachmentItem": "stream_attachment_item",
+    "StreamAttachmentResponse": "stream_attachment_response",
+    "StreamAttributes": "stream_attributes",
+    "StreamFilter": "stream_filter",
+    "StreamList": "stream_list",
+    "StreamType": "stream_type",
+    "StringId": "string_id",
+    "StringList": "string_list",
+    "SuccessResponse": "success_response",
+    "User": "user",
+    "UserAppEntitlement": "user_app_entitlement",
+    "UserAppEntitlementList": "user_app_entitlement_list",
+    "UserAppEntitlementPatch": "user_app_entitlement_patch",
+    "UserAppEntitlementPatchEnum": "user_app_entitlement_patch_enum",
+    "UserAppEntitlementsPatchList": "user_app_entitlements_patch_list",
+    "UserAttributes": "user_attributes",
+    "UserCompp": "user_compp",
+    "UserConnection": "user_connection",
+    "UserConnectionList": "user_connection_list",
+    "UserConnectionRequest": "user_connection_request",
+    "UserCreate": "user_create",
+    "UserData": "user_data",
+    "UserDetail": "user_detail",
+    "UserDetailList": "user_detail_list",
+    "UserError": "user_error",
+    "UserFilter": "user_filter",
+    "UserGroupAssignee": "user_group_assignee",
+    "UserGroupAssigneeResponse": "user_group_assignee_response",
+    "UserGroupAssigneeUpdate": "user_group_assignee_update",
+    "UserGroupAssignmentResponse": "user_group_assignment_response",
+    "UserGroupCreate": "user_group_create",
+    "UserGroupData": "user_group_data",
+    "UserGroupMembershipData": "user_group_membership_data",
+    "UserGroupMembershipRequest": "user_group_membership_request",
+    "UserGroupMembershipResponse": "user_group_membership_response",
+    "UserGroupMembershipResponseData": "user_group_membership_response_data",
+    "UserGroupMembershipUpdate": "user_group_membership_update",
+    "UserGroupResponse": "user_group_response",
+    "UserGroupResponseList": "user_group_response_list",
+    "UserGroupUpdate": "user_group_update",
+    "UserId": "user_id",
+    "UserIdList": "user_id_list",
+    "UserInfo": "user_info",
+    "UserName": "user_name",
+    "UserNameList": "user_name_list",
+    "UserSearchFilter": "user_search_filter",
+    "UserSearchQuery": "user_search_query",
+    "UserSearchResults": "user_search_results",
+    "UserStatus": "user_status",
+    "UserSuspension": "user_suspension",
+    "UserSystemInfo": "user_system_info",
+    "UserV2": "user_v2",
+    "V1IMAttributes": "v1_im_attributes",
+    "V1IMDetail": "v1_im_detail",
+    "V1Session": "v1_session",
+    "V1UserSessions": "v1_user_sessions",
+    "V2AdminStreamAttributes": "v2_admin_stream_attributes",
+    "V2AdminStreamFilter": "v2_admin_stream_filter",
+    "V2AdminStreamInfo": "v2_admin_stream_info",
+    "V2AdminStreamInfoList": "v2_admin_stream_info_list",
+    "V2AdminStreamList": "v2_admin_stream_list",
+    "V2AdminStreamType": "v2_admin_stream_type",
+    "V2ConversationSpecificStreamAttributes": "v2_conversation_specific_stream_attributes",
+    "V2MemberInfo": "v2_member_info",
+    "V2MemberInfoList": "v2_member_info_list",
+    "V2MemberUserDetail": "v2_member_user_detail",
+    "V2MembershipList": "v2_membership_list",
+    "V2Presence": "v2_presence",
+    "V2PresenceAllOf": "v2_presence_all_of",
+    "V2PresenceList": "v2_presence_list",
+    "V2PresenceStatus": "v2_presence_status",
+    "V2RoomAttributes": "v2_room_attributes",
+    "V2RoomDetail": "v2_room_detail",
+    "V2RoomSearchCriteria": "v2_room_search_criteria",
+    "V2RoomSearchCriteriaAllOf": "v2_room_search_criteria_all_of",
+    "V2RoomSpecificStreamAttributes": "v2_room_specific_stream_attributes",
+    "V2StreamAttributes": "v2_stream_attributes",
+    "V2StreamType": "v2_stream_type",
+    "V2UserAttributes": "v2_user_attributes",
+    "V2UserCreate": "v2_user_create",
+    "V2UserDetail": "v2_user_detail",
+    "V2UserDetailList": "v2_user_detail_list",
+    "V2UserKeyRequest": "v2_user_key_request",
+    "V2UserList": "v2_user_list",
+    "V2UserPresence": "v2_user_presence",
+    "V2UserPresenceAllOf": "v2_user_presence_all_of",
+    "V3RoomAttributes": "v3_room_attributes",
+    "V3RoomDetail": "v3_room_detail",
+    "V3RoomSearchResults": "v3_room_search_results",
+}
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODEL_MODULES))
@@ -27,8 +27,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.admin_stream_type_enum import AdminStreamTypeEnum
-globals()['AdminStreamTypeEnum'] = AdminStreamTypeEnum
+def lazy_import():
+    from symphony.bdk.gen.pod_model.admin_stream_type_enum import AdminStreamTypeEnum
+    globals()['AdminStreamTypeEnum'] = AdminStreamTypeEnum
 
 
 class AdminStreamFilter(ModelNormal):
@@ -91,6 +92,7 @@ class AdminStreamFilter(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'stream_types': ([AdminStreamTypeEnum], none_type),  # noqa: E501
             'scope': (str, none_type),  # noqa: E501
@@ -103,6 +105,7 @@ class AdminStreamFilter(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -27,8 +27,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.admin_stream_attributes import AdminStreamAttributes
-globals()['AdminStreamAttributes'] = AdminStreamAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.admin_stream_attributes import AdminStreamAttributes
+    globals()['AdminStreamAttributes'] = AdminStreamAttributes
 
 
 class AdminStreamInfo(ModelNormal):
@@ -75,6 +76,7 @@ class AdminStreamInfo(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'is_external': (bool, none_type),  # noqa: E501
@@ -86,6 +88,7 @@ class AdminStreamInfo(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
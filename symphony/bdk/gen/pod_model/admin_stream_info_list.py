@@ -27,8 +27,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.admin_stream_info import AdminStreamInfo
-globals()['AdminStreamInfo'] = AdminStreamInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.admin_stream_info import AdminStreamInfo
+    globals()['AdminStreamInfo'] = AdminStreamInfo
 
 
 class AdminStreamInfoList(ModelSimple):
@@ -71,12 +72,14 @@ class AdminStreamInfoList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([AdminStreamInfo],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -27,10 +27,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.admin_stream_filter import AdminStreamFilter
-from symphony.bdk.gen.pod_model.admin_stream_info_list import AdminStreamInfoList
-globals()['AdminStreamFilter'] = AdminStreamFilter
-globals()['AdminStreamInfoList'] = AdminStreamInfoList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.admin_stream_filter import AdminStreamFilter
+    from symphony.bdk.gen.pod_model.admin_stream_info_list import AdminStreamInfoList
+    globals()['AdminStreamFilter'] = AdminStreamFilter
+    globals()['AdminStreamInfoList'] = AdminStreamInfoList
 
 
 class AdminStreamList(ModelNormal):
@@ -77,6 +78,7 @@ class AdminStreamList(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -87,6 +89,7 @@ class AdminStreamList(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
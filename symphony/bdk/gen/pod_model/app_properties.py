@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.app_property import AppProperty
-globals()['AppProperty'] = AppProperty
+def lazy_import():
+    from symphony.bdk.gen.pod_model.app_property import AppProperty
+    globals()['AppProperty'] = AppProperty
 
 class AppProperties(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class AppProperties(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([AppProperty],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,14 +30,15 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.app_authentication_keys import AppAuthenticationKeys
-from symphony.bdk.gen.pod_model.app_notification import AppNotification
-from symphony.bdk.gen.pod_model.app_properties import AppProperties
-from symphony.bdk.gen.pod_model.application_info import ApplicationInfo
-globals()['AppAuthenticationKeys'] = AppAuthenticationKeys
-globals()['AppNotification'] = AppNotification
-globals()['AppProperties'] = AppProperties
-globals()['ApplicationInfo'] = ApplicationInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.app_authentication_keys import AppAuthenticationKeys
+    from symphony.bdk.gen.pod_model.app_notification import AppNotification
+    from symphony.bdk.gen.pod_model.app_properties import AppProperties
+    from symphony.bdk.gen.pod_model.application_info import ApplicationInfo
+    globals()['AppAuthenticationKeys'] = AppAuthenticationKeys
+    globals()['AppNotification'] = AppNotification
+    globals()['AppProperties'] = AppProperties
+    globals()['ApplicationInfo'] = ApplicationInfo
 
 class ApplicationDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -75,6 +76,7 @@ class ApplicationDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -89,6 +91,7 @@ class ApplicationDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'application_info': (ApplicationInfo, none_type),  # noqa: E501
             'icon_url': (str, none_type),  # noqa: E501
@@ -103,6 +106,7 @@ class ApplicationDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
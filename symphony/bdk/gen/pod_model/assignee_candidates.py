@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.assignee_candidate import AssigneeCandidate
-from symphony.bdk.gen.pod_model.pagination import Pagination
-globals()['AssigneeCandidate'] = AssigneeCandidate
-globals()['Pagination'] = Pagination
+def lazy_import():
+    from symphony.bdk.gen.pod_model.assignee_candidate import AssigneeCandidate
+    from symphony.bdk.gen.pod_model.pagination import Pagination
+    globals()['AssigneeCandidate'] = AssigneeCandidate
+    globals()['Pagination'] = Pagination
 
 class AssigneeCandidates(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class AssigneeCandidates(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class AssigneeCandidates(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'users': ([AssigneeCandidate], none_type),  # noqa: E501
             'pagination': (Pagination, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class AssigneeCandidates(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.avatar import Avatar
-globals()['Avatar'] = Avatar
+def lazy_import():
+    from symphony.bdk.gen.pod_model.avatar import Avatar
+    globals()['Avatar'] = Avatar
 
 class AvatarList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class AvatarList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([Avatar],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.company_cert_status import CompanyCertStatus
-from symphony.bdk.gen.pod_model.company_cert_type import CompanyCertType
-globals()['CompanyCertStatus'] = CompanyCertStatus
-globals()['CompanyCertType'] = CompanyCertType
+def lazy_import():
+    from symphony.bdk.gen.pod_model.company_cert_status import CompanyCertStatus
+    from symphony.bdk.gen.pod_model.company_cert_type import CompanyCertType
+    globals()['CompanyCertStatus'] = CompanyCertStatus
+    globals()['CompanyCertType'] = CompanyCertType
 
 class CompanyCertAttributes(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class CompanyCertAttributes(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class CompanyCertAttributes(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'name': (str, none_type),  # noqa: E501
             'type': (CompanyCertType, none_type),  # noqa: E501
@@ -93,6 +96,7 @@ class CompanyCertAttributes(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.cert_info import CertInfo
-from symphony.bdk.gen.pod_model.company_cert_attributes import CompanyCertAttributes
-from symphony.bdk.gen.pod_model.company_cert_info import CompanyCertInfo
-globals()['CertInfo'] = CertInfo
-globals()['CompanyCertAttributes'] = CompanyCertAttributes
-globals()['CompanyCertInfo'] = CompanyCertInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.cert_info import CertInfo
+    from symphony.bdk.gen.pod_model.company_cert_attributes import CompanyCertAttributes
+    from symphony.bdk.gen.pod_model.company_cert_info import CompanyCertInfo
+    globals()['CertInfo'] = CertInfo
+    globals()['CompanyCertAttributes'] = CompanyCertAttributes
+    globals()['CompanyCertInfo'] = CompanyCertInfo
 
 class CompanyCertDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class CompanyCertDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class CompanyCertDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'company_cert_attributes': (CompanyCertAttributes, none_type),  # noqa: E501
             'company_cert_info': (CompanyCertInfo, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class CompanyCertDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.message_download_receipt_count import MessageDownloadReceiptCount
-from symphony.bdk.gen.pod_model.message_stream import MessageStream
-from symphony.bdk.gen.pod_model.message_user import MessageUser
-globals()['MessageDownloadReceiptCount'] = MessageDownloadReceiptCount
-globals()['MessageStream'] = MessageStream
-globals()['MessageUser'] = MessageUser
+def lazy_import():
+    from symphony.bdk.gen.pod_model.message_download_receipt_count import MessageDownloadReceiptCount
+    from symphony.bdk.gen.pod_model.message_stream import MessageStream
+    from symphony.bdk.gen.pod_model.message_user import MessageUser
+    globals()['MessageDownloadReceiptCount'] = MessageDownloadReceiptCount
+    globals()['MessageStream'] = MessageStream
+    globals()['MessageUser'] = MessageUser
 
 class MessageDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class MessageDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class MessageDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'message_id': (str, none_type),  # noqa: E501
             'creator': (MessageUser, none_type),  # noqa: E501
@@ -101,6 +104,7 @@ class MessageDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.message_metadata_response_parent import MessageMetadataResponseParent
-globals()['MessageMetadataResponseParent'] = MessageMetadataResponseParent
+def lazy_import():
+    from symphony.bdk.gen.pod_model.message_metadata_response_parent import MessageMetadataResponseParent
+    globals()['MessageMetadataResponseParent'] = MessageMetadataResponseParent
 
 class MessageMetadataResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class MessageMetadataResponse(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class MessageMetadataResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'message_id': (str, none_type),  # noqa: E501
             'parent': (MessageMetadataResponseParent, none_type),  # noqa: E501
@@ -93,6 +96,7 @@ class MessageMetadataResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.download_receipt_count import DownloadReceiptCount
-from symphony.bdk.gen.pod_model.user_compp import UserCompp
-globals()['DownloadReceiptCount'] = DownloadReceiptCount
-globals()['UserCompp'] = UserCompp
+def lazy_import():
+    from symphony.bdk.gen.pod_model.download_receipt_count import DownloadReceiptCount
+    from symphony.bdk.gen.pod_model.user_compp import UserCompp
+    globals()['DownloadReceiptCount'] = DownloadReceiptCount
+    globals()['UserCompp'] = UserCompp
 
 class MessageReceiptDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class MessageReceiptDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class MessageReceiptDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'user': (UserCompp, none_type),  # noqa: E501
             'delivery_receipt_timestamp': (int, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class MessageReceiptDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
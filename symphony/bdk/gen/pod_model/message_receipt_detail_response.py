@@ -30,16 +30,17 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.message_download_receipt_count import MessageDownloadReceiptCount
-from symphony.bdk.gen.pod_model.message_receipt_detail import MessageReceiptDetail
-from symphony.bdk.gen.pod_model.message_stream import MessageStream
-from symphony.bdk.gen.pod_model.message_user import MessageUser
-from symphony.bdk.gen.pod_model.pagination import Pagination
-globals()['MessageDownloadReceiptCount'] = MessageDownloadReceiptCount
-globals()['MessageReceiptDetail'] = MessageReceiptDetail
-globals()['MessageStream'] = MessageStream
-globals()['MessageUser'] = MessageUser
-globals()['Pagination'] = Pagination
+def lazy_import():
+    from symphony.bdk.gen.pod_model.message_download_receipt_count import MessageDownloadReceiptCount
+    from symphony.bdk.gen.pod_model.message_receipt_detail import MessageReceiptDetail
+    from symphony.bdk.gen.pod_model.message_stream import MessageStream
+    from symphony.bdk.gen.pod_model.message_user import MessageUser
+    from symphony.bdk.gen.pod_model.pagination import Pagination
+    globals()['MessageDownloadReceiptCount'] = MessageDownloadReceiptCount
+    globals()['MessageReceiptDetail'] = MessageReceiptDetail
+    globals()['MessageStream'] = MessageStream
+    globals()['MessageUser'] = MessageUser
+    globals()['Pagination'] = Pagination
 
 class MessageReceiptDetailResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -77,6 +78,7 @@ class MessageReceiptDetailResponse(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -91,6 +93,7 @@ class MessageReceiptDetailResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'creator': (MessageUser, none_type),  # noqa: E501
             'on_behalf_of_user': (MessageUser, none_type),  # noqa: E501
@@ -106,6 +109,7 @@ class MessageReceiptDetailResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
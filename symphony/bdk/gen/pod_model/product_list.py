@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.product import Product
-globals()['Product'] = Product
+def lazy_import():
+    from symphony.bdk.gen.pod_model.product import Product
+    globals()['Product'] = Product
 
 class ProductList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class ProductList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([Product],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -27,10 +27,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.immutable_room_attributes import ImmutableRoomAttributes
-from symphony.bdk.gen.pod_model.room_attributes import RoomAttributes
-globals()['ImmutableRoomAttributes'] = ImmutableRoomAttributes
-globals()['RoomAttributes'] = RoomAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.immutable_room_attributes import ImmutableRoomAttributes
+    from symphony.bdk.gen.pod_model.room_attributes import RoomAttributes
+    globals()['ImmutableRoomAttributes'] = ImmutableRoomAttributes
+    globals()['RoomAttributes'] = RoomAttributes
 
 
 class RoomCreate(ModelNormal):
@@ -77,6 +78,7 @@ class RoomCreate(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'room_attributes': (RoomAttributes, none_type),  # noqa: E501
             'immutable_room_attributes': (ImmutableRoomAttributes, none_type),  # noqa: E501
@@ -84,6 +86,7 @@ class RoomCreate(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
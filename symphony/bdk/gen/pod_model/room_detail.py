@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.immutable_room_attributes import ImmutableRoomAttributes
-from symphony.bdk.gen.pod_model.room_attributes import RoomAttributes
-from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
-globals()['ImmutableRoomAttributes'] = ImmutableRoomAttributes
-globals()['RoomAttributes'] = RoomAttributes
-globals()['RoomSystemInfo'] = RoomSystemInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.immutable_room_attributes import ImmutableRoomAttributes
+    from symphony.bdk.gen.pod_model.room_attributes import RoomAttributes
+    from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
+    globals()['ImmutableRoomAttributes'] = ImmutableRoomAttributes
+    globals()['RoomAttributes'] = RoomAttributes
+    globals()['RoomSystemInfo'] = RoomSystemInfo
 
 class RoomDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class RoomDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class RoomDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'room_attributes': (RoomAttributes, none_type),  # noqa: E501
             'room_system_info': (RoomSystemInfo, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class RoomDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
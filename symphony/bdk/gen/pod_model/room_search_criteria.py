@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.user_id import UserId
-globals()['UserId'] = UserId
+def lazy_import():
+    from symphony.bdk.gen.pod_model.user_id import UserId
+    globals()['UserId'] = UserId
 
 class RoomSearchCriteria(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class RoomSearchCriteria(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class RoomSearchCriteria(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'query': (str,),  # noqa: E501
             'labels': ([str], none_type),  # noqa: E501
@@ -100,6 +103,7 @@ class RoomSearchCriteria(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
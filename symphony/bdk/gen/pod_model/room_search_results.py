@@ -27,12 +27,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.faceted_match_count import FacetedMatchCount
-from symphony.bdk.gen.pod_model.room_search_criteria import RoomSearchCriteria
-from symphony.bdk.gen.pod_model.v2_room_detail import V2RoomDetail
-globals()['FacetedMatchCount'] = FacetedMatchCount
-globals()['RoomSearchCriteria'] = RoomSearchCriteria
-globals()['V2RoomDetail'] = V2RoomDetail
+def lazy_import():
+    from symphony.bdk.gen.pod_model.faceted_match_count import FacetedMatchCount
+    from symphony.bdk.gen.pod_model.room_search_criteria import RoomSearchCriteria
+    from symphony.bdk.gen.pod_model.v2_room_detail import V2RoomDetail
+    globals()['FacetedMatchCount'] = FacetedMatchCount
+    globals()['RoomSearchCriteria'] = RoomSearchCriteria
+    globals()['V2RoomDetail'] = V2RoomDetail
 
 
 class RoomSearchResults(ModelNormal):
@@ -79,6 +80,7 @@ class RoomSearchResults(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -90,6 +92,7 @@ class RoomSearchResults(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
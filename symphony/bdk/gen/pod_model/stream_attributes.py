@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.conversation_specific_stream_attributes import ConversationSpecificStreamAttributes
-from symphony.bdk.gen.pod_model.room_specific_stream_attributes import RoomSpecificStreamAttributes
-from symphony.bdk.gen.pod_model.stream_type import StreamType
-globals()['ConversationSpecificStreamAttributes'] = ConversationSpecificStreamAttributes
-globals()['RoomSpecificStreamAttributes'] = RoomSpecificStreamAttributes
-globals()['StreamType'] = StreamType
+def lazy_import():
+    from symphony.bdk.gen.pod_model.conversation_specific_stream_attributes import ConversationSpecificStreamAttributes
+    from symphony.bdk.gen.pod_model.room_specific_stream_attributes import RoomSpecificStreamAttributes
+    from symphony.bdk.gen.pod_model.stream_type import StreamType
+    globals()['ConversationSpecificStreamAttributes'] = ConversationSpecificStreamAttributes
+    globals()['RoomSpecificStreamAttributes'] = RoomSpecificStreamAttributes
+    globals()['StreamType'] = StreamType
 
 class StreamAttributes(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class StreamAttributes(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class StreamAttributes(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'cross_pod': (bool, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class StreamAttributes(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.product_list import ProductList
-globals()['ProductList'] = ProductList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.product_list import ProductList
+    globals()['ProductList'] = ProductList
 
 class UserAppEntitlement(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -77,6 +78,7 @@ class UserAppEntitlement(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -91,6 +93,7 @@ class UserAppEntitlement(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'app_id': (str,),  # noqa: E501
             'listed': (bool,),  # noqa: E501
@@ -101,6 +104,7 @@ class UserAppEntitlement(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
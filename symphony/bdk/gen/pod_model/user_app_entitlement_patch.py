@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.product import Product
-globals()['Product'] = Product
+def lazy_import():
+    from symphony.bdk.gen.pod_model.product import Product
+    globals()['Product'] = Product
 
 class UserAppEntitlementPatch(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -85,6 +86,7 @@ class UserAppEntitlementPatch(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -99,6 +101,7 @@ class UserAppEntitlementPatch(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'app_id': (str,),  # noqa: E501
             'listed': (str, none_type),  # noqa: E501
@@ -108,6 +111,7 @@ class UserAppEntitlementPatch(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
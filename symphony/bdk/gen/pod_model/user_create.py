@@ -27,10 +27,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.password import Password
-from symphony.bdk.gen.pod_model.user_attributes import UserAttributes
-globals()['Password'] = Password
-globals()['UserAttributes'] = UserAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.password import Password
+    from symphony.bdk.gen.pod_model.user_attributes import UserAttributes
+    globals()['Password'] = Password
+    globals()['UserAttributes'] = UserAttributes
 
 
 class UserCreate(ModelNormal):
@@ -77,6 +78,7 @@ class UserCreate(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'user_attributes': (UserAttributes, none_type),  # noqa: E501
             'password': (Password, none_type),  # noqa: E501
@@ -85,6 +87,7 @@ class UserCreate(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
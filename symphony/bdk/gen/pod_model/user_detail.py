@@ -30,16 +30,17 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.avatar import Avatar
-from symphony.bdk.gen.pod_model.integer_list import IntegerList
-from symphony.bdk.gen.pod_model.string_list import StringList
-from symphony.bdk.gen.pod_model.user_attributes import UserAttributes
-from symphony.bdk.gen.pod_model.user_system_info import UserSystemInfo
-globals()['Avatar'] = Avatar
-globals()['IntegerList'] = IntegerList
-globals()['StringList'] = StringList
-globals()['UserAttributes'] = UserAttributes
-globals()['UserSystemInfo'] = UserSystemInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.avatar import Avatar
+    from symphony.bdk.gen.pod_model.integer_list import IntegerList
+    from symphony.bdk.gen.pod_model.string_list import StringList
+    from symphony.bdk.gen.pod_model.user_attributes import UserAttributes
+    from symphony.bdk.gen.pod_model.user_system_info import UserSystemInfo
+    globals()['Avatar'] = Avatar
+    globals()['IntegerList'] = IntegerList
+    globals()['StringList'] = StringList
+    globals()['UserAttributes'] = UserAttributes
+    globals()['UserSystemInfo'] = UserSystemInfo
 
 class UserDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -77,6 +78,7 @@ class UserDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -91,6 +93,7 @@ class UserDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'user_attributes': (UserAttributes, none_type),  # noqa: E501
             'user_system_info': (UserSystemInfo, none_type),  # noqa: E501
@@ -104,6 +107,7 @@ class UserDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
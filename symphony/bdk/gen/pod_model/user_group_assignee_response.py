@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.pagination import Pagination
-from symphony.bdk.gen.pod_model.user_group_assignee import UserGroupAssignee
-globals()['Pagination'] = Pagination
-globals()['UserGroupAssignee'] = UserGroupAssignee
+def lazy_import():
+    from symphony.bdk.gen.pod_model.pagination import Pagination
+    from symphony.bdk.gen.pod_model.user_group_assignee import UserGroupAssignee
+    globals()['Pagination'] = Pagination
+    globals()['UserGroupAssignee'] = UserGroupAssignee
 
 class UserGroupAssigneeResponse(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class UserGroupAssigneeResponse(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class UserGroupAssigneeResponse(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'data': ([UserGroupAssignee], none_type),  # noqa: E501
             'pagination': (Pagination, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class UserGroupAssigneeResponse(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.membership_data import MembershipData
-from symphony.bdk.gen.pod_model.user_group_data import UserGroupData
-globals()['MembershipData'] = MembershipData
-globals()['UserGroupData'] = UserGroupData
+def lazy_import():
+    from symphony.bdk.gen.pod_model.membership_data import MembershipData
+    from symphony.bdk.gen.pod_model.user_group_data import UserGroupData
+    globals()['MembershipData'] = MembershipData
+    globals()['UserGroupData'] = UserGroupData
 
 class UserGroupMembershipData(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class UserGroupMembershipData(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class UserGroupMembershipData(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'group_id': (str, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class UserGroupMembershipData(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.string_list import StringList
-globals()['StringList'] = StringList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.string_list import StringList
+    globals()['StringList'] = StringList
 
 class UserSearchFilter(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class UserSearchFilter(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class UserSearchFilter(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'account_types': (StringList, none_type),  # noqa: E501
             'title': (str, none_type),  # noqa: E501
@@ -96,6 +99,7 @@ class UserSearchFilter(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.user_search_filter import UserSearchFilter
-globals()['UserSearchFilter'] = UserSearchFilter
+def lazy_import():
+    from symphony.bdk.gen.pod_model.user_search_filter import UserSearchFilter
+    globals()['UserSearchFilter'] = UserSearchFilter
 
 class UserSearchQuery(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class UserSearchQuery(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class UserSearchQuery(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'query': (str, none_type),  # noqa: E501
             'filters': (UserSearchFilter, none_type),  # noqa: E501
@@ -90,6 +93,7 @@ class UserSearchQuery(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
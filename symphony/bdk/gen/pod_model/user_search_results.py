@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.user_search_query import UserSearchQuery
-from symphony.bdk.gen.pod_model.user_v2 import UserV2
-globals()['UserSearchQuery'] = UserSearchQuery
-globals()['UserV2'] = UserV2
+def lazy_import():
+    from symphony.bdk.gen.pod_model.user_search_query import UserSearchQuery
+    from symphony.bdk.gen.pod_model.user_v2 import UserV2
+    globals()['UserSearchQuery'] = UserSearchQuery
+    globals()['UserV2'] = UserV2
 
 class UserSearchResults(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class UserSearchResults(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class UserSearchResults(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class UserSearchResults(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
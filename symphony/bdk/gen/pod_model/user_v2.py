@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.avatar_list import AvatarList
-from symphony.bdk.gen.pod_model.string_list import StringList
-globals()['AvatarList'] = AvatarList
-globals()['StringList'] = StringList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.avatar_list import AvatarList
+    from symphony.bdk.gen.pod_model.string_list import StringList
+    globals()['AvatarList'] = AvatarList
+    globals()['StringList'] = StringList
 
 class UserV2(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -76,6 +77,7 @@ class UserV2(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -90,6 +92,7 @@ class UserV2(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (int, none_type),  # noqa: E501
             'email_address': (str, none_type),  # noqa: E501
@@ -112,6 +115,7 @@ class UserV2(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.im_system_info import IMSystemInfo
-from symphony.bdk.gen.pod_model.v1_im_attributes import V1IMAttributes
-globals()['IMSystemInfo'] = IMSystemInfo
-globals()['V1IMAttributes'] = V1IMAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.im_system_info import IMSystemInfo
+    from symphony.bdk.gen.pod_model.v1_im_attributes import V1IMAttributes
+    globals()['IMSystemInfo'] = IMSystemInfo
+    globals()['V1IMAttributes'] = V1IMAttributes
 
 class V1IMDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V1IMDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V1IMDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'v1_im_attributes': (V1IMAttributes, none_type),  # noqa: E501
             'im_system_info': (IMSystemInfo, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V1IMDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_admin_stream_info import V2AdminStreamInfo
-globals()['V2AdminStreamInfo'] = V2AdminStreamInfo
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_admin_stream_info import V2AdminStreamInfo
+    globals()['V2AdminStreamInfo'] = V2AdminStreamInfo
 
 class V2AdminStreamInfoList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V2AdminStreamInfoList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V2AdminStreamInfo],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
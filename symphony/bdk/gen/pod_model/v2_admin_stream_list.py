@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_admin_stream_filter import V2AdminStreamFilter
-from symphony.bdk.gen.pod_model.v2_admin_stream_info_list import V2AdminStreamInfoList
-globals()['V2AdminStreamFilter'] = V2AdminStreamFilter
-globals()['V2AdminStreamInfoList'] = V2AdminStreamInfoList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_admin_stream_filter import V2AdminStreamFilter
+    from symphony.bdk.gen.pod_model.v2_admin_stream_info_list import V2AdminStreamInfoList
+    globals()['V2AdminStreamFilter'] = V2AdminStreamFilter
+    globals()['V2AdminStreamInfoList'] = V2AdminStreamInfoList
 
 class V2AdminStreamList(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V2AdminStreamList(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V2AdminStreamList(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class V2AdminStreamList(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
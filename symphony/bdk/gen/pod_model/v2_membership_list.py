@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_member_info_list import V2MemberInfoList
-globals()['V2MemberInfoList'] = V2MemberInfoList
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_member_info_list import V2MemberInfoList
+    globals()['V2MemberInfoList'] = V2MemberInfoList
 
 class V2MembershipList(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -69,6 +70,7 @@ class V2MembershipList(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -83,6 +85,7 @@ class V2MembershipList(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V2MembershipList(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_presence_all_of import V2PresenceAllOf
-from symphony.bdk.gen.pod_model.v2_user_presence import V2UserPresence
-globals()['V2PresenceAllOf'] = V2PresenceAllOf
-globals()['V2UserPresence'] = V2UserPresence
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_presence_all_of import V2PresenceAllOf
+    from symphony.bdk.gen.pod_model.v2_user_presence import V2UserPresence
+    globals()['V2PresenceAllOf'] = V2PresenceAllOf
+    globals()['V2UserPresence'] = V2UserPresence
 
 class V2Presence(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V2Presence(ModelComposed):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V2Presence(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'category': (str,),  # noqa: E501
             'user_id': (int, none_type),  # noqa: E501
@@ -93,6 +96,7 @@ class V2Presence(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -301,6 +305,7 @@ class V2Presence(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
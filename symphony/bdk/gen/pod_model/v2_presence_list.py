@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_presence import V2Presence
-globals()['V2Presence'] = V2Presence
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_presence import V2Presence
+    globals()['V2Presence'] = V2Presence
 
 class V2PresenceList(ModelSimple):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,12 +74,14 @@ class V2PresenceList(ModelSimple):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'value': ([V2Presence],),
         }
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
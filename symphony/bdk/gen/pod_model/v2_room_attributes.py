@@ -27,8 +27,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.room_tag import RoomTag
-globals()['RoomTag'] = RoomTag
+def lazy_import():
+    from symphony.bdk.gen.pod_model.room_tag import RoomTag
+    globals()['RoomTag'] = RoomTag
 
 
 class V2RoomAttributes(ModelNormal):
@@ -75,6 +76,7 @@ class V2RoomAttributes(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'name': (str, none_type),  # noqa: E501
             'keywords': ([RoomTag], none_type),  # noqa: E501
@@ -88,6 +90,7 @@ class V2RoomAttributes(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
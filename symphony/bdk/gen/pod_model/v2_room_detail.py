@@ -27,10 +27,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
     validate_get_composed_info,
 )
 
-from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
-from symphony.bdk.gen.pod_model.v2_room_attributes import V2RoomAttributes
-globals()['RoomSystemInfo'] = RoomSystemInfo
-globals()['V2RoomAttributes'] = V2RoomAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
+    from symphony.bdk.gen.pod_model.v2_room_attributes import V2RoomAttributes
+    globals()['RoomSystemInfo'] = RoomSystemInfo
+    globals()['V2RoomAttributes'] = V2RoomAttributes
 
 
 class V2RoomDetail(ModelNormal):
@@ -77,6 +78,7 @@ class V2RoomDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'room_attributes': (V2RoomAttributes, none_type),  # noqa: E501
             'room_system_info': (RoomSystemInfo, none_type),  # noqa: E501
@@ -84,6 +86,7 @@ class V2RoomDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.room_search_criteria import RoomSearchCriteria
-from symphony.bdk.gen.pod_model.user_id import UserId
-from symphony.bdk.gen.pod_model.v2_room_search_criteria_all_of import V2RoomSearchCriteriaAllOf
-globals()['RoomSearchCriteria'] = RoomSearchCriteria
-globals()['UserId'] = UserId
-globals()['V2RoomSearchCriteriaAllOf'] = V2RoomSearchCriteriaAllOf
+def lazy_import():
+    from symphony.bdk.gen.pod_model.room_search_criteria import RoomSearchCriteria
+    from symphony.bdk.gen.pod_model.user_id import UserId
+    from symphony.bdk.gen.pod_model.v2_room_search_criteria_all_of import V2RoomSearchCriteriaAllOf
+    globals()['RoomSearchCriteria'] = RoomSearchCriteria
+    globals()['UserId'] = UserId
+    globals()['V2RoomSearchCriteriaAllOf'] = V2RoomSearchCriteriaAllOf
 
 class V2RoomSearchCriteria(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -77,6 +78,7 @@ class V2RoomSearchCriteria(ModelComposed):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -91,6 +93,7 @@ class V2RoomSearchCriteria(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'query': (str,),  # noqa: E501
             'labels': ([str], none_type),  # noqa: E501
@@ -105,6 +108,7 @@ class V2RoomSearchCriteria(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -337,6 +341,7 @@ class V2RoomSearchCriteria(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
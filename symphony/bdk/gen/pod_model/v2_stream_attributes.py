@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_conversation_specific_stream_attributes import V2ConversationSpecificStreamAttributes
-from symphony.bdk.gen.pod_model.v2_room_specific_stream_attributes import V2RoomSpecificStreamAttributes
-from symphony.bdk.gen.pod_model.v2_stream_type import V2StreamType
-globals()['V2ConversationSpecificStreamAttributes'] = V2ConversationSpecificStreamAttributes
-globals()['V2RoomSpecificStreamAttributes'] = V2RoomSpecificStreamAttributes
-globals()['V2StreamType'] = V2StreamType
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_conversation_specific_stream_attributes import V2ConversationSpecificStreamAttributes
+    from symphony.bdk.gen.pod_model.v2_room_specific_stream_attributes import V2RoomSpecificStreamAttributes
+    from symphony.bdk.gen.pod_model.v2_stream_type import V2StreamType
+    globals()['V2ConversationSpecificStreamAttributes'] = V2ConversationSpecificStreamAttributes
+    globals()['V2RoomSpecificStreamAttributes'] = V2RoomSpecificStreamAttributes
+    globals()['V2StreamType'] = V2StreamType
 
 class V2StreamAttributes(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V2StreamAttributes(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V2StreamAttributes(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'id': (str, none_type),  # noqa: E501
             'cross_pod': (bool, none_type),  # noqa: E501
@@ -100,6 +103,7 @@ class V2StreamAttributes(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -30,8 +30,9 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_user_key_request import V2UserKeyRequest
-globals()['V2UserKeyRequest'] = V2UserKeyRequest
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_user_key_request import V2UserKeyRequest
+    globals()['V2UserKeyRequest'] = V2UserKeyRequest
 
 class V2UserAttributes(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -74,6 +75,7 @@ class V2UserAttributes(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -88,6 +90,7 @@ class V2UserAttributes(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'email_address': (str, none_type),  # noqa: E501
             'first_name': (str, none_type),  # noqa: E501
@@ -118,6 +121,7 @@ class V2UserAttributes(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
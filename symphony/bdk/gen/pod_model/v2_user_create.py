@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.password import Password
-from symphony.bdk.gen.pod_model.v2_user_attributes import V2UserAttributes
-globals()['Password'] = Password
-globals()['V2UserAttributes'] = V2UserAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.password import Password
+    from symphony.bdk.gen.pod_model.v2_user_attributes import V2UserAttributes
+    globals()['Password'] = Password
+    globals()['V2UserAttributes'] = V2UserAttributes
 
 class V2UserCreate(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V2UserCreate(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V2UserCreate(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'user_attributes': (V2UserAttributes, none_type),  # noqa: E501
             'password': (Password, none_type),  # noqa: E501
@@ -93,6 +96,7 @@ class V2UserCreate(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
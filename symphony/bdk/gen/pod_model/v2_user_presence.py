@@ -30,10 +30,11 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.v2_presence_status import V2PresenceStatus
-from symphony.bdk.gen.pod_model.v2_user_presence_all_of import V2UserPresenceAllOf
-globals()['V2PresenceStatus'] = V2PresenceStatus
-globals()['V2UserPresenceAllOf'] = V2UserPresenceAllOf
+def lazy_import():
+    from symphony.bdk.gen.pod_model.v2_presence_status import V2PresenceStatus
+    from symphony.bdk.gen.pod_model.v2_user_presence_all_of import V2UserPresenceAllOf
+    globals()['V2PresenceStatus'] = V2PresenceStatus
+    globals()['V2UserPresenceAllOf'] = V2UserPresenceAllOf
 
 class V2UserPresence(ModelComposed):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -71,6 +72,7 @@ class V2UserPresence(ModelComposed):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -85,6 +87,7 @@ class V2UserPresence(ModelComposed):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'category': (str,),  # noqa: E501
             'user_id': (int, none_type),  # noqa: E501
@@ -92,6 +95,7 @@ class V2UserPresence(ModelComposed):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
@@ -296,6 +300,7 @@ class V2UserPresence(ModelComposed):
 
     @cached_property
     def _composed_schemas():
+        lazy_import()
         # we need this here to make our import statements work
         # we must store _composed_schemas in here so the code is only run
         # when we invoke this method. If we kept this at the class
@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.group_item import GroupItem
-from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
-from symphony.bdk.gen.pod_model.v3_room_attributes import V3RoomAttributes
-globals()['GroupItem'] = GroupItem
-globals()['RoomSystemInfo'] = RoomSystemInfo
-globals()['V3RoomAttributes'] = V3RoomAttributes
+def lazy_import():
+    from symphony.bdk.gen.pod_model.group_item import GroupItem
+    from symphony.bdk.gen.pod_model.room_system_info import RoomSystemInfo
+    from symphony.bdk.gen.pod_model.v3_room_attributes import V3RoomAttributes
+    globals()['GroupItem'] = GroupItem
+    globals()['RoomSystemInfo'] = RoomSystemInfo
+    globals()['V3RoomAttributes'] = V3RoomAttributes
 
 class V3RoomDetail(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V3RoomDetail(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V3RoomDetail(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'room_attributes': (V3RoomAttributes, none_type),  # noqa: E501
             'room_system_info': (RoomSystemInfo, none_type),  # noqa: E501
@@ -95,6 +98,7 @@ class V3RoomDetail(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
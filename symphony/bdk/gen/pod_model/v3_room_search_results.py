@@ -30,12 +30,13 @@ from symphony.bdk.gen.model_utils import (  # noqa: F401
 from symphony.bdk.gen.exceptions import ApiAttributeError
 
 
-from symphony.bdk.gen.pod_model.faceted_match_count import FacetedMatchCount
-from symphony.bdk.gen.pod_model.v2_room_search_criteria import V2RoomSearchCriteria
-from symphony.bdk.gen.pod_model.v3_room_detail import V3RoomDetail
-globals()['FacetedMatchCount'] = FacetedMatchCount
-globals()['V2RoomSearchCriteria'] = V2RoomSearchCriteria
-globals()['V3RoomDetail'] = V3RoomDetail
+def lazy_import():
+    from symphony.bdk.gen.pod_model.faceted_match_count import FacetedMatchCount
+    from symphony.bdk.gen.pod_model.v2_room_search_criteria import V2RoomSearchCriteria
+    from symphony.bdk.gen.pod_model.v3_room_detail import V3RoomDetail
+    globals()['FacetedMatchCount'] = FacetedMatchCount
+    globals()['V2RoomSearchCriteria'] = V2RoomSearchCriteria
+    globals()['V3RoomDetail'] = V3RoomDetail
 
 class V3RoomSearchResults(ModelNormal):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -73,6 +74,7 @@ class V3RoomSearchResults(ModelNormal):
         This must be a method because a pod_model may have properties that are
         of type self, this must run after the class is loaded
         """
+        lazy_import()
         return (bool, date, datetime, dict, float, int, list, str, none_type,)  # noqa: E501
 
     _nullable = False
@@ -87,6 +89,7 @@ class V3RoomSearchResults(ModelNormal):
             openapi_types (dict): The key is attribute name
                 and the value is attribute type.
         """
+        lazy_import()
         return {
             'count': (int, none_type),  # noqa: E501
             'skip': (int, none_type),  # noqa: E501
@@ -98,6 +101,7 @@ class V3RoomSearchResults(ModelNormal):
 
     @cached_property
     def discriminator():
+        lazy_import()
         return None
 
 
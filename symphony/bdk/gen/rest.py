@@ -151,6 +151,9 @@ class RESTClientObject(object):
                     elif isinstance(v, tuple) and len(v) == 2:
                         # needed because of multipart form data payload while sending messages with attachment
                         data.add_field(k, v[0], content_type=v[1])
+                    elif isinstance(v, aiohttp.payload.Payload):
+                        # streamed field, e.g. the content of a message built with the MessageMLBuilder
+                        data.add_field(k, v, content_type=v.content_type)
                     else:
                         data.add_field(k, v)
                 args["data"] = data
@@ -0,0 +1,206 @@
+import importlib
+import io
+import pkgutil
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import quote
+
+import pytest
+
+import symphony.bdk.gen
+from symphony.bdk.gen.agent_api.attachments_api import AttachmentsApi
+from symphony.bdk.gen.agent_api.messages_api import MessagesApi
+from symphony.bdk.gen.api_client import ApiClient, Endpoint, _render_path
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.exceptions import ApiTypeError, ApiValueError
+from symphony.bdk.gen.model_utils import validate_and_convert_types
+from symphony.bdk.gen.pod_api.streams_api import StreamsApi
+from symphony.bdk.gen.pod_model.stream_filter import StreamFilter
+
+HOST = "https://acme.symphony.com"
+SAMPLE_VALUES = ["value", 1, 1.5, True, None]
+
+
+def all_endpoints():
+    api_client = MagicMock(ApiClient)
+    api_client.configuration = Configuration()
+    for package in ("agent_api", "auth_api", "group_api", "login_api", "pod_api"):
+        package_path = symphony.bdk.gen.__path__[0] + "/" + package
+        for module_info in pkgutil.iter_modules([package_path]):
+            module = importlib.import_module(f"symphony.bdk.gen.{package}.{module_info.name}")
+            for api_class in vars(module).values():
+                if isinstance(api_class, type) and api_class.__module__ == module.__name__:
+                    api = api_class(api_client)
+                    yield from (e for e in vars(api).values() if isinstance(e, Endpoint))
+
+
+def replace_path_params(resource_path, path_params):
+    """Path rendering as done before path templates were compiled."""
+    for k, v in path_params:
+        resource_path = resource_path.replace("{%s}" % k, quote(str(v), safe=""))
+    return resource_path
+
+
+@pytest.fixture(name="mocked_api_client")
+def fixture_mocked_api_client():
+    api_client = MagicMock(ApiClient)
+    api_client.call_api = AsyncMock()
+    api_client.configuration = Configuration()
+    api_client.select_header_accept.side_effect = lambda accepts: ApiClient.select_header_accept(
+        None, accepts
+    )
+    api_client.select_header_content_type.side_effect = (
+        lambda content_types, method, body: ApiClient.select_header_content_type(
+            None, content_types, method, body
+        )
+    )
+    return api_client
+
+
+def test_passthrough_values_are_unchanged_by_type_validation():
+    configuration = Configuration()
+    checked = 0
+    for endpoint in all_endpoints():
+        for name, types in endpoint.openapi_types.items():
+            for value in SAMPLE_VALUES:
+                if type(value) in endpoint._passthrough_classes[name]:
+                    converted = validate_and_convert_types(
+                        value, types, [name], False, True, configuration=configuration
+                    )
+                    assert converted is value, f"{endpoint.settings['operation_id']}.{name}"
+                    checked += 1
+    assert checked > 0
+
+
+@pytest.mark.parametrize(
+    "resource_path, path_params",
+    [
+        ("/v1/stream/{sid}/info", [("sid", "a/b c+d==")]),
+        ("/v1/user/{uid}/stream/{sid}", [("uid", 123), ("sid", "stream")]),
+        ("/v1/{sid}/{sid}/{other}", [("sid", "stream")]),
+        ("/v1/stream/{sid}", [("sid", "first"), ("sid", "second")]),
+        ("/v1/streams", [("sid", "stream")]),
+    ],
+)
+def test_render_path(resource_path, path_params):
+    assert _render_path(resource_path, path_params, "") == replace_path_params(
+        resource_path, path_params
+    )
+
+
+@pytest.mark.asyncio
+async def test_path_query_and_header_params(mocked_api_client):
+    await MessagesApi(mocked_api_client).v4_stream_sid_message_get(
+        sid="stream-id", since=0, session_token="session-token", limit=50
+    )
+
+    args, kwargs = mocked_api_client.call_api.call_args
+    assert args == (
+        "/v4/stream/{sid}/message",
+        "GET",
+        {"sid": "stream-id"},
+        [("limit", 50), ("since", 0)],
+        {"sessionToken": "session-token", "Accept": "application/json"},
+    )
+    assert kwargs["body"] is None
+    assert kwargs["post_params"] == []
+    assert kwargs["files"] == {}
+    assert kwargs["collection_formats"] == {}
+
+
+@pytest.mark.asyncio
+async def test_body_param(mocked_api_client):
+    stream_filter = StreamFilter(include_inactive_streams=True)
+
+    await StreamsApi(mocked_api_client).v1_streams_list_post(
+        session_token="session-token", skip=1, filter=stream_filter
+    )
+
+    args, kwargs = mocked_api_client.call_api.call_args
+    assert args[3] == [("skip", 1)]
+    assert args[4] == {
+        "sessionToken": "session-token",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    assert kwargs["body"] is stream_filter
+
+
+@pytest.mark.asyncio
+async def test_form_file_and_collection_format_params(mocked_api_client):
+    attachment = io.BytesIO(b"content")
+
+    await MessagesApi(mocked_api_client).v4_message_blast_post(
+        session_token="session-token",
+        sids=["s1", "s2"],
+        message="<messageML/>",
+        attachment=attachment,
+    )
+
+    args, kwargs = mocked_api_client.call_api.call_args
+    assert args[4]["Content-Type"] == "multipart/form-data"
+    assert sorted(kwargs["post_params"]) == [("message", "<messageML/>"), ("sids", ["s1", "s2"])]
+    assert kwargs["files"] == {"attachment": [attachment]}
+    assert kwargs["collection_formats"] == {"sids": "csv"}
+
+
+@pytest.mark.asyncio
+async def test_single_file_param(mocked_api_client):
+    file = io.BytesIO(b"content")
+
+    await AttachmentsApi(mocked_api_client).v1_stream_sid_attachment_create_post(
+        sid="stream-id", session_token="session-token", file=file
+    )
+
+    args, kwargs = mocked_api_client.call_api.call_args
+    assert args[2] == {"sid": "stream-id"}
+    assert kwargs["files"] == {"file": [file]}
+
+
+@pytest.mark.asyncio
+async def test_unexpected_param(mocked_api_client):
+    with pytest.raises(ApiTypeError):
+        await StreamsApi(mocked_api_client).v1_streams_list_post(
+            session_token="session-token", unknown="value"
+        )
+
+
+@pytest.mark.asyncio
+async def test_missing_required_param(mocked_api_client):
+    endpoint = MessagesApi(mocked_api_client).v4_stream_sid_message_get_endpoint
+    with pytest.raises(ApiValueError):
+        await endpoint.call_with_http_info(
+            sid="stream-id", **{"_check_input_type": True, "_host_index": None}
+        )
+
+
+@pytest.mark.asyncio
+async def test_wrong_param_type(mocked_api_client):
+    with pytest.raises(ApiTypeError):
+        await MessagesApi(mocked_api_client).v4_stream_sid_message_get(
+            sid="stream-id", since="not-an-int", session_token="session-token"
+        )
+
+
+@pytest.mark.asyncio
+async def test_request_prepared_from_plain_and_serialized_params():
+    api_client = ApiClient(Configuration(host=HOST))
+    api_client.request = AsyncMock(return_value=MagicMock(status=204, data=b""))
+    api_client.set_default_header("X-Custom", "custom")
+    since = datetime(2021, 1, 1)
+
+    await api_client.call_api(
+        "/v1/stream/{sid}/messages",
+        "GET",
+        {"sid": "a/b"},
+        [("since", since), ("limit", 50), ("ids", ["1", "2"])],
+        {"sessionToken": "session-token"},
+        collection_formats={"ids": "csv"},
+    )
+
+    args, kwargs = api_client.request.call_args
+    assert args == ("GET", HOST + "/v1/stream/a%2Fb/messages")
+    assert kwargs["query_params"] == [("since", since.isoformat()), ("limit", 50), ("ids", "1,2")]
+    assert kwargs["headers"]["sessionToken"] == "session-token"
+    assert kwargs["headers"]["X-Custom"] == "custom"
+    await api_client.close()
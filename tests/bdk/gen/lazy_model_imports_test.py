@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+from symphony.bdk.gen import agent_model
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from tests.utils.resource_utils import deserialize_object
+
+
+def test_referenced_models_not_imported_with_model():
+    # checked in a new interpreter as other tests may already have imported the referenced models
+    script = (
+        "import sys\n"
+        "import symphony.bdk.gen.agent_model.v4_payload\n"
+        "print('symphony.bdk.gen.agent_model.v4_message_sent' in sys.modules)\n"
+    )
+
+    assert subprocess.check_output([sys.executable, "-c", script], text=True).strip() == "False"
+
+
+def test_referenced_models_resolved_on_deserialization():
+    message = deserialize_object(V4Message, '{"messageId": "id", "stream": {"streamId": "sid"}}')
+
+    assert isinstance(message.stream, V4Stream)
+    assert message.stream.stream_id == "sid"
+
+
+def test_model_resolved_from_package():
+    assert agent_model.V4Message is V4Message
+    assert "V4Message" in dir(agent_model)
+
+
+def test_unknown_model_from_package():
+    with pytest.raises(AttributeError):
+        agent_model.Unknown
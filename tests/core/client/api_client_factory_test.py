@@ -54,6 +54,24 @@ async def test_host_configured(config):
     assert_host_configured_only(client_factory.get_relay_client(), RELAY)
 
 
+@pytest.mark.asyncio
+async def test_clients_created_on_first_access(config):
+    with patch.object(
+        ApiClientFactory,
+        "_get_api_client_from_config",
+        side_effect=ApiClientFactory._get_api_client_from_config,
+    ) as get_api_client:
+        client_factory = ApiClientFactory(config)
+        get_api_client.assert_not_called()
+
+        pod_client = client_factory.get_pod_client()
+        assert client_factory.get_pod_client() is pod_client
+        get_api_client.assert_called_once()
+
+        await client_factory.close_clients()
+        assert pod_client.rest_client.pool_manager.closed is True
+
+
 @pytest.mark.asyncio
 async def test_custom_host_configured(config):
     custom_path = "/my-host"
@@ -345,7 +363,6 @@ async def test_x_trace_id_not_in_default_headers(config, add_x_trace_id):
     ) as mock:
         client_factory = ApiClientFactory(config)
 
-        assert mock.call_count == 7
         assert_default_headers(client_factory.get_pod_client().default_headers, {})
         assert_default_headers(client_factory.get_login_client().default_headers, {})
         assert_default_headers(client_factory.get_agent_client().default_headers, {})
@@ -353,6 +370,7 @@ async def test_x_trace_id_not_in_default_headers(config, add_x_trace_id):
         assert_default_headers(client_factory.get_key_auth_client().default_headers, {})
         assert_default_headers(client_factory.get_app_session_auth_client().default_headers, {})
         assert_default_headers(client_factory.get_relay_client().default_headers, {})
+        assert mock.call_count == 7
 
 
 @pytest.mark.asyncio
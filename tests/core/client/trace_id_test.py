@@ -4,10 +4,12 @@ from unittest.mock import AsyncMock
 import pytest
 
 from symphony.bdk.core.client.trace_id import (
+    TRACE_ID_CHARACTERS,
     TRACE_ID_LENGTH,
     X_TRACE_ID,
     DistributedTracingContext,
     add_x_trace_id,
+    generate_trace_id,
 )
 
 
@@ -49,6 +51,15 @@ def test_set_new_trace_id():
     assert not DistributedTracingContext.is_trace_id_set_by_user()
 
 
+def test_generate_trace_id():
+    trace_ids = {generate_trace_id() for _ in range(1000)}
+
+    assert len(trace_ids) > 990
+    for trace_id in trace_ids:
+        assert len(trace_id) == TRACE_ID_LENGTH
+        assert set(trace_id) <= set(TRACE_ID_CHARACTERS)
+
+
 def test_clear_trace_id():
     DistributedTracingContext.set_trace_id("trace-id")
     DistributedTracingContext.clear()
@@ -0,0 +1,23 @@
+from symphony.bdk.core.config.model.bdk_connection_cache_config import BdkConnectionCacheConfig
+
+
+def test_empty_connection_cache_config():
+    connection_cache_config = BdkConnectionCacheConfig(None)
+
+    assert not connection_cache_config.enabled
+    assert connection_cache_config.max_size == BdkConnectionCacheConfig.DEFAULT_MAX_SIZE
+    assert (
+        connection_cache_config.ttl.total_seconds() == BdkConnectionCacheConfig.DEFAULT_TTL_SECONDS
+    )
+    assert not connection_cache_config.warm_up
+
+
+def test_connection_cache_config():
+    connection_cache_config = BdkConnectionCacheConfig(
+        {"enabled": True, "maxSize": 100, "ttlSeconds": 60, "warmUp": True}
+    )
+
+    assert connection_cache_config.enabled
+    assert connection_cache_config.max_size == 100
+    assert connection_cache_config.ttl.total_seconds() == 60
+    assert connection_cache_config.warm_up
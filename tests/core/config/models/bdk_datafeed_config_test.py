@@ -17,6 +17,14 @@ def test_empty_datafeed_config():
     assert datafeed_config.id_file_path == ""
     assert isinstance(datafeed_config.get_id_file_path(), Path)
     assert datafeed_config.get_id_file_path().resolve() == Path(".").resolve()
+    assert not datafeed_config.early_ack
+    assert datafeed_config.max_pending_tasks == BdkDatafeedConfig.DEFAULT_MAX_PENDING_TASKS
+
+
+def test_early_ack():
+    datafeed_config = BdkDatafeedConfig({"earlyAck": True, "maxPendingTasks": 50})
+    assert datafeed_config.early_ack
+    assert datafeed_config.max_pending_tasks == 50
 
 
 def test_version_should_default_on_v1(datafeed_version):
@@ -0,0 +1,23 @@
+import sys
+
+from symphony.bdk.core.config.model.bdk_presence_feed_config import BdkPresenceFeedConfig
+
+
+def test_empty_presence_feed_config():
+    presence_feed_config = BdkPresenceFeedConfig(None)
+
+    assert presence_feed_config.poll_interval == BdkPresenceFeedConfig.DEFAULT_POLL_INTERVAL_SECONDS
+    assert presence_feed_config.seed
+    assert presence_feed_config.page_size == BdkPresenceFeedConfig.DEFAULT_PAGE_SIZE
+    assert presence_feed_config.retry.max_attempts == sys.maxsize
+
+
+def test_presence_feed_config():
+    presence_feed_config = BdkPresenceFeedConfig(
+        {"pollIntervalSeconds": 1, "seed": False, "pageSize": 100, "retry": {"maxAttempts": 3}}
+    )
+
+    assert presence_feed_config.poll_interval == 1
+    assert not presence_feed_config.seed
+    assert presence_feed_config.page_size == 100
+    assert presence_feed_config.retry.max_attempts == 3
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from symphony.bdk.core.config.model.bdk_room_membership_index_config import (
+    BdkRoomMembershipIndexConfig,
+)
+
+
+def test_empty_room_membership_index_config():
+    index_config = BdkRoomMembershipIndexConfig(None)
+
+    assert not index_config.enabled
+    assert index_config.snapshot_file_path is None
+    assert index_config.concurrency == BdkRoomMembershipIndexConfig.DEFAULT_CONCURRENCY
+
+
+def test_room_membership_index_config():
+    index_config = BdkRoomMembershipIndexConfig(
+        {"enabled": True, "snapshotFilePath": "/tmp/rooms.json", "concurrency": 5}
+    )
+
+    assert index_config.enabled
+    assert index_config.snapshot_file_path == Path("/tmp/rooms.json")
+    assert index_config.concurrency == 5
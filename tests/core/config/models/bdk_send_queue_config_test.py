@@ -0,0 +1,21 @@
+from symphony.bdk.core.config.model.bdk_send_queue_config import BdkSendQueueConfig
+
+
+def test_empty_send_queue_config():
+    queue_config = BdkSendQueueConfig(None)
+
+    assert not queue_config.enabled
+    assert queue_config.max_concurrent_streams == BdkSendQueueConfig.DEFAULT_MAX_CONCURRENT_STREAMS
+    assert queue_config.rate_limit == BdkSendQueueConfig.DEFAULT_RATE_LIMIT
+    assert queue_config.burst == BdkSendQueueConfig.DEFAULT_BURST
+
+
+def test_send_queue_config():
+    queue_config = BdkSendQueueConfig(
+        {"enabled": True, "maxConcurrentStreams": 5, "rateLimit": 2.5, "burst": 3}
+    )
+
+    assert queue_config.enabled
+    assert queue_config.max_concurrent_streams == 5
+    assert queue_config.rate_limit == 2.5
+    assert queue_config.burst == 3
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from symphony.bdk.core.config.model.bdk_user_cache_config import BdkUserCacheConfig
+
+
+def test_empty_user_cache_config():
+    user_cache_config = BdkUserCacheConfig(None)
+
+    assert not user_cache_config.enabled
+    assert user_cache_config.max_size == BdkUserCacheConfig.DEFAULT_MAX_SIZE
+    assert user_cache_config.ttl.total_seconds() == BdkUserCacheConfig.DEFAULT_TTL_SECONDS
+    assert not user_cache_config.warm_up
+    assert user_cache_config.snapshot_file_path is None
+
+
+def test_user_cache_config():
+    user_cache_config = BdkUserCacheConfig(
+        {
+            "enabled": True,
+            "maxSize": 100,
+            "ttlSeconds": 60,
+            "warmUp": True,
+            "snapshotFilePath": "/tmp/users.json",
+        }
+    )
+
+    assert user_cache_config.enabled
+    assert user_cache_config.max_size == 100
+    assert user_cache_config.ttl.total_seconds() == 60
+    assert user_cache_config.warm_up
+    assert user_cache_config.snapshot_file_path == Path("/tmp/users.json")
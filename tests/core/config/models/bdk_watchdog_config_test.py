@@ -0,0 +1,21 @@
+from symphony.bdk.core.config.model.bdk_watchdog_config import BdkWatchdogConfig
+
+
+def test_empty_watchdog_config():
+    watchdog_config = BdkWatchdogConfig(None)
+
+    assert not watchdog_config.enabled
+    assert watchdog_config.listener_budget == BdkWatchdogConfig.DEFAULT_LISTENER_BUDGET
+    assert watchdog_config.lag_threshold == BdkWatchdogConfig.DEFAULT_LAG_THRESHOLD
+    assert watchdog_config.sampling_interval == BdkWatchdogConfig.DEFAULT_SAMPLING_INTERVAL
+
+
+def test_watchdog_config():
+    watchdog_config = BdkWatchdogConfig(
+        {"enabled": True, "listenerBudget": 5, "lagThreshold": 0.05, "samplingInterval": 0.5}
+    )
+
+    assert watchdog_config.enabled
+    assert watchdog_config.listener_budget == 5
+    assert watchdog_config.lag_threshold == 0.05
+    assert watchdog_config.sampling_interval == 0.5
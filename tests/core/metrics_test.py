@@ -0,0 +1,213 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.client.api_client_factory import ApiClientFactory
+from symphony.bdk.core.config.loader import BdkConfigLoader
+from symphony.bdk.core.metrics import (
+    REGISTERED_METRICS,
+    BdkMetrics,
+    InMemoryMetrics,
+    get_metrics,
+    is_metrics_enabled,
+    set_metrics,
+)
+from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.symphony_bdk import SymphonyBdk
+from symphony.bdk.gen import ApiClient, ApiException, Configuration
+from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
+from symphony.bdk.gen.agent_api.messages_api import MessagesApi
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
+from tests.core.service.datafeed.test_fixtures import EventsMock
+from tests.utils.resource_utils import get_config_resource_filepath
+
+
+@pytest.fixture(name="config")
+def fixture_config():
+    config = BdkConfigLoader.load_from_file(get_config_resource_filepath("config.yaml"))
+    config.datafeed.retry = minimal_retry_config()
+    return config
+
+
+@pytest.fixture(name="metrics")
+def fixture_metrics():
+    metrics = InMemoryMetrics()
+    set_metrics(metrics)
+    yield metrics
+    set_metrics(None)
+
+
+def test_no_metrics_by_default():
+    assert not is_metrics_enabled()
+    assert type(get_metrics()) is BdkMetrics
+
+
+@pytest.mark.asyncio
+async def test_symphony_bdk_registers_metrics(config):
+    metrics = InMemoryMetrics()
+    try:
+        async with SymphonyBdk(config, metrics=metrics) as bdk:
+            assert bdk.metrics() is metrics
+            assert bdk._api_client_factory.get_pod_client().metrics is REGISTERED_METRICS
+    finally:
+        set_metrics(None)
+
+
+@pytest.mark.asyncio
+async def test_api_client_reports_to_metrics_registered_after_its_creation(config):
+    factory = ApiClientFactory(config)
+    api_client = factory.get_pod_client()
+    api_client.request = AsyncMock(return_value=MagicMock(status=200, data=b"[]"))
+    metrics = InMemoryMetrics()
+    set_metrics(metrics)
+    try:
+        await MessagesApi(api_client).v4_stream_sid_message_get(
+            sid="stream-id", since=0, session_token="session-token"
+        )
+    finally:
+        set_metrics(None)
+        await factory.close_clients()
+
+    assert metrics.api_calls == {("v4_stream_sid_message_get", "GET", "200"): 1}
+
+
+@pytest.mark.asyncio
+async def test_api_call(metrics):
+    api_client = ApiClient(Configuration(host="https://acme.symphony.com"))
+    api_client.metrics = metrics
+    api_client.request = AsyncMock(return_value=MagicMock(status=200, data=b"[]"))
+
+    await MessagesApi(api_client).v4_stream_sid_message_get(
+        sid="stream-id", since=0, session_token="session-token"
+    )
+
+    assert metrics.api_calls == {("v4_stream_sid_message_get", "GET", "200"): 1}
+    assert metrics.api_call_durations["v4_stream_sid_message_get"].count == 1
+    assert metrics.api_response_bytes["v4_stream_sid_message_get"] == 2
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_api_call(metrics):
+    api_client = ApiClient(Configuration(host="https://acme.symphony.com"))
+    api_client.metrics = metrics
+    exception = ApiException(status=503)
+    exception.body = b"unavailable"
+    api_client.request = AsyncMock(side_effect=exception)
+
+    with pytest.raises(ApiException):
+        await MessagesApi(api_client).v4_stream_sid_message_get(
+            sid="stream-id", since=0, session_token="session-token"
+        )
+
+    assert metrics.api_calls == {("v4_stream_sid_message_get", "GET", "503"): 1}
+    assert metrics.api_response_bytes["v4_stream_sid_message_get"] == len(b"unavailable")
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+async def test_retry(metrics):
+    class Service:
+        def __init__(self):
+            self._retry_config = minimal_retry_config_with_attempts(3)
+            self.calls = 0
+
+        @retry
+        async def call(self):
+            self.calls += 1
+            if self.calls < 3:
+                raise ApiException(status=500)
+            return self.calls
+
+    assert await Service().call() == 3
+    assert metrics.retries == {"test_retry.<locals>.Service.call": 2}
+
+
+@pytest.mark.asyncio
+async def test_auth_refresh(metrics):
+    authenticator = AsyncMock()
+    authenticator.retrieve_session_token.side_effect = ApiException(status=400)
+    auth_session = AuthSession(authenticator)
+
+    with pytest.raises(ApiException):
+        await auth_session.refresh()
+
+    assert metrics.auth_refreshes == {("AuthSession", False): 1}
+    assert metrics.auth_refresh_durations["AuthSession"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_datafeed_loop_iteration(metrics, config):
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+    datafeed_loop = DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config)
+    event = V4Event(
+        type=RealTimeEvent.MESSAGESENT.name, payload=V4Payload(message_sent=V4MessageSent())
+    )
+    datafeed_loop._read_events = AsyncMock(return_value=EventsMock([event, event]))
+
+    class FailingListener(RealTimeEventListener):
+        @staticmethod
+        async def is_accepting_event(event, bot_info):
+            return True
+
+        async def on_message_sent(self, initiator, event):
+            raise ValueError("listener error")
+
+    datafeed_loop.subscribe(FailingListener())
+
+    await datafeed_loop._run_loop_iteration()
+
+    assert metrics.datafeed_reads.count == 1
+    assert metrics.datafeed_batch_sizes.sum == 2
+    assert metrics.datafeed_dispatches.count == 1
+    assert metrics.datafeed_ack_delays.count == 1
+    assert metrics.listener_errors == {"MESSAGESENT": 2}
+
+
+@pytest.mark.asyncio
+async def test_datafeed_loop_iteration_with_early_ack(metrics, config):
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+    datafeed_loop = DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config)
+    datafeed_loop._early_ack = True
+    event = V4Event(
+        type=RealTimeEvent.MESSAGESENT.name, payload=V4Payload(message_sent=V4MessageSent())
+    )
+    datafeed_loop._read_events = AsyncMock(return_value=EventsMock([event]))
+
+    await datafeed_loop._run_loop_iteration()
+
+    assert metrics.datafeed_dispatches.count == 1
+    assert metrics.datafeed_ack_delays.count == 1
+
+
+def test_prometheus_text():
+    metrics = InMemoryMetrics()
+    metrics.on_api_call("list_users", "GET", 200, 0.5, 10)
+    metrics.on_api_call("list_users", "GET", 200, 0.25, 20)
+    metrics.on_api_call(None, "POST", None, 1.0, 0)
+    metrics.on_retry("UserService.list_users", 1, None)
+    metrics.on_listener_error('a"b', ValueError())
+
+    text = metrics.to_prometheus_text()
+
+    assert "# TYPE symphony_bdk_api_calls_total counter" in text
+    assert (
+        'symphony_bdk_api_calls_total{operation_id="list_users",method="GET",status="200"} 2'
+        in text
+    )
+    assert 'symphony_bdk_api_calls_total{method="POST",status="none"} 1' in text
+    assert 'symphony_bdk_api_call_duration_seconds_count{operation_id="list_users"} 2' in text
+    assert 'symphony_bdk_api_call_duration_seconds_sum{operation_id="list_users"} 0.75' in text
+    assert 'symphony_bdk_api_response_bytes_total{operation_id="list_users"} 30' in text
+    assert 'symphony_bdk_retries_total{operation="UserService.list_users"} 1' in text
+    assert "symphony_bdk_datafeed_read_duration_seconds_count 0" in text
+    assert 'symphony_bdk_listener_errors_total{event_type="a\\"b"} 1' in text
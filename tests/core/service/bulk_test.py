@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from symphony.bdk.core.service.bulk import chunks, run_concurrently
+from symphony.bdk.gen import ApiException
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_bounds_concurrency():
+    running = 0
+    max_running = 0
+
+    async def call(item):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if item == 2:
+            raise ApiException(status=500)
+        return item * 10
+
+    results = [result async for result in run_concurrently(range(6), call, 2)]
+
+    assert max_running == 2
+    assert sorted(result.item for result in results) == list(range(6))
+    failed = [result for result in results if not result.is_successful]
+    assert [result.item for result in failed] == [2]
+    assert isinstance(failed[0].error, ApiException)
+    assert all(result.value == result.item * 10 for result in results if result.is_successful)
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_reads_items_lazily():
+    read = []
+
+    async def items():
+        for item in range(10):
+            read.append(item)
+            yield item
+
+    async def call(item):
+        return item
+
+    generator = run_concurrently(items(), call, 2)
+    await generator.__anext__()
+    await generator.aclose()
+
+    assert len(read) < 10
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_raises_unexpected_errors():
+    async def call(item):
+        raise KeyError(item)
+
+    with pytest.raises(KeyError):
+        _ = [result async for result in run_concurrently([1], call, 1)]
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_invalid_max_concurrency():
+    async def call(item):
+        return item
+
+    with pytest.raises(ValueError):
+        _ = [result async for result in run_concurrently([1], call, 0)]
+
+
+@pytest.mark.asyncio
+async def test_chunks():
+    assert [chunk async for chunk in chunks(range(7), 3)] == [[0, 1, 2], [3, 4, 5], [6]]
+
+    with pytest.raises(ValueError):
+        _ = [chunk async for chunk in chunks(range(7), 0)]
@@ -0,0 +1,95 @@
+import pytest
+
+from symphony.bdk.core.service.cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    return FakeClock()
+
+
+def test_get_missing_key(clock):
+    cache = LruTtlCache(2, 10, clock)
+
+    assert cache.get("key") is None
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 0
+
+
+def test_put_and_get(clock):
+    cache = LruTtlCache(2, 10, clock)
+    cache.put("key", "value")
+
+    assert cache.get("key") == "value"
+    assert "key" in cache
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_ratio == 1.0
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = LruTtlCache(2, 10, clock)
+    cache.put("one", 1)
+    cache.put("two", 2)
+    cache.get("one")
+    cache.put("three", 3)
+
+    assert len(cache) == 2
+    assert cache.peek("two") is None
+    assert cache.peek("one") == 1
+    assert cache.peek("three") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_expired_entry(clock):
+    cache = LruTtlCache(2, 10, clock)
+    cache.put("key", "value")
+    clock.now += 10
+
+    assert "key" not in cache
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.stats.expirations == 1
+    assert cache.stats.misses == 1
+
+
+def test_peek_does_not_update_stats(clock):
+    cache = LruTtlCache(2, 10, clock)
+    cache.put("key", "value")
+
+    assert cache.peek("key") == "value"
+    assert cache.stats.hits == 0
+    assert cache.stats.misses == 0
+
+
+def test_invalidate(clock):
+    cache = LruTtlCache(2, 10, clock)
+    cache.put("key", "value")
+
+    assert cache.invalidate("key")
+    assert not cache.invalidate("key")
+    assert cache.get("key") is None
+
+
+def test_purge_expired_and_items(clock):
+    cache = LruTtlCache(3, 10, clock)
+    cache.put("old", 1)
+    clock.now += 5
+    cache.put("new", 2)
+    clock.now += 5
+
+    assert list(cache.items()) == [("new", 1015.0, 2)]
+    assert cache.purge_expired() == 1
+    assert len(cache) == 1
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        LruTtlCache(0, 10)
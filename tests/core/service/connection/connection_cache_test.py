@@ -0,0 +1,109 @@
+import pytest
+
+from symphony.bdk.core.service.connection.connection_cache import ConnectionCache
+from symphony.bdk.core.service.connection.model.connection_status import ConnectionStatus
+from symphony.bdk.gen.agent_model.v4_connection_accepted import V4ConnectionAccepted
+from symphony.bdk.gen.agent_model.v4_connection_requested import V4ConnectionRequested
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.pod_model.user_connection import UserConnection
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+BOT_INFO = UserV2(id=12345)
+USER_ID = 67890
+
+
+def connection_requested(initiator_id, to_user_id):
+    return V4Event(
+        type="CONNECTIONREQUESTED",
+        initiator=V4Initiator(user=V4User(user_id=initiator_id)),
+        payload=V4Payload(
+            connection_requested=V4ConnectionRequested(to_user=V4User(user_id=to_user_id))
+        ),
+    )
+
+
+def connection_accepted(initiator_id, from_user_id):
+    return V4Event(
+        type="CONNECTIONACCEPTED",
+        initiator=V4Initiator(user=V4User(user_id=initiator_id)),
+        payload=V4Payload(
+            connection_accepted=V4ConnectionAccepted(from_user=V4User(user_id=from_user_id))
+        ),
+    )
+
+
+def test_put_and_get():
+    connection_cache = ConnectionCache(10, 60)
+    connection_cache.put(UserConnection(user_id=USER_ID, status="ACCEPTED"))
+
+    assert connection_cache.get(USER_ID).status == "ACCEPTED"
+    assert connection_cache.is_connected(USER_ID)
+    assert connection_cache.is_connected(1) is None
+
+    connection_cache.invalidate(USER_ID)
+    assert connection_cache.get(USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_connection_requested_by_user():
+    connection_cache = ConnectionCache(10, 60)
+
+    accepted = await connection_cache.is_accepting_event(
+        connection_requested(USER_ID, BOT_INFO.id), BOT_INFO
+    )
+
+    assert not accepted
+    assert connection_cache.get_status(USER_ID) == ConnectionStatus.PENDING_INCOMING.value
+    assert connection_cache.get(USER_ID) is None  # only the status is known
+    assert not connection_cache.is_connected(USER_ID)
+
+
+@pytest.mark.asyncio
+async def test_connection_requested_by_bot():
+    connection_cache = ConnectionCache(10, 60)
+
+    await connection_cache.is_accepting_event(connection_requested(BOT_INFO.id, USER_ID), BOT_INFO)
+
+    assert connection_cache.get_status(USER_ID) == ConnectionStatus.PENDING_OUTGOING.value
+
+
+@pytest.mark.asyncio
+async def test_connection_accepted():
+    connection_cache = ConnectionCache(10, 60)
+
+    await connection_cache.is_accepting_event(connection_accepted(USER_ID, BOT_INFO.id), BOT_INFO)
+    await connection_cache.is_accepting_event(connection_accepted(BOT_INFO.id, 1), BOT_INFO)
+
+    assert connection_cache.is_connected(USER_ID)
+    assert connection_cache.is_connected(1)
+
+
+@pytest.mark.asyncio
+async def test_connection_accepted_updates_cached_connection():
+    connection_cache = ConnectionCache(10, 60)
+    cached_connection = UserConnection(
+        user_id=USER_ID, status="PENDING_OUTGOING", first_requested_at=1000, request_counter=2
+    )
+    connection_cache.put(cached_connection)
+
+    await connection_cache.is_accepting_event(connection_accepted(USER_ID, BOT_INFO.id), BOT_INFO)
+
+    connection = connection_cache.get(USER_ID)
+    assert connection.status == "ACCEPTED"
+    assert connection.first_requested_at == 1000
+    assert connection.request_counter == 2
+    assert cached_connection.status == "PENDING_OUTGOING"
+
+
+@pytest.mark.asyncio
+async def test_other_events_are_ignored():
+    connection_cache = ConnectionCache(10, 60)
+
+    assert not await connection_cache.is_accepting_event(V4Event(), BOT_INFO)
+    assert not await connection_cache.is_accepting_event(
+        V4Event(type="CONNECTIONACCEPTED"), BOT_INFO
+    )
+    assert len(connection_cache.connections) == 0
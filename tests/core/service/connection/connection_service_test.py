@@ -1,15 +1,18 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.service.connection.connection_cache import ConnectionCache
 from symphony.bdk.core.service.connection.connection_service import ConnectionService
 from symphony.bdk.core.service.connection.model.connection_status import ConnectionStatus
+from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.pod_api.connection_api import ConnectionApi
 from symphony.bdk.gen.pod_model.user_connection import UserConnection
 from symphony.bdk.gen.pod_model.user_connection_list import UserConnectionList
 from symphony.bdk.gen.pod_model.user_connection_request import UserConnectionRequest
-from tests.core.config import minimal_retry_config
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
 from tests.utils.resource_utils import deserialize_object
 
 
@@ -168,3 +171,110 @@ async def test_remove_connection(connection_api, connection_service):
     connection_api.v1_connection_user_uid_remove_post.assert_called_with(
         uid=1234, session_token="session_token"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_connection_from_cache(connection_api, auth_session):
+    connection_cache = ConnectionCache(10, 60)
+    connection_service = ConnectionService(
+        connection_api, auth_session, minimal_retry_config(), connection_cache
+    )
+    connection_api.v1_connection_user_user_id_info_get = AsyncMock(
+        return_value=UserConnection(user_id=1234, status="ACCEPTED")
+    )
+    connection_api.v1_connection_user_uid_remove_post = AsyncMock()
+
+    await connection_service.get_connection(1234)
+    user_connection = await connection_service.get_connection(1234)
+
+    assert user_connection.status == "ACCEPTED"
+    connection_api.v1_connection_user_user_id_info_get.assert_called_once()
+
+    await connection_service.remove_connection(1234)
+    assert connection_cache.get(1234) is None
+
+
+@pytest.mark.asyncio
+async def test_get_connection_with_status_only_cached(connection_api, auth_session):
+    connection_cache = ConnectionCache(10, 60)
+    connection_service = ConnectionService(
+        connection_api, auth_session, minimal_retry_config(), connection_cache
+    )
+    connection_cache._put_status(1234, ConnectionStatus.ACCEPTED)
+    connection_api.v1_connection_user_user_id_info_get = AsyncMock(
+        return_value=UserConnection(user_id=1234, status="ACCEPTED", first_requested_at=1000)
+    )
+
+    user_connection = await connection_service.get_connection(1234)
+
+    assert user_connection.first_requested_at == 1000
+    connection_api.v1_connection_user_user_id_info_get.assert_called_once()
+    assert connection_cache.get(1234) == user_connection
+
+
+@pytest.mark.asyncio
+async def test_warm_up_connection_cache(connection_api, auth_session):
+    connection_cache = ConnectionCache(10, 60)
+    connection_service = ConnectionService(
+        connection_api, auth_session, minimal_retry_config(), connection_cache
+    )
+    connection_api.v1_connection_list_get = AsyncMock(
+        return_value=UserConnectionList(
+            value=[
+                UserConnection(user_id=1, status="ACCEPTED"),
+                UserConnection(user_id=2, status="PENDING_INCOMING"),
+            ]
+        )
+    )
+
+    assert await connection_service.warm_up_connection_cache() == 2
+    assert connection_cache.is_connected(1)
+    assert not connection_cache.is_connected(2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_accept_connections(connection_api, auth_session):
+    connection_service = ConnectionService(
+        connection_api, auth_session, minimal_retry_config_with_attempts(2)
+    )
+    running = 0
+    max_running = 0
+    failing_user_ids = {3: 1, 5: 2}
+
+    async def accept(connection_request, session_token):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        user_id = connection_request.user_id
+        if failing_user_ids.get(user_id):
+            failing_user_ids[user_id] -= 1
+            raise ApiException(status=503)
+        return UserConnection(user_id=user_id, status="ACCEPTED")
+
+    connection_api.v1_connection_accept_post = AsyncMock(side_effect=accept)
+
+    report = await connection_service.bulk_accept_connections(
+        [0, 1, 2, 3, 4, 5, 6, 1], max_concurrency=2
+    )
+
+    assert max_running == 2
+    assert connection_api.v1_connection_accept_post.call_count == 9
+    assert sorted(report.connections) == [0, 1, 2, 3, 4, 6]
+    assert list(report.errors) == [5]
+    assert not report.is_successful
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_connections(connection_api, connection_service):
+    connection_api.v1_connection_create_post = AsyncMock(
+        side_effect=lambda connection_request, session_token: UserConnection(
+            user_id=connection_request.user_id, status="PENDING_OUTGOING"
+        )
+    )
+
+    report = await connection_service.bulk_create_connections(range(5))
+
+    assert report.is_successful
+    assert sorted(report.connections) == list(range(5))
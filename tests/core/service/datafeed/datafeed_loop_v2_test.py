@@ -11,12 +11,13 @@ from tests.core.service.datafeed.test_fixtures import (
 )
 
 from symphony.bdk.core.config.loader import BdkConfigLoader
-from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent, defer
 from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
 from symphony.bdk.core.service.datafeed.exception import EventError
 from symphony.bdk.core.service.datafeed.real_time_event_listener import (
     RealTimeEventListener,
 )
+from symphony.bdk.core.service.datafeed.worker_pool import DatafeedWorkerPool
 from symphony.bdk.gen import ApiClient, ApiException
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
 from symphony.bdk.gen.agent_model.ack_id import AckId
@@ -385,6 +386,158 @@ async def test_events_concurrency_within_same_read_df_chunk(
     await mock_datafeed_loop.start()  # test no deadlock
 
 
+class AcceptingListener(RealTimeEventListener):
+    @staticmethod
+    async def is_accepting_event(event, bot_info):
+        return True
+
+
+class BlockingListener(AcceptingListener):
+    def __init__(self, error=None):
+        self.release = asyncio.Event()
+        self.processed = 0
+        self._error = error
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        await self.release.wait()
+        self.processed += 1
+        if self._error:
+            raise self._error
+
+
+@pytest.mark.asyncio
+async def test_early_ack(mock_datafeed_loop, message_sent):
+    listener = BlockingListener()
+    mock_datafeed_loop._early_ack = True
+    mock_datafeed_loop._read_events.return_value = EventsMock([message_sent])
+    mock_datafeed_loop.subscribe(listener)
+
+    await mock_datafeed_loop._run_loop_iteration()
+
+    assert mock_datafeed_loop._ack_id == ACK_ID  # acknowledged before the listener is done
+    assert len(mock_datafeed_loop._background_tasks) == 1
+
+    listener.release.set()
+    await mock_datafeed_loop._stop_listener_tasks()
+    assert listener.processed == 1
+    assert not mock_datafeed_loop._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_early_ack_event_error_in_listener(mock_datafeed_loop, message_sent, caplog):
+    listener = BlockingListener(EventError())
+    listener.release.set()
+    mock_datafeed_loop._early_ack = True
+    mock_datafeed_loop._read_events.return_value = EventsMock([message_sent])
+    mock_datafeed_loop.subscribe(listener)
+
+    await mock_datafeed_loop._run_loop_iteration()
+    await mock_datafeed_loop._stop_listener_tasks()
+
+    assert mock_datafeed_loop._ack_id == ACK_ID
+    assert "will not be re-queued" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_early_ack_with_worker_pool(mock_datafeed_loop, message_sent):
+    listener = BlockingListener()
+    worker_pool = MagicMock(DatafeedWorkerPool)
+    worker_pool.dispatch = AsyncMock(side_effect=[EventError(), None])
+    mock_datafeed_loop.use_worker_pool(worker_pool)
+    mock_datafeed_loop._early_ack = True
+    mock_datafeed_loop._read_events.side_effect = [
+        EventsMock([message_sent], ack_id="first_ack_id"),
+        EventsMock([message_sent], ack_id="second_ack_id"),
+    ]
+    mock_datafeed_loop.subscribe(listener)
+
+    await mock_datafeed_loop._run_loop_iteration()
+
+    assert mock_datafeed_loop._ack_id == ""  # the worker pool failed, events will be re-queued
+
+    await mock_datafeed_loop._run_loop_iteration()
+
+    assert mock_datafeed_loop._ack_id == "second_ack_id"
+    assert worker_pool.dispatch.call_count == 2
+    assert len(mock_datafeed_loop._background_tasks) == 2  # listeners still running in the background
+
+    listener.release.set()
+    await mock_datafeed_loop._stop_listener_tasks()
+
+
+@pytest.mark.asyncio
+async def test_early_ack_waits_for_pending_tasks_below_limit(mock_datafeed_loop, message_sent):
+    listener = BlockingListener()
+    mock_datafeed_loop._early_ack = True
+    mock_datafeed_loop._max_pending_tasks = 1
+    mock_datafeed_loop._read_events.return_value = EventsMock([message_sent])
+    mock_datafeed_loop.subscribe(listener)
+
+    await mock_datafeed_loop._run_loop_iteration()
+    second_iteration = asyncio.create_task(mock_datafeed_loop._run_loop_iteration())
+    await asyncio.sleep(SLEEP_SECONDS)
+
+    assert not second_iteration.done()
+    mock_datafeed_loop._read_events.assert_called_once()
+
+    listener.release.set()
+    await second_iteration
+    await mock_datafeed_loop._stop_listener_tasks()
+    assert listener.processed == 2
+
+
+@pytest.mark.asyncio
+async def test_deferred_work_does_not_delay_ack(mock_datafeed_loop, message_sent):
+    release = asyncio.Event()
+    deferred_done = []
+
+    async def long_work():
+        await release.wait()
+        deferred_done.append(True)
+
+    class DeferringListener(AcceptingListener):
+        async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+            defer(long_work())
+
+    mock_datafeed_loop._read_events.return_value = EventsMock([message_sent])
+    mock_datafeed_loop.subscribe(DeferringListener())
+
+    await mock_datafeed_loop._run_loop_iteration()
+
+    assert mock_datafeed_loop._ack_id == ACK_ID
+    (deferred_task,) = mock_datafeed_loop._background_tasks
+    assert deferred_task.get_name().endswith("-deferred")
+
+    release.set()
+    await mock_datafeed_loop._stop_listener_tasks()
+    assert deferred_done == [True]
+
+
+@pytest.mark.asyncio
+async def test_deferred_work_cancelled_on_hard_kill(mock_datafeed_loop, message_sent):
+    class DeferringListener(AcceptingListener):
+        async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+            defer(asyncio.sleep(60))
+
+    mock_datafeed_loop._read_events.return_value = EventsMock([message_sent])
+    mock_datafeed_loop.subscribe(DeferringListener())
+
+    await mock_datafeed_loop._run_loop_iteration()
+    (deferred_task,) = mock_datafeed_loop._background_tasks
+    await mock_datafeed_loop.stop(hard_kill=True)
+    await mock_datafeed_loop._stop_listener_tasks()
+
+    assert deferred_task.cancelled()
+
+
+def test_defer_outside_listener():
+    async def work():
+        pass
+
+    with pytest.raises(RuntimeError):
+        defer(work())
+
+
 @pytest.mark.asyncio
 async def test_400_should_call_recreate_df_and_retry(datafeed_loop, datafeed_api):
     datafeed_loop._retry_config = minimal_retry_config_with_attempts(2)
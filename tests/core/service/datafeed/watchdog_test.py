@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.loader import BdkConfigLoader
+from symphony.bdk.core.config.model.bdk_watchdog_config import BdkWatchdogConfig
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.datafeed.watchdog import DatafeedWatchdog
+from symphony.bdk.gen import ApiClient
+from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from tests.core.config import minimal_retry_config
+from tests.core.service.datafeed.test_fixtures import EventsMock
+from tests.utils.resource_utils import get_config_resource_filepath
+
+
+class SlowListener(RealTimeEventListener):
+    @staticmethod
+    async def is_accepting_event(event, bot_info):
+        return True
+
+    async def on_message_sent(self, initiator, event):
+        await asyncio.sleep(0.05)
+
+
+def message_sent_event(event_id="event-id"):
+    return V4Event(
+        id=event_id,
+        type=RealTimeEvent.MESSAGESENT.name,
+        payload=V4Payload(message_sent=V4MessageSent()),
+    )
+
+
+def watchdog_config(**config):
+    return BdkWatchdogConfig(
+        {"enabled": True, "listenerBudget": 0.01, "lagThreshold": 0.05, **config}
+    )
+
+
+def test_task_runtime():
+    watchdog = DatafeedWatchdog(watchdog_config(listenerBudget=10))
+    listener = SlowListener()
+
+    watchdog.task_started("task-1/event-id/1", listener, message_sent_event())
+    assert [task_info.label for task_info in watchdog.running_tasks()] == ["task-1/event-id/1"]
+    watchdog.task_finished("task-1/event-id/1")
+
+    assert watchdog.running_tasks() == []
+    assert watchdog.listener_runtimes["SlowListener"].count == 1
+    assert watchdog.over_budget_tasks == {}
+
+
+def test_task_over_budget_flagged_while_running(caplog):
+    watchdog = DatafeedWatchdog(watchdog_config())
+    watchdog.task_started("task-1/event-id/1", SlowListener(), message_sent_event())
+    time.sleep(0.02)
+
+    with caplog.at_level(logging.WARNING):
+        watchdog._check_running_tasks()
+        watchdog._check_running_tasks()
+
+    assert watchdog.over_budget_tasks == {"SlowListener": 1}
+    assert watchdog.running_tasks()[0].over_budget
+    assert "task-1/event-id/1" in caplog.text
+
+    watchdog.task_finished("task-1/event-id/1")
+    assert watchdog.over_budget_tasks == {"SlowListener": 1}
+
+
+def test_task_over_budget_flagged_when_finished():
+    watchdog = DatafeedWatchdog(watchdog_config())
+    watchdog.task_started("task-1/event-id/1", SlowListener(), message_sent_event())
+    time.sleep(0.02)
+    watchdog.task_finished("task-1/event-id/1")
+
+    assert watchdog.over_budget_tasks == {"SlowListener": 1}
+    assert watchdog.get_stats()["over_budget_tasks"] == {"SlowListener": 1}
+
+
+@pytest.mark.asyncio
+async def test_blocked_event_loop_detected(caplog):
+    watchdog = DatafeedWatchdog(watchdog_config(samplingInterval=0.01))
+    watchdog.task_started("task-1/event-id/1", SlowListener(), message_sent_event())
+
+    watchdog.start()
+    await asyncio.sleep(0.02)
+    with caplog.at_level(logging.WARNING):
+        time.sleep(0.1)  # blocking call, as a listener running synchronous code would do
+        await asyncio.sleep(0.02)
+    await watchdog.stop()
+
+    assert watchdog.blocked_samples >= 1
+    assert watchdog.event_loop_lag.max >= 0.05
+    assert "Event loop was blocked" in caplog.text
+    assert "task-1/event-id/1" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_datafeed_loop_reports_to_watchdog():
+    config = BdkConfigLoader.load_from_file(get_config_resource_filepath("config.yaml"))
+    config.datafeed.retry = minimal_retry_config()
+    config.watchdog = watchdog_config()
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+    datafeed_loop = DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config)
+    datafeed_loop._read_events = AsyncMock(
+        return_value=EventsMock([message_sent_event("event-1"), message_sent_event("event-2")])
+    )
+    datafeed_loop.subscribe(SlowListener())
+
+    await datafeed_loop._run_loop_iteration()
+
+    watchdog = datafeed_loop.watchdog
+    assert watchdog.running_tasks() == []
+    assert watchdog.listener_runtimes["SlowListener"].count == 2
+    assert watchdog.over_budget_tasks == {"SlowListener": 2}
+
+
+def test_no_watchdog_by_default():
+    config = BdkConfigLoader.load_from_file(get_config_resource_filepath("config.yaml"))
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+
+    assert DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config).watchdog is None
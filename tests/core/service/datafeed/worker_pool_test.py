@@ -0,0 +1,127 @@
+import os
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.loader import BdkConfigLoader
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
+from symphony.bdk.core.service.datafeed.exception import EventError
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.datafeed.worker_pool import DatafeedWorkerPool
+from symphony.bdk.gen import ApiClient
+from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from tests.core.config import minimal_retry_config
+from tests.core.service.datafeed.test_fixtures import EventsMock
+from tests.utils.resource_utils import get_config_resource_filepath
+
+BOT_INFO = UserV2(id=67890)
+
+
+class RecordingListener(RealTimeEventListener):
+    """Appends the id of the processed messages to a file, raises EventError for messages with 'fail' id."""
+
+    def __init__(self, output_path):
+        self._output_path = output_path
+
+    async def on_message_sent(self, initiator, event):
+        if event.message.message_id == "fail":
+            raise EventError()
+        with open(self._output_path, "a", encoding="utf-8") as output:
+            output.write(f"{os.getpid()} {event.message.message_id}\n")
+
+
+def create_listeners(output_path):
+    return [RecordingListener(output_path)]
+
+
+def message_sent_event(message_id):
+    return V4Event(
+        id=message_id,
+        type=RealTimeEvent.MESSAGESENT.name,
+        initiator=V4Initiator(user=V4User(user_id=12345)),
+        payload=V4Payload(message_sent=V4MessageSent(message=V4Message(message_id=message_id))),
+    )
+
+
+def read_processed(output_path):
+    with open(output_path, encoding="utf-8") as output:
+        return [line.split() for line in output.read().splitlines()]
+
+
+@pytest.fixture(name="output_path")
+def fixture_output_path(tmpdir):
+    return str(tmpdir.join("processed.txt"))
+
+
+@pytest.mark.asyncio
+async def test_dispatch(output_path):
+    worker_pool = DatafeedWorkerPool(
+        partial(create_listeners, output_path), processes=2, events_per_task=2
+    )
+    worker_pool.start(BOT_INFO)
+    try:
+        await worker_pool.dispatch([message_sent_event(f"message-{i}") for i in range(5)])
+    finally:
+        await worker_pool.stop()
+
+    processed = read_processed(output_path)
+    assert sorted(message_id for _, message_id in processed) == [f"message-{i}" for i in range(5)]
+    assert all(int(pid) != os.getpid() for pid, _ in processed)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_event_error(output_path):
+    worker_pool = DatafeedWorkerPool(partial(create_listeners, output_path), processes=1)
+    worker_pool.start(BOT_INFO)
+    try:
+        with pytest.raises(EventError):
+            await worker_pool.dispatch([message_sent_event("message"), message_sent_event("fail")])
+    finally:
+        await worker_pool.stop()
+
+    assert [message_id for _, message_id in read_processed(output_path)] == ["message"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_not_started():
+    with pytest.raises(RuntimeError):
+        await DatafeedWorkerPool(create_listeners).dispatch([message_sent_event("message")])
+
+
+@pytest.mark.asyncio
+async def test_datafeed_loop_acks_after_workers(output_path):
+    config = BdkConfigLoader.load_from_file(get_config_resource_filepath("config.yaml"))
+    config.datafeed.retry = minimal_retry_config()
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+    datafeed_loop = DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config)
+    worker_pool = DatafeedWorkerPool(partial(create_listeners, output_path), processes=1)
+    datafeed_loop.use_worker_pool(worker_pool)
+    worker_pool.start(BOT_INFO)
+
+    try:
+        datafeed_loop._read_events = AsyncMock(
+            return_value=EventsMock([message_sent_event("fail")], ack_id="ack-1")
+        )
+        await datafeed_loop._run_loop_iteration()
+        assert datafeed_loop._ack_id == ""
+
+        datafeed_loop._read_events = AsyncMock(
+            return_value=EventsMock([message_sent_event("message")], ack_id="ack-2")
+        )
+        await datafeed_loop._run_loop_iteration()
+        assert datafeed_loop._ack_id == "ack-2"
+    finally:
+        await worker_pool.stop()
+
+    assert [message_id for _, message_id in read_processed(output_path)] == ["message"]
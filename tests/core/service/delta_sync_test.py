@@ -0,0 +1,132 @@
+import pytest
+
+from symphony.bdk.core.service.delta_sync import (
+    DeltaSync,
+    FileSnapshotStore,
+    InMemorySnapshotStore,
+    content_fingerprint,
+)
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+
+async def listing(*objects):
+    for obj in objects:
+        yield obj
+
+
+class InterruptedListing(Exception):
+    pass
+
+
+async def interrupted_listing(*objects):
+    for obj in objects:
+        yield obj
+    raise InterruptedListing()
+
+
+def by_id(obj):
+    return obj["id"]
+
+
+@pytest.mark.asyncio
+async def test_first_sync_adds_everything():
+    delta_sync = DeltaSync(InMemorySnapshotStore(), key=by_id)
+
+    result = await delta_sync.sync(listing({"id": 1}, {"id": 2}))
+
+    assert result.added == [{"id": 1}, {"id": 2}]
+    assert result.changed == []
+    assert result.removed == []
+    assert result.has_changes
+
+
+@pytest.mark.asyncio
+async def test_sync_emits_changes_only():
+    store = InMemorySnapshotStore()
+    delta_sync = DeltaSync(store, key=by_id)
+    store.commit(
+        await delta_sync.sync(listing({"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3}))
+    )
+
+    result = await delta_sync.sync(
+        listing({"id": 1, "name": "a"}, {"id": 2, "name": "c"}, {"id": 4})
+    )
+
+    assert result.added == [{"id": 4}]
+    assert result.changed == [{"id": 2, "name": "c"}]
+    assert result.removed == ["3"]
+    assert result.unchanged == 1
+
+    store.commit(result)
+    result = await delta_sync.sync(
+        listing({"id": 1, "name": "a"}, {"id": 2, "name": "c"}, {"id": 4})
+    )
+
+    assert not result.has_changes
+    assert result.unchanged == 3
+
+
+@pytest.mark.asyncio
+async def test_interrupted_sync_keeps_previous_snapshot():
+    store = InMemorySnapshotStore()
+    delta_sync = DeltaSync(store, key=by_id)
+    store.commit(await delta_sync.sync(listing({"id": 1}, {"id": 2})))
+
+    with pytest.raises(InterruptedListing):
+        await delta_sync.sync(interrupted_listing({"id": 1}))
+
+    result = await delta_sync.sync(listing({"id": 1}, {"id": 2}))
+    assert not result.has_changes
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_sync_reports_changes_again():
+    store = InMemorySnapshotStore()
+    delta_sync = DeltaSync(store, key=by_id)
+    store.commit(await delta_sync.sync(listing({"id": 1, "name": "a"}, {"id": 2})))
+
+    await delta_sync.sync(listing({"id": 1, "name": "b"}))  # e.g. the changes failed to be applied
+    result = await delta_sync.sync(listing({"id": 1, "name": "b"}))
+
+    assert result.changed == [{"id": 1, "name": "b"}]
+    assert result.removed == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_custom_fingerprint():
+    store = InMemorySnapshotStore()
+    delta_sync = DeltaSync(store, key=by_id, fingerprint=lambda obj: obj["version"])
+    store.commit(await delta_sync.sync(listing({"id": 1, "version": "1", "name": "a"})))
+
+    result = await delta_sync.sync(listing({"id": 1, "version": "1", "name": "b"}))
+
+    assert not result.has_changes
+
+
+@pytest.mark.asyncio
+async def test_file_snapshot_store(tmp_path):
+    snapshot_path = tmp_path / "users.json"
+    store = FileSnapshotStore(snapshot_path)
+    store.commit(await DeltaSync(store, key=by_id).sync(listing({"id": 1}, {"id": 2})))
+
+    result = await DeltaSync(FileSnapshotStore(snapshot_path), key=by_id).sync(listing({"id": 2}))
+
+    assert result.removed == ["1"]
+    assert result.unchanged == 1
+    assert list(tmp_path.iterdir()) == [snapshot_path]
+
+
+def test_file_snapshot_store_ignores_corrupted_file(tmp_path):
+    snapshot_path = tmp_path / "users.json"
+    snapshot_path.write_text("{not json")
+
+    assert FileSnapshotStore(snapshot_path).load() == {}
+
+
+def test_content_fingerprint_of_model():
+    assert content_fingerprint(UserV2(id=1, display_name="a")) == content_fingerprint(
+        UserV2(display_name="a", id=1)
+    )
+    assert content_fingerprint(UserV2(id=1, display_name="a")) != content_fingerprint(
+        UserV2(id=1, display_name="b")
+    )
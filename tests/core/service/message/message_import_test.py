@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from symphony.bdk.core.service.message.message_import import (
+    ImportCheckpoint,
+    ImportReport,
+    batches,
+)
+from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
+
+
+def test_report_add_responses():
+    report = ImportReport()
+    rejection = V4ImportResponse(original_message_id="m2", diagnostic="Invalid message")
+
+    report.add_responses([V4ImportResponse(message_id="id1", original_message_id="m1"), rejection])
+
+    assert report.imported == 1
+    assert report.rejected == 1
+    assert report.rejections == [rejection]
+    assert not report.is_successful
+
+
+def test_checkpoint_without_file():
+    checkpoint = ImportCheckpoint(None, 10)
+    checkpoint.complete(0, ImportReport())
+
+    assert checkpoint.is_completed(0)
+    assert not checkpoint.is_completed(1)
+
+
+def test_checkpoint_saved_and_restored(tmp_path):
+    file_path = tmp_path / "checkpoint.json"
+    checkpoint = ImportCheckpoint(file_path, 10)
+    report = ImportReport()
+    report.imported = 18
+    report.rejected = 2
+
+    checkpoint.complete(0, report)
+    checkpoint.complete(2, report)
+
+    assert json.loads(file_path.read_text()) == {
+        "batchSize": 10,
+        "importedUpTo": 1,
+        "completedBatches": [2],
+        "imported": 18,
+        "rejected": 2,
+    }
+
+    restored_checkpoint = ImportCheckpoint(file_path, 10)
+    restored_report = ImportReport()
+    restored_checkpoint.restore(restored_report)
+
+    assert [restored_checkpoint.is_completed(i) for i in range(4)] == [True, False, True, False]
+    assert restored_report.imported == 18
+    assert restored_report.rejected == 2
+
+
+def test_checkpoint_write_failure(tmp_path, caplog):
+    checkpoint = ImportCheckpoint(tmp_path / "missing" / "checkpoint.json", 10)
+
+    checkpoint.complete(0, ImportReport())
+
+    assert checkpoint.is_completed(0)
+    assert "Could not write import checkpoint" in caplog.text
+
+
+def test_checkpoint_compacted(tmp_path):
+    file_path = tmp_path / "checkpoint.json"
+    checkpoint = ImportCheckpoint(file_path, 10)
+
+    for batch_index in (1, 2, 0):
+        checkpoint.complete(batch_index, ImportReport())
+
+    checkpoint_content = json.loads(file_path.read_text())
+    assert checkpoint_content["importedUpTo"] == 3
+    assert checkpoint_content["completedBatches"] == []
+
+
+def test_checkpoint_with_different_batch_size(tmp_path):
+    file_path = tmp_path / "checkpoint.json"
+    ImportCheckpoint(file_path, 10).complete(0, ImportReport())
+
+    with pytest.raises(ValueError):
+        ImportCheckpoint(file_path, 20)
+
+
+@pytest.mark.asyncio
+async def test_batches():
+    assert [b async for b in batches(range(5), 2)] == [(0, [0, 1]), (1, [2, 3]), (2, [4])]
+
+
+@pytest.mark.asyncio
+async def test_batches_from_async_iterable():
+    async def messages():
+        for i in range(4):
+            yield i
+
+    assert [b async for b in batches(messages(), 2)] == [(0, [0, 1]), (1, [2, 3])]
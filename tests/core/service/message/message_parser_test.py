@@ -1,9 +1,12 @@
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
+from defusedxml.ElementTree import fromstring
 
 from symphony.bdk.core.service.exception import MessageParserError
 from symphony.bdk.core.service.message.message_parser import (
+    ParsedMessage,
     get_cashtags,
     get_emojis,
     get_hashtags,
@@ -106,3 +109,54 @@ def test_get_emojis(message_with_data):
 def test_get_tags_unparsable_data(message_with_invalid_data):
     with pytest.raises(MessageParserError):
         get_emojis(message_with_invalid_data)
+
+
+def test_parsed_message(message_with_data):
+    parsed_message = ParsedMessage.of(message_with_data)
+
+    assert parsed_message.text_content == "This is a link to Symphony's Website"
+    assert parsed_message.mentions == [13056700580915, 1305690252351]
+    assert parsed_message.hashtags == ["bot"]
+    assert parsed_message.cashtags == ["hello"]
+    assert parsed_message.emojis == {"grinning": "😀"}
+
+
+def test_parsed_message_parses_once(message_with_data):
+    with (
+        patch(
+            "symphony.bdk.core.service.message.message_parser.json.loads", wraps=json.loads
+        ) as json_loads,
+        patch(
+            "symphony.bdk.core.service.message.message_parser.fromstring", wraps=fromstring
+        ) as xml_fromstring,
+    ):
+        get_text_content_from_message(message_with_data)
+        get_mentions(message_with_data)
+        get_hashtags(message_with_data)
+        get_cashtags(message_with_data)
+        get_emojis(message_with_data)
+        get_text_content_from_message(message_with_data)
+
+    json_loads.assert_called_once()
+    xml_fromstring.assert_called_once()
+    assert ParsedMessage.of(message_with_data) is ParsedMessage.of(message_with_data)
+
+
+def test_parsed_message_cache_discarded_when_message_changes(message_with_data):
+    assert get_hashtags(message_with_data) == ["bot"]
+
+    message_with_data.data = "{}"
+    message_with_data.message = "<div>Updated</div>"
+
+    assert get_hashtags(message_with_data) == []
+    assert get_text_content_from_message(message_with_data) == "Updated"
+
+
+def test_parsed_message_on_generated_model():
+    message = V4Message(
+        message="<div>Hello</div>", data=get_resource_content("utils/message_entity_data.json")
+    )
+
+    assert get_hashtags(message) == ["bot"]
+    assert get_text_content_from_message(message) == "Hello"
+    assert message.to_dict()["message"] == "<div>Hello</div>"
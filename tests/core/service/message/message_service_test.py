@@ -1,3 +1,4 @@
+import io
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -5,12 +6,15 @@ import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.service.message.message_service import MessageService
-from symphony.bdk.core.service.message.model import Message
+from symphony.bdk.core.service.message.messageml_builder import MessageMLBuilder
+from symphony.bdk.core.service.message.model import Message, MessageMLPayload
 from symphony.bdk.core.service.message.multi_attachments_messages_api import (
     MultiAttachmentsMessagesApi,
 )
+from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.agent_api.attachments_api import AttachmentsApi
 from symphony.bdk.gen.agent_model.message_search_query import MessageSearchQuery
+from symphony.bdk.gen.agent_model.v4_import_response import V4ImportResponse
 from symphony.bdk.gen.agent_model.v4_import_response_list import V4ImportResponseList
 from symphony.bdk.gen.agent_model.v4_imported_message import V4ImportedMessage
 from symphony.bdk.gen.agent_model.v4_message import V4Message
@@ -28,7 +32,7 @@ from symphony.bdk.gen.pod_model.message_status import MessageStatus
 from symphony.bdk.gen.pod_model.message_suppression_response import MessageSuppressionResponse
 from symphony.bdk.gen.pod_model.stream_attachment_response import StreamAttachmentResponse
 from symphony.bdk.gen.pod_model.string_list import StringList
-from tests.core.config import minimal_retry_config
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
 from tests.utils.resource_utils import deserialize_object, get_deserialized_object_from_resource
 
 
@@ -86,6 +90,28 @@ async def test_send_message(mocked_api_client, message_service):
     assert message.user.user_id == 7078106482890
 
 
+@pytest.mark.asyncio
+async def test_send_built_message_streams_payload(mocked_api_client, message_service):
+    mocked_api_client.call_api.side_effect = [
+        ApiException(status=500),
+        get_deserialized_object_from_resource(V4Message, "message_response/message.json"),
+    ]
+    message_service._retry_config = minimal_retry_config_with_attempts(2)
+    builder = MessageMLBuilder()
+    builder.element("div", "Hello", {"data-entity-id": "entity"}).entity("entity", {"foo": "bar"})
+
+    await message_service.send_message("stream_id", builder.build())
+
+    assert mocked_api_client.call_api.call_count == 2
+    first_params, second_params = (
+        dict(call.kwargs["post_params"]) for call in mocked_api_client.call_api.call_args_list
+    )
+    assert isinstance(first_params["message"], MessageMLPayload)
+    assert isinstance(first_params["data"], MessageMLPayload)
+    # a streamed payload can only be sent once, a new one is created for the retry
+    assert first_params["message"] is not second_params["message"]
+
+
 @pytest.mark.asyncio
 async def test_send_simple_message(message_service):
     message_service._send_message = AsyncMock(
@@ -244,6 +270,95 @@ async def test_blast_complex_message(message_service):
     )
 
 
+def blast_response(stream_ids, failed_stream_ids=()):
+    return deserialize_object(
+        V4MessageBlastResponse,
+        json.dumps(
+            {
+                "messages": [
+                    {"messageId": f"msg-{sid}", "stream": {"streamId": sid}}
+                    for sid in stream_ids
+                    if sid not in failed_stream_ids
+                ],
+                "errors": {sid: {"code": 403, "message": "Forbidden"} for sid in failed_stream_ids},
+            }
+        ),
+    )
+
+
+def get_sids(post_params):
+    return next(value for name, value in post_params if name == "sids")
+
+
+@pytest.mark.asyncio
+async def test_bulk_blast_message(mocked_api_client, message_service):
+    sent_chunks = []
+    sent_attachments = []
+
+    async def call_api(*args, post_params=None, files=None, **kwargs):
+        sids = get_sids(post_params)
+        sent_chunks.append(sids)
+        sent_attachments.append([(f.name, f.read()) for f in files["attachment"]])
+        return blast_response(sids, failed_stream_ids=["sid3"])
+
+    mocked_api_client.call_api.side_effect = call_api
+    attachment = io.BytesIO(b"content")
+    attachment.name = "/tmp/file.txt"
+    stream_ids = ["sid1", "sid2", "sid3", "sid4", "sid5"]
+
+    report = await message_service.bulk_blast_message(
+        stream_ids, "Hello", attachment=[attachment], chunk_size=2, max_concurrency=2
+    )
+
+    assert sorted(sid for chunk in sent_chunks for sid in chunk) == stream_ids
+    assert all(len(chunk) <= 2 for chunk in sent_chunks)
+    assert sent_attachments == [[("file.txt", b"content")]] * 3
+    assert sorted(report.successful_stream_ids) == ["sid1", "sid2", "sid4", "sid5"]
+    assert report.failed_stream_ids == ["sid3"]
+    assert report.messages["sid1"].message_id == "msg-sid1"
+    assert report.errors["sid3"].code == 403
+    assert report.failed_chunks == []
+    assert not report.is_successful
+
+
+@pytest.mark.asyncio
+async def test_bulk_blast_message_retries_failed_chunks(mocked_api_client, message_service):
+    sent_chunks = []
+    exception = ApiException(status=500)
+    failing_chunks = [["sid3", "sid4"]]
+
+    async def call_api(*args, post_params=None, files=None, **kwargs):
+        sids = get_sids(post_params)
+        sent_chunks.append(sids)
+        if sids in failing_chunks:
+            raise exception
+        return blast_response(sids)
+
+    mocked_api_client.call_api.side_effect = call_api
+
+    report = await message_service.bulk_blast_message(
+        ["sid1", "sid2", "sid3", "sid4"], "Hello", chunk_size=2
+    )
+
+    assert report.failed_chunks == [["sid3", "sid4"]]
+    assert report.errors == {"sid3": exception, "sid4": exception}
+
+    sent_chunks.clear()
+    failing_chunks.clear()
+    await message_service.retry_bulk_blast(report)
+
+    assert sent_chunks == [["sid3", "sid4"]]
+    assert report.is_successful
+    assert report.failed_chunks == []
+    assert sorted(report.successful_stream_ids) == ["sid1", "sid2", "sid3", "sid4"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_blast_message_invalid_chunk_size(message_service):
+    with pytest.raises(ValueError):
+        await message_service.bulk_blast_message(["sid1"], "Hello", chunk_size=0)
+
+
 @pytest.mark.asyncio
 async def test_import_message(mocked_api_client, message_service):
     mocked_api_client.call_api.return_value = deserialize_object(
@@ -274,6 +389,81 @@ async def test_import_message(mocked_api_client, message_service):
     assert import_response[0].originating_system_id == "AGENT_SDK"
 
 
+def imported_message(message_id):
+    return V4ImportedMessage(
+        intended_message_timestamp=1433045622000,
+        intended_message_from_user_id=7215545057281,
+        originating_system_id="fooChat",
+        original_message_id=message_id,
+        stream_id="stream_id",
+        message="<messageML>Hello</messageML>",
+    )
+
+
+def import_responses(messages):
+    return [
+        V4ImportResponse(
+            message_id=f"id-{message.original_message_id}",
+            original_message_id=message.original_message_id,
+        )
+        for message in messages
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_messages(message_service):
+    message_service.import_messages = AsyncMock(side_effect=import_responses)
+
+    async def messages():
+        for i in range(5):
+            yield imported_message(f"m{i}")
+
+    report = await message_service.bulk_import_messages(messages(), batch_size=2, max_concurrency=2)
+
+    assert message_service.import_messages.call_count == 3
+    assert [len(c.args[0]) for c in message_service.import_messages.call_args_list] == [2, 2, 1]
+    assert report.imported == 5
+    assert report.is_successful
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_messages_resumed_from_checkpoint(message_service, tmp_path):
+    checkpoint_file_path = tmp_path / "checkpoint.json"
+    exception = ApiException(status=500)
+
+    async def import_messages(batch):
+        if batch[0].original_message_id == "m2":
+            raise exception
+        return import_responses(batch)
+
+    message_service.import_messages = AsyncMock(side_effect=import_messages)
+    messages = [imported_message(f"m{i}") for i in range(6)]
+
+    report = await message_service.bulk_import_messages(
+        messages, batch_size=2, checkpoint_file_path=checkpoint_file_path
+    )
+
+    assert report.imported == 4
+    assert report.failed == 2
+    assert report.failed_batches == [(1, exception)]
+
+    message_service.import_messages = AsyncMock(side_effect=import_responses)
+    report = await message_service.bulk_import_messages(
+        messages, batch_size=2, checkpoint_file_path=checkpoint_file_path
+    )
+
+    message_service.import_messages.assert_called_once_with(messages[2:4])
+    assert report.imported == 6
+    assert report.skipped == 4
+    assert report.is_successful
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_messages_invalid_batch_size(message_service):
+    with pytest.raises(ValueError):
+        await message_service.bulk_import_messages([], batch_size=0)
+
+
 @pytest.mark.asyncio
 async def test_get_attachment(mocked_api_client, message_service):
     mocked_api_client.call_api.return_value = "attachment-string"
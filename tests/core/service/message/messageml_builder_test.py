@@ -0,0 +1,111 @@
+import pytest
+
+from symphony.bdk.core.service.exception import MessageCreationError
+from symphony.bdk.core.service.message.messageml_builder import MessageMLBuilder
+from symphony.bdk.core.service.message.model import MessageMLBody, MessageMLPayload
+
+
+async def read_payload(payload: MessageMLPayload) -> bytes:
+    return b"".join([chunk async for chunk in payload._iter])
+
+
+def test_build_message():
+    builder = MessageMLBuilder()
+    with builder.tag("table", {"class": "pasted-table"}):
+        with builder.tag("tr"):
+            builder.element("td", "a & b").element("td", "<c>")
+    builder.text("Total: 3.5$").element("br").messageml("<b>done</b>")
+
+    message = builder.build(version="2.0")
+
+    assert str(message.content) == (
+        '<messageML><table class="pasted-table"><tr><td>a &amp; b</td><td>&lt;c&gt;</td></tr></table>'
+        "Total: 3&#46;5&#36;<br/><b>done</b></messageML>"
+    )
+    assert message.data == ""
+    assert message.version == "2.0"
+
+
+def test_build_message_with_entities():
+    builder = MessageMLBuilder()
+    builder.element("div", attributes={"data-entity-id": 'quote"1'})
+    builder.entity('quote"1', {"type": "org.symphonyoss.fin.security", "value": "AAPL"})
+    builder.entity("quote2", ["foo", 1])
+
+    message = builder.build()
+
+    assert str(message.content) == '<messageML><div data-entity-id="quote&quot;1"/></messageML>'
+    assert str(message.data) == (
+        '{"quote\\"1":{"type": "org.symphonyoss.fin.security", "value": "AAPL"},"quote2":["foo", 1]}'
+    )
+
+
+def test_build_message_in_chunks():
+    builder = MessageMLBuilder(chunk_size=100)
+    for i in range(1000):
+        builder.element("p", f"line {i} é")
+
+    content = builder.build().content
+
+    assert isinstance(content, MessageMLBody)
+    assert len(content.chunks) > 1
+    assert all(len(chunk) < 200 for chunk in content.chunks)
+    assert content.size == len(str(content).encode("utf-8"))
+    assert str(content).count("<p>") == 1000
+
+
+def test_content_size_limit_checked_while_writing():
+    builder = MessageMLBuilder(max_content_size=1000, chunk_size=100)
+    with pytest.raises(MessageCreationError):
+        for i in range(1000):
+            builder.element("p", f"line {i}")
+    assert i < 100
+
+
+def test_content_size_limit_counts_bytes():
+    builder = MessageMLBuilder(max_content_size=40, chunk_size=100)
+    builder.text("éééééééééééééé")  # 14 characters, 28 bytes
+
+    with pytest.raises(MessageCreationError):
+        builder.build()
+
+
+def test_data_size_limit():
+    builder = MessageMLBuilder(max_data_size=20)
+    with pytest.raises(MessageCreationError):
+        builder.entity("entity", {"value": "a long value exceeding the limit"})
+
+
+def test_unclosed_tag():
+    builder = MessageMLBuilder()
+    builder.start_tag("table")
+
+    with pytest.raises(MessageCreationError):
+        builder.build()
+
+
+def test_no_tag_to_close():
+    with pytest.raises(MessageCreationError):
+        MessageMLBuilder().end_tag()
+
+
+def test_builder_cannot_be_reused():
+    builder = MessageMLBuilder()
+    builder.build()
+
+    with pytest.raises(MessageCreationError):
+        builder.text("more")
+    with pytest.raises(MessageCreationError):
+        builder.build()
+
+
+@pytest.mark.asyncio
+async def test_payload_streams_chunks():
+    content = MessageMLBuilder(chunk_size=10).text("hello world, " * 10).build().content
+
+    first_payload, second_payload = content.payload(), content.payload()
+
+    assert first_payload is not second_payload
+    assert first_payload.content_type == "text/plain; charset=utf-8"
+    assert await read_payload(first_payload) == str(content).encode("utf-8")
+    assert await read_payload(second_payload) == str(content).encode("utf-8")
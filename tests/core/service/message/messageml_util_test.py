@@ -1,4 +1,7 @@
-from symphony.bdk.core.service.message.messageml_util import escape_special_chars
+from symphony.bdk.core.service.message.messageml_util import (
+    escape_special_chars,
+    escape_special_chars_chunks,
+)
 
 
 def test_escape_special_chars_match_found():
@@ -22,3 +25,25 @@ def test_escape_special_chars_multiple_matches():
 def test_escape_special_chars_no_change():
     text = "  This text will remain the same  "
     assert text == escape_special_chars(text)
+
+
+def test_escape_special_chars_all_chars():
+    text = "&<>'\"#$%()*.;=[\\]`{}"
+    expected_text = (
+        "&amp;&lt;&gt;&apos;&quot;&#35;&#36;&#37;&#40;&#41;&#42;&#46;&#59;&#61;&#91;&#92;&#93;&#96;"
+        "&#123;&#125;"
+    )
+    assert expected_text == escape_special_chars(text)
+
+
+def test_escape_special_chars_chunks():
+    text = "Here's <b>a & b</b> costing $3.50 (50%) [{x}]"
+    chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+
+    escaped_chunks = escape_special_chars_chunks(iter(chunks))
+
+    assert "".join(escaped_chunks) == escape_special_chars(text)
+
+
+def test_escape_special_chars_chunks_empty():
+    assert list(escape_special_chars_chunks([])) == []
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.service.exception import SendQueueClosedError
+from symphony.bdk.core.service.message.message_service import MessageService
+from symphony.bdk.core.service.message.send_queue import MessageSendQueue
+from symphony.bdk.core.service.rate_limiter import RateLimiter
+from symphony.bdk.gen import ApiException
+
+
+@pytest.fixture(name="message_service")
+def fixture_message_service():
+    message_service = MagicMock(MessageService)
+    sent = []
+
+    async def send_message(stream_id, message):
+        sent.append((stream_id, message.content))
+        # gives the other streams a chance to run
+        await asyncio.sleep(0)
+        return f"{stream_id}:{message.content}"
+
+    message_service.send_message = AsyncMock(side_effect=send_message)
+    message_service.sent = sent
+    return message_service
+
+
+@pytest.fixture(name="send_queue")
+def fixture_send_queue(message_service):
+    return MessageSendQueue(message_service, max_concurrent_streams=2)
+
+
+@pytest.mark.asyncio
+async def test_send(send_queue):
+    future = send_queue.send("stream_id", "Hello")
+
+    assert await future == "stream_id:<messageML>Hello</messageML>"
+    assert send_queue.metrics.sent == 1
+    assert send_queue.metrics.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_messages_sent_in_order_per_stream(send_queue, message_service):
+    futures = [send_queue.send(f"stream_{i % 3}", str(i)) for i in range(9)]
+    assert send_queue.metrics.pending == 9
+    assert send_queue.metrics.active_streams == 3
+
+    await asyncio.gather(*futures)
+
+    for stream in range(3):
+        contents = [
+            content
+            for stream_id, content in message_service.sent
+            if stream_id == f"stream_{stream}"
+        ]
+        assert contents == [f"<messageML>{i}</messageML>" for i in range(stream, 9, 3)]
+    assert send_queue.metrics.sent == 9
+    assert send_queue.metrics.active_streams == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_limited(message_service):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send_message(stream_id, message):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    message_service.send_message.side_effect = send_message
+    send_queue = MessageSendQueue(message_service, max_concurrent_streams=2)
+
+    for i in range(6):
+        send_queue.send(f"stream_{i}", "Hello")
+    await send_queue.flush()
+
+    assert max_in_flight == 2
+    assert message_service.send_message.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_failed_send_does_not_stop_stream(send_queue, message_service):
+    exception = ApiException(status=400)
+    message_service.send_message.side_effect = [exception, "sent"]
+
+    failed = send_queue.send("stream_id", "first")
+    succeeded = send_queue.send("stream_id", "second")
+
+    with pytest.raises(ApiException):
+        await failed
+    assert await succeeded == "sent"
+    assert send_queue.metrics.failed == 1
+    assert send_queue.metrics.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_message_not_sent(send_queue, message_service):
+    send_queue.send("stream_id", "first")
+    cancelled = send_queue.send("stream_id", "second")
+    cancelled.cancel()
+
+    await send_queue.flush()
+
+    assert message_service.sent == [("stream_id", "<messageML>first</messageML>")]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_applied(message_service):
+    rate_limiter = MagicMock(RateLimiter)
+    rate_limiter.acquire = AsyncMock()
+    send_queue = MessageSendQueue(message_service, rate_limiter=rate_limiter)
+
+    send_queue.send("stream_1", "Hello")
+    send_queue.send("stream_2", "Hello")
+    await send_queue.flush()
+
+    assert rate_limiter.acquire.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_and_rejects_new_messages(send_queue, message_service):
+    future = send_queue.send("stream_id", "Hello")
+
+    await send_queue.close()
+
+    assert future.done()
+    assert send_queue.closed
+    with pytest.raises(SendQueueClosedError):
+        send_queue.send("stream_id", "Hello")
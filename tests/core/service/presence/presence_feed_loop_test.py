@@ -0,0 +1,179 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.model.bdk_presence_feed_config import BdkPresenceFeedConfig
+from symphony.bdk.core.service.presence.presence_feed_loop import (
+    PresenceFeedLoop,
+    PresenceListener,
+    PresenceMap,
+)
+from symphony.bdk.core.service.presence.presence_service import PresenceService
+from symphony.bdk.gen import ApiException
+from symphony.bdk.gen.pod_api.presence_api import PresenceApi
+from symphony.bdk.gen.pod_model.string_id import StringId
+from symphony.bdk.gen.pod_model.v2_presence import V2Presence
+from symphony.bdk.gen.pod_model.v2_presence_list import V2PresenceList
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
+
+
+@pytest.fixture(name="auth_session")
+def fixture_auth_session():
+    auth_session = AuthSession(None)
+    auth_session.session_token = "session_token"
+    auth_session.key_manager_token = "km_token"
+    return auth_session
+
+
+@pytest.fixture(name="presence_api")
+def fixture_presence_api():
+    presence_api = MagicMock(PresenceApi)
+    presence_api.v2_users_presence_get = AsyncMock(return_value=V2PresenceList(value=[]))
+    presence_api.v3_user_uid_presence_get = AsyncMock()
+    presence_api.v1_presence_feed_create_post = AsyncMock(return_value=StringId(id="feed_id"))
+    presence_api.v1_presence_feed_feed_id_read_get = AsyncMock(
+        return_value=V2PresenceList(value=[])
+    )
+    presence_api.v1_presence_feed_feed_id_delete_post = AsyncMock(
+        return_value=StringId(id="feed_id")
+    )
+    return presence_api
+
+
+@pytest.fixture(name="presence_feed_loop")
+def fixture_presence_feed_loop(presence_api, auth_session):
+    config = BdkPresenceFeedConfig({"pollIntervalSeconds": 0, "pageSize": 2})
+    config.retry = minimal_retry_config_with_attempts(2)
+    return PresenceFeedLoop(presence_api, auth_session, config)
+
+
+def presence(user_id, category, timestamp):
+    return V2Presence(user_id=user_id, category=category, timestamp=timestamp)
+
+
+class RecordingListener(PresenceListener):
+    def __init__(self, loop, reads):
+        self.loop = loop
+        self.reads = reads
+        self.received = []
+
+    async def on_presence_changed(self, presences):
+        self.received.append([p.user_id for p in presences])
+        if len(self.received) == self.reads:
+            await self.loop.stop()
+
+
+def test_presence_map_ignores_older_presences():
+    presence_map = PresenceMap()
+    presence_map.update([presence(1, "AVAILABLE", 20)])
+
+    applied = presence_map.update([presence(1, "AWAY", 10), presence(2, "BUSY", 10)])
+
+    assert [p.user_id for p in applied] == [2]
+    assert presence_map.get(1).category == "AVAILABLE"
+    assert len(presence_map) == 2
+
+
+@pytest.mark.asyncio
+async def test_presence_feed_loop_seeds_and_dispatches(presence_feed_loop, presence_api):
+    presence_api.v2_users_presence_get.side_effect = [
+        V2PresenceList(value=[presence(1, "AVAILABLE", 1), presence(2, "AVAILABLE", 1)]),
+        V2PresenceList(value=[presence(3, "OFFLINE", 1)]),
+    ]
+    presence_api.v1_presence_feed_feed_id_read_get.side_effect = [
+        V2PresenceList(value=[]),
+        V2PresenceList(value=[presence(2, "BUSY", 2)]),
+    ]
+    listener = RecordingListener(presence_feed_loop, 1)
+    presence_feed_loop.subscribe(listener)
+
+    await asyncio.wait_for(presence_feed_loop.start(), 5)
+
+    presence_api.v2_users_presence_get.assert_any_call(
+        session_token="session_token", limit=2, last_user_id=2
+    )
+    presence_api.v1_presence_feed_feed_id_read_get.assert_called_with(
+        session_token="session_token", feed_id="feed_id"
+    )
+    presence_api.v1_presence_feed_feed_id_delete_post.assert_called_once_with(
+        session_token="session_token", feed_id="feed_id"
+    )
+    assert listener.received == [[2]]
+    presence_map = presence_feed_loop.presence_map
+    assert len(presence_map) == 3
+    assert presence_map.get(2).category == "BUSY"
+    assert not presence_map.is_live
+
+
+@pytest.mark.asyncio
+async def test_presence_feed_loop_recreates_expired_feed(presence_feed_loop, presence_api):
+    presence_api.v1_presence_feed_create_post.side_effect = [
+        StringId(id="expired_feed_id"),
+        StringId(id="feed_id"),
+    ]
+    presence_api.v1_presence_feed_feed_id_read_get.side_effect = [
+        ApiException(status=400),
+        V2PresenceList(value=[presence(1, "AWAY", 1)]),
+    ]
+    presence_feed_loop.subscribe(RecordingListener(presence_feed_loop, 1))
+
+    await asyncio.wait_for(presence_feed_loop.start(), 5)
+
+    assert presence_api.v1_presence_feed_create_post.call_count == 2
+    presence_api.v1_presence_feed_feed_id_read_get.assert_called_with(
+        session_token="session_token", feed_id="feed_id"
+    )
+    # the presence map is seeded again as the changes made while the feed was expired are lost
+    assert presence_api.v2_users_presence_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_presence_feed_loop_listener_error(presence_feed_loop, presence_api):
+    presence_api.v1_presence_feed_feed_id_read_get.side_effect = [
+        V2PresenceList(value=[presence(1, "AWAY", 1)]),
+        V2PresenceList(value=[presence(1, "BUSY", 2)]),
+    ]
+    failing_listener = MagicMock(PresenceListener)
+    failing_listener.on_presence_changed = AsyncMock(side_effect=ValueError())
+    listener = RecordingListener(presence_feed_loop, 2)
+    presence_feed_loop.subscribe(failing_listener)
+    presence_feed_loop.subscribe(listener)
+
+    await asyncio.wait_for(presence_feed_loop.start(), 5)
+
+    assert listener.received == [[1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_get_user_presence_from_live_presence_map(
+    presence_feed_loop, presence_api, auth_session
+):
+    presence_service = PresenceService(presence_api, auth_session, minimal_retry_config())
+    presence_service.use_presence_map(presence_feed_loop.presence_map)
+    presence_api.v2_users_presence_get.return_value = V2PresenceList(
+        value=[presence(1, "AVAILABLE", 1)]
+    )
+    local_presences = []
+
+    class LookupListener(PresenceListener):
+        async def on_presence_changed(self, presences):
+            local_presences.append(await presence_service.get_user_presence(1, False))
+            await presence_service.get_user_presence(1, True)
+            await presence_feed_loop.stop()
+
+    presence_api.v1_presence_feed_feed_id_read_get.return_value = V2PresenceList(
+        value=[presence(2, "AWAY", 1)]
+    )
+    presence_feed_loop.subscribe(LookupListener())
+
+    await asyncio.wait_for(presence_feed_loop.start(), 5)
+
+    assert local_presences[0].category == "AVAILABLE"
+    presence_api.v3_user_uid_presence_get.assert_called_once_with(
+        uid=1, session_token="session_token", local=True
+    )
+
+    await presence_service.get_user_presence(1, False)
+    assert presence_api.v3_user_uid_presence_get.call_count == 2
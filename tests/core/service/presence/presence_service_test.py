@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -11,7 +12,7 @@ from symphony.bdk.gen.pod_model.v2_presence import V2Presence
 from symphony.bdk.gen.pod_model.v2_presence_list import V2PresenceList
 from symphony.bdk.gen.pod_model.v2_presence_status import V2PresenceStatus
 from symphony.bdk.gen.pod_model.v2_user_presence import V2UserPresence
-from tests.core.config import minimal_retry_config
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
 from tests.utils.resource_utils import deserialize_object
 
 
@@ -260,3 +261,64 @@ async def test_set_user_presence(presence_service, mocked_presence_api_client):
 
     assert presence.user_id == 14568529068038
     assert presence.category == "AWAY"
+
+
+@pytest.mark.asyncio
+async def test_bulk_set_user_presence(presence_service, mocked_presence_api_client):
+    presence_service._retry_config = minimal_retry_config_with_attempts(2)
+    running = 0
+    max_running = 0
+    failures = {3: 1, 4: 2}
+
+    async def set_user_presence(session_token, presence, soft):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if failures.get(presence.user_id):
+            failures[presence.user_id] -= 1
+            raise ApiException(status=500)
+        return V2Presence(user_id=presence.user_id, category=presence.category)
+
+    mocked_presence_api_client.v3_user_presence_post.side_effect = set_user_presence
+
+    async def user_presences():
+        for user_id in range(10):
+            yield user_id, PresenceStatus.AVAILABLE
+
+    results = [
+        result
+        async for result in presence_service.bulk_set_user_presence(
+            user_presences(), soft=False, max_concurrency=3
+        )
+    ]
+
+    assert max_running == 3
+    assert sorted(result.item[0] for result in results) == list(range(10))
+    failed = [result for result in results if not result.is_successful]
+    assert [result.item for result in failed] == [(4, PresenceStatus.AVAILABLE)]
+    assert isinstance(failed[0].error, ApiException)
+    succeeded = next(result for result in results if result.item[0] == 3)
+    assert succeeded.value.category == "AVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_bulk_external_presence_interest(presence_service, mocked_presence_api_client):
+    async def register(session_token, uid_list):
+        if 4 in uid_list:
+            raise ApiException(status=400)
+
+    mocked_presence_api_client.v1_user_presence_register_post.side_effect = register
+
+    results = [
+        result
+        async for result in presence_service.bulk_external_presence_interest(range(7), chunk_size=3)
+    ]
+
+    assert mocked_presence_api_client.v1_user_presence_register_post.call_count == 3
+    mocked_presence_api_client.v1_user_presence_register_post.assert_any_call(
+        session_token="session_token", uid_list=[6]
+    )
+    assert sorted(r.item for r in results if not r.is_successful) == [3, 4, 5]
+    assert sorted(r.item for r in results if r.is_successful) == [0, 1, 2, 6]
@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from symphony.bdk.core.service.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    return FakeClock()
+
+
+def test_invalid_rate_limiter():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, burst=0)
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_burst(clock):
+    rate_limiter = RateLimiter(1, burst=3, clock=clock)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        for _ in range(3):
+            await rate_limiter.acquire()
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_when_burst_exceeded(clock):
+    rate_limiter = RateLimiter(2, burst=1, clock=clock)
+
+    async def advance_clock(delay):
+        clock.now += delay
+
+    with patch("asyncio.sleep", side_effect=advance_clock) as sleep:
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 0.5]
+    assert clock.now == 1.0
+
+
+@pytest.mark.asyncio
+async def test_tokens_refilled_over_time(clock):
+    rate_limiter = RateLimiter(1, burst=2, clock=clock)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+        clock.now = 10
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+
+    sleep.assert_not_called()
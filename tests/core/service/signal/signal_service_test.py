@@ -1,11 +1,14 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.service.signal.signal_service import SignalService
+from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.agent_api.signals_api import SignalsApi
 from symphony.bdk.gen.agent_model.base_signal import BaseSignal
+from symphony.bdk.gen.agent_model.channel_subscriber import ChannelSubscriber
 from symphony.bdk.gen.agent_model.channel_subscriber_response import ChannelSubscriberResponse
 from symphony.bdk.gen.agent_model.channel_subscription_response import ChannelSubscriptionResponse
 from symphony.bdk.gen.agent_model.signal import Signal
@@ -258,3 +261,136 @@ async def test_list_all_subscribers(signals_api, signal_service):
     )
 
     assert len(subscribers) == 3
+
+
+class FakeSignalBackend:
+    """Keeps the subscribers of signals, served and updated through the signals API calls."""
+
+    def __init__(self, subscribers_by_signal_id, owner_id=None, failing_user_id=None):
+        self.subscribers = {
+            signal_id: list(ids) for signal_id, ids in subscribers_by_signal_id.items()
+        }
+        self.owner_id = owner_id
+        self.failing_user_id = failing_user_id
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def subscribe(self, id, pushed, users, session_token, key_manager_token):
+        self.calls.append(("subscribe", id, users))
+        return await self._update(id, users, self.subscribers[id].append)
+
+    async def unsubscribe(self, id, users, session_token, key_manager_token):
+        self.calls.append(("unsubscribe", id, users))
+        return await self._update(id, users, self.subscribers[id].remove)
+
+    async def list_subscribers(self, id, skip, limit, session_token, key_manager_token):
+        self.calls.append(("list", id, skip))
+        user_ids = self.subscribers[id]
+        return ChannelSubscriberResponse(
+            offset=skip,
+            total=len(user_ids),
+            has_more=skip + limit < len(user_ids),
+            data=[
+                ChannelSubscriber(user_id=user_id, owner=user_id == self.owner_id)
+                for user_id in user_ids[skip : skip + limit]
+            ],
+        )
+
+    async def _update(self, signal_id, user_ids, apply):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if self.failing_user_id in user_ids:
+            raise ApiException(status=400)
+        for user_id in user_ids:
+            apply(user_id)
+        return ChannelSubscriptionResponse(
+            requested_subscription=len(user_ids),
+            successful_subscription=len(user_ids),
+            failed_subscription=0,
+            subscription_errors=[],
+        )
+
+
+@pytest.fixture(name="signal_backend")
+def fixture_signal_backend(signals_api):
+    backend = FakeSignalBackend({"signal_1": [], "signal_2": []})
+    signals_api.v1_signals_id_subscribe_post = AsyncMock(side_effect=backend.subscribe)
+    signals_api.v1_signals_id_unsubscribe_post = AsyncMock(side_effect=backend.unsubscribe)
+    signals_api.v1_signals_id_subscribers_get = AsyncMock(side_effect=backend.list_subscribers)
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_bulk_subscribe_users_to_signals(signal_service, signal_backend):
+    signal_backend.failing_user_id = 250
+
+    reports = await signal_service.bulk_subscribe_users_to_signals(
+        ["signal_1", "signal_2"], True, list(range(300)) + [0], chunk_size=100
+    )
+
+    assert len(signal_backend.calls) == 6
+    assert all(len(users) == 100 for _, _, users in signal_backend.calls)
+    for signal_id in ("signal_1", "signal_2"):
+        report = reports[signal_id]
+        assert report.requested == 300
+        assert report.successful == 200
+        assert report.failed == 100
+        assert not report.is_successful
+        assert report.failed_chunks[0][0] == list(range(200, 300))
+        assert signal_backend.subscribers[signal_id] == list(range(200))
+
+
+@pytest.mark.asyncio
+async def test_bulk_unsubscribe_users_from_signals(signal_service, signal_backend):
+    signal_backend.subscribers["signal_1"] = list(range(150))
+
+    reports = await signal_service.bulk_unsubscribe_users_from_signals(
+        ["signal_1"], range(100, 150), chunk_size=20
+    )
+
+    assert reports["signal_1"].successful == 50
+    assert reports["signal_1"].is_successful
+    assert signal_backend.subscribers["signal_1"] == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_sync_subscribers(signal_service, signal_backend):
+    signal_backend.subscribers["signal_1"] = list(range(1000))
+    signal_backend.owner_id = 0
+
+    result = await signal_service.sync_subscribers("signal_1", range(500, 1200))
+
+    assert result.is_successful
+    assert result.subscribed.successful == 200
+    assert result.unsubscribed.successful == 499
+    assert sorted(signal_backend.subscribers["signal_1"]) == [0] + list(range(500, 1200))
+    list_calls = [skip for call, _, skip in signal_backend.calls if call == "list"]
+    assert sorted(list_calls) == list(range(0, 1000, 100))
+
+
+@pytest.mark.asyncio
+async def test_sync_subscribers_max_concurrency(signal_service, signal_backend):
+    signal_backend.subscribers["signal_1"] = list(range(1000))
+
+    result = await signal_service.sync_subscribers(
+        "signal_1", range(500, 1500), chunk_size=50, max_concurrency=3
+    )
+
+    assert result.is_successful
+    assert signal_backend.max_in_flight == 3
+    calls = [call for call, _, _ in signal_backend.calls if call != "list"]
+    assert calls == ["subscribe"] * 10 + ["unsubscribe"] * 10
+
+
+@pytest.mark.asyncio
+async def test_sync_subscribers_already_in_sync(signal_service, signal_backend):
+    signal_backend.subscribers["signal_1"] = [1, 2]
+
+    result = await signal_service.sync_subscribers("signal_1", [2, 1])
+
+    assert result.is_successful
+    assert result.subscribed.requested == 0
+    assert [call for call, _, _ in signal_backend.calls] == ["list"]
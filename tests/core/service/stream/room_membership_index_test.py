@@ -0,0 +1,141 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.service.stream.room_membership_index import RoomMembershipIndex
+from symphony.bdk.core.service.stream.stream_service import StreamService
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
+from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
+from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
+from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
+from symphony.bdk.gen.pod_model.v2_admin_stream_info import V2AdminStreamInfo
+from symphony.bdk.gen.pod_model.v2_member_info import V2MemberInfo
+from symphony.bdk.gen.pod_model.v2_member_user_detail import V2MemberUserDetail
+
+ROOM_MEMBERS = {"room_1": [1, 2], "room_2": [2, 3]}
+
+
+async def async_generator(items):
+    for item in items:
+        yield item
+
+
+def member(user_id):
+    return V2MemberInfo(user=V2MemberUserDetail(user_id=user_id))
+
+
+@pytest.fixture(name="stream_service")
+def fixture_stream_service():
+    stream_service = MagicMock(StreamService)
+    stream_service.list_all_streams_admin = AsyncMock(
+        side_effect=lambda *args: async_generator(
+            [V2AdminStreamInfo(id=room_id) for room_id in ROOM_MEMBERS]
+        )
+    )
+    stream_service.list_all_stream_members = AsyncMock(
+        side_effect=lambda room_id, *args: async_generator(
+            [member(user_id) for user_id in ROOM_MEMBERS[room_id]]
+        )
+    )
+    return stream_service
+
+
+@pytest.fixture(name="index")
+def fixture_index(stream_service):
+    return RoomMembershipIndex(stream_service, concurrency=2)
+
+
+@pytest.mark.asyncio
+async def test_seed(index, stream_service):
+    await index.seed()
+
+    assert len(index) == 2
+    assert index.get_room_members("room_1") == {1, 2}
+    assert index.get_user_rooms(2) == {"room_1", "room_2"}
+    assert index.is_member(3, "room_2")
+    assert not index.is_member(3, "room_1")
+    assert index.get_user_rooms(4) == set()
+    stream_filter = stream_service.list_all_streams_admin.call_args.args[0]
+    assert stream_filter.stream_types[0].type == "ROOM"
+    assert stream_filter.status == "ACTIVE"
+
+
+@pytest.mark.asyncio
+async def test_user_joined_and_left_room(index):
+    await index.seed()
+    stream = V4Stream(stream_id="room_1")
+
+    await index.on_user_joined_room(
+        V4Initiator(), V4UserJoinedRoom(stream=stream, affected_user=V4User(user_id=3))
+    )
+    assert index.get_room_members("room_1") == {1, 2, 3}
+    assert index.get_user_rooms(3) == {"room_1", "room_2"}
+
+    await index.on_user_left_room(
+        V4Initiator(), V4UserLeftRoom(stream=stream, affected_user=V4User(user_id=1))
+    )
+    assert index.get_room_members("room_1") == {2, 3}
+    assert index.get_user_rooms(1) == set()
+
+
+@pytest.mark.asyncio
+async def test_room_created_and_deactivated(index):
+    stream = V4Stream(stream_id="room_3", members=[V4User(user_id=5)])
+
+    await index.on_room_created(V4Initiator(user=V4User(user_id=4)), V4RoomCreated(stream=stream))
+    assert index.get_room_members("room_3") == {4, 5}
+
+    await index.on_room_deactivated(V4Initiator(), V4RoomDeactivated(stream=stream))
+    assert "room_3" not in index.room_ids
+    assert index.get_user_rooms(4) == set()
+
+
+@pytest.mark.asyncio
+async def test_room_reactivated(index, stream_service):
+    await index.on_room_reactivated(
+        V4Initiator(), V4RoomReactivated(stream=V4Stream(stream_id="room_2"))
+    )
+
+    assert index.get_room_members("room_2") == {2, 3}
+    stream_service.list_all_stream_members.assert_called_once_with("room_2")
+
+
+@pytest.mark.asyncio
+async def test_is_accepting_event(index):
+    assert await index.is_accepting_event(V4Event(type="USERJOINEDROOM"), None)
+    assert not await index.is_accepting_event(V4Event(type="MESSAGESENT"), None)
+
+
+@pytest.mark.asyncio
+async def test_initialize_from_snapshot(tmp_path, stream_service):
+    snapshot_file_path = tmp_path / "rooms.json"
+    index = RoomMembershipIndex(stream_service, snapshot_file_path)
+    await index.initialize()
+    index.save_snapshot()
+    stream_service.list_all_streams_admin.assert_called_once()
+
+    reloaded_index = RoomMembershipIndex(stream_service, snapshot_file_path)
+    await reloaded_index.initialize()
+
+    stream_service.list_all_streams_admin.assert_called_once()
+    assert reloaded_index.get_user_rooms(2) == {"room_1", "room_2"}
+
+
+def test_load_invalid_snapshot(tmp_path, stream_service):
+    snapshot_file_path = tmp_path / "rooms.json"
+    snapshot_file_path.write_text("not json")
+
+    assert not RoomMembershipIndex(stream_service, snapshot_file_path).load_snapshot()
+
+
+def test_save_snapshot_failure(tmp_path, stream_service):
+    index = RoomMembershipIndex(stream_service, tmp_path / "missing" / "rooms.json")
+    index.add_member("room_id", 1)
+
+    assert not index.save_snapshot()
+    assert not RoomMembershipIndex(stream_service).save_snapshot()
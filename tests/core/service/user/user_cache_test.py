@@ -0,0 +1,108 @@
+import pytest
+
+from symphony.bdk.core.service.user.user_cache import UserCache
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
+from tests.utils.resource_utils import get_deserialized_object_from_resource
+
+USER_ID = 7215545078461
+
+
+@pytest.fixture(name="user_detail")
+def fixture_user_detail():
+    return get_deserialized_object_from_resource(V2UserDetail, "user/user_detail.json")
+
+
+@pytest.fixture(name="user")
+def fixture_user():
+    return UserV2(id=USER_ID, display_name="John Doe", email_address="johndoe@symphony.com")
+
+
+def event_initiated_by(**user_fields):
+    return V4Event(initiator=V4Initiator(user=V4User(user_id=USER_ID, **user_fields)))
+
+
+def test_put_and_get(user_detail, user):
+    user_cache = UserCache(10, 60)
+    user_cache.put_user_detail(user_detail)
+    user_cache.put_user(user, local=False)
+
+    assert user_cache.get_user_detail(USER_ID) == user_detail
+    assert user_cache.get_user(USER_ID, local=False) == user
+    assert user_cache.get_user(USER_ID, local=True) is None
+    assert user_cache.stats()["details"].hits == 1
+    assert user_cache.stats()["users"].misses == 1
+
+
+def test_invalidate(user_detail, user):
+    user_cache = UserCache(10, 60)
+    user_cache.put_user_detail(user_detail)
+    user_cache.put_user(user, local=True)
+    user_cache.invalidate(USER_ID)
+
+    assert user_cache.get_user_detail(USER_ID) is None
+    assert user_cache.get_user(USER_ID, local=True) is None
+
+
+@pytest.mark.asyncio
+async def test_event_with_same_user_info_keeps_entries(user_detail, user):
+    user_cache = UserCache(10, 60)
+    user_cache.put_user_detail(user_detail)
+    user_cache.put_user(user, local=False)
+
+    event = event_initiated_by(display_name="John Doe", email="johndoe@symphony.com")
+    assert not await user_cache.is_accepting_event(event, None)
+    assert user_cache.details.peek(USER_ID) == user_detail
+    assert user_cache.users.peek((USER_ID, False)) == user
+
+
+@pytest.mark.asyncio
+async def test_event_with_changed_user_info_invalidates_entries(user_detail, user):
+    user_cache = UserCache(10, 60)
+    user_cache.put_user_detail(user_detail)
+    user_cache.put_user(user, local=False)
+
+    event = event_initiated_by(display_name="John Smith")
+    assert not await user_cache.is_accepting_event(event, None)
+    assert user_cache.details.peek(USER_ID) is None
+    assert user_cache.users.peek((USER_ID, False)) is None
+
+
+@pytest.mark.asyncio
+async def test_event_without_initiator():
+    user_cache = UserCache(10, 60)
+
+    assert not await user_cache.is_accepting_event(V4Event(), None)
+
+
+def test_save_and_load_snapshot(tmp_path, user_detail, user):
+    snapshot_file_path = tmp_path / "users.json"
+    user_cache = UserCache(10, 60, snapshot_file_path)
+    user_cache.put_user_detail(user_detail)
+    user_cache.put_user(user, local=True)
+    user_cache.save_snapshot()
+
+    reloaded_cache = UserCache(10, 60, snapshot_file_path)
+    assert reloaded_cache.load_snapshot() == 2
+    assert reloaded_cache.get_user_detail(USER_ID) == user_detail
+    assert reloaded_cache.get_user(USER_ID, local=True) == user
+
+
+def test_save_snapshot_failure(tmp_path, user):
+    user_cache = UserCache(10, 60, tmp_path / "missing" / "users.json")
+    user_cache.put_user(user, local=True)
+
+    assert not user_cache.save_snapshot()
+    assert not UserCache(10, 60).save_snapshot()
+
+
+def test_load_missing_or_invalid_snapshot(tmp_path):
+    assert UserCache(10, 60).load_snapshot() == 0
+    assert UserCache(10, 60, tmp_path / "missing.json").load_snapshot() == 0
+
+    invalid_file_path = tmp_path / "invalid.json"
+    invalid_file_path.write_text("not json")
+    assert UserCache(10, 60, invalid_file_path).load_snapshot() == 0
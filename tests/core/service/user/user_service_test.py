@@ -5,8 +5,10 @@ from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.service.delta_sync import InMemorySnapshotStore
 from symphony.bdk.core.service.user.model.delegate_action_enum import DelegateActionEnum
 from symphony.bdk.core.service.user.model.role_id import RoleId
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.core.service.user.user_service import UserService
 from symphony.bdk.gen.agent_api.audit_trail_api import AuditTrailApi
 from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_list import V1AuditTrailInitiatorList
@@ -34,6 +36,7 @@ from symphony.bdk.gen.pod_model.user_search_query import UserSearchQuery
 from symphony.bdk.gen.pod_model.user_search_results import UserSearchResults
 from symphony.bdk.gen.pod_model.user_status import UserStatus
 from symphony.bdk.gen.pod_model.user_suspension import UserSuspension
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
 from symphony.bdk.gen.pod_model.v2_user_attributes import V2UserAttributes
 from symphony.bdk.gen.pod_model.v2_user_create import V2UserCreate
 from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
@@ -89,6 +92,20 @@ def fixture_user_service(user_api, users_api, audit_trail_api, system_api, auth_
     return service
 
 
+@pytest.fixture(name="cached_user_service")
+def fixture_cached_user_service(user_api, users_api, audit_trail_api, system_api, auth_session):
+    return UserService(
+        user_api,
+        users_api,
+        audit_trail_api,
+        system_api,
+        auth_session,
+        minimal_retry_config(),
+        "manifest.json",
+        UserCache(10, 60),
+    )
+
+
 @pytest.mark.asyncio
 async def test_list_users_by_ids(users_api, user_service):
     users_api.v3_users_get = AsyncMock()
@@ -264,6 +281,36 @@ async def test_list_all_user_details(user_api, user_service):
     assert user_detail_list[1].user_system_info.id == 9826885173258
 
 
+@pytest.mark.asyncio
+async def test_sync_user_details(user_api, user_service):
+    user_api.v2_admin_user_list_get = AsyncMock()
+    user_api.v2_admin_user_list_get.return_value = get_deserialized_object_from_resource(
+        V2UserDetailList, "user/list_user_detail.json"
+    )
+    store = InMemorySnapshotStore()
+
+    result = await user_service.sync_user_details(store)
+    assert len(result.added) == 5
+    store.commit(result)
+
+    user_details = get_deserialized_object_from_resource(
+        V2UserDetailList, "user/list_user_detail.json"
+    )
+    user_details.value[0].user_attributes.display_name = "Renamed"
+    user_details.value[1].user_system_info.last_login_date = 1700000000000
+    removed_user = user_details.value.pop()
+    user_api.v2_admin_user_list_get.return_value = user_details
+
+    result = await user_service.sync_user_details(store)
+
+    assert result.added == []
+    assert [u.user_system_info.id for u in result.changed] == [
+        user_details.value[0].user_system_info.id
+    ]
+    assert result.removed == [str(removed_user.user_system_info.id)]
+    assert result.unchanged == 3
+
+
 @pytest.mark.asyncio
 async def test_list_user_details_by_filter(user_api, user_service):
     user_api.v1_admin_user_find_post = AsyncMock()
@@ -807,3 +854,104 @@ async def test_update_manifest_file(user_api, user_service):
             session_token="session_token",
             manifest=ServiceAccountManifest(json.dumps(expected_manifest_data)),
         )
+
+
+@pytest.mark.asyncio
+async def test_get_user_detail_from_cache(user_api, cached_user_service):
+    user_api.v2_admin_user_uid_get = AsyncMock()
+    user_api.v2_admin_user_uid_get.return_value = get_deserialized_object_from_resource(
+        V2UserDetail, "user/user_detail.json"
+    )
+
+    first_user_detail = await cached_user_service.get_user_detail(7215545078461)
+    second_user_detail = await cached_user_service.get_user_detail(7215545078461)
+
+    user_api.v2_admin_user_uid_get.assert_called_once_with(
+        uid=7215545078461, session_token="session_token"
+    )
+    assert first_user_detail == second_user_detail
+    assert cached_user_service.user_cache.stats()["details"].hits == 1
+
+
+@pytest.mark.asyncio
+async def test_update_status_invalidates_cached_user_detail(user_api, cached_user_service):
+    user_api.v2_admin_user_uid_get = AsyncMock()
+    user_api.v2_admin_user_uid_get.return_value = get_deserialized_object_from_resource(
+        V2UserDetail, "user/user_detail.json"
+    )
+    user_api.v1_admin_user_uid_status_update_post = AsyncMock()
+
+    await cached_user_service.get_user_detail(7215545078461)
+    await cached_user_service.update_status(7215545078461, UserStatus(status="DISABLED"))
+    await cached_user_service.get_user_detail(7215545078461)
+
+    assert user_api.v2_admin_user_uid_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_only_fetches_missing_users(users_api, cached_user_service):
+    cached_user = UserV2(id=123, display_name="Cached User")
+    cached_user_service.user_cache.put_user(cached_user, local=False)
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(
+        V2UserList, "user/list_user.json"
+    )
+
+    users_list = await cached_user_service.list_users_by_ids([123, 15942919536460, 15942919536461])
+
+    users_api.v3_users_get.assert_called_once_with(
+        uid="15942919536460,15942919536461", local=False, session_token="session_token"
+    )
+    assert [user.id for user in users_list.users] == [123, 15942919536460, 15942919536461]
+    assert len(users_list.errors) == 2
+
+    users_list = await cached_user_service.list_users_by_ids([15942919536460, 123])
+
+    users_api.v3_users_get.assert_called_once()
+    assert [user.id for user in users_list.users] == [15942919536460, 123]
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_keeps_requested_order(users_api, cached_user_service):
+    cached_user_service.user_cache.put_user(UserV2(id=123), local=False)
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(
+        V2UserList, "user/list_user.json"
+    )
+
+    users_list = await cached_user_service.list_users_by_ids(
+        [15942919536461, 123, 15942919536460, 123]
+    )
+
+    assert [user.id for user in users_list.users] == [15942919536461, 123, 15942919536460]
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_with_active_bypasses_cache(users_api, cached_user_service):
+    cached_user_service.user_cache.put_user(UserV2(id=15942919536460), local=False)
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(
+        V2UserList, "user/list_user.json"
+    )
+
+    await cached_user_service.list_users_by_ids([15942919536460], active=True)
+
+    users_api.v3_users_get.assert_called_once_with(
+        uid="15942919536460", local=False, session_token="session_token", active=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_user_cache(user_api, user_service, cached_user_service):
+    user_api.v2_admin_user_list_get = AsyncMock()
+    user_api.v2_admin_user_list_get.return_value = get_deserialized_object_from_resource(
+        V2UserDetailList, "user/list_user_detail.json"
+    )
+    user_api.v2_admin_user_uid_get = AsyncMock()
+
+    assert await user_service.warm_up_user_cache() == 0
+    assert await cached_user_service.warm_up_user_cache() == 5
+
+    user_detail = await cached_user_service.get_user_detail(9826885173258)
+    assert user_detail.user_system_info.id == 9826885173258
+    user_api.v2_admin_user_uid_get.assert_not_called()
@@ -10,6 +10,7 @@ from symphony.bdk.core.service.connection.connection_service import ConnectionSe
 from symphony.bdk.core.service.datafeed.datafeed_loop_v1 import DatafeedLoopV1
 from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
 from symphony.bdk.core.service.message.message_service import MessageService
+from symphony.bdk.core.service.presence.presence_feed_loop import PresenceFeedLoop
 from symphony.bdk.core.service.presence.presence_service import PresenceService
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import SignalService
@@ -108,3 +109,9 @@ def test_get_presence_service(service_factory):
     presence_service = service_factory.get_presence_service()
     assert presence_service is not None
     assert isinstance(presence_service, PresenceService)
+
+
+def test_get_presence_feed_loop(service_factory):
+    presence_feed_loop = service_factory.get_presence_feed_loop()
+    assert presence_feed_loop is not None
+    assert isinstance(presence_feed_loop, PresenceFeedLoop)
@@ -10,6 +10,11 @@ from symphony.bdk.core.client.api_client_factory import ApiClientFactory
 from symphony.bdk.core.config.exception import BdkConfigError, BotNotConfiguredError
 from symphony.bdk.core.config.loader import BdkConfigLoader
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
+from symphony.bdk.core.config.model.bdk_room_membership_index_config import (
+    BdkRoomMembershipIndexConfig,
+)
+from symphony.bdk.core.config.model.bdk_send_queue_config import BdkSendQueueConfig
+from symphony.bdk.core.config.model.bdk_user_cache_config import BdkUserCacheConfig
 from symphony.bdk.core.extension import ExtensionService
 from symphony.bdk.core.symphony_bdk import SymphonyBdk
 from tests.utils.resource_utils import get_config_resource_filepath
@@ -72,6 +77,90 @@ async def test_bot_extensions_service_initialisation(config):
         assert isinstance(extension_service._config, BdkConfig)
 
 
+@pytest.mark.asyncio
+async def test_user_cache_subscribed_to_datafeed(config, tmp_path):
+    snapshot_file_path = tmp_path / "users.json"
+    config.user_cache = BdkUserCacheConfig(
+        {"enabled": True, "snapshotFilePath": str(snapshot_file_path)}
+    )
+    async with SymphonyBdk(config) as symphony_bdk:
+        user_cache = symphony_bdk.users().user_cache
+        assert user_cache is not None
+        assert user_cache in symphony_bdk.datafeed()._listeners
+    assert snapshot_file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_clients_closed_when_user_cache_snapshot_fails(config, tmp_path):
+    config.user_cache = BdkUserCacheConfig(
+        {"enabled": True, "snapshotFilePath": str(tmp_path / "missing" / "users.json")}
+    )
+    symphony_bdk = SymphonyBdk(config)
+    symphony_bdk._api_client_factory = AsyncMock(ApiClientFactory)
+    assert symphony_bdk.users().user_cache is not None
+
+    await symphony_bdk.close_clients()
+
+    symphony_bdk._api_client_factory.close_clients.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_room_membership_index_subscribed_to_datafeed(config, tmp_path):
+    snapshot_file_path = tmp_path / "rooms.json"
+    snapshot_file_path.write_text('{"room_id": [1234]}')
+    config.room_membership_index = BdkRoomMembershipIndexConfig(
+        {"enabled": True, "snapshotFilePath": str(snapshot_file_path)}
+    )
+    async with SymphonyBdk(config) as symphony_bdk:
+        index = symphony_bdk.room_memberships()
+        assert index in symphony_bdk.datafeed()._listeners
+        assert index.is_member(1234, "room_id")
+        index.add_member("room_id", 5678)
+    assert "5678" in snapshot_file_path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_room_membership_index_disabled(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        assert symphony_bdk.room_memberships() is None
+
+
+@pytest.mark.asyncio
+async def test_services_created_on_first_access(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        assert symphony_bdk._message_service is None
+        assert symphony_bdk._datafeed_loop is None
+        assert symphony_bdk._api_client_factory._pod_client is None
+        assert symphony_bdk._api_client_factory._agent_client is None
+
+        assert symphony_bdk._bot_session._authenticator.agent_version_service is not None
+        assert symphony_bdk._api_client_factory._agent_client is not None
+
+        assert symphony_bdk.messages() is symphony_bdk.messages()
+        assert symphony_bdk.activities() in symphony_bdk.datafeed()._listeners
+
+
+@pytest.mark.asyncio
+async def test_send_queue_flushed_on_close(config):
+    config.send_queue = BdkSendQueueConfig({"enabled": True})
+    symphony_bdk = SymphonyBdk(config)
+    send_queue = symphony_bdk.send_queue()
+    send_queue._message_service = AsyncMock()
+
+    future = send_queue.send("stream_id", "Hello")
+    await symphony_bdk.close_clients()
+
+    assert future.done()
+    assert send_queue.closed
+    send_queue._message_service.send_message.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_queue_disabled(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        assert symphony_bdk.send_queue() is None
+
+
 @pytest.mark.asyncio
 async def test_bot_invalid_config_session(invalid_username_config):
     async with SymphonyBdk(invalid_username_config) as symphony_bdk:
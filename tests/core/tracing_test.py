@@ -0,0 +1,219 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.client.api_client_factory import ApiClientFactory
+from symphony.bdk.core.config.loader import BdkConfigLoader
+from symphony.bdk.core.retry import retry
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.datafeed_loop_v2 import DatafeedLoopV2
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.symphony_bdk import SymphonyBdk
+from symphony.bdk.core.tracing import (
+    API_CALL_SPAN_NAME,
+    DATAFEED_DISPATCH_SPAN_NAME,
+    EVENT_TYPE,
+    HTTP_REQUEST_METHOD,
+    HTTP_REQUEST_RESEND_COUNT,
+    HTTP_RESPONSE_STATUS_CODE,
+    LISTENER,
+    OPERATION_ID,
+    STATUS_ERROR,
+    STATUS_OK,
+    URL_TEMPLATE,
+    InMemorySpanExporter,
+    Tracer,
+    get_current_span,
+    get_tracer,
+    set_tracer,
+    trace_api_call,
+)
+from symphony.bdk.gen import ApiClient, ApiException, Configuration
+from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
+from symphony.bdk.gen.agent_api.messages_api import MessagesApi
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from tests.core.config import minimal_retry_config, minimal_retry_config_with_attempts
+from tests.core.service.datafeed.test_fixtures import EventsMock
+from tests.utils.resource_utils import get_config_resource_filepath
+
+
+@pytest.fixture(name="config")
+def fixture_config():
+    config = BdkConfigLoader.load_from_file(get_config_resource_filepath("config.yaml"))
+    config.datafeed.retry = minimal_retry_config()
+    return config
+
+
+@pytest.fixture(name="exporter")
+def fixture_exporter():
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    yield exporter
+    set_tracer(None)
+
+
+def api_exception(status):
+    exception = ApiException(status=status)
+    exception.body = b""
+    return exception
+
+
+def traced_api_client():
+    api_client = ApiClient(Configuration(host="https://acme.symphony.com"))
+    api_client._ApiClient__call_api = trace_api_call(api_client, api_client._ApiClient__call_api)
+    return api_client
+
+
+def test_no_tracer_by_default():
+    assert get_tracer() is None
+    assert get_current_span() is None
+
+
+def test_nested_spans(exporter):
+    tracer = get_tracer()
+    with tracer.start_span("parent", {"key": "value"}) as parent:
+        assert get_current_span() is parent
+        with tracer.start_span("child") as child:
+            assert get_current_span() is child
+        assert get_current_span() is parent
+    assert get_current_span() is None
+
+    assert exporter.get_finished_spans() == [child, parent]
+    assert parent.parent_span_id is None
+    assert parent.attributes == {"key": "value"}
+    assert len(parent.trace_id) == 32 and len(parent.span_id) == 16
+    assert child.trace_id == parent.trace_id
+    assert child.parent_span_id == parent.span_id
+    assert child.span_id != parent.span_id
+    assert parent.duration >= child.duration >= 0
+
+
+def test_span_records_exception(exporter):
+    with pytest.raises(ValueError):
+        with get_tracer().start_span("failing"):
+            raise ValueError("error")
+
+    span = exporter.get_finished_spans("failing")[0]
+    assert span.status == STATUS_ERROR
+    assert span.events[0][0] == "exception"
+    assert span.events[0][2] == {"exception.type": "ValueError", "exception.message": "error"}
+
+
+@pytest.mark.asyncio
+async def test_symphony_bdk_registers_tracer(config):
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+    try:
+        async with SymphonyBdk(config, tracer=tracer) as bdk:
+            assert bdk.tracer() is tracer
+            pod_client = bdk._api_client_factory.get_pod_client()
+            pod_client.request = AsyncMock(return_value=MagicMock(status=204, data=b""))
+            await pod_client.call_api("/v1/endpoint", "GET", header_params={})
+            assert len(exporter.get_finished_spans(API_CALL_SPAN_NAME)) == 1
+    finally:
+        set_tracer(None)
+
+
+@pytest.mark.asyncio
+async def test_api_client_not_traced_without_tracer(config):
+    factory = ApiClientFactory(config)
+    pod_client = factory.get_pod_client()
+    pod_client.request = AsyncMock(return_value=MagicMock(status=204, data=b""))
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    try:
+        await pod_client.call_api("/v1/endpoint", "GET", header_params={})
+        assert exporter.get_finished_spans() == []
+    finally:
+        set_tracer(None)
+        await factory.close_clients()
+
+
+@pytest.mark.asyncio
+async def test_api_call(exporter):
+    api_client = traced_api_client()
+    api_client.request = AsyncMock(return_value=MagicMock(status=200, data=b"[]"))
+
+    await MessagesApi(api_client).v4_stream_sid_message_get(
+        sid="stream-id", since=0, session_token="session-token"
+    )
+
+    span = exporter.get_finished_spans(API_CALL_SPAN_NAME)[0]
+    assert span.status == STATUS_OK
+    assert span.attributes == {
+        OPERATION_ID: "v4_stream_sid_message_get",
+        URL_TEMPLATE: "/v4/stream/{sid}/message",
+        HTTP_REQUEST_METHOD: "GET",
+        HTTP_RESPONSE_STATUS_CODE: 200,
+    }
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_api_call(exporter):
+    api_client = traced_api_client()
+    api_client.request = AsyncMock(side_effect=api_exception(503))
+
+    with pytest.raises(ApiException):
+        await MessagesApi(api_client).v4_stream_sid_message_get(
+            sid="stream-id", since=0, session_token="session-token"
+        )
+
+    span = exporter.get_finished_spans(API_CALL_SPAN_NAME)[0]
+    assert span.status == STATUS_ERROR
+    assert span.attributes[HTTP_RESPONSE_STATUS_CODE] == 503
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+async def test_api_calls_within_listener_are_child_spans(exporter, config):
+    api_client = traced_api_client()
+    api_client.request = AsyncMock(
+        side_effect=[api_exception(500), MagicMock(status=200, data=b"[]")]
+    )
+
+    class Service:
+        def __init__(self):
+            self._retry_config = minimal_retry_config_with_attempts(2)
+
+        @retry
+        async def list_messages(self):
+            return await MessagesApi(api_client).v4_stream_sid_message_get(
+                sid="stream-id", since=0, session_token="session-token"
+            )
+
+    class Listener(RealTimeEventListener):
+        @staticmethod
+        async def is_accepting_event(event, bot_info):
+            return True
+
+        async def on_message_sent(self, initiator, event):
+            await Service().list_messages()
+
+    datafeed_api = MagicMock(DatafeedApi)
+    datafeed_api.api_client = MagicMock(ApiClient)
+    datafeed_loop = DatafeedLoopV2(datafeed_api, AsyncMock(), AuthSession(None), config)
+    event = V4Event(
+        type=RealTimeEvent.MESSAGESENT.name, payload=V4Payload(message_sent=V4MessageSent())
+    )
+    datafeed_loop._read_events = AsyncMock(return_value=EventsMock([event]))
+    datafeed_loop.subscribe(Listener())
+
+    await datafeed_loop._run_loop_iteration()
+
+    dispatch_span = exporter.get_finished_spans(DATAFEED_DISPATCH_SPAN_NAME)[0]
+    assert dispatch_span.attributes[EVENT_TYPE] == "MESSAGESENT"
+    assert dispatch_span.attributes[LISTENER].endswith("Listener")
+    assert HTTP_REQUEST_RESEND_COUNT not in dispatch_span.attributes
+
+    api_call_spans = exporter.get_finished_spans(API_CALL_SPAN_NAME)
+    assert [span.attributes[HTTP_RESPONSE_STATUS_CODE] for span in api_call_spans] == [500, 200]
+    assert HTTP_REQUEST_RESEND_COUNT not in api_call_spans[0].attributes
+    assert api_call_spans[1].attributes[HTTP_REQUEST_RESEND_COUNT] == 1
+    for span in api_call_spans:
+        assert span.trace_id == dispatch_span.trace_id
+        assert span.parent_span_id == dispatch_span.span_id
+    await api_client.close()
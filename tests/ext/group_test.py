@@ -1,11 +1,15 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import jwt
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.auth.bot_authenticator import BotAuthenticator
 from symphony.bdk.core.client.api_client_factory import ApiClientFactory
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
+from symphony.bdk.core.service.delta_sync import InMemorySnapshotStore
 from symphony.bdk.core.service.user.user_util import extract_tenant_id
 from symphony.bdk.ext.group import OAuthSession, SymphonyGroupBdkExtension, SymphonyGroupService
 from symphony.bdk.gen import ApiClient, ApiException, Configuration
@@ -14,7 +18,11 @@ from symphony.bdk.gen.group_model.create_group import CreateGroup
 from symphony.bdk.gen.group_model.group_list import GroupList
 from symphony.bdk.gen.group_model.member import Member
 from symphony.bdk.gen.group_model.owner import Owner
+from symphony.bdk.gen.group_model.pagination import Pagination
+from symphony.bdk.gen.group_model.pagination_cursors import PaginationCursors
+from symphony.bdk.gen.group_model.profile import Profile
 from symphony.bdk.gen.group_model.read_group import ReadGroup
+from symphony.bdk.gen.group_model.read_member import ReadMember
 from symphony.bdk.gen.group_model.sort_order import SortOrder
 from symphony.bdk.gen.group_model.status import Status
 from symphony.bdk.gen.group_model.update_group import UpdateGroup
@@ -73,6 +81,14 @@ def fixture_group():
     return ReadGroup(type="SDL", owner_type=Owner(value="TENANT"), owner_id=123, name="SDl test")
 
 
+def jwt_expiring_in(seconds):
+    return jwt.encode(
+        {"sub": "bot", "exp": int(time.time()) + seconds},
+        "a secret long enough for HS256 signatures",
+        algorithm="HS256",
+    )
+
+
 def assert_called_idm_tokens(first_call_args, session_token=SESSION_TOKEN):
     assert first_call_args.args[0] == "/idm/tokens"
     params = dict(first_call_args.args[3])
@@ -360,3 +376,280 @@ async def test_oauth_settings_does_not_refresh_when_called_twice(
         }
     }
     login_client.call_api.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_oauth_settings_cached(auth_session, retry_config, login_client):
+    login_client.call_api.return_value = JwtToken(access_token="bearer token")
+
+    oauth_session = OAuthSession(login_client, auth_session, retry_config)
+
+    assert await oauth_session.get_auth_settings() is await oauth_session.get_auth_settings()
+
+
+@pytest.mark.asyncio
+async def test_oauth_session_concurrent_refreshes_coalesced(
+    auth_session, retry_config, login_client
+):
+    async def idm_tokens(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return JwtToken(access_token="bearer token")
+
+    login_client.call_api.side_effect = idm_tokens
+    oauth_session = OAuthSession(login_client, auth_session, retry_config)
+
+    await asyncio.gather(*(oauth_session.get_auth_settings() for _ in range(10)))
+    await asyncio.gather(*(oauth_session.refresh() for _ in range(10)))
+
+    assert login_client.call_api.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_oauth_session_proactive_renewal(auth_session, retry_config, login_client):
+    tokens = [jwt_expiring_in(30), jwt_expiring_in(3600)]
+    login_client.call_api.side_effect = [JwtToken(access_token=token) for token in tokens]
+    oauth_session = OAuthSession(login_client, auth_session, retry_config)
+
+    await oauth_session.get_auth_settings()  # token expiring within the renewal margin
+    await oauth_session.get_auth_settings()  # renewed
+    await oauth_session.get_auth_settings()  # still valid
+
+    assert login_client.call_api.call_count == 2
+    assert oauth_session._bearer_token == tokens[1]
+
+
+@pytest.mark.asyncio
+async def test_oauth_session_renewal_from_expires_in(auth_session, retry_config, login_client):
+    login_client.call_api.side_effect = [
+        JwtToken(access_token="first token", expires_in=10),
+        JwtToken(access_token="second token", expires_in=3600),
+    ]
+    oauth_session = OAuthSession(login_client, auth_session, retry_config)
+
+    await oauth_session.get_auth_settings()
+    settings = await oauth_session.get_auth_settings()
+
+    assert settings["bearerAuth"]["value"] == "Bearer second token"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_unauthorized_calls_refresh_once(
+    group_service, mocked_group, api_client, login_client
+):
+    login_client.call_api.side_effect = [
+        JwtToken(access_token="expired token"),
+        JwtToken(access_token="new token"),
+    ]
+    sent_tokens = []
+
+    async def call_api(*args, **kwargs):
+        settings = await group_service._oauth_session.get_auth_settings()
+        sent_tokens.append(settings["bearerAuth"]["value"])
+        await asyncio.sleep(0.01)
+        if settings["bearerAuth"]["value"] == "Bearer expired token":
+            raise ApiException(status=401)
+        return mocked_group
+
+    api_client.call_api.side_effect = call_api
+
+    await asyncio.gather(*(group_service.get_group(f"group-{i}") for i in range(10)))
+
+    assert login_client.call_api.call_count == 2
+    assert sent_tokens.count("Bearer new token") == 10
+
+
+class FakeGroupBackend:
+    """Serves a group through get_group and update_group calls, checking eTags as the Groups API does."""
+
+    def __init__(self, group_id, member_ids, conflicts=0, failing_update=None, ignored_ids=()):
+        self.group = group_with_members(group_id, member_ids, e_tag="0")
+        self.updated_members = []
+        self._conflicts = conflicts
+        self._failing_update = failing_update
+        self._ignored_ids = set(ignored_ids)
+
+    async def call_api(self, path, method, path_params, query_params, header_params, **kwargs):
+        if method == "GET":
+            return self.group
+        if self._conflicts:
+            # the group is modified by someone else in the meantime
+            self._conflicts -= 1
+            self.group.e_tag = str(int(self.group.e_tag) + 1)
+        if header_params["If-Match"] != self.group.e_tag:
+            raise ApiException(status=412)
+        if len(self.updated_members) == self._failing_update:
+            raise ApiException(status=500)
+        member_ids = [
+            member.member_id
+            for member in kwargs["body"].members
+            if member.member_id not in self._ignored_ids
+        ]
+        self.updated_members.append(member_ids)
+        self.group = group_with_members(
+            self.group.id, member_ids, e_tag=str(int(self.group.e_tag) + 1)
+        )
+        return self.group
+
+
+def group_with_members(group_id, member_ids, e_tag):
+    return ReadGroup(
+        type="SDL",
+        owner_type=Owner(value="TENANT"),
+        owner_id=123,
+        name="SDL test",
+        id=group_id,
+        e_tag=e_tag,
+        profile=Profile(display_name="SDL test", id="profile-id"),
+        members=[
+            ReadMember(member_id=member_id, member_tenant=extract_tenant_id(member_id))
+            for member_id in member_ids
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1, 2, 3, 4])
+    api_client.call_api.side_effect = backend.call_api
+
+    result = await group_service.sync_group_members("group_id", range(3, 10), batch_size=4)
+
+    assert sorted(result.added) == [5, 6, 7, 8, 9]
+    assert sorted(result.removed) == [1, 2]
+    assert result.updates == 2
+    assert all(
+        len(set(after) ^ set(before)) <= 4
+        for before, after in zip([[1, 2, 3, 4]] + backend.updated_members, backend.updated_members)
+    )
+    assert sorted(m.member_id for m in result.group.members) == list(range(3, 10))
+    update_body = api_client.call_api.call_args.kwargs["body"]
+    assert update_body.name == "SDL test"
+    assert update_body.profile.display_name == "SDL test"
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members_unchanged(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1, 2])
+    api_client.call_api.side_effect = backend.call_api
+
+    result = await group_service.sync_group_members("group_id", [2, 1])
+
+    assert not result.changed
+    assert result.updates == 0
+    api_client.call_api.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members_etag_conflict(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1], conflicts=2)
+    api_client.call_api.side_effect = backend.call_api
+
+    result = await group_service.sync_group_members("group_id", [1, 2])
+
+    assert result.conflicts == 2
+    assert result.added == [2]
+    assert backend.updated_members == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members_too_many_conflicts(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1], conflicts=10)
+    api_client.call_api.side_effect = backend.call_api
+
+    with pytest.raises(ApiException):
+        await group_service.sync_group_members("group_id", [1, 2], max_conflicts=2)
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members_ignored_member(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1], ignored_ids=[2])
+    api_client.call_api.side_effect = backend.call_api
+
+    result = await group_service.sync_group_members("group_id", [1, 2, 3])
+
+    assert result.updates == 1
+    assert result.added == [3]
+    assert backend.updated_members == [[1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_sync_group_members_invalid_batch_size(group_service, api_client):
+    with pytest.raises(ValueError):
+        await group_service.sync_group_members("group_id", [1, 2], batch_size=0)
+
+    with pytest.raises(ValueError):
+        await group_service.bulk_sync_group_members({"group_id": [1, 2]}, batch_size=0)
+
+    api_client.call_api.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_group_members_keeps_partial_result(group_service, api_client):
+    backend = FakeGroupBackend("group_id", [1, 2], failing_update=1)
+    api_client.call_api.side_effect = backend.call_api
+
+    report = await group_service.bulk_sync_group_members({"group_id": [3, 4, 5]}, batch_size=2)
+
+    result = report.results["group_id"]
+    assert isinstance(result.error, ApiException)
+    assert result.updates == 1
+    assert len(result.added) == 2
+    assert result.removed == []
+    assert result.changed
+    assert report.changed_group_ids == ["group_id"]
+    assert report.failed_group_ids == ["group_id"]
+    assert sorted(m.member_id for m in result.group.members) == [1, 2] + sorted(result.added)
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_group_members(group_service, api_client):
+    backends = {
+        "group-1": FakeGroupBackend("group-1", [1, 2]),
+        "group-2": FakeGroupBackend("group-2", [1]),
+        "group-3": FakeGroupBackend("group-3", [1], conflicts=10),
+    }
+
+    async def call_api(path, method, path_params, *args, **kwargs):
+        return await backends[path_params["groupId"]].call_api(
+            path, method, path_params, *args, **kwargs
+        )
+
+    api_client.call_api.side_effect = call_api
+
+    report = await group_service.bulk_sync_group_members(
+        {"group-1": [1, 2], "group-2": [1, 3], "group-3": [3]}, max_concurrency=2
+    )
+
+    assert report.changed_group_ids == ["group-2"]
+    assert report.failed_group_ids == ["group-3"]
+    assert isinstance(report.results["group-3"].error, ApiException)
+    assert not report.is_successful
+
+
+@pytest.mark.asyncio
+async def test_sync_groups(group_service, api_client):
+    store = InMemorySnapshotStore()
+    api_client.call_api.return_value = GroupList(
+        data=[
+            group_with_members("group-1", [1], e_tag="1"),
+            group_with_members("group-2", [2], e_tag="1"),
+        ],
+        pagination=Pagination(cursors=PaginationCursors(before="1")),
+    )
+    result = await group_service.sync_groups(store)
+
+    assert [group.id for group in result.added] == ["group-1", "group-2"]
+    store.commit(result)
+
+    api_client.call_api.return_value = GroupList(
+        data=[
+            group_with_members("group-2", [2, 3], e_tag="2"),
+            group_with_members("group-3", [3], e_tag="1"),
+        ],
+        pagination=Pagination(cursors=PaginationCursors(before="1")),
+    )
+    result = await group_service.sync_groups(store)
+
+    assert [group.id for group in result.added] == ["group-3"]
+    assert [group.id for group in result.changed] == ["group-2"]
+    assert result.removed == ["group-1"]